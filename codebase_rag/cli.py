@@ -6,12 +6,18 @@ from loguru import logger
 
 from . import cli_help as ch
 from . import constants as cs
+from . import exceptions as ex
 from . import logs as ls
 from .config import load_cgrignore_patterns, settings
+from .graph_diff import (
+    apply_graph_diff,
+    diff_snapshots,
+    snapshot_from_index,
+    snapshot_from_memgraph,
+)
 from .graph_updater import GraphUpdater
 from .main import (
     app_context,
-    connect_memgraph,
     export_graph_to_file,
     main_async,
     main_optimize_async,
@@ -20,7 +26,11 @@ from .main import (
     update_model_settings,
 )
 from .parser_loader import load_parsers
+from .services.connection import connect_memgraph
+from .services.protobuf_loader import load_protobuf_index
+from .services.protobuf_offsets import build_offset_table
 from .services.protobuf_service import ProtobufFileIngestor
+from .services.protobuf_shards import ShardIngestor, merge_index_shards
 from .tools.language import cli as language_cli
 
 app = typer.Typer(
@@ -138,7 +148,16 @@ def start(
                 unignore_paths,
                 exclude_paths,
             )
-            updater.run()
+            if settings.MEMGRAPH_BULK_LOAD:
+                ingestor.enable_bulk_load_if_empty(
+                    settings.MEMGRAPH_BULK_STAGING_DIR,
+                    settings.MEMGRAPH_BULK_BATCH_SIZE,
+                    updater.project_id,
+                )
+            if not ingestor.bulk_load_enabled:
+                ingestor.ensure_indexes()
+            with ingestor.analytical_storage():
+                updater.run()
 
             if output:
                 app_context.console.print(
@@ -179,6 +198,26 @@ def index(
         "--split-index",
         help=ch.HELP_SPLIT_INDEX,
     ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help=ch.HELP_STREAM_INDEX,
+    ),
+    schema_version: cs.ProtobufSchemaVersion = typer.Option(
+        cs.ProtobufSchemaVersion.V1,
+        "--schema-version",
+        help=ch.HELP_PROTO_SCHEMA_VERSION,
+    ),
+    offset_table: bool = typer.Option(
+        False,
+        "--offset-table",
+        help=ch.HELP_OFFSET_TABLE,
+    ),
+    shard: bool = typer.Option(
+        False,
+        "--shard",
+        help=ch.HELP_SHARD_INDEX,
+    ),
     exclude: list[str] | None = typer.Option(
         None,
         "--exclude",
@@ -193,6 +232,13 @@ def index(
     if project_id:
         settings.TARGET_PROJECT_ID = project_id
 
+    if offset_table and schema_version != cs.ProtobufSchemaVersion.V1:
+        app_context.console.print(style(cs.CLI_ERR_OFFSET_TABLE_V1_ONLY, cs.Color.RED))
+        raise typer.Exit(1)
+    if shard and schema_version != cs.ProtobufSchemaVersion.V1:
+        app_context.console.print(style(cs.CLI_ERR_SHARD_V1_ONLY, cs.Color.RED))
+        raise typer.Exit(1)
+
     target_repo_path = repo_path or settings.TARGET_REPO_PATH
     repo_to_index = Path(target_repo_path)
 
@@ -214,8 +260,15 @@ def index(
         unignore_paths = cgrignore.unignore or None
 
     try:
-        ingestor = ProtobufFileIngestor(
-            output_path=output_proto_dir, split_index=split_index
+        ingestor = (
+            ShardIngestor(output_proto_dir, split_index)
+            if shard
+            else ProtobufFileIngestor(
+                output_path=output_proto_dir,
+                split_index=split_index,
+                streaming=stream,
+                schema_version=schema_version,
+            )
         )
         parsers, queries = load_parsers()
         updater = GraphUpdater(
@@ -223,6 +276,8 @@ def index(
         )
 
         updater.run()
+        if offset_table:
+            build_offset_table(Path(output_proto_dir))
 
         app_context.console.print(style(cs.CLI_MSG_INDEXING_DONE, cs.Color.GREEN))
     except Exception as e:
@@ -245,6 +300,15 @@ def export(
         min=1,
         help=ch.HELP_BATCH_SIZE,
     ),
+    export_format: cs.ExportFormat | None = typer.Option(
+        None, "--format", help=ch.HELP_EXPORT_FORMAT
+    ),
+    compression: cs.ExportCompression | None = typer.Option(
+        None, "--compression", help=ch.HELP_EXPORT_COMPRESSION
+    ),
+    project_id: str | None = typer.Option(
+        None, "--project-id", help=ch.HELP_EXPORT_PROJECT
+    ),
 ) -> None:
     if not format_json:
         app_context.console.print(style(cs.CLI_ERR_ONLY_JSON, cs.Color.RED))
@@ -257,7 +321,13 @@ def export(
     try:
         with connect_memgraph(effective_batch_size) as ingestor:
             app_context.console.print(style(cs.CLI_MSG_EXPORTING_DATA, cs.Color.CYAN))
-            if not export_graph_to_file(ingestor, output):
+            if not export_graph_to_file(
+                ingestor,
+                output,
+                fmt=export_format,
+                compression=compression,
+                project_id=project_id,
+            ):
                 raise typer.Exit(1)
 
     except Exception as e:
@@ -268,6 +338,188 @@ def export(
         raise typer.Exit(1) from e
 
 
+@app.command(name=ch.CLICommandName.LOAD_PROTO, help=ch.CMD_LOAD_PROTO)
+def load_proto_command(
+    input_proto_dir: str = typer.Option(
+        ..., "-i", "--input-proto-dir", help=ch.HELP_PROTO_INPUT_DIR
+    ),
+    project_id: str | None = typer.Option(
+        None, "--project-id", help=ch.HELP_LOAD_PROTO_PROJECT
+    ),
+    clean: bool = typer.Option(False, "--clean", help=ch.HELP_CLEAN_DB),
+    bulk: bool = typer.Option(
+        settings.MEMGRAPH_BULK_LOAD, "--bulk/--no-bulk", help=ch.HELP_BULK_LOAD
+    ),
+    batch_size: int | None = typer.Option(
+        None,
+        "--batch-size",
+        min=1,
+        help=ch.HELP_BATCH_SIZE,
+    ),
+) -> None:
+    index_dir = Path(input_proto_dir)
+    app_context.console.print(
+        style(cs.CLI_MSG_LOADING_PROTO.format(path=index_dir), cs.Color.CYAN)
+    )
+
+    effective_batch_size = settings.resolve_batch_size(batch_size)
+
+    try:
+        with connect_memgraph(effective_batch_size) as ingestor:
+            if clean:
+                app_context.console.print(
+                    style(cs.CLI_MSG_CLEANING_DB, cs.Color.YELLOW)
+                )
+                ingestor.clean_database()
+            ingestor.ensure_constraints()
+            if bulk:
+                ingestor.enable_bulk_load_if_empty(
+                    settings.MEMGRAPH_BULK_STAGING_DIR,
+                    settings.MEMGRAPH_BULK_BATCH_SIZE,
+                    project_id,
+                )
+            if not ingestor.bulk_load_enabled:
+                ingestor.ensure_indexes()
+            with ingestor.analytical_storage():
+                result = load_protobuf_index(ingestor, index_dir, project_id)
+    except Exception as e:
+        app_context.console.print(
+            style(cs.CLI_ERR_LOAD_PROTO.format(error=e), cs.Color.RED)
+        )
+        logger.exception(ls.PROTOBUF_LOAD_FAILED.format(path=index_dir))
+        raise typer.Exit(1) from e
+
+    app_context.console.print(
+        style(
+            cs.CLI_MSG_PROTO_LOADED.format(
+                nodes=result.nodes,
+                relationships=result.relationships,
+                version=result.schema_version.value,
+                skipped=result.skipped,
+            ),
+            cs.Color.GREEN,
+        )
+    )
+
+
+@app.command(name=ch.CLICommandName.MERGE_INDEX, help=ch.CMD_MERGE_INDEX)
+def merge_index_command(
+    shard_dirs: list[str] = typer.Argument(..., help=ch.HELP_SHARD_DIRS),
+    output_proto_dir: str = typer.Option(
+        ..., "-o", "--output-proto-dir", help=ch.HELP_MERGE_OUTPUT_DIR
+    ),
+    split_index: bool = typer.Option(
+        False,
+        "--split-index",
+        help=ch.HELP_SPLIT_INDEX,
+    ),
+) -> None:
+    output_dir = Path(output_proto_dir)
+    app_context.console.print(
+        style(
+            cs.CLI_MSG_MERGING_SHARDS.format(count=len(shard_dirs), path=output_dir),
+            cs.Color.CYAN,
+        )
+    )
+
+    try:
+        result = merge_index_shards(
+            [Path(d) for d in shard_dirs], output_dir, split_index=split_index
+        )
+    except Exception as e:
+        app_context.console.print(
+            style(cs.CLI_ERR_MERGE_INDEX.format(error=e), cs.Color.RED)
+        )
+        logger.exception(ls.PROTOBUF_MERGE_FAILED.format(path=output_dir))
+        raise typer.Exit(1) from e
+
+    app_context.console.print(
+        style(
+            cs.CLI_MSG_SHARDS_MERGED.format(
+                nodes=result.nodes,
+                relationships=result.relationships,
+                resolved=result.resolved_calls,
+                unresolved=result.unresolved_calls,
+            ),
+            cs.Color.GREEN,
+        )
+    )
+
+
+@app.command(name=ch.CLICommandName.DIFF_INDEX, help=ch.CMD_DIFF_INDEX)
+def diff_index_command(
+    input_proto_dir: str = typer.Option(
+        ..., "-i", "--input-proto-dir", help=ch.HELP_DIFF_NEW_DIR
+    ),
+    base_proto_dir: str | None = typer.Option(
+        None, "--base-proto-dir", help=ch.HELP_DIFF_BASE_DIR
+    ),
+    project_id: str | None = typer.Option(
+        None, "--project-id", help=ch.HELP_DIFF_PROJECT
+    ),
+    apply: bool = typer.Option(False, "--apply", help=ch.HELP_DIFF_APPLY),
+    batch_size: int | None = typer.Option(
+        None,
+        "--batch-size",
+        min=1,
+        help=ch.HELP_BATCH_SIZE,
+    ),
+) -> None:
+    if project_id is None and (apply or base_proto_dir is None):
+        app_context.console.print(style(cs.CLI_ERR_DIFF_REQUIRES_PROJECT, cs.Color.RED))
+        raise typer.Exit(1)
+    if apply and base_proto_dir is not None:
+        app_context.console.print(style(cs.CLI_ERR_DIFF_APPLY_WITH_BASE, cs.Color.RED))
+        raise typer.Exit(1)
+
+    index_dir = Path(input_proto_dir)
+    app_context.console.print(
+        style(
+            cs.CLI_MSG_DIFFING_INDEX.format(
+                path=index_dir, base=base_proto_dir or cs.CLI_MSG_DIFF_LIVE_GRAPH
+            ),
+            cs.Color.CYAN,
+        )
+    )
+
+    effective_batch_size = settings.resolve_batch_size(batch_size)
+
+    try:
+        new = snapshot_from_index(index_dir)
+        if base_proto_dir is not None:
+            diff = diff_snapshots(snapshot_from_index(Path(base_proto_dir)), new)
+        else:
+            with connect_memgraph(effective_batch_size) as ingestor:
+                old = snapshot_from_memgraph(ingestor, project_id=project_id)
+                diff = diff_snapshots(old, new)
+                if apply and not diff.is_empty:
+                    ingestor.ensure_constraints()
+                    ingestor.ensure_indexes()
+                    apply_graph_diff(ingestor, diff, project_id)
+    except Exception as e:
+        app_context.console.print(
+            style(cs.CLI_ERR_DIFF_INDEX.format(error=e), cs.Color.RED)
+        )
+        logger.exception(ls.GRAPH_DIFF_FAILED.format(path=index_dir))
+        raise typer.Exit(1) from e
+
+    app_context.console.print(
+        style(
+            cs.CLI_MSG_INDEX_DIFF.format(
+                added_nodes=len(diff.added_nodes),
+                updated_nodes=len(diff.updated_nodes),
+                removed_nodes=len(diff.removed_nodes),
+                added_rels=len(diff.added_relationships),
+                updated_rels=len(diff.updated_relationships),
+                removed_rels=len(diff.removed_relationships),
+            ),
+            cs.Color.GREEN,
+        )
+    )
+    if apply:
+        app_context.console.print(style(cs.CLI_MSG_DIFF_APPLIED, cs.Color.GREEN))
+
+
 @app.command(help=ch.CMD_OPTIMIZE)
 def optimize(
     language: str = typer.Argument(
@@ -357,12 +609,37 @@ def mcp_server() -> None:
 @app.command(name=ch.CLICommandName.GRAPH_LOADER, help=ch.CMD_GRAPH_LOADER)
 def graph_loader_command(
     graph_file: str = typer.Argument(..., help=ch.HELP_GRAPH_FILE),
+    lazy_properties: bool = typer.Option(
+        False, "--lazy-properties", help=ch.HELP_LAZY_PROPERTIES
+    ),
+    compact: bool = typer.Option(False, "--compact", help=ch.HELP_COMPACT_GRAPH),
+    write_snapshot: str | None = typer.Option(
+        None, "--write-snapshot", help=ch.HELP_WRITE_SNAPSHOT
+    ),
 ) -> None:
     from .graph_loader import load_graph
+    from .utils.dependencies import has_numpy
 
     try:
-        graph = load_graph(graph_file)
-        summary = graph.summary()
+        if compact or write_snapshot:
+            if not has_numpy():
+                raise RuntimeError(ex.NUMPY_MISSING)
+            from .graph_compact import load_compact_graph
+
+            compact_graph = load_compact_graph(graph_file)
+            if write_snapshot:
+                size = compact_graph.save_snapshot(Path(write_snapshot))
+                app_context.console.print(
+                    style(
+                        cs.CLI_MSG_GRAPH_SNAPSHOT_WRITTEN.format(
+                            path=write_snapshot, size=size
+                        ),
+                        cs.Color.GREEN,
+                    )
+                )
+            summary = compact_graph.summary()
+        else:
+            summary = load_graph(graph_file, lazy_properties).summary()
 
         app_context.console.print(style(cs.CLI_MSG_GRAPH_SUMMARY, cs.Color.GREEN))
         app_context.console.print(f"  Total nodes: {summary['total_nodes']}")
@@ -386,6 +663,183 @@ def graph_loader_command(
         raise typer.Exit(1) from e
 
 
+@app.command(name=ch.CLICommandName.VECTOR_INDEX, help=ch.CMD_VECTOR_INDEX)
+def vector_index_command(
+    benchmark_queries: int = typer.Option(
+        cs.IVF_BENCHMARK_DEFAULT_QUERIES,
+        "--benchmark-queries",
+        min=0,
+        help=ch.HELP_BENCHMARK_QUERIES,
+    ),
+    top_k: int = typer.Option(
+        cs.IVF_BENCHMARK_DEFAULT_TOP_K, "--top-k", min=1, help=ch.HELP_BENCHMARK_TOP_K
+    ),
+    nprobe: int | None = typer.Option(None, "--nprobe", min=1, help=ch.HELP_NPROBE),
+    n_lists: int | None = typer.Option(None, "--lists", min=1, help=ch.HELP_NLIST),
+    quantization: cs.VectorQuantization | None = typer.Option(
+        None, "--quantization", help=ch.HELP_QUANTIZATION
+    ),
+    project_id: str | None = typer.Option(
+        None, "--project-id", help=ch.HELP_VECTOR_INDEX_PROJECT
+    ),
+) -> None:
+    from .utils.dependencies import has_qdrant_client
+
+    if not has_qdrant_client():
+        app_context.console.print(style(ex.SEMANTIC_EXTRA, cs.Color.RED))
+        raise typer.Exit(1)
+
+    from .vector_store import build_ivf_index, collection_name_for, ivf_index_path
+
+    app_context.console.print(style(cs.CLI_MSG_BUILDING_VECTOR_INDEX, cs.Color.CYAN))
+    try:
+        index = build_ivf_index(n_lists, quantization, project_id)
+    except Exception as e:
+        app_context.console.print(
+            style(cs.CLI_ERR_VECTOR_INDEX.format(error=e), cs.Color.RED)
+        )
+        raise typer.Exit(1) from e
+
+    if index is None:
+        app_context.console.print(style(cs.CLI_MSG_VECTOR_INDEX_EMPTY, cs.Color.YELLOW))
+        return
+
+    app_context.console.print(
+        style(
+            cs.CLI_MSG_VECTOR_INDEX_BUILT.format(
+                vectors=len(index),
+                lists=index.n_lists,
+                path=ivf_index_path(collection_name_for(project_id)),
+            ),
+            cs.Color.GREEN,
+        )
+    )
+    if benchmark_queries:
+        report = index.benchmark(
+            benchmark_queries,
+            top_k,
+            nprobe or settings.IVF_NPROBE,
+            settings.QUANTIZATION_RERANK_FACTOR,
+        )
+        app_context.console.print(
+            style(
+                cs.CLI_MSG_VECTOR_INDEX_REPORT.format(
+                    queries=report["num_queries"],
+                    top_k=report["top_k"],
+                    nprobe=report["nprobe"],
+                    recall=report["recall_at_k"],
+                    ivf_p50=report["ivf_p50_ms"],
+                    ivf_p95=report["ivf_p95_ms"],
+                    exact_p50=report["exact_p50_ms"],
+                    exact_p95=report["exact_p95_ms"],
+                ),
+                cs.Color.CYAN,
+            )
+        )
+        app_context.console.print(
+            style(
+                cs.CLI_MSG_VECTOR_INDEX_MEMORY.format(
+                    quantization=report["quantization"],
+                    vector_mb=report["vector_bytes"] / cs.BYTES_PER_MB,
+                    code_mb=report["code_bytes"] / cs.BYTES_PER_MB,
+                ),
+                cs.Color.CYAN,
+            )
+        )
+
+
+@app.command(name=ch.CLICommandName.GRAPH_INDEX, help=ch.CMD_GRAPH_INDEX)
+def graph_index_command(
+    benchmark_nodes: int = typer.Option(
+        0, "--benchmark-nodes", min=0, help=ch.HELP_INDEX_BENCHMARK_NODES
+    ),
+    benchmark_queries: int = typer.Option(
+        cs.INDEX_BENCHMARK_DEFAULT_QUERIES,
+        "--benchmark-queries",
+        min=1,
+        help=ch.HELP_INDEX_BENCHMARK_QUERIES,
+    ),
+    benchmark_storage: bool = typer.Option(
+        False, "--benchmark-storage-modes", help=ch.HELP_STORAGE_BENCHMARK
+    ),
+    batch_size: int | None = typer.Option(
+        None,
+        "--batch-size",
+        min=1,
+        help=ch.HELP_BATCH_SIZE,
+    ),
+) -> None:
+    from .graph_benchmark import benchmark_index_impact, benchmark_storage_modes
+
+    effective_batch_size = settings.resolve_batch_size(batch_size)
+    app_context.console.print(style(cs.CLI_MSG_ENSURING_GRAPH_INDEXES, cs.Color.CYAN))
+    try:
+        with connect_memgraph(effective_batch_size) as ingestor:
+            ingestor.ensure_constraints()
+            created = ingestor.ensure_indexes()
+            app_context.console.print(
+                style(
+                    cs.CLI_MSG_GRAPH_INDEXES_DONE.format(
+                        created=created, total=len(cs.NODE_PROPERTY_INDEXES)
+                    ),
+                    cs.Color.GREEN,
+                )
+            )
+            if not benchmark_nodes:
+                return
+
+            app_context.console.print(
+                style(
+                    cs.CLI_MSG_GRAPH_INDEX_BENCHMARK.format(
+                        nodes=benchmark_nodes, queries=benchmark_queries
+                    ),
+                    cs.Color.CYAN,
+                )
+            )
+            report = benchmark_index_impact(
+                ingestor, benchmark_nodes, benchmark_queries
+            )
+            results = [
+                (cs.GRAPH_INDEX_MODE_WITHOUT, report["without_indexes"]),
+                (cs.GRAPH_INDEX_MODE_WITH, report["with_indexes"]),
+            ]
+            if benchmark_storage:
+                app_context.console.print(
+                    style(
+                        cs.CLI_MSG_GRAPH_STORAGE_BENCHMARK.format(
+                            nodes=benchmark_nodes
+                        ),
+                        cs.Color.CYAN,
+                    )
+                )
+                storage = benchmark_storage_modes(
+                    ingestor, benchmark_nodes, benchmark_queries
+                )
+                results += [
+                    (cs.STORAGE_MODE_TRANSACTIONAL, storage["transactional"]),
+                    (cs.STORAGE_MODE_ANALYTICAL, storage["analytical"]),
+                ]
+    except Exception as e:
+        app_context.console.print(
+            style(cs.CLI_ERR_GRAPH_INDEX.format(error=e), cs.Color.RED)
+        )
+        raise typer.Exit(1) from e
+
+    for mode, result in results:
+        app_context.console.print(
+            style(
+                cs.CLI_MSG_GRAPH_INDEX_REPORT.format(
+                    mode=mode,
+                    flush_s=result["flush_seconds"],
+                    rate=result["rows_per_second"],
+                    p50=result["lookup_p50_ms"],
+                    p95=result["lookup_p95_ms"],
+                ),
+                cs.Color.CYAN,
+            )
+        )
+
+
 @app.command(
     name=ch.CLICommandName.LANGUAGE,
     help=ch.CMD_LANGUAGE,
@@ -9,6 +9,11 @@ class CLICommandName(StrEnum):
     MCP_SERVER = "mcp-server"
     GRAPH_LOADER = "graph-loader"
     LANGUAGE = "language"
+    VECTOR_INDEX = "vector-index"
+    GRAPH_INDEX = "graph-index"
+    LOAD_PROTO = "load-proto"
+    MERGE_INDEX = "merge-index"
+    DIFF_INDEX = "diff-index"
 
 
 APP_DESCRIPTION = (
@@ -19,11 +24,28 @@ APP_DESCRIPTION = (
 
 CMD_START = "Start interactive chat session with your codebase"
 CMD_INDEX = "Index codebase to protobuf files for offline use"
-CMD_EXPORT = "Export knowledge graph from Memgraph to JSON file"
+CMD_EXPORT = "Export knowledge graph from Memgraph to JSON, Parquet or Arrow files"
 CMD_OPTIMIZE = "AI-guided codebase optimization session"
 CMD_MCP_SERVER = "Start the MCP server for Claude Code integration"
 CMD_GRAPH_LOADER = "Load and display summary of exported graph JSON"
 CMD_LANGUAGE = "Manage language grammars (add, remove, list)"
+CMD_VECTOR_INDEX = (
+    "Build the IVF approximate nearest-neighbour index and report recall/latency"
+)
+CMD_GRAPH_INDEX = (
+    "Create missing Memgraph label/property indexes and optionally benchmark them"
+)
+
+CMD_LOAD_PROTO = (
+    "Load a protobuf index written by `index` into Memgraph (v1 or v2, joint or split)"
+)
+CMD_MERGE_INDEX = (
+    "Merge protobuf index shards into one index, resolving cross-shard calls"
+)
+CMD_DIFF_INDEX = (
+    "Diff a protobuf index against another index or the live graph and "
+    "optionally apply the changes to Memgraph"
+)
 
 CMD_LANGUAGE_GROUP = "CLI for managing language grammars"
 CMD_LANGUAGE_ADD = "Add a new language grammar to the project."
@@ -57,12 +79,77 @@ HELP_OUTPUT_PROTO_DIR = (
     "Required. Path to the output directory for the protobuf index file(s)."
 )
 HELP_SPLIT_INDEX = "Write index to separate nodes.bin and relationships.bin files."
+HELP_PROTO_SCHEMA_VERSION = (
+    "Index schema: v1 (GraphCodeIndex) or v2 (string table, integer node ids; "
+    "always streamed to index.v2.bin)."
+)
+HELP_OFFSET_TABLE = (
+    "Also write index.offsets, an offset table for mmap-based random access "
+    "to single nodes and their relationships."
+)
+HELP_SHARD_INDEX = (
+    "Write a shard for `merge-index`: streamed v1 records plus the call sites "
+    "that could not be resolved inside this shard. Index the repository root "
+    "with --exclude per shard so qualified names match across shards."
+)
+HELP_SHARD_DIRS = "Shard directories written by `index --shard`"
+HELP_MERGE_OUTPUT_DIR = "Directory to write the merged protobuf index to"
+HELP_DIFF_NEW_DIR = "Directory containing the new protobuf index"
+HELP_DIFF_BASE_DIR = (
+    "Directory containing the previous protobuf index (default: diff against "
+    "the live graph in Memgraph; cannot be combined with --apply)"
+)
+HELP_DIFF_PROJECT = (
+    "Project id of the index: scopes the live graph snapshot and is stamped on "
+    "every node written by --apply (required unless diffing two indexes)"
+)
+HELP_DIFF_APPLY = (
+    "Apply the insertions, updates and deletions to Memgraph as batched writes; "
+    "the diff is always taken against the live graph (default: only print the "
+    "summary)"
+)
+HELP_STREAM_INDEX = (
+    "Write length-delimited records to disk as they are produced "
+    "(bounded memory for very large repositories)."
+)
+HELP_PROTO_INPUT_DIR = "Directory containing the protobuf index files to load"
+HELP_LOAD_PROTO_PROJECT = (
+    "Project id to stamp on every loaded node, so project-scoped queries, "
+    "exports and deletes can find them"
+)
+HELP_BULK_LOAD = (
+    "Stage records on disk grouped by label and relationship pattern and import "
+    "them in large batches when the database is empty (batched MERGE otherwise)."
+)
 HELP_FORMAT_JSON = "Export in JSON format"
+HELP_EXPORT_FORMAT = (
+    "Export layout: a JSON document, JSON Lines, or a directory of per-label "
+    "Parquet/Arrow tables (default: from file suffix)"
+)
+HELP_EXPORT_COMPRESSION = (
+    "Compress the export with gzip or zstd (default: from file suffix; "
+    "zstd for Parquet)"
+)
+HELP_EXPORT_PROJECT = "Only export nodes and relationships of this project id"
 HELP_LANGUAGE_ARG = (
     "Programming language to optimize for (e.g., python, java, javascript, cpp)"
 )
 HELP_REFERENCE_DOC = "Path to reference document/book for optimization guidance"
-HELP_GRAPH_FILE = "Path to the exported graph JSON file"
+HELP_GRAPH_FILE = (
+    "Path to the exported graph (JSON or JSON Lines, optionally gzip/zstd "
+    "compressed, or a Parquet/Arrow directory)"
+)
+HELP_LAZY_PROPERTIES = (
+    "Keep node properties as compact JSON and decode them on access "
+    "(lower memory for large exports)"
+)
+HELP_COMPACT_GRAPH = (
+    "Load into the compact CSR/columnar representation (also reads snapshots "
+    "written with --write-snapshot)"
+)
+HELP_WRITE_SNAPSHOT = (
+    "Write a binary snapshot of the compact graph that later loads via mmap"
+)
 HELP_EXPORTED_GRAPH_FILE = "Path to the exported_graph.json file."
 
 HELP_GRAMMAR_URL = (
@@ -71,6 +158,29 @@ HELP_GRAMMAR_URL = (
 )
 HELP_KEEP_SUBMODULE = "Keep the git submodule (default: remove it)"
 
+HELP_BENCHMARK_QUERIES = (
+    "Number of sampled queries used to measure recall@k and latency (0 to skip)"
+)
+HELP_BENCHMARK_TOP_K = "Number of neighbours (k) used for the recall@k benchmark"
+HELP_NPROBE = "Number of inverted lists probed per query (defaults to IVF_NPROBE)"
+HELP_NLIST = "Number of k-means lists (defaults to IVF_NLIST or 4*sqrt(N))"
+HELP_QUANTIZATION = (
+    "Vector codes searched before exact rerank: none, int8 or binary "
+    "(defaults to VECTOR_QUANTIZATION)"
+)
+HELP_VECTOR_INDEX_PROJECT = (
+    "Build the index of this project's collection when "
+    "QDRANT_COLLECTION_PER_PROJECT is set"
+)
+HELP_INDEX_BENCHMARK_NODES = (
+    "Number of synthetic Function nodes written with and without indexes "
+    "(0 to skip; temporarily drops the indexes)"
+)
+HELP_INDEX_BENCHMARK_QUERIES = "Number of point lookups timed in each benchmark pass"
+HELP_STORAGE_BENCHMARK = (
+    "Also time the benchmark load in transactional and analytical storage modes"
+)
+
 HELP_EXCLUDE_PATTERNS = (
     "Additional directories to exclude from indexing. Can be specified multiple times."
 )
@@ -87,4 +197,9 @@ CLI_COMMANDS: dict[CLICommandName, str] = {
     CLICommandName.MCP_SERVER: CMD_MCP_SERVER,
     CLICommandName.GRAPH_LOADER: CMD_GRAPH_LOADER,
     CLICommandName.LANGUAGE: CMD_LANGUAGE,
+    CLICommandName.VECTOR_INDEX: CMD_VECTOR_INDEX,
+    CLICommandName.GRAPH_INDEX: CMD_GRAPH_INDEX,
+    CLICommandName.LOAD_PROTO: CMD_LOAD_PROTO,
+    CLICommandName.MERGE_INDEX: CMD_MERGE_INDEX,
+    CLICommandName.DIFF_INDEX: CMD_DIFF_INDEX,
 }
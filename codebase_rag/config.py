@@ -52,6 +52,22 @@ class AppConfig(BaseSettings):
     MEMGRAPH_HTTP_PORT: int = 7444
     LAB_PORT: int = 3000
     MEMGRAPH_BATCH_SIZE: int = 1000
+    MEMGRAPH_WRITER_QUEUE_SIZE: int = 4
+    MEMGRAPH_COUNT_DUPLICATE_RELATIONSHIPS: bool = False
+    MEMGRAPH_ADAPTIVE_BATCHING: bool = True
+    MEMGRAPH_BATCH_MIN_SIZE: int = 50
+    MEMGRAPH_BATCH_MAX_SIZE: int = 20000
+    MEMGRAPH_BATCH_TARGET_SECONDS: float = 0.5
+    MEMGRAPH_NODE_ID_CACHE_SIZE: int = 200_000
+    MEMGRAPH_ANALYTICAL_STORAGE: bool = False
+    MEMGRAPH_DELETE_BATCH_SIZE: int = 10000
+    MEMGRAPH_REINDEX_IN_PLACE: bool = True
+    MEMGRAPH_FETCH_CHUNK_SIZE: int = 1000
+    MEMGRAPH_FETCH_MAX_ROWS: int | None = None
+    MEMGRAPH_EXPORT_PAGE_SIZE: int = 50000
+    MEMGRAPH_BULK_LOAD: bool = True
+    MEMGRAPH_BULK_BATCH_SIZE: int = 50000
+    MEMGRAPH_BULK_STAGING_DIR: str | None = None
     AGENT_RETRIES: int = 3
     ORCHESTRATOR_OUTPUT_RETRIES: int = 100
 
@@ -143,11 +159,31 @@ class AppConfig(BaseSettings):
     )
 
     QDRANT_DB_PATH: str = "./.qdrant_code_embeddings"
+    QDRANT_URL: str | None = None
     QDRANT_COLLECTION_NAME: str = "code_embeddings"
+    QDRANT_COLLECTION_PER_PROJECT: bool = False
     QDRANT_VECTOR_DIM: int = 768
     QDRANT_TOP_K: int = 5
     EMBEDDING_MAX_LENGTH: int = 512
     EMBEDDING_PROGRESS_INTERVAL: int = 10
+    EMBEDDING_WARMUP: bool = True
+    QUERY_EMBEDDING_CACHE_SIZE: int = 256
+    QUERY_EMBEDDING_CACHE_TTL_SECONDS: float = 3600.0
+    QUERY_MAX_ROWS: int | None = 1000
+
+    IVF_INDEX_PATH: str = "./.qdrant_code_embeddings_ivf"
+    IVF_INDEX_MIN_VECTORS: int = 100_000
+    IVF_NLIST: int | None = None
+    IVF_NPROBE: int = 16
+    IVF_KMEANS_ITERATIONS: int = 20
+    IVF_TRAIN_SAMPLE_SIZE: int = 200_000
+
+    VECTOR_QUANTIZATION: cs.VectorQuantization = cs.VectorQuantization.NONE
+    QUANTIZATION_RERANK_FACTOR: float = 4.0
+
+    LEXICAL_INDEX_PATH: str = "./.code_lexical_index.json"
+    HYBRID_RRF_K: int = 60
+    HYBRID_CANDIDATE_MULTIPLIER: int = 4
 
     CACHE_MAX_ENTRIES: int = 1000
     CACHE_MAX_MEMORY_MB: int = 500
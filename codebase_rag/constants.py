@@ -146,10 +146,14 @@ V1_PATH = "/v1"
 HTTP_OK = 200
 
 UNIXCODER_MODEL = "microsoft/unixcoder-base"
+EMBEDDING_WARMUP_THREAD_NAME = "embedding-model-warmup"
 
 KEY_NODES = "nodes"
 KEY_RELATIONSHIPS = "relationships"
 KEY_NODE_ID = "node_id"
+KEY_DELETED = "deleted"
+KEY_LIMIT = "limit"
+KEY_ID = "id"
 KEY_LABELS = "labels"
 KEY_PROPERTIES = "properties"
 KEY_FROM_ID = "from_id"
@@ -173,6 +177,7 @@ KEY_MODULE_TYPE = "module_type"
 KEY_IMPLEMENTS_MODULE = "implements_module"
 KEY_PROPS = "props"
 KEY_CREATED = "created"
+KEY_COUNT = "count"
 KEY_FROM_VAL = "from_val"
 KEY_TO_VAL = "to_val"
 KEY_VERSION_SPEC = "version_spec"
@@ -193,6 +198,45 @@ PROTOBUF_INDEX_FILE = "index.bin"
 PROTOBUF_NODES_FILE = "nodes.bin"
 PROTOBUF_RELS_FILE = "relationships.bin"
 
+# (H) Streaming protobuf records (GraphCodeIndex wire format, one field per record)
+PROTOBUF_FIELD_NODES = 1
+PROTOBUF_FIELD_RELATIONSHIPS = 2
+PROTOBUF_FIELD_UNRESOLVED_CALLS = 3
+PROTOBUF_WIRE_TYPE_LEN = 2
+PROTOBUF_STREAM_BUFFER_BYTES = 1 << 20
+PROTOBUF_SEEN_DIGEST_BYTES = 8
+PROTOBUF_KEY_SEPARATOR = "\x00"
+PROTOBUF_NODE_ONEOF = "payload"
+PROTOBUF_REL_PROPERTIES_FIELD = "properties"
+
+# (H) Protobuf offset table (mmap random access next to v1 records)
+PROTOBUF_OFFSETS_FILE = "index.offsets"
+PROTOBUF_OFFSETS_MAGIC = b"CGROFF01"
+PROTOBUF_OFFSETS_HEADER_FORMAT = "<8sIIIII"
+PROTOBUF_OFFSETS_NAME_FORMAT = "<H"
+PROTOBUF_OFFSETS_SLOT_FORMAT = "<QI"
+PROTOBUF_OFFSETS_NODE_FORMAT = "<QIBQIIIII"
+PROTOBUF_OFFSETS_REL_FORMAT = "<BQI"
+PROTOBUF_OFFSETS_ADJACENCY_FORMAT = "<I"
+PROTOBUF_OFFSETS_SLOTS_PER_NODE = 2
+
+
+# (H) Protobuf index v2 (string table, integer node ids, enum labels)
+class ProtobufSchemaVersion(StrEnum):
+    V1 = "v1"
+    V2 = "v2"
+
+
+PROTOBUF_V2_INDEX_FILE = "index.v2.bin"
+PROTOBUF_V2_NODES_FILE = "nodes.v2.bin"
+PROTOBUF_V2_RELS_FILE = "relationships.v2.bin"
+PROTOBUF_V2_FIELD_STRINGS = 1
+PROTOBUF_V2_FIELD_NODES = 2
+PROTOBUF_V2_FIELD_RELATIONSHIPS = 3
+PROTOBUF_V2_PROPERTY_ONEOF = "value"
+PROTOBUF_V2_STRING_REF = "string_ref"
+PROTOBUF_V2_STRING_LIST = "string_list"
+
 # (H) Protobuf oneof field names
 ONEOF_PROJECT = "project"
 ONEOF_PACKAGE = "package"
@@ -216,6 +260,20 @@ CLI_ERR_CONFIG = "Configuration Error: {error}"
 CLI_ERR_INDEXING = "An error occurred during indexing: {error}"
 CLI_ERR_EXPORT_FAILED = "Failed to export graph: {error}"
 CLI_ERR_LOAD_GRAPH = "Failed to load graph: {error}"
+CLI_ERR_LOAD_PROTO = "Failed to load protobuf index: {error}"
+CLI_ERR_SHARD_V1_ONLY = "Error: --shard is only supported with --schema-version v1."
+CLI_ERR_MERGE_INDEX = "Failed to merge index shards: {error}"
+CLI_ERR_DIFF_INDEX = "Failed to diff protobuf index: {error}"
+CLI_ERR_DIFF_REQUIRES_PROJECT = (
+    "Error: --project-id is required to diff against the live graph or to --apply."
+)
+CLI_ERR_DIFF_APPLY_WITH_BASE = (
+    "Error: --apply writes to the live graph, so it cannot be combined with "
+    "--base-proto-dir; diff against the live graph instead."
+)
+CLI_ERR_OFFSET_TABLE_V1_ONLY = (
+    "Error: --offset-table is only supported with --schema-version v1."
+)
 CLI_ERR_MCP_SERVER = "MCP Server Error: {error}"
 
 CLI_MSG_UPDATING_GRAPH = "Updating knowledge graph for: {path}"
@@ -228,12 +286,67 @@ CLI_MSG_OUTPUT_TO = "Output will be written to: {path}"
 CLI_MSG_INDEXING_DONE = "Indexing process completed successfully!"
 CLI_MSG_CONNECTING_MEMGRAPH = "Connecting to Memgraph to export graph..."
 CLI_MSG_EXPORTING_DATA = "Exporting graph data..."
+CLI_MSG_MERGING_SHARDS = "Merging {count} index shards into: {path}"
+CLI_MSG_SHARDS_MERGED = (
+    "Merged {nodes} nodes and {relationships} relationships; "
+    "resolved {resolved} cross-shard calls ({unresolved} left unresolved)"
+)
+CLI_MSG_DIFFING_INDEX = "Diffing protobuf index {path} against {base}..."
+CLI_MSG_DIFF_LIVE_GRAPH = "the live graph"
+CLI_MSG_INDEX_DIFF = (
+    "Nodes: {added_nodes} added, {updated_nodes} updated, {removed_nodes} removed; "
+    "relationships: {added_rels} added, {updated_rels} updated, "
+    "{removed_rels} removed"
+)
+CLI_MSG_DIFF_APPLIED = "Applied the diff to Memgraph"
+CLI_MSG_GRAPH_SNAPSHOT_WRITTEN = "Wrote compact graph snapshot to {path} ({size} bytes)"
+CLI_MSG_LOADING_PROTO = "Loading protobuf index from {path} into Memgraph..."
+CLI_MSG_PROTO_LOADED = (
+    "Loaded {nodes} nodes and {relationships} relationships "
+    "({version} index, {skipped} records skipped)"
+)
 CLI_MSG_OPTIMIZATION_TERMINATED = "\nOptimization session terminated by user."
 CLI_MSG_MCP_TERMINATED = "\nMCP server terminated by user."
 CLI_MSG_HINT_TARGET_REPO = (
     "\nHint: Make sure TARGET_REPO_PATH environment variable is set."
 )
 CLI_MSG_GRAPH_SUMMARY = "Graph Summary:"
+CLI_MSG_BUILDING_VECTOR_INDEX = (
+    "Building IVF vector index from the embeddings collection..."
+)
+CLI_MSG_VECTOR_INDEX_EMPTY = "No embeddings found; nothing to index."
+CLI_MSG_VECTOR_INDEX_BUILT = (
+    "IVF index built: {vectors} vectors in {lists} lists, saved to {path}"
+)
+CLI_MSG_VECTOR_INDEX_REPORT = (
+    "Benchmark ({queries} queries, top_k={top_k}, nprobe={nprobe}): "
+    "recall@k={recall:.3f}, IVF p50={ivf_p50:.2f}ms p95={ivf_p95:.2f}ms, "
+    "exact p50={exact_p50:.2f}ms p95={exact_p95:.2f}ms"
+)
+CLI_MSG_VECTOR_INDEX_MEMORY = (
+    "Memory ({quantization}): full vectors {vector_mb:.1f} MB (kept in Qdrant "
+    "when quantized), search codes {code_mb:.1f} MB in RAM"
+)
+CLI_ERR_VECTOR_INDEX = "Failed to build vector index: {error}"
+CLI_MSG_ENSURING_GRAPH_INDEXES = "Ensuring Memgraph label/property indexes..."
+CLI_MSG_GRAPH_INDEXES_DONE = (
+    "Graph indexes ready: {created} created, {total} label/property pairs covered"
+)
+CLI_MSG_GRAPH_INDEX_BENCHMARK = (
+    "Benchmarking {nodes} synthetic functions and {queries} lookups "
+    "with and without indexes..."
+)
+CLI_MSG_GRAPH_INDEX_REPORT = (
+    "{mode}: flush {flush_s:.2f}s ({rate:.0f} rows/s), "
+    "lookup p50={p50:.2f}ms p95={p95:.2f}ms"
+)
+CLI_ERR_GRAPH_INDEX = "Failed to manage graph indexes: {error}"
+GRAPH_INDEX_MODE_WITHOUT = "without indexes"
+GRAPH_INDEX_MODE_WITH = "with indexes"
+CLI_MSG_GRAPH_STORAGE_BENCHMARK = (
+    "Benchmarking {nodes} synthetic functions in transactional and analytical "
+    "storage modes..."
+)
 CLI_MSG_AUTO_EXCLUDE = (
     "Auto-excluding common directories (venv, node_modules, .git, etc.). "
     "Use --interactive-setup to customize."
@@ -387,6 +500,7 @@ BYTES_PER_MB = 1024 * 1024
 KEY_PARAMETERS = "parameters"
 KEY_DECORATORS = "decorators"
 KEY_DOCSTRING = "docstring"
+KEY_LABEL = "label"
 KEY_IS_EXPORTED = "is_exported"
 
 # (H) Method signature formatting
@@ -415,13 +529,23 @@ CYPHER_DEFAULT_LIMIT = 50
 
 CYPHER_QUERY_EMBEDDINGS = """
 MATCH (m:Module)-[:DEFINES]->(n)
-WHERE n:Function OR n:Method
+WHERE (n:Function OR n:Method) AND n.project_id = $project_id
 RETURN id(n) AS node_id, n.qualified_name AS qualified_name,
        n.start_line AS start_line, n.end_line AS end_line,
-       m.path AS path
+       m.path AS path, n.project_id AS project_id, labels(n) AS type
 ORDER BY n.qualified_name
 """
 
+CYPHER_QUERY_LEXICAL_INDEX = """
+MATCH (n {project_id: $project_id})
+WHERE n:Function OR n:Method OR n:Class
+OPTIONAL MATCH (m:Module)-[:DEFINES|DEFINES_METHOD*1..2]->(n)
+WITH n, head(collect(m.path)) AS path
+RETURN id(n) AS node_id, n.qualified_name AS qualified_name,
+       n.name AS name, n.docstring AS docstring, labels(n) AS type,
+       n.project_id AS project_id, path
+"""
+
 
 class SupportedLanguage(StrEnum):
     PYTHON = "python"
@@ -829,6 +953,145 @@ IGNORE_SUFFIXES = frozenset(
 
 PAYLOAD_NODE_ID = "node_id"
 PAYLOAD_QUALIFIED_NAME = "qualified_name"
+PAYLOAD_PROJECT_ID = "project_id"
+PAYLOAD_LABEL = "label"
+PAYLOAD_MODULE_PATH = "module_path"
+PAYLOAD_PATH_PREFIXES = "path_prefixes"
+PAYLOAD_INDEXED_FIELDS = (PAYLOAD_PROJECT_ID, PAYLOAD_LABEL, PAYLOAD_PATH_PREFIXES)
+QDRANT_COLLECTION_SEPARATOR = "__"
+QDRANT_COLLECTION_NAME_PATTERN = r"[^A-Za-z0-9_-]"
+
+# (H) IVF vector index constants
+IVF_CENTROIDS_FILE = "centroids.npy"
+IVF_OFFSETS_FILE = "offsets.npy"
+IVF_IDS_FILE = "ids.npy"
+IVF_VECTORS_FILE = "vectors.npy"
+IVF_META_FILE = "meta.json"
+IVF_TMP_SUFFIX = ".tmp"
+IVF_META_NUM_VECTORS = "num_vectors"
+IVF_META_N_LISTS = "n_lists"
+IVF_META_DIM = "dim"
+IVF_LISTS_PER_SQRT_N = 4
+IVF_ASSIGN_CHUNK_SIZE = 65536
+IVF_SCROLL_BATCH_SIZE = 2048
+IVF_KMEANS_SEED = 0
+IVF_BENCHMARK_NOISE = 0.05
+IVF_BENCHMARK_DEFAULT_QUERIES = 200
+IVF_BENCHMARK_DEFAULT_TOP_K = 10
+IVF_LATENCY_PERCENTILE = 95
+IVF_CODES_FILE = "codes.npy"
+IVF_SCALE_FILE = "scale.npy"
+IVF_META_QUANTIZATION = "quantization"
+IVF_META_ATTRIBUTES = "attributes"
+IVF_META_WRITE_GENERATION = "write_generation"
+IVF_WRITES_SUFFIX = ".writes"
+IVF_ATTRIBUTE_FILE = "attr_{field}.npy"
+IVF_FILTER_FIELDS = (PAYLOAD_PROJECT_ID, PAYLOAD_LABEL, PAYLOAD_MODULE_PATH)
+INT8_MAX = 127
+BITS_PER_BYTE = 8
+QDRANT_INT8_QUANTILE = 0.99
+MS_PER_SECOND = 1000.0
+
+
+class VectorQuantization(StrEnum):
+    NONE = "none"
+    INT8 = "int8"
+    BINARY = "binary"
+
+
+# (H) Streaming graph export
+class ExportFormat(StrEnum):
+    JSON = "json"
+    JSONL = "jsonl"
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
+class ExportCompression(StrEnum):
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+EXPORT_COMPRESSION_SUFFIXES = {
+    ".gz": ExportCompression.GZIP,
+    ".zst": ExportCompression.ZSTD,
+}
+EXPORT_JSONL_SUFFIX = ".jsonl"
+EXPORT_JSON_SEPARATORS = (",", ":")
+EXPORT_KEY_KIND = "kind"
+EXPORT_KIND_NODE = "node"
+EXPORT_KIND_RELATIONSHIP = "relationship"
+EXPORT_KIND_METADATA = "metadata"
+GRAPH_STREAM_CHUNK_CHARS = 1 << 20
+GRAPH_STREAM_MAX_VALUE_CHARS = 1 << 26
+
+# (H) Columnar (Parquet / Arrow IPC) export
+COLUMNAR_FORMATS = (ExportFormat.PARQUET, ExportFormat.ARROW)
+COLUMNAR_SUFFIXES = {
+    ".parquet": ExportFormat.PARQUET,
+    ".arrow": ExportFormat.ARROW,
+}
+COLUMNAR_DEFAULT_COMPRESSION = {
+    ExportFormat.PARQUET: ExportCompression.ZSTD,
+    ExportFormat.ARROW: ExportCompression.NONE,
+}
+COLUMNAR_MANIFEST = "manifest.json"
+COLUMNAR_NODES_DIR = "nodes"
+COLUMNAR_RELATIONSHIPS_DIR = "relationships"
+COLUMNAR_ROW_GROUP_SIZE = 65536
+COLUMNAR_EXTRA_COLUMN = "extra_properties"
+COLUMNAR_DICTIONARY_COLUMNS = frozenset({KEY_QUALIFIED_NAME, KEY_PROJECT_ID, KEY_PATH})
+COLUMNAR_KEY_FORMAT = "format"
+COLUMNAR_KEY_TABLES = "tables"
+
+
+# (H) Compact (CSR) graph loader and binary snapshot
+class CompactColumnKind(StrEnum):
+    INT = "int"
+    FLOAT = "float"
+    BOOL = "bool"
+    STR = "str"
+    JSON = "json"
+
+
+COMPACT_SNAPSHOT_MAGIC = b"CGRSNAP1"
+COMPACT_SNAPSHOT_HEADER_FORMAT = "<8sQ"
+COMPACT_SNAPSHOT_ALIGNMENT = 8
+COMPACT_KEY_METADATA = "metadata"
+COMPACT_KEY_LABELS = "labels"
+COMPACT_KEY_TYPES = "types"
+COMPACT_KEY_ARRAYS = "arrays"
+COMPACT_KEY_NODE_COLUMNS = "node_columns"
+COMPACT_KEY_REL_COLUMNS = "rel_columns"
+COMPACT_NODE_COLUMN_PREFIX = "node"
+COMPACT_REL_COLUMN_PREFIX = "rel"
+COMPACT_COLUMN_ROWS = "rows"
+COMPACT_COLUMN_VALUES = "values"
+COMPACT_COLUMN_DATA = "data"
+
+
+# (H) Lexical (BM25) index constants
+LEXICAL_BM25_K1 = 1.2
+LEXICAL_BM25_B = 0.75
+LEXICAL_NAME_WEIGHT = 3
+LEXICAL_QN_WEIGHT = 1
+LEXICAL_DOC_WEIGHT = 1
+LEXICAL_EXACT_MATCH_SCORE = 1.0
+LEXICAL_TMP_SUFFIX = ".tmp"
+LEXICAL_PROJECT_SEPARATOR = "__"
+LEXICAL_KEY_DOCS = "docs"
+LEXICAL_KEY_POSTINGS = "postings"
+LEXICAL_KEY_DOC_LENGTHS = "doc_lengths"
+LEXICAL_WORD_PATTERN = r"[A-Za-z0-9_]+"
+LEXICAL_SUBTOKEN_PATTERN = r"[A-Z]+(?=[A-Z][a-z0-9])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+"
+
+
+class SearchScoreType(StrEnum):
+    EXACT = "exact"
+    HYBRID = "hybrid"
+    LEXICAL = "lexical"
+    VECTOR = "vector"
 
 
 class EventType(StrEnum):
@@ -930,6 +1193,9 @@ TEXT_UNKNOWN = "unknown"
 MODULE_TORCH = "torch"
 MODULE_TRANSFORMERS = "transformers"
 MODULE_QDRANT_CLIENT = "qdrant_client"
+MODULE_ZSTANDARD = "zstandard"
+MODULE_PYARROW = "pyarrow"
+MODULE_NUMPY = "numpy"
 
 SEMANTIC_DEPENDENCIES = (MODULE_QDRANT_CLIENT, MODULE_TORCH, MODULE_TRANSFORMERS)
 ML_DEPENDENCIES = (MODULE_TORCH, MODULE_TRANSFORMERS)
@@ -951,6 +1217,53 @@ NODE_UNIQUE_CONSTRAINTS: dict[str, str] = {
     label.value: key.value for label, key in _NODE_LABEL_UNIQUE_KEYS.items()
 }
 
+# (H) Memgraph label/property indexes
+NODE_PROPERTY_INDEXES: tuple[tuple[str, str], ...] = tuple(
+    (label, prop)
+    for label, key in NODE_UNIQUE_CONSTRAINTS.items()
+    for prop in dict.fromkeys((key, KEY_PROJECT_ID))
+)
+INDEX_INFO_LABEL = "label"
+INDEX_INFO_PROPERTY = "property"
+INDEX_BENCHMARK_PROJECT_ID = "__cgr_index_benchmark__"
+INDEX_BENCHMARK_MODULE = "bench_module"
+INDEX_BENCHMARK_FUNCTION = "bench_fn"
+INDEX_BENCHMARK_FUNCTIONS_PER_MODULE = 50
+INDEX_BENCHMARK_CALLS_PER_FUNCTION = 2
+INDEX_BENCHMARK_DEFAULT_NODES = 5000
+INDEX_BENCHMARK_DEFAULT_QUERIES = 200
+INDEX_BENCHMARK_SEED = 0
+
+# (H) Memgraph storage modes
+STORAGE_MODE_TRANSACTIONAL = "IN_MEMORY_TRANSACTIONAL"
+STORAGE_MODE_ANALYTICAL = "IN_MEMORY_ANALYTICAL"
+STORAGE_INFO_KEY = "storage info"
+STORAGE_INFO_VALUE = "value"
+STORAGE_INFO_MODE = "storage_mode"
+
+# (H) Memgraph background writer
+WRITER_THREAD_NAME = "memgraph-writer"
+
+# (H) Memgraph in-place re-index generations
+KEY_GENERATION = "generation"
+KEY_NODE_IDS = "node_ids"
+GENERATION_SWEEP_THREAD_NAME = "memgraph-generation-sweep"
+
+# (H) Graph diff
+DIFF_IGNORED_REL_PROPERTIES = frozenset({KEY_GENERATION, KEY_COUNT})
+
+# (H) Memgraph adaptive batch sizing
+ADAPTIVE_BATCH_SMOOTHING = 0.3
+ADAPTIVE_BATCH_MAX_GROWTH = 2
+
+# (H) Memgraph bulk-load staging
+BULK_STAGING_DIR_PREFIX = "cgr-bulk-"
+BULK_STAGING_SUFFIX = ".jsonl"
+BULK_NODE_PREFIX = "nodes_"
+BULK_NODE_MERGE_PREFIX = "nodes_merge_"
+BULK_REL_PREFIX = "rels_"
+BULK_REL_MERGE_PREFIX = "rels_merge_"
+
 # (H) Cypher response cleaning
 CYPHER_PREFIX = "cypher"
 CYPHER_SEMICOLON = ";"
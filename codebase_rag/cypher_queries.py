@@ -4,11 +4,9 @@ CYPHER_DELETE_ALL = "MATCH (n) DETACH DELETE n;"
 
 CYPHER_LIST_PROJECTS = "MATCH (p:Project) RETURN p.name AS name ORDER BY p.name"
 
-CYPHER_DELETE_PROJECT = """
+CYPHER_PROJECT_IDS_BY_NAME = """
 MATCH (p:Project {name: $project_name})
-OPTIONAL MATCH (p)-[:CONTAINS_PACKAGE|CONTAINS_FOLDER|CONTAINS_FILE|CONTAINS_MODULE*]->(container)
-OPTIONAL MATCH (container)-[:DEFINES|DEFINES_METHOD*]->(defined)
-DETACH DELETE p, container, defined
+RETURN DISTINCT coalesce(p.project_id, p.name) AS project_id
 """
 
 CYPHER_EXAMPLE_DECORATED_FUNCTIONS = f"""MATCH (n:Function|Method)
@@ -61,8 +59,30 @@ MATCH (a)-[r]->(b)
 RETURN id(a) as from_id, id(b) as to_id, type(r) as type, properties(r) as properties
 """
 
+CYPHER_SHOW_INDEX_INFO = "SHOW INDEX INFO;"
+
+CYPHER_GRAPH_HAS_NODES = "MATCH (n) RETURN 1 AS found LIMIT 1"
+
+CYPHER_PROJECT_HAS_NODES = (
+    "MATCH (n {project_id: $project_id}) RETURN 1 AS found LIMIT 1"
+)
+
+CYPHER_SHOW_STORAGE_INFO = "SHOW STORAGE INFO;"
+
+CYPHER_BENCHMARK_FUNCTION_LOOKUP = """
+MATCH (n:Function {qualified_name: $qn})
+RETURN n.name AS name
+"""
+
+CYPHER_BENCHMARK_MODULE_LOOKUP = """
+MATCH (m:Module {project_id: $project_id, name: $name})
+RETURN m.qualified_name AS qualified_name
+"""
+
 CYPHER_RETURN_COUNT = "RETURN count(r) as created"
 CYPHER_SET_PROPS_RETURN_COUNT = "SET r += row.props\nRETURN count(r) as created"
+CYPHER_RETURN_NODE_ID = "RETURN row.id AS id, id(n) AS node_id"
+CYPHER_RETURN_ROW_IDS = "RETURN row.from_id AS from_id, row.to_id AS to_id"
 
 CYPHER_GET_FUNCTION_SOURCE_LOCATION = """
 MATCH (m:Module)-[:DEFINES]->(n)
@@ -98,10 +118,97 @@ def build_constraint_query(label: str, prop: str) -> str:
     return f"CREATE CONSTRAINT ON (n:{label}) ASSERT n.{prop} IS UNIQUE;"
 
 
+def build_index_query(label: str, prop: str) -> str:
+    return f"CREATE INDEX ON :{label}({prop});"
+
+
+def build_drop_index_query(label: str, prop: str) -> str:
+    return f"DROP INDEX ON :{label}({prop});"
+
+
+def build_storage_mode_query(mode: str) -> str:
+    return f"STORAGE MODE {mode};"
+
+
+def build_delete_label_by_project_query(label: str) -> str:
+    return f"MATCH (n:{label} {{project_id: $project_id}}) DETACH DELETE n;"
+
+
+def build_delete_label_by_project_batch_query(label: str) -> str:
+    return (
+        f"MATCH (n:{label} {{project_id: $project_id}})\n"
+        "WITH n LIMIT $limit\n"
+        "DETACH DELETE n\n"
+        "RETURN count(*) AS deleted"
+    )
+
+
+def build_delete_stale_nodes_query(label: str) -> str:
+    return (
+        f"MATCH (n:{label} {{project_id: $project_id}})\n"
+        "WHERE coalesce(n.generation, '') <> $generation\n"
+        "WITH n LIMIT $limit\n"
+        "WITH n, id(n) AS node_id\n"
+        "DETACH DELETE n\n"
+        "RETURN count(*) AS deleted, collect(node_id) AS node_ids"
+    )
+
+
+def build_delete_stale_relationships_query(label: str) -> str:
+    return (
+        f"MATCH (n:{label} {{project_id: $project_id}})-[r]->()\n"
+        "WHERE coalesce(r.generation, '') <> $generation\n"
+        "WITH r LIMIT $limit\n"
+        "DELETE r\n"
+        "RETURN count(*) AS deleted"
+    )
+
+
+def build_delete_nodes_by_key_query(label: str, id_key: str) -> str:
+    return f"MATCH (n:{label} {{{id_key}: row.id}})\nDETACH DELETE n"
+
+
+def build_delete_relationship_query(
+    from_label: str,
+    from_key: str,
+    rel_type: str,
+    to_label: str,
+    to_key: str,
+) -> str:
+    return (
+        f"MATCH (a:{from_label} {{{from_key}: row.from_val}})"
+        f"-[r:{rel_type}]->(b:{to_label} {{{to_key}: row.to_val}})\n"
+        "DELETE r"
+    )
+
+
 def build_merge_node_query(label: str, id_key: str) -> str:
     return f"MERGE (n:{label} {{{id_key}: row.id}})\nSET n += row.props"
 
 
+def build_merge_node_returning_id_query(label: str, id_key: str) -> str:
+    return f"{build_merge_node_query(label, id_key)}\n{CYPHER_RETURN_NODE_ID}"
+
+
+def build_create_node_query(label: str, id_key: str) -> str:
+    return f"CREATE (n:{label} {{{id_key}: row.id}})\nSET n += row.props"
+
+
+def build_create_relationship_query(
+    from_label: str,
+    from_key: str,
+    rel_type: str,
+    to_label: str,
+    to_key: str,
+) -> str:
+    return (
+        f"MATCH (a:{from_label} {{{from_key}: row.from_val}}), "
+        f"(b:{to_label} {{{to_key}: row.to_val}})\n"
+        f"CREATE (a)-[r:{rel_type}]->(b)\n"
+        f"{CYPHER_SET_PROPS_RETURN_COUNT}"
+    )
+
+
 def build_merge_relationship_query(
     from_label: str,
     from_key: str,
@@ -117,3 +224,34 @@ def build_merge_relationship_query(
     )
     query += CYPHER_SET_PROPS_RETURN_COUNT if has_props else CYPHER_RETURN_COUNT
     return query
+
+
+def build_merge_relationship_by_id_query(rel_type: str, has_props: bool = False) -> str:
+    query = (
+        "MATCH (a), (b) WHERE id(a) = row.from_id AND id(b) = row.to_id\n"
+        f"MERGE (a)-[r:{rel_type}]->(b)\n"
+    )
+    if has_props:
+        query += "SET r += row.props\n"
+    return query + CYPHER_RETURN_ROW_IDS
+
+
+def _project_filter(variable: str, project_filter: bool) -> str:
+    return f"WHERE {variable}.project_id = $project_id\n" if project_filter else ""
+
+
+def build_export_nodes_query(project_filter: bool = False) -> str:
+    return (
+        "MATCH (n)\n"
+        f"{_project_filter('n', project_filter)}"
+        "RETURN id(n) AS node_id, labels(n) AS labels, properties(n) AS properties"
+    )
+
+
+def build_export_relationships_query(project_filter: bool = False) -> str:
+    return (
+        "MATCH (a)-[r]->(b)\n"
+        f"{_project_filter('a', project_filter)}"
+        "RETURN id(a) AS from_id, id(b) AS to_id, type(r) AS type, "
+        "properties(r) AS properties"
+    )
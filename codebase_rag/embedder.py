@@ -7,13 +7,61 @@
 # │   - Easy testability with cache_clear() method                        │
 # │   - Memory efficient with maxsize=1                                   │
 # └────────────────────────────────────────────────────────────────────────┘
+import threading
+import time
+from collections import OrderedDict
 from functools import lru_cache
 
+from loguru import logger
+
 from . import exceptions as ex
+from . import logs as ls
 from .config import settings
-from .constants import UNIXCODER_MODEL
+from .constants import EMBEDDING_WARMUP_THREAD_NAME, UNIXCODER_MODEL
 from .utils.dependencies import has_torch, has_transformers
 
+
+class QueryEmbeddingCache:
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, tuple[float, ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> list[float] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, embedding = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return list(embedding)
+
+    def put(self, key: str, embedding: list[float]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), tuple(embedding))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+query_embedding_cache = QueryEmbeddingCache(
+    settings.QUERY_EMBEDDING_CACHE_SIZE, settings.QUERY_EMBEDDING_CACHE_TTL_SECONDS
+)
+
+
 if has_torch() and has_transformers():
     import numpy as np
     import torch
@@ -21,6 +69,8 @@ if has_torch() and has_transformers():
 
     from .unixcoder import UniXcoder
 
+    _MODEL_LOCK = threading.Lock()
+
     @lru_cache(maxsize=1)
     def get_model() -> UniXcoder:
         model = UniXcoder(UNIXCODER_MODEL)
@@ -32,7 +82,8 @@ if has_torch() and has_transformers():
     def embed_code(code: str, max_length: int | None = None) -> list[float]:
         if max_length is None:
             max_length = settings.EMBEDDING_MAX_LENGTH
-        model = get_model()
+        with _MODEL_LOCK:
+            model = get_model()
         device = next(model.parameters()).device
         tokens = model.tokenize([code], max_length=max_length)
         tokens_tensor = torch.tensor(tokens).to(device)
@@ -42,7 +93,39 @@ if has_torch() and has_transformers():
         result: list[float] = embedding[0].tolist()
         return result
 
+    def _load_model_in_background() -> None:
+        started = time.perf_counter()
+        try:
+            with _MODEL_LOCK:
+                get_model()
+            logger.info(
+                ls.EMBEDDING_MODEL_WARM.format(seconds=time.perf_counter() - started)
+            )
+        except Exception as e:
+            logger.warning(ls.EMBEDDING_MODEL_WARM_FAILED.format(error=e))
+
+    def warm_up_model() -> threading.Thread | None:
+        logger.info(ls.EMBEDDING_MODEL_WARMING)
+        thread = threading.Thread(
+            target=_load_model_in_background,
+            name=EMBEDDING_WARMUP_THREAD_NAME,
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
 else:
 
     def embed_code(code: str, max_length: int | None = None) -> list[float]:
         raise RuntimeError(ex.SEMANTIC_EXTRA)
+
+    def warm_up_model() -> threading.Thread | None:
+        return None
+
+
+def embed_query(query: str) -> list[float]:
+    if (cached := query_embedding_cache.get(query)) is not None:
+        return cached
+    embedding = embed_code(query)
+    query_embedding_cache.put(query, embedding)
+    return embedding
@@ -23,6 +23,16 @@ UNKNOWN_PROVIDER = "Unknown provider '{provider}'. Available providers: {availab
 
 # (H) Dependency errors
 SEMANTIC_EXTRA = "Semantic search requires 'semantic' extra: uv sync --extra semantic"
+ZSTD_MISSING = (
+    "zstd compression requires the zstandard package: uv pip install zstandard"
+)
+ARROW_GZIP_UNSUPPORTED = "Arrow IPC export supports zstd or no compression, not gzip"
+PYARROW_MISSING = (
+    "Parquet/Arrow export requires the pyarrow package: uv pip install pyarrow"
+)
+NUMPY_MISSING = (
+    "Compact graph loading requires the numpy package: uv sync --extra compact"
+)
 
 # (H) Configuration errors
 PROVIDER_EMPTY = "Provider name cannot be empty in 'provider:model' format."
@@ -39,6 +49,17 @@ FAILED_TO_LOAD_DATA = "Failed to load data from file"
 NODES_NOT_LOADED = "Nodes should be loaded"
 RELATIONSHIPS_NOT_LOADED = "Relationships should be loaded"
 DATA_NOT_LOADED = "Data should be loaded"
+GRAPH_STREAM_MALFORMED = (
+    "Malformed graph export {path}: expected {expected!r}, found {found!r}"
+)
+PROTOBUF_STREAM_TRUNCATED = "Truncated protobuf record in {path} at offset {offset}"
+PROTOBUF_STREAM_UNKNOWN_TAG = (
+    "Unexpected protobuf tag {tag} in {path} at offset {offset}"
+)
+PROTOBUF_INDEX_NOT_FOUND = "No protobuf index files found in: {path}"
+PROTOBUF_OFFSETS_NOT_FOUND = "Protobuf offset table not found: {path}"
+PROTOBUF_OFFSETS_BAD_MAGIC = "Not a protobuf offset table: {path}"
+GRAPH_SNAPSHOT_BAD_MAGIC = "Not a compact graph snapshot: {path}"
 
 # (H) Parser errors
 NO_LANGUAGES = "No Tree-sitter languages available."
@@ -52,6 +73,8 @@ LLM_INIT_ORCHESTRATOR = "Failed to initialize RAG Orchestrator: {error}"
 # (H) Graph service errors
 BATCH_SIZE = "batch_size must be a positive integer"
 CONN = "Not connected to Memgraph."
+WRITER_QUEUE_SIZE = "writer_queue_size must be zero or a positive integer"
+ADAPTIVE_BATCH_BOUNDS = "Adaptive batch bounds must satisfy 1 <= minimum <= maximum"
 
 # (H) Access control errors (used with raise)
 ACCESS_DENIED = "Access denied: Cannot access files outside the project root."
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import random
+import time
+
+from loguru import logger
+
+from . import constants as cs
+from . import logs as ls
+from .cypher_queries import (
+    CYPHER_BENCHMARK_FUNCTION_LOOKUP,
+    CYPHER_BENCHMARK_MODULE_LOOKUP,
+    build_delete_label_by_project_query,
+)
+from .services.graph_service import MemgraphIngestor
+from .types_defs import (
+    IndexBenchmarkPass,
+    IndexBenchmarkReport,
+    StorageModeBenchmarkReport,
+)
+
+_BENCHMARK_LABELS = (cs.NodeLabel.MODULE, cs.NodeLabel.FUNCTION)
+
+
+def _percentile_ms(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = min(len(ordered) - 1, round(q / 100 * (len(ordered) - 1)))
+    return ordered[position] * cs.MS_PER_SECOND
+
+
+def _module_name(index: int) -> str:
+    return f"{cs.INDEX_BENCHMARK_MODULE}{index}"
+
+
+def _num_modules(num_nodes: int) -> int:
+    return -(-num_nodes // cs.INDEX_BENCHMARK_FUNCTIONS_PER_MODULE)
+
+
+def _module_qn(project_id: str, function_index: int) -> str:
+    module = _module_name(function_index // cs.INDEX_BENCHMARK_FUNCTIONS_PER_MODULE)
+    return cs.SEPARATOR_DOT.join((project_id, module))
+
+
+def _function_qn(project_id: str, index: int) -> str:
+    return cs.SEPARATOR_DOT.join(
+        (_module_qn(project_id, index), f"{cs.INDEX_BENCHMARK_FUNCTION}{index}")
+    )
+
+
+def _clear_benchmark_project(ingestor: MemgraphIngestor, project_id: str) -> None:
+    for label in _BENCHMARK_LABELS:
+        ingestor.execute_write(
+            build_delete_label_by_project_query(label),
+            {cs.KEY_PROJECT_ID: project_id},
+        )
+
+
+def _load_synthetic_graph(
+    ingestor: MemgraphIngestor, project_id: str, num_nodes: int, seed: int
+) -> int:
+    rng = random.Random(seed)
+    num_modules = _num_modules(num_nodes)
+    for j in range(num_modules):
+        ingestor.ensure_node_batch(
+            cs.NodeLabel.MODULE,
+            {
+                cs.KEY_QUALIFIED_NAME: _module_qn(
+                    project_id, j * cs.INDEX_BENCHMARK_FUNCTIONS_PER_MODULE
+                ),
+                cs.KEY_NAME: _module_name(j),
+                cs.KEY_PROJECT_ID: project_id,
+            },
+        )
+    for i in range(num_nodes):
+        ingestor.ensure_node_batch(
+            cs.NodeLabel.FUNCTION,
+            {
+                cs.KEY_QUALIFIED_NAME: _function_qn(project_id, i),
+                cs.KEY_NAME: f"{cs.INDEX_BENCHMARK_FUNCTION}{i}",
+                cs.KEY_PROJECT_ID: project_id,
+            },
+        )
+
+    num_relationships = 0
+    for i in range(num_nodes):
+        ingestor.ensure_relationship_batch(
+            (cs.NodeLabel.MODULE, cs.KEY_QUALIFIED_NAME, _module_qn(project_id, i)),
+            cs.RelationshipType.DEFINES,
+            (cs.NodeLabel.FUNCTION, cs.KEY_QUALIFIED_NAME, _function_qn(project_id, i)),
+        )
+        num_relationships += 1
+        for _ in range(cs.INDEX_BENCHMARK_CALLS_PER_FUNCTION):
+            ingestor.ensure_relationship_batch(
+                (
+                    cs.NodeLabel.FUNCTION,
+                    cs.KEY_QUALIFIED_NAME,
+                    _function_qn(project_id, i),
+                ),
+                cs.RelationshipType.CALLS,
+                (
+                    cs.NodeLabel.FUNCTION,
+                    cs.KEY_QUALIFIED_NAME,
+                    _function_qn(project_id, rng.randrange(num_nodes)),
+                ),
+            )
+            num_relationships += 1
+    ingestor.flush_all()
+    return num_modules + num_nodes + num_relationships
+
+
+def _time_lookups(
+    ingestor: MemgraphIngestor,
+    project_id: str,
+    num_nodes: int,
+    num_queries: int,
+    seed: int,
+) -> list[float]:
+    rng = random.Random(seed)
+    num_modules = _num_modules(num_nodes)
+    latencies: list[float] = []
+    for i in range(num_queries):
+        if i % 2:
+            query = CYPHER_BENCHMARK_MODULE_LOOKUP
+            params = {
+                cs.KEY_PROJECT_ID: project_id,
+                cs.KEY_NAME: _module_name(rng.randrange(num_modules)),
+            }
+        else:
+            query = CYPHER_BENCHMARK_FUNCTION_LOOKUP
+            params = {"qn": _function_qn(project_id, rng.randrange(num_nodes))}
+        started = time.perf_counter()
+        ingestor.fetch_all(query, params)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def _run_pass(
+    ingestor: MemgraphIngestor,
+    *,
+    mode: str,
+    num_nodes: int,
+    num_queries: int,
+    seed: int,
+) -> IndexBenchmarkPass:
+    project_id = cs.INDEX_BENCHMARK_PROJECT_ID
+    _clear_benchmark_project(ingestor, project_id)
+    started = time.perf_counter()
+    rows = _load_synthetic_graph(ingestor, project_id, num_nodes, seed)
+    flush_seconds = time.perf_counter() - started
+    latencies = _time_lookups(ingestor, project_id, num_nodes, num_queries, seed)
+    _clear_benchmark_project(ingestor, project_id)
+
+    result = IndexBenchmarkPass(
+        flush_seconds=flush_seconds,
+        rows_per_second=rows / flush_seconds if flush_seconds else 0.0,
+        lookup_p50_ms=_percentile_ms(latencies, 50),
+        lookup_p95_ms=_percentile_ms(latencies, cs.IVF_LATENCY_PERCENTILE),
+    )
+    logger.info(
+        ls.MG_INDEX_BENCHMARK_PASS.format(
+            mode=mode,
+            rows=rows,
+            seconds=flush_seconds,
+            queries=num_queries,
+            p50=result["lookup_p50_ms"],
+        )
+    )
+    return result
+
+
+def benchmark_index_impact(
+    ingestor: MemgraphIngestor,
+    num_nodes: int = cs.INDEX_BENCHMARK_DEFAULT_NODES,
+    num_queries: int = cs.INDEX_BENCHMARK_DEFAULT_QUERIES,
+    seed: int = cs.INDEX_BENCHMARK_SEED,
+) -> IndexBenchmarkReport:
+    try:
+        ingestor.drop_indexes()
+        without_indexes = _run_pass(
+            ingestor,
+            mode=cs.GRAPH_INDEX_MODE_WITHOUT,
+            num_nodes=num_nodes,
+            num_queries=num_queries,
+            seed=seed,
+        )
+    finally:
+        ingestor.ensure_indexes()
+    with_indexes = _run_pass(
+        ingestor,
+        mode=cs.GRAPH_INDEX_MODE_WITH,
+        num_nodes=num_nodes,
+        num_queries=num_queries,
+        seed=seed,
+    )
+    return IndexBenchmarkReport(
+        num_nodes=_num_modules(num_nodes) + num_nodes,
+        num_relationships=num_nodes * (1 + cs.INDEX_BENCHMARK_CALLS_PER_FUNCTION),
+        num_queries=num_queries,
+        without_indexes=without_indexes,
+        with_indexes=with_indexes,
+    )
+
+
+def benchmark_storage_modes(
+    ingestor: MemgraphIngestor,
+    num_nodes: int = cs.INDEX_BENCHMARK_DEFAULT_NODES,
+    num_queries: int = cs.INDEX_BENCHMARK_DEFAULT_QUERIES,
+    seed: int = cs.INDEX_BENCHMARK_SEED,
+) -> StorageModeBenchmarkReport:
+    original = ingestor.storage_mode()
+    passes: dict[str, IndexBenchmarkPass] = {}
+    try:
+        for mode in (cs.STORAGE_MODE_TRANSACTIONAL, cs.STORAGE_MODE_ANALYTICAL):
+            ingestor.set_storage_mode(mode)
+            passes[mode] = _run_pass(
+                ingestor,
+                mode=mode,
+                num_nodes=num_nodes,
+                num_queries=num_queries,
+                seed=seed,
+            )
+    finally:
+        ingestor.set_storage_mode(original or cs.STORAGE_MODE_TRANSACTIONAL)
+    return StorageModeBenchmarkReport(
+        num_nodes=_num_modules(num_nodes) + num_nodes,
+        num_relationships=num_nodes * (1 + cs.INDEX_BENCHMARK_CALLS_PER_FUNCTION),
+        num_queries=num_queries,
+        transactional=passes[cs.STORAGE_MODE_TRANSACTIONAL],
+        analytical=passes[cs.STORAGE_MODE_ANALYTICAL],
+    )
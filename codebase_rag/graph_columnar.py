@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from . import constants as cs
+from . import exceptions as ex
+from . import logs as ls
+from .types_defs import (
+    GraphData,
+    GraphMetadata,
+    NodeData,
+    PropertyDict,
+    PropertyValue,
+    RelationshipData,
+    ResultRow,
+)
+from .utils.dependencies import has_pyarrow
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+def _require_pyarrow() -> None:
+    if not has_pyarrow():
+        raise RuntimeError(ex.PYARROW_MISSING)
+
+
+def _string_type(name: str) -> pa.DataType:
+    import pyarrow as pa
+
+    if name in cs.COLUMNAR_DICTIONARY_COLUMNS:
+        return pa.dictionary(pa.int32(), pa.string())
+    return pa.string()
+
+
+def _infer_type(name: str, values: list[PropertyValue]) -> pa.DataType | None:
+    import pyarrow as pa
+
+    kinds = {type(v) for v in values if v is not None}
+    if kinds == {bool}:
+        return pa.bool_()
+    if kinds == {int}:
+        return pa.int64()
+    if kinds and kinds <= {int, float}:
+        return pa.float64()
+    if kinds == {str}:
+        return _string_type(name)
+    if kinds == {list} and all(
+        isinstance(item, str) for v in values if isinstance(v, list) for item in v
+    ):
+        return pa.list_(pa.string())
+    return None
+
+
+def _fits(value: PropertyValue, dtype: pa.DataType) -> bool:
+    import pyarrow as pa
+
+    if value is None:
+        return True
+    if pa.types.is_boolean(dtype):
+        return isinstance(value, bool)
+    if pa.types.is_integer(dtype):
+        return (
+            isinstance(value, int)
+            and not isinstance(value, bool)
+            and _INT64_MIN <= value <= _INT64_MAX
+        )
+    if pa.types.is_floating(dtype):
+        return isinstance(value, int | float) and not isinstance(value, bool)
+    if pa.types.is_list(dtype):
+        return isinstance(value, list) and all(isinstance(v, str) for v in value)
+    return isinstance(value, str)
+
+
+def _compression_codec(
+    fmt: cs.ExportFormat, compression: cs.ExportCompression
+) -> str | None:
+    if compression == cs.ExportCompression.NONE:
+        return None
+    if fmt == cs.ExportFormat.ARROW and compression == cs.ExportCompression.GZIP:
+        raise ValueError(ex.ARROW_GZIP_UNSUPPORTED)
+    return compression.value
+
+
+class _ColumnarTable:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        kind: str,
+        name: str,
+        fmt: cs.ExportFormat,
+        codec: str | None,
+        key_columns: list[tuple[str, pa.DataType]],
+        row_group_size: int,
+    ) -> None:
+        self.path = path
+        self.kind = kind
+        self.name = name
+        self.fmt = fmt
+        self.codec = codec
+        self.key_columns = key_columns
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self._buffer: list[tuple[list[PropertyValue], PropertyDict]] = []
+        self._property_types: dict[str, pa.DataType] = {}
+        self._fallbacks: set[str] = set()
+        self._schema: pa.Schema | None = None
+        self._writer: pa.ipc.RecordBatchStreamWriter | pq.ParquetWriter | None = None
+
+    def append(self, keys: list[PropertyValue], properties: PropertyDict) -> None:
+        self._buffer.append((keys, properties))
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+
+    def _open(self) -> None:
+        import pyarrow as pa
+
+        reserved = {name for name, _ in self.key_columns}
+        names = sorted(
+            {k for _, props in self._buffer for k in props if k not in reserved}
+        )
+        for name in names:
+            dtype = _infer_type(name, [props.get(name) for _, props in self._buffer])
+            if dtype is not None:
+                self._property_types[name] = dtype
+        self._schema = pa.schema(
+            [pa.field(name, dtype) for name, dtype in self.key_columns]
+            + [pa.field(name, dtype) for name, dtype in self._property_types.items()]
+            + [pa.field(cs.COLUMNAR_EXTRA_COLUMN, pa.string())]
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.fmt == cs.ExportFormat.PARQUET:
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(
+                self.path, self._schema, compression=self.codec or "none"
+            )
+        else:
+            self._writer = pa.ipc.new_stream(
+                str(self.path),
+                self._schema,
+                options=pa.ipc.IpcWriteOptions(compression=self.codec),
+            )
+
+    def _extra(self, properties: PropertyDict) -> str | None:
+        extra: PropertyDict = {}
+        for key, value in properties.items():
+            dtype = self._property_types.get(key)
+            if dtype is not None and _fits(value, dtype):
+                continue
+            if dtype is not None and key not in self._fallbacks:
+                self._fallbacks.add(key)
+                logger.debug(
+                    ls.COLUMNAR_COLUMN_FALLBACK.format(
+                        column=key, name=self.name, extra=cs.COLUMNAR_EXTRA_COLUMN
+                    )
+                )
+            extra[key] = value
+        return json.dumps(extra, ensure_ascii=False) if extra else None
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        import pyarrow as pa
+
+        if self._schema is None:
+            self._open()
+        assert self._schema is not None
+        columns: list[list[PropertyValue]] = [
+            [keys[i] for keys, _ in self._buffer] for i in range(len(self.key_columns))
+        ]
+        for name, dtype in self._property_types.items():
+            columns.append(
+                [
+                    value if _fits(value := props.get(name), dtype) else None
+                    for _, props in self._buffer
+                ]
+            )
+        columns.append([self._extra(props) for _, props in self._buffer])
+        table = pa.Table.from_arrays(
+            [
+                pa.array(values, type=field.type)
+                for values, field in zip(columns, self._schema, strict=True)
+            ],
+            schema=self._schema,
+        )
+        assert self._writer is not None
+        if self.fmt == cs.ExportFormat.PARQUET:
+            self._writer.write_table(table, row_group_size=len(self._buffer))
+        else:
+            self._writer.write_table(table)
+        self.rows += len(self._buffer)
+        self._buffer = []
+
+    def discard(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._buffer = []
+
+    def close(self) -> None:
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            logger.info(
+                ls.COLUMNAR_TABLE_WRITTEN.format(
+                    kind=self.kind, name=self.name, rows=self.rows, path=self.path
+                )
+            )
+
+
+def _table_path(kind_dir: str, name: str, fmt: cs.ExportFormat) -> Path:
+    return Path(kind_dir) / f"{name}.{fmt.value}"
+
+
+def write_columnar_graph(
+    output_dir: Path,
+    nodes: Iterable[ResultRow],
+    relationships: Iterable[ResultRow],
+    *,
+    fmt: cs.ExportFormat,
+    compression: cs.ExportCompression | None = None,
+    exported_at: str,
+    row_group_size: int = cs.COLUMNAR_ROW_GROUP_SIZE,
+) -> GraphMetadata:
+    _require_pyarrow()
+    import pyarrow as pa
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    codec = _compression_codec(fmt, compression or cs.COLUMNAR_DEFAULT_COMPRESSION[fmt])
+    label_type = pa.list_(pa.dictionary(pa.int32(), pa.string()))
+    node_columns = [(cs.KEY_NODE_ID, pa.int64()), (cs.KEY_LABELS, label_type)]
+    rel_columns = [(cs.KEY_FROM_ID, pa.int64()), (cs.KEY_TO_ID, pa.int64())]
+    tables: dict[str, dict[str, _ColumnarTable]] = {
+        cs.COLUMNAR_NODES_DIR: {},
+        cs.COLUMNAR_RELATIONSHIPS_DIR: {},
+    }
+
+    def table_for(
+        kind: str, name: str, key_columns: list[tuple[str, pa.DataType]]
+    ) -> _ColumnarTable:
+        table = tables[kind].get(name)
+        if table is None:
+            table = _ColumnarTable(
+                output_dir / _table_path(kind, name, fmt),
+                kind=kind,
+                name=name,
+                fmt=fmt,
+                codec=codec,
+                key_columns=key_columns,
+                row_group_size=row_group_size,
+            )
+            tables[kind][name] = table
+        return table
+
+    try:
+        for row in nodes:
+            labels = row[cs.KEY_LABELS]
+            assert isinstance(labels, list)
+            label = str(labels[0]) if labels else cs.TEXT_UNKNOWN
+            table_for(cs.COLUMNAR_NODES_DIR, label, node_columns).append(
+                [row[cs.KEY_NODE_ID], labels], row[cs.KEY_PROPERTIES] or {}
+            )
+        for row in relationships:
+            table_for(
+                cs.COLUMNAR_RELATIONSHIPS_DIR, str(row[cs.KEY_TYPE]), rel_columns
+            ).append(
+                [row[cs.KEY_FROM_ID], row[cs.KEY_TO_ID]], row[cs.KEY_PROPERTIES] or {}
+            )
+    except BaseException:
+        for by_name in tables.values():
+            for table in by_name.values():
+                table.discard()
+        raise
+    for by_name in tables.values():
+        for table in by_name.values():
+            table.close()
+
+    metadata = GraphMetadata(
+        total_nodes=sum(t.rows for t in tables[cs.COLUMNAR_NODES_DIR].values()),
+        total_relationships=sum(
+            t.rows for t in tables[cs.COLUMNAR_RELATIONSHIPS_DIR].values()
+        ),
+        exported_at=exported_at,
+    )
+    manifest = {
+        cs.COLUMNAR_KEY_FORMAT: fmt.value,
+        cs.KEY_METADATA: metadata,
+        cs.COLUMNAR_KEY_TABLES: {
+            kind: {
+                name: _table_path(kind, name, fmt).as_posix()
+                for name in sorted(by_name)
+            }
+            for kind, by_name in tables.items()
+        },
+    }
+    (output_dir / cs.COLUMNAR_MANIFEST).write_text(
+        json.dumps(manifest, indent=cs.JSON_INDENT), encoding=cs.ENCODING_UTF8
+    )
+    return metadata
+
+
+def _read_table(path: Path, fmt: cs.ExportFormat) -> pa.Table:
+    import pyarrow as pa
+
+    if fmt == cs.ExportFormat.PARQUET:
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path, memory_map=True)
+    with pa.memory_map(str(path)) as source:
+        return pa.ipc.open_stream(source).read_all()
+
+
+def _row_properties(row: dict[str, PropertyValue]) -> PropertyDict:
+    extra = row.pop(cs.COLUMNAR_EXTRA_COLUMN, None)
+    properties: PropertyDict = {k: v for k, v in row.items() if v is not None}
+    if isinstance(extra, str):
+        properties.update(json.loads(extra))
+    return properties
+
+
+def is_columnar_export(path: Path) -> bool:
+    return path.is_dir() and (path / cs.COLUMNAR_MANIFEST).is_file()
+
+
+def read_columnar_graph(directory: Path) -> GraphData:
+    _require_pyarrow()
+    manifest = json.loads(
+        (directory / cs.COLUMNAR_MANIFEST).read_text(encoding=cs.ENCODING_UTF8)
+    )
+    fmt = cs.ExportFormat(manifest[cs.COLUMNAR_KEY_FORMAT])
+    paths = manifest[cs.COLUMNAR_KEY_TABLES]
+
+    nodes: list[NodeData] = []
+    for relative in paths[cs.COLUMNAR_NODES_DIR].values():
+        for row in _read_table(directory / relative, fmt).to_pylist():
+            node_id = row.pop(cs.KEY_NODE_ID)
+            labels = row.pop(cs.KEY_LABELS)
+            nodes.append(
+                NodeData(
+                    node_id=node_id, labels=labels, properties=_row_properties(row)
+                )
+            )
+
+    relationships: list[RelationshipData] = []
+    for rel_type, relative in paths[cs.COLUMNAR_RELATIONSHIPS_DIR].items():
+        for row in _read_table(directory / relative, fmt).to_pylist():
+            from_id = row.pop(cs.KEY_FROM_ID)
+            to_id = row.pop(cs.KEY_TO_ID)
+            relationships.append(
+                RelationshipData(
+                    from_id=from_id,
+                    to_id=to_id,
+                    type=rel_type,
+                    properties=_row_properties(row),
+                )
+            )
+
+    return GraphData(
+        nodes=nodes, relationships=relationships, metadata=manifest[cs.KEY_METADATA]
+    )
@@ -0,0 +1,543 @@
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+from numpy.typing import NDArray
+
+from . import constants as cs
+from . import exceptions as ex
+from . import logs as ls
+from .decorators import ensure_loaded
+from .graph_loader import GraphLoader
+from .graph_stream import iter_graph_records
+from .models import GraphNode, GraphRelationship
+from .types_defs import GraphMetadata, GraphSummary, PropertyValue
+
+type IndexArray = NDArray[np.integer[Any]]
+
+_HEADER = struct.Struct(cs.COMPACT_SNAPSHOT_HEADER_FORMAT)
+_INT64_MIN = np.iinfo(np.int64).min
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def _index_dtype(size: int) -> type[np.integer[Any]]:
+    return np.int32 if size < np.iinfo(np.int32).max else np.int64
+
+
+def _code_dtype(size: int) -> type[np.integer[Any]]:
+    return np.uint16 if size <= np.iinfo(np.uint16).max else np.int32
+
+
+def _column_kind(values: list[PropertyValue]) -> cs.CompactColumnKind:
+    types = {type(value) for value in values}
+    if types == {bool}:
+        return cs.CompactColumnKind.BOOL
+    if types == {int} and all(_INT64_MIN <= v <= _INT64_MAX for v in values):
+        return cs.CompactColumnKind.INT
+    if types == {float}:
+        return cs.CompactColumnKind.FLOAT
+    if types == {str}:
+        return cs.CompactColumnKind.STR
+    return cs.CompactColumnKind.JSON
+
+
+@dataclass(frozen=True, slots=True)
+class _Column:
+    kind: cs.CompactColumnKind
+    rows: IndexArray
+    values: NDArray[Any]
+    data: NDArray[np.uint8] | None = None
+
+    @classmethod
+    def build(cls, rows: list[int], values: list[PropertyValue]) -> _Column:
+        kind = _column_kind(values)
+        row_array = np.asarray(rows, dtype=_index_dtype(rows[-1] + 1))
+        if kind == cs.CompactColumnKind.BOOL:
+            return cls(kind, row_array, np.asarray(values, dtype=np.bool_))
+        if kind == cs.CompactColumnKind.INT:
+            return cls(kind, row_array, np.asarray(values, dtype=np.int64))
+        if kind == cs.CompactColumnKind.FLOAT:
+            return cls(kind, row_array, np.asarray(values, dtype=np.float64))
+        encoded = [
+            (
+                value
+                if kind == cs.CompactColumnKind.STR
+                else json.dumps(
+                    value, ensure_ascii=False, separators=cs.EXPORT_JSON_SEPARATORS
+                )
+            ).encode(cs.ENCODING_UTF8)
+            for value in values
+        ]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(item) for item in encoded], dtype=np.int64, out=offsets[1:])
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return cls(kind, row_array, offsets, data)
+
+    def position(self, row: int) -> int | None:
+        pos = int(np.searchsorted(self.rows, row))
+        return pos if pos < len(self.rows) and self.rows[pos] == row else None
+
+    def value_at(self, pos: int) -> PropertyValue:
+        if self.data is None:
+            return self.values[pos].item()
+        raw = bytes(self.data[self.values[pos] : self.values[pos + 1]]).decode(
+            cs.ENCODING_UTF8
+        )
+        return raw if self.kind == cs.CompactColumnKind.STR else json.loads(raw)
+
+    def value_index(self) -> dict[PropertyValue, list[int]]:
+        index: defaultdict[PropertyValue, list[int]] = defaultdict(list)
+        for pos in range(len(self.rows)):
+            value = self.value_at(pos)
+            if value is not None and not isinstance(value, list | dict):
+                index[value].append(int(self.rows[pos]))
+        return dict(index)
+
+    def arrays(self) -> dict[str, NDArray[Any]]:
+        arrays = {
+            cs.COMPACT_COLUMN_ROWS: self.rows,
+            cs.COMPACT_COLUMN_VALUES: self.values,
+        }
+        if self.data is not None:
+            arrays[cs.COMPACT_COLUMN_DATA] = self.data
+        return arrays
+
+
+def _row_properties(columns: dict[str, _Column], row: int) -> dict[str, PropertyValue]:
+    properties: dict[str, PropertyValue] = {}
+    for key, column in columns.items():
+        if (pos := column.position(row)) is not None:
+            properties[key] = column.value_at(pos)
+    return properties
+
+
+def _csr(
+    owners: IndexArray, size: int, count: int
+) -> tuple[NDArray[np.int64], IndexArray]:
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(owners, minlength=size), out=indptr[1:])
+    return indptr, np.argsort(owners, kind="stable").astype(_index_dtype(count))
+
+
+@dataclass(slots=True)
+class _CompactGraph:
+    metadata: GraphMetadata
+    labels: list[str]
+    types: list[str]
+    node_ids: NDArray[np.int64]
+    id_order: IndexArray
+    label_indptr: NDArray[np.int64]
+    label_indices: IndexArray
+    vertex_ids: NDArray[np.int64]
+    rel_from: NDArray[np.int64]
+    rel_to: NDArray[np.int64]
+    rel_type: IndexArray
+    out_indptr: NDArray[np.int64]
+    out_indices: IndexArray
+    in_indptr: NDArray[np.int64]
+    in_indices: IndexArray
+    node_columns: dict[str, _Column]
+    rel_columns: dict[str, _Column]
+
+    ARRAY_FIELDS = (
+        "node_ids",
+        "id_order",
+        "label_indptr",
+        "label_indices",
+        "vertex_ids",
+        "rel_from",
+        "rel_to",
+        "rel_type",
+        "out_indptr",
+        "out_indices",
+        "in_indptr",
+        "in_indices",
+    )
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def relationship_count(self) -> int:
+        return len(self.rel_type)
+
+    def dense_index(self, node_id: int) -> int | None:
+        pos = int(np.searchsorted(self.node_ids, node_id, sorter=self.id_order))
+        if pos == self.node_count:
+            return None
+        dense = int(self.id_order[pos])
+        return dense if self.node_ids[dense] == node_id else None
+
+    def vertex_index(self, node_id: int) -> int | None:
+        pos = int(np.searchsorted(self.vertex_ids, node_id))
+        if pos < len(self.vertex_ids) and self.vertex_ids[pos] == node_id:
+            return pos
+        return None
+
+    def arrays(self) -> dict[str, NDArray[Any]]:
+        arrays = {name: getattr(self, name) for name in self.ARRAY_FIELDS}
+        for prefix, columns in (
+            (cs.COMPACT_NODE_COLUMN_PREFIX, self.node_columns),
+            (cs.COMPACT_REL_COLUMN_PREFIX, self.rel_columns),
+        ):
+            for key, column in columns.items():
+                for part, array in column.arrays().items():
+                    arrays[_column_array_name(prefix, key, part)] = array
+        return arrays
+
+
+def _column_array_name(prefix: str, key: str, part: str) -> str:
+    return f"{prefix}:{key}:{part}"
+
+
+@dataclass(slots=True)
+class _CompactGraphBuilder:
+    labels: dict[str, int] = field(default_factory=dict)
+    types: dict[str, int] = field(default_factory=dict)
+    node_ids: list[int] = field(default_factory=list)
+    label_counts: list[int] = field(default_factory=list)
+    label_codes: list[int] = field(default_factory=list)
+    rel_from: list[int] = field(default_factory=list)
+    rel_to: list[int] = field(default_factory=list)
+    rel_type: list[int] = field(default_factory=list)
+    node_properties: defaultdict[str, tuple[list[int], list[PropertyValue]]] = field(
+        default_factory=lambda: defaultdict(lambda: ([], []))
+    )
+    rel_properties: defaultdict[str, tuple[list[int], list[PropertyValue]]] = field(
+        default_factory=lambda: defaultdict(lambda: ([], []))
+    )
+    metadata: GraphMetadata | None = None
+
+    def add_node(self, record: dict[str, Any]) -> None:
+        row = len(self.node_ids)
+        self.node_ids.append(record[cs.KEY_NODE_ID])
+        labels = record[cs.KEY_LABELS]
+        self.label_counts.append(len(labels))
+        for label in labels:
+            self.label_codes.append(self.labels.setdefault(label, len(self.labels)))
+        for key, value in record[cs.KEY_PROPERTIES].items():
+            rows, values = self.node_properties[key]
+            rows.append(row)
+            values.append(value)
+
+    def add_relationship(self, record: dict[str, Any]) -> None:
+        row = len(self.rel_type)
+        self.rel_from.append(record[cs.KEY_FROM_ID])
+        self.rel_to.append(record[cs.KEY_TO_ID])
+        rel_type = record[cs.KEY_TYPE]
+        self.rel_type.append(self.types.setdefault(rel_type, len(self.types)))
+        for key, value in record[cs.KEY_PROPERTIES].items():
+            rows, values = self.rel_properties[key]
+            rows.append(row)
+            values.append(value)
+
+    def build(self) -> _CompactGraph:
+        if self.metadata is None:
+            raise RuntimeError(ex.FAILED_TO_LOAD_DATA)
+        node_count, rel_count = len(self.node_ids), len(self.rel_type)
+        node_ids = np.asarray(self.node_ids, dtype=np.int64)
+        rel_from = np.asarray(self.rel_from, dtype=np.int64)
+        rel_to = np.asarray(self.rel_to, dtype=np.int64)
+        vertex_ids = np.unique(np.concatenate((node_ids, rel_from, rel_to)))
+        out_indptr, out_indices = _csr(
+            np.searchsorted(vertex_ids, rel_from), len(vertex_ids), rel_count
+        )
+        in_indptr, in_indices = _csr(
+            np.searchsorted(vertex_ids, rel_to), len(vertex_ids), rel_count
+        )
+        label_indptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(self.label_counts, dtype=np.int64, out=label_indptr[1:])
+        return _CompactGraph(
+            metadata=self.metadata,
+            labels=list(self.labels),
+            types=list(self.types),
+            node_ids=node_ids,
+            id_order=np.argsort(node_ids, kind="stable").astype(
+                _index_dtype(node_count)
+            ),
+            label_indptr=label_indptr,
+            label_indices=np.asarray(
+                self.label_codes, dtype=_code_dtype(len(self.labels))
+            ),
+            vertex_ids=vertex_ids,
+            rel_from=rel_from,
+            rel_to=rel_to,
+            rel_type=np.asarray(self.rel_type, dtype=_code_dtype(len(self.types))),
+            out_indptr=out_indptr,
+            out_indices=out_indices,
+            in_indptr=in_indptr,
+            in_indices=in_indices,
+            node_columns={
+                key: _Column.build(rows, values)
+                for key, (rows, values) in self.node_properties.items()
+            },
+            rel_columns={
+                key: _Column.build(rows, values)
+                for key, (rows, values) in self.rel_properties.items()
+            },
+        )
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // cs.COMPACT_SNAPSHOT_ALIGNMENT) * cs.COMPACT_SNAPSHOT_ALIGNMENT
+
+
+def write_graph_snapshot(graph: _CompactGraph, path: Path) -> int:
+    arrays = {
+        name: np.ascontiguousarray(array) for name, array in graph.arrays().items()
+    }
+    layout: dict[str, tuple[str, int, int]] = {}
+    offset = 0
+    for name, array in arrays.items():
+        layout[name] = (array.dtype.str, offset, len(array))
+        offset = _aligned(offset + array.nbytes)
+    manifest = json.dumps(
+        {
+            cs.COMPACT_KEY_METADATA: graph.metadata,
+            cs.COMPACT_KEY_LABELS: graph.labels,
+            cs.COMPACT_KEY_TYPES: graph.types,
+            cs.COMPACT_KEY_ARRAYS: layout,
+            cs.COMPACT_KEY_NODE_COLUMNS: {
+                key: column.kind for key, column in graph.node_columns.items()
+            },
+            cs.COMPACT_KEY_REL_COLUMNS: {
+                key: column.kind for key, column in graph.rel_columns.items()
+            },
+        },
+        ensure_ascii=False,
+        separators=cs.EXPORT_JSON_SEPARATORS,
+    ).encode(cs.ENCODING_UTF8)
+    data_start = _aligned(_HEADER.size + len(manifest))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(cs.COMPACT_SNAPSHOT_MAGIC, len(manifest)))
+        f.write(manifest)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name][1])
+            f.write(array.tobytes())
+        size = data_start + offset
+        f.truncate(size)
+    logger.info(ls.GRAPH_SNAPSHOT_WRITTEN.format(size=size, path=path))
+    return size
+
+
+def is_graph_snapshot(path: Path) -> bool:
+    if not path.is_file():
+        return False
+    with open(path, "rb") as f:
+        return f.read(len(cs.COMPACT_SNAPSHOT_MAGIC)) == cs.COMPACT_SNAPSHOT_MAGIC
+
+
+def read_graph_snapshot(path: Path) -> _CompactGraph:
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mapped) < _HEADER.size:
+        raise ValueError(ex.GRAPH_SNAPSHOT_BAD_MAGIC.format(path=path))
+    magic, manifest_size = _HEADER.unpack_from(mapped, 0)
+    if magic != cs.COMPACT_SNAPSHOT_MAGIC:
+        raise ValueError(ex.GRAPH_SNAPSHOT_BAD_MAGIC.format(path=path))
+    manifest = json.loads(mapped[_HEADER.size : _HEADER.size + manifest_size])
+    data_start = _aligned(_HEADER.size + manifest_size)
+    arrays: dict[str, NDArray[Any]] = {
+        name: np.frombuffer(
+            mapped, dtype=np.dtype(dtype), count=count, offset=data_start + offset
+        )
+        for name, (dtype, offset, count) in manifest[cs.COMPACT_KEY_ARRAYS].items()
+    }
+
+    def columns(prefix: str, kinds: dict[str, str]) -> dict[str, _Column]:
+        return {
+            key: _Column(
+                kind=cs.CompactColumnKind(kind),
+                rows=arrays[_column_array_name(prefix, key, cs.COMPACT_COLUMN_ROWS)],
+                values=arrays[
+                    _column_array_name(prefix, key, cs.COMPACT_COLUMN_VALUES)
+                ],
+                data=arrays.get(
+                    _column_array_name(prefix, key, cs.COMPACT_COLUMN_DATA)
+                ),
+            )
+            for key, kind in kinds.items()
+        }
+
+    return _CompactGraph(
+        metadata=manifest[cs.COMPACT_KEY_METADATA],
+        labels=manifest[cs.COMPACT_KEY_LABELS],
+        types=manifest[cs.COMPACT_KEY_TYPES],
+        node_columns=columns(
+            cs.COMPACT_NODE_COLUMN_PREFIX, manifest[cs.COMPACT_KEY_NODE_COLUMNS]
+        ),
+        rel_columns=columns(
+            cs.COMPACT_REL_COLUMN_PREFIX, manifest[cs.COMPACT_KEY_REL_COLUMNS]
+        ),
+        **{name: arrays[name] for name in _CompactGraph.ARRAY_FIELDS},
+    )
+
+
+class CompactGraphLoader(GraphLoader):
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self._graph: _CompactGraph | None = None
+        self._label_codes: dict[str, int] = {}
+        self._value_indexes: dict[str, dict[PropertyValue, list[int]]] = {}
+
+    def _ensure_loaded(self) -> None:
+        if self._graph is None:
+            self.load()
+
+    def load(self) -> None:
+        if not self.file_path.exists():
+            raise FileNotFoundError(ex.GRAPH_FILE_NOT_FOUND.format(path=self.file_path))
+
+        logger.info(ls.LOADING_GRAPH.format(path=self.file_path))
+        if is_graph_snapshot(self.file_path):
+            graph = read_graph_snapshot(self.file_path)
+            message = ls.LOADED_GRAPH_SNAPSHOT
+        else:
+            builder = _CompactGraphBuilder()
+            for kind, record in iter_graph_records(self.file_path):
+                if kind == cs.EXPORT_KIND_NODE:
+                    builder.add_node(record)
+                elif kind == cs.EXPORT_KIND_RELATIONSHIP:
+                    builder.add_relationship(record)
+                elif kind == cs.EXPORT_KIND_METADATA:
+                    builder.metadata = GraphMetadata(**record)
+            graph = builder.build()
+            message = ls.LOADED_GRAPH
+        self._graph = graph
+        self._label_codes = {label: code for code, label in enumerate(graph.labels)}
+        self._value_indexes = {}
+        logger.info(
+            message.format(
+                nodes=graph.node_count, relationships=graph.relationship_count
+            )
+        )
+
+    @ensure_loaded
+    def save_snapshot(self, path: Path) -> int:
+        return write_graph_snapshot(self._loaded(), path)
+
+    def _loaded(self) -> _CompactGraph:
+        assert self._graph is not None, ex.DATA_NOT_LOADED
+        return self._graph
+
+    def _node(self, dense: int) -> GraphNode:
+        graph = self._loaded()
+        start, end = graph.label_indptr[dense], graph.label_indptr[dense + 1]
+        return GraphNode(
+            node_id=int(graph.node_ids[dense]),
+            labels=[graph.labels[code] for code in graph.label_indices[start:end]],
+            properties=_row_properties(graph.node_columns, dense),
+        )
+
+    def _relationship(self, ordinal: int) -> GraphRelationship:
+        graph = self._loaded()
+        return GraphRelationship(
+            from_id=int(graph.rel_from[ordinal]),
+            to_id=int(graph.rel_to[ordinal]),
+            type=graph.types[graph.rel_type[ordinal]],
+            properties=_row_properties(graph.rel_columns, ordinal),
+        )
+
+    def _adjacent(
+        self, node_id: int, indptr: NDArray[np.int64], indices: IndexArray
+    ) -> list[GraphRelationship]:
+        vertex = self._loaded().vertex_index(node_id)
+        if vertex is None:
+            return []
+        return [
+            self._relationship(int(ordinal))
+            for ordinal in indices[indptr[vertex] : indptr[vertex + 1]]
+        ]
+
+    @property
+    @ensure_loaded
+    def nodes(self) -> list[GraphNode]:
+        return [self._node(dense) for dense in range(self._loaded().node_count)]
+
+    @property
+    @ensure_loaded
+    def relationships(self) -> list[GraphRelationship]:
+        return [
+            self._relationship(ordinal)
+            for ordinal in range(self._loaded().relationship_count)
+        ]
+
+    @property
+    @ensure_loaded
+    def metadata(self) -> GraphMetadata:
+        return self._loaded().metadata
+
+    @ensure_loaded
+    def find_nodes_by_label(self, label: str) -> list[GraphNode]:
+        code = self._label_codes.get(label)
+        if code is None:
+            return []
+        graph = self._loaded()
+        entries = np.flatnonzero(graph.label_indices == code)
+        owners = np.searchsorted(graph.label_indptr, entries, side="right") - 1
+        return [self._node(int(dense)) for dense in owners]
+
+    @ensure_loaded
+    def find_node_by_property(
+        self, property_name: str, value: PropertyValue
+    ) -> list[GraphNode]:
+        if property_name not in self._value_indexes:
+            column = self._loaded().node_columns.get(property_name)
+            self._value_indexes[property_name] = column.value_index() if column else {}
+        return [
+            self._node(dense)
+            for dense in self._value_indexes[property_name].get(value, [])
+        ]
+
+    @ensure_loaded
+    def get_node_by_id(self, node_id: int) -> GraphNode | None:
+        dense = self._loaded().dense_index(node_id)
+        return None if dense is None else self._node(dense)
+
+    @ensure_loaded
+    def get_outgoing_relationships(self, node_id: int) -> list[GraphRelationship]:
+        graph = self._loaded()
+        return self._adjacent(node_id, graph.out_indptr, graph.out_indices)
+
+    @ensure_loaded
+    def get_incoming_relationships(self, node_id: int) -> list[GraphRelationship]:
+        graph = self._loaded()
+        return self._adjacent(node_id, graph.in_indptr, graph.in_indices)
+
+    @ensure_loaded
+    def summary(self) -> GraphSummary:
+        graph = self._loaded()
+        label_counts = np.bincount(graph.label_indices, minlength=len(graph.labels))
+        type_counts = np.bincount(graph.rel_type, minlength=len(graph.types))
+        return GraphSummary(
+            total_nodes=graph.node_count,
+            total_relationships=graph.relationship_count,
+            node_labels={
+                label: int(count)
+                for label, count in zip(graph.labels, label_counts)
+                if count
+            },
+            relationship_types={
+                rel_type: int(count)
+                for rel_type, count in zip(graph.types, type_counts)
+                if count
+            },
+            metadata=graph.metadata,
+        )
+
+
+def load_compact_graph(file_path: str) -> CompactGraphLoader:
+    loader = CompactGraphLoader(file_path)
+    loader.load()
+    return loader
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from loguru import logger
+
+from . import constants as cs
+from . import logs as ls
+from .graph_export import iter_graph_rows
+from .services.graph_service import MemgraphIngestor
+from .services.protobuf_loader import load_protobuf_index
+from .services.protobuf_service import LABEL_TO_ONEOF_FIELD, payload_fields
+from .types_defs import PropertyDict, PropertyValue
+
+NodeKey = tuple[str, PropertyValue]
+RelKey = tuple[NodeKey, str, NodeKey]
+
+
+@dataclass(slots=True)
+class GraphSnapshot:
+    nodes: dict[NodeKey, PropertyDict] = field(default_factory=dict)
+    relationships: dict[RelKey, PropertyDict] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class GraphDiff:
+    added_nodes: list[tuple[NodeKey, PropertyDict]]
+    updated_nodes: list[tuple[NodeKey, PropertyDict]]
+    removed_nodes: list[NodeKey]
+    added_relationships: list[tuple[RelKey, PropertyDict]]
+    updated_relationships: list[tuple[RelKey, PropertyDict]]
+    removed_relationships: list[RelKey]
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.added_nodes
+            or self.updated_nodes
+            or self.removed_nodes
+            or self.added_relationships
+            or self.updated_relationships
+            or self.removed_relationships
+        )
+
+
+def _node_key(label: str, properties: PropertyDict) -> NodeKey | None:
+    if label not in LABEL_TO_ONEOF_FIELD:
+        return None
+    node_id = properties.get(cs.NODE_UNIQUE_CONSTRAINTS[label])
+    if node_id is None or isinstance(node_id, list):
+        return None
+    return (label, node_id)
+
+
+def _is_set(value: PropertyValue) -> bool:
+    # (H) Repeated proto fields cannot tell [] from unset, so both read as absent
+    return value is not None and value != []
+
+
+def _node_properties(label: str, properties: PropertyDict) -> PropertyDict:
+    fields = payload_fields(cs.NodeLabel(label))
+    return {k: v for k, v in properties.items() if k in fields and _is_set(v)}
+
+
+def _rel_properties(properties: PropertyDict | None) -> PropertyDict:
+    return {
+        k: v
+        for k, v in (properties or {}).items()
+        if k not in cs.DIFF_IGNORED_REL_PROPERTIES and _is_set(v)
+    }
+
+
+def _node_spec(key: NodeKey) -> tuple[str, str, PropertyValue]:
+    label, node_id = key
+    return (label, cs.NODE_UNIQUE_CONSTRAINTS[label], node_id)
+
+
+class _SnapshotCollector:
+    def __init__(self) -> None:
+        self.snapshot = GraphSnapshot()
+
+    def ensure_node_batch(self, label: str, properties: PropertyDict) -> None:
+        if key := _node_key(label, properties):
+            self.snapshot.nodes[key] = _node_properties(label, properties)
+
+    def ensure_relationship_batch(
+        self,
+        from_spec: tuple[str, str, PropertyValue],
+        rel_type: str,
+        to_spec: tuple[str, str, PropertyValue],
+        properties: PropertyDict | None = None,
+    ) -> None:
+        key = ((from_spec[0], from_spec[2]), rel_type, (to_spec[0], to_spec[2]))
+        self.snapshot.relationships[key] = _rel_properties(properties)
+
+    def flush_all(self) -> None:
+        pass
+
+
+def snapshot_from_index(index_dir: Path) -> GraphSnapshot:
+    collector = _SnapshotCollector()
+    load_protobuf_index(collector, index_dir)
+    return collector.snapshot
+
+
+def snapshot_from_memgraph(
+    ingestor: MemgraphIngestor,
+    *,
+    project_id: str | None = None,
+    page_size: int | None = None,
+) -> GraphSnapshot:
+    snapshot = GraphSnapshot()
+    node_keys: dict[int, NodeKey] = {}
+    nodes, relationships = iter_graph_rows(
+        ingestor, project_id=project_id, page_size=page_size
+    )
+    for row in nodes:
+        labels = row.get(cs.KEY_LABELS)
+        properties = row.get(cs.KEY_PROPERTIES)
+        node_id = row.get(cs.KEY_NODE_ID)
+        if (
+            not isinstance(labels, list)
+            or not isinstance(properties, dict)
+            or not isinstance(node_id, int)
+        ):
+            continue
+        for label in labels:
+            if key := _node_key(str(label), properties):
+                node_keys[node_id] = key
+                snapshot.nodes[key] = _node_properties(str(label), properties)
+                break
+    for row in relationships:
+        source = node_keys.get(row.get(cs.KEY_FROM_ID))
+        target = node_keys.get(row.get(cs.KEY_TO_ID))
+        properties = row.get(cs.KEY_PROPERTIES)
+        if source is None or target is None:
+            continue
+        snapshot.relationships[(source, str(row.get(cs.KEY_TYPE)), target)] = (
+            _rel_properties(properties if isinstance(properties, dict) else None)
+        )
+    return snapshot
+
+
+def _changed_properties(old: PropertyDict, new: PropertyDict) -> PropertyDict:
+    changes: PropertyDict = {k: v for k, v in new.items() if old.get(k) != v}
+    changes.update({k: None for k in old if k not in new})
+    return changes
+
+
+def diff_snapshots(old: GraphSnapshot, new: GraphSnapshot) -> GraphDiff:
+    added_nodes, updated_nodes = [], []
+    for key, properties in new.nodes.items():
+        if key not in old.nodes:
+            added_nodes.append((key, properties))
+        elif changes := _changed_properties(old.nodes[key], properties):
+            updated_nodes.append((key, changes))
+    added_rels, updated_rels = [], []
+    for key, properties in new.relationships.items():
+        if key not in old.relationships:
+            added_rels.append((key, properties))
+        elif changes := _changed_properties(old.relationships[key], properties):
+            updated_rels.append((key, changes))
+    diff = GraphDiff(
+        added_nodes=added_nodes,
+        updated_nodes=updated_nodes,
+        removed_nodes=[key for key in old.nodes if key not in new.nodes],
+        added_relationships=added_rels,
+        updated_relationships=updated_rels,
+        removed_relationships=[
+            key for key in old.relationships if key not in new.relationships
+        ],
+    )
+    logger.info(
+        ls.GRAPH_DIFF_COMPUTED.format(
+            added_nodes=len(diff.added_nodes),
+            updated_nodes=len(diff.updated_nodes),
+            removed_nodes=len(diff.removed_nodes),
+            added_rels=len(diff.added_relationships),
+            updated_rels=len(diff.updated_relationships),
+            removed_rels=len(diff.removed_relationships),
+        )
+    )
+    return diff
+
+
+def apply_graph_diff(
+    ingestor: MemgraphIngestor, diff: GraphDiff, project_id: str
+) -> None:
+    removed_nodes = set(diff.removed_nodes)
+    ingestor.delete_relationships(
+        [
+            (_node_spec(source), rel_type, _node_spec(target))
+            for source, rel_type, target in diff.removed_relationships
+            if source not in removed_nodes and target not in removed_nodes
+        ]
+    )
+    ingestor.delete_nodes(diff.removed_nodes)
+    for key, properties in (*diff.added_nodes, *diff.updated_nodes):
+        label, id_key, node_id = _node_spec(key)
+        ingestor.ensure_node_batch(
+            label, properties | {id_key: node_id, cs.KEY_PROJECT_ID: project_id}
+        )
+    for (source, rel_type, target), properties in (
+        *diff.added_relationships,
+        *diff.updated_relationships,
+    ):
+        ingestor.ensure_relationship_batch(
+            _node_spec(source), rel_type, _node_spec(target), properties or None
+        )
+    ingestor.flush_all()
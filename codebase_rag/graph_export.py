@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO
+
+from loguru import logger
+
+from . import constants as cs
+from . import exceptions as ex
+from . import logs as ls
+from .config import settings
+from .cypher_queries import (
+    build_export_nodes_query,
+    build_export_relationships_query,
+)
+from .graph_columnar import write_columnar_graph
+from .services import QueryProtocol
+from .types_defs import GraphMetadata, PropertyValue, ResultRow
+from .utils.dependencies import has_zstandard
+
+
+def infer_export_compression(path: Path) -> cs.ExportCompression:
+    return cs.EXPORT_COMPRESSION_SUFFIXES.get(path.suffix, cs.ExportCompression.NONE)
+
+
+def infer_export_format(path: Path) -> cs.ExportFormat:
+    if path.suffix in cs.COLUMNAR_SUFFIXES:
+        return cs.COLUMNAR_SUFFIXES[path.suffix]
+    suffixes = path.suffixes
+    if suffixes and suffixes[-1] in cs.EXPORT_COMPRESSION_SUFFIXES:
+        suffixes = suffixes[:-1]
+    if suffixes and suffixes[-1] == cs.EXPORT_JSONL_SUFFIX:
+        return cs.ExportFormat.JSONL
+    return cs.ExportFormat.JSON
+
+
+@contextmanager
+def open_export_stream(
+    path: Path, compression: cs.ExportCompression
+) -> Iterator[IO[str]]:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if compression == cs.ExportCompression.GZIP:
+        with gzip.open(path, "wt", encoding=cs.ENCODING_UTF8) as f:
+            yield f
+    elif compression == cs.ExportCompression.ZSTD:
+        if not has_zstandard():
+            raise RuntimeError(ex.ZSTD_MISSING)
+        import zstandard
+
+        with (
+            open(path, "wb") as raw,
+            zstandard.ZstdCompressor().stream_writer(raw) as compressed,
+            io.TextIOWrapper(compressed, encoding=cs.ENCODING_UTF8) as f,
+        ):
+            yield f
+    else:
+        with open(path, "w", encoding=cs.ENCODING_UTF8) as f:
+            yield f
+
+
+@contextmanager
+def open_export_reader(path: Path) -> Iterator[IO[str]]:
+    compression = infer_export_compression(path)
+    if compression == cs.ExportCompression.GZIP:
+        with gzip.open(path, "rt", encoding=cs.ENCODING_UTF8) as f:
+            yield f
+    elif compression == cs.ExportCompression.ZSTD:
+        if not has_zstandard():
+            raise RuntimeError(ex.ZSTD_MISSING)
+        import zstandard
+
+        with (
+            open(path, "rb") as raw,
+            zstandard.ZstdDecompressor().stream_reader(raw) as decompressed,
+            io.TextIOWrapper(decompressed, encoding=cs.ENCODING_UTF8) as f,
+        ):
+            yield f
+    else:
+        with open(path, encoding=cs.ENCODING_UTF8) as f:
+            yield f
+
+
+def _dumps(value: object) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=cs.EXPORT_JSON_SEPARATORS)
+
+
+def _iter_rows(
+    ingestor: QueryProtocol,
+    query: str,
+    params: dict[str, PropertyValue],
+    kind: str,
+    page_size: int,
+) -> Iterator[ResultRow]:
+    rows = 0
+    for row in ingestor.fetch_iter(query, params, chunk_size=page_size):
+        rows += 1
+        yield row
+    logger.debug(ls.MG_EXPORT_STREAMED.format(kind=kind, rows=rows))
+
+
+def _write_json_array(f: IO[str], rows: Iterable[ResultRow]) -> int:
+    count = 0
+    for row in rows:
+        if count:
+            f.write(",")
+        f.write(_dumps(row))
+        count += 1
+    return count
+
+
+def _write_jsonl(f: IO[str], kind: str, rows: Iterable[ResultRow]) -> int:
+    count = 0
+    for row in rows:
+        f.write(_dumps({cs.EXPORT_KEY_KIND: kind} | row))
+        f.write("\n")
+        count += 1
+    return count
+
+
+def iter_graph_rows(
+    ingestor: QueryProtocol,
+    *,
+    project_id: str | None = None,
+    page_size: int | None = None,
+) -> tuple[Iterator[ResultRow], Iterator[ResultRow]]:
+    page_size = page_size or settings.MEMGRAPH_EXPORT_PAGE_SIZE
+    params: dict[str, PropertyValue] = (
+        {cs.KEY_PROJECT_ID: project_id} if project_id else {}
+    )
+    nodes = _iter_rows(
+        ingestor,
+        build_export_nodes_query(project_id is not None),
+        params,
+        cs.EXPORT_KIND_NODE,
+        page_size,
+    )
+    relationships = _iter_rows(
+        ingestor,
+        build_export_relationships_query(project_id is not None),
+        params,
+        cs.EXPORT_KIND_RELATIONSHIP,
+        page_size,
+    )
+    return nodes, relationships
+
+
+def stream_graph_export(
+    ingestor: QueryProtocol,
+    output_path: Path,
+    *,
+    fmt: cs.ExportFormat | None = None,
+    compression: cs.ExportCompression | None = None,
+    project_id: str | None = None,
+    page_size: int | None = None,
+) -> GraphMetadata:
+    fmt = fmt or infer_export_format(output_path)
+    exported_at = datetime.now(UTC).isoformat()
+    nodes, relationships = iter_graph_rows(
+        ingestor, project_id=project_id, page_size=page_size
+    )
+
+    logger.info(ls.MG_EXPORTING)
+    if fmt in cs.COLUMNAR_FORMATS:
+        metadata = write_columnar_graph(
+            output_path,
+            nodes,
+            relationships,
+            fmt=fmt,
+            compression=compression,
+            exported_at=exported_at,
+        )
+    else:
+        metadata = _write_json_export(
+            output_path,
+            nodes,
+            relationships,
+            fmt=fmt,
+            compression=compression or infer_export_compression(output_path),
+            exported_at=exported_at,
+        )
+    logger.info(
+        ls.MG_EXPORTED.format(
+            nodes=metadata["total_nodes"], rels=metadata["total_relationships"]
+        )
+    )
+    return metadata
+
+
+def _write_json_export(
+    output_path: Path,
+    nodes: Iterable[ResultRow],
+    relationships: Iterable[ResultRow],
+    *,
+    fmt: cs.ExportFormat,
+    compression: cs.ExportCompression,
+    exported_at: str,
+) -> GraphMetadata:
+    with open_export_stream(output_path, compression) as f:
+        if fmt == cs.ExportFormat.JSONL:
+            metadata = GraphMetadata(
+                total_nodes=_write_jsonl(f, cs.EXPORT_KIND_NODE, nodes),
+                total_relationships=_write_jsonl(
+                    f, cs.EXPORT_KIND_RELATIONSHIP, relationships
+                ),
+                exported_at=exported_at,
+            )
+            _write_jsonl(f, cs.EXPORT_KIND_METADATA, [dict(metadata)])
+        else:
+            f.write(f"{{{_dumps(cs.KEY_NODES)}:[")
+            total_nodes = _write_json_array(f, nodes)
+            f.write(f"],{_dumps(cs.KEY_RELATIONSHIPS)}:[")
+            metadata = GraphMetadata(
+                total_nodes=total_nodes,
+                total_relationships=_write_json_array(f, relationships),
+                exported_at=exported_at,
+            )
+            f.write(f"],{_dumps(cs.KEY_METADATA)}:{_dumps(metadata)}}}")
+    return metadata
@@ -1,6 +1,8 @@
 import json
+import sys
 from collections import Counter, defaultdict
 from pathlib import Path
+from typing import Any
 
 from loguru import logger
 
@@ -8,14 +10,20 @@ from . import constants as cs
 from . import exceptions as ex
 from . import logs as ls
 from .decorators import ensure_loaded
-from .models import GraphNode, GraphRelationship
-from .types_defs import GraphData, GraphMetadata, GraphSummary, PropertyValue
+from .graph_stream import iter_graph_records
+from .models import GraphNode, GraphRelationship, LazyGraphNode
+from .types_defs import GraphMetadata, GraphSummary, PropertyValue
+
+
+def _interned_keys(properties: dict[str, PropertyValue]) -> dict[str, PropertyValue]:
+    return {sys.intern(key): value for key, value in properties.items()}
 
 
 class GraphLoader:
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, lazy_properties: bool = False):
         self.file_path = Path(file_path)
-        self._data: GraphData | None = None
+        self.lazy_properties = lazy_properties
+        self._metadata: GraphMetadata | None = None
         self._nodes: list[GraphNode] | None = None
         self._relationships: list[GraphRelationship] | None = None
 
@@ -30,7 +38,7 @@ class GraphLoader:
         self._property_indexes: dict[str, dict[PropertyValue, list[GraphNode]]] = {}
 
     def _ensure_loaded(self) -> None:
-        if self._data is None:
+        if self._nodes is None:
             self.load()
 
     def load(self) -> None:
@@ -38,37 +46,23 @@ class GraphLoader:
             raise FileNotFoundError(ex.GRAPH_FILE_NOT_FOUND.format(path=self.file_path))
 
         logger.info(ls.LOADING_GRAPH.format(path=self.file_path))
-        with open(self.file_path, encoding=cs.ENCODING_UTF8) as f:
-            self._data = json.load(f)
-
-        if self._data is None:
-            raise RuntimeError(ex.FAILED_TO_LOAD_DATA)
-
+        self._reset()
         self._nodes = []
-        for node_data in self._data[cs.KEY_NODES]:
-            node = GraphNode(
-                node_id=node_data[cs.KEY_NODE_ID],
-                labels=node_data[cs.KEY_LABELS],
-                properties=node_data[cs.KEY_PROPERTIES],
-            )
-            self._nodes.append(node)
-
-            self._nodes_by_id[node.node_id] = node
-            for label in node.labels:
-                self._nodes_by_label[label].append(node)
-
         self._relationships = []
-        for rel_data in self._data[cs.KEY_RELATIONSHIPS]:
-            rel = GraphRelationship(
-                from_id=rel_data[cs.KEY_FROM_ID],
-                to_id=rel_data[cs.KEY_TO_ID],
-                type=rel_data[cs.KEY_TYPE],
-                properties=rel_data[cs.KEY_PROPERTIES],
-            )
-            self._relationships.append(rel)
-
-            self._outgoing_rels[rel.from_id].append(rel)
-            self._incoming_rels[rel.to_id].append(rel)
+        try:
+            for kind, record in iter_graph_records(self.file_path):
+                if kind == cs.EXPORT_KIND_NODE:
+                    self._add_node(record)
+                elif kind == cs.EXPORT_KIND_RELATIONSHIP:
+                    self._add_relationship(record)
+                elif kind == cs.EXPORT_KIND_METADATA:
+                    self._metadata = GraphMetadata(**record)
+
+            if self._metadata is None:
+                raise RuntimeError(ex.FAILED_TO_LOAD_DATA)
+        except BaseException:
+            self._reset()
+            raise
 
         logger.info(
             ls.LOADED_GRAPH.format(
@@ -76,6 +70,55 @@ class GraphLoader:
             )
         )
 
+    def _reset(self) -> None:
+        self._metadata = None
+        self._nodes = None
+        self._relationships = None
+        self._nodes_by_id.clear()
+        self._nodes_by_label.clear()
+        self._outgoing_rels.clear()
+        self._incoming_rels.clear()
+        self._property_indexes.clear()
+
+    def _add_node(self, record: dict[str, Any]) -> None:
+        assert self._nodes is not None, ex.NODES_NOT_LOADED
+        labels = [sys.intern(label) for label in record[cs.KEY_LABELS]]
+        node = (
+            LazyGraphNode(
+                node_id=record[cs.KEY_NODE_ID],
+                labels=labels,
+                properties_json=json.dumps(
+                    record[cs.KEY_PROPERTIES],
+                    ensure_ascii=False,
+                    separators=cs.EXPORT_JSON_SEPARATORS,
+                ),
+            )
+            if self.lazy_properties
+            else GraphNode(
+                node_id=record[cs.KEY_NODE_ID],
+                labels=labels,
+                properties=_interned_keys(record[cs.KEY_PROPERTIES]),
+            )
+        )
+        self._nodes.append(node)
+
+        self._nodes_by_id[node.node_id] = node
+        for label in labels:
+            self._nodes_by_label[label].append(node)
+
+    def _add_relationship(self, record: dict[str, Any]) -> None:
+        assert self._relationships is not None, ex.RELATIONSHIPS_NOT_LOADED
+        rel = GraphRelationship(
+            from_id=record[cs.KEY_FROM_ID],
+            to_id=record[cs.KEY_TO_ID],
+            type=sys.intern(record[cs.KEY_TYPE]),
+            properties=_interned_keys(record[cs.KEY_PROPERTIES]),
+        )
+        self._relationships.append(rel)
+
+        self._outgoing_rels[rel.from_id].append(rel)
+        self._incoming_rels[rel.to_id].append(rel)
+
     def _build_property_index(self, property_name: str) -> None:
         if property_name in self._property_indexes:
             return
@@ -102,8 +145,8 @@ class GraphLoader:
     @property
     @ensure_loaded
     def metadata(self) -> GraphMetadata:
-        assert self._data is not None, ex.DATA_NOT_LOADED
-        return self._data[cs.KEY_METADATA]
+        assert self._metadata is not None, ex.DATA_NOT_LOADED
+        return self._metadata
 
     @ensure_loaded
     def find_nodes_by_label(self, label: str) -> list[GraphNode]:
@@ -148,7 +191,7 @@ class GraphLoader:
         )
 
 
-def load_graph(file_path: str) -> GraphLoader:
-    loader = GraphLoader(file_path)
+def load_graph(file_path: str, lazy_properties: bool = False) -> GraphLoader:
+    loader = GraphLoader(file_path, lazy_properties)
     loader.load()
     return loader
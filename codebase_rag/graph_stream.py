@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any
+
+from . import constants as cs
+from . import exceptions as ex
+from .graph_columnar import is_columnar_export, read_columnar_graph
+from .graph_export import infer_export_format, open_export_reader
+
+GraphRecord = tuple[str, dict[str, Any]]
+
+_WHITESPACE_CHARS = " \t\n\r"
+_WHITESPACE = re.compile(f"[{_WHITESPACE_CHARS}]*")
+_ARRAY_KINDS = {
+    cs.KEY_NODES: cs.EXPORT_KIND_NODE,
+    cs.KEY_RELATIONSHIPS: cs.EXPORT_KIND_RELATIONSHIP,
+}
+
+
+class _JsonReader:
+    def __init__(
+        self, f: IO[str], path: Path, chunk_size: int, max_value_chars: int
+    ) -> None:
+        self._f = f
+        self._path = path
+        self._chunk_size = chunk_size
+        self._max_value_chars = max_value_chars
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+
+    def _fill(self) -> bool:
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            if self._pos < len(self._buffer):
+                char = self._buffer[self._pos]
+                if char not in _WHITESPACE_CHARS:
+                    return char
+                if match := _WHITESPACE.match(self._buffer, self._pos):
+                    self._pos = match.end()
+                continue
+            if not self._fill():
+                return ""
+
+    def skip(self, char: str) -> bool:
+        if self.peek() != char:
+            return False
+        self._pos += 1
+        return True
+
+    def expect(self, char: str) -> None:
+        if not self.skip(char):
+            raise ValueError(
+                ex.GRAPH_STREAM_MALFORMED.format(
+                    path=self._path, expected=char, found=self.peek()
+                )
+            )
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # (H) Past the cap the error is a real one, not a value cut by a chunk.
+                if (
+                    len(self._buffer) - self._pos > self._max_value_chars
+                    or not self._fill()
+                ):
+                    raise
+                continue
+            # (H) A number can end exactly at the chunk boundary; read on to be sure.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def items(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.skip("]"):
+            return
+        while True:
+            yield self.value()
+            if not self.skip(","):
+                self.expect("]")
+                return
+
+
+def _iter_json_document(
+    f: IO[str], path: Path, chunk_size: int, max_value_chars: int
+) -> Iterator[GraphRecord]:
+    reader = _JsonReader(f, path, chunk_size, max_value_chars)
+    reader.expect("{")
+    if reader.skip("}"):
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if kind := _ARRAY_KINDS.get(key):
+            for item in reader.items():
+                yield kind, item
+        elif key == cs.KEY_METADATA:
+            yield cs.EXPORT_KIND_METADATA, reader.value()
+        else:
+            reader.value()
+        if not reader.skip(","):
+            reader.expect("}")
+            return
+
+
+def _iter_jsonl(f: IO[str]) -> Iterator[GraphRecord]:
+    for line in f:
+        if line.strip():
+            record = json.loads(line)
+            yield record.pop(cs.EXPORT_KEY_KIND), record
+
+
+def _iter_columnar(path: Path) -> Iterator[GraphRecord]:
+    data = read_columnar_graph(path)
+    for node in data[cs.KEY_NODES]:
+        yield cs.EXPORT_KIND_NODE, dict(node)
+    for rel in data[cs.KEY_RELATIONSHIPS]:
+        yield cs.EXPORT_KIND_RELATIONSHIP, dict(rel)
+    yield cs.EXPORT_KIND_METADATA, dict(data[cs.KEY_METADATA])
+
+
+def iter_graph_records(
+    path: Path,
+    chunk_size: int = cs.GRAPH_STREAM_CHUNK_CHARS,
+    max_value_chars: int = cs.GRAPH_STREAM_MAX_VALUE_CHARS,
+) -> Iterator[GraphRecord]:
+    if is_columnar_export(path):
+        yield from _iter_columnar(path)
+        return
+    with open_export_reader(path) as f:
+        if infer_export_format(path) == cs.ExportFormat.JSONL:
+            yield from _iter_jsonl(f)
+        else:
+            yield from _iter_json_document(f, path, chunk_size, max_value_chars)
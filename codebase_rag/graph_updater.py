@@ -10,6 +10,7 @@ from . import constants as cs
 from . import logs as ls
 from .config import settings
 from .language_spec import LANGUAGE_FQN_SPECS, get_language_spec
+from .lexical_index import LexicalIndex, lexical_index_path
 from .parsers.factory import ProcessorFactory
 from .services import IngestorProtocol, QueryProtocol
 from .types_defs import (
@@ -287,6 +288,7 @@ class GraphUpdater:
         logger.info(ls.ANALYSIS_COMPLETE)
         self.ingestor.flush_all()
 
+        self._build_lexical_index()
         self._generate_semantic_embeddings()
 
     def remove_file_from_state(self, file_path: Path) -> None:
@@ -358,6 +360,27 @@ class GraphUpdater:
                 file_path, root_node, language, self.queries
             )
 
+    def _build_lexical_index(self) -> None:
+        if not isinstance(self.ingestor, QueryProtocol):
+            return
+
+        try:
+            logger.info(ls.LEXICAL_INDEX_BUILDING)
+            rows = self.ingestor.fetch_iter(
+                cs.CYPHER_QUERY_LEXICAL_INDEX,
+                {cs.KEY_PROJECT_ID: self.project_id},
+                max_rows=settings.MEMGRAPH_FETCH_MAX_ROWS,
+            )
+            index = LexicalIndex.build(rows)
+            if not len(index):
+                logger.info(ls.LEXICAL_INDEX_EMPTY)
+                return
+            index.save(
+                lexical_index_path(Path(settings.LEXICAL_INDEX_PATH), self.project_id)
+            )
+        except Exception as e:
+            logger.warning(ls.LEXICAL_INDEX_FAILED.format(error=e))
+
     def _generate_semantic_embeddings(self) -> None:
         if not has_semantic_dependencies():
             logger.info(ls.SEMANTIC_NOT_AVAILABLE)
@@ -369,20 +392,21 @@ class GraphUpdater:
 
         try:
             from .embedder import embed_code
-            from .vector_store import store_embedding
+            from .vector_store import refresh_vector_index, store_embedding
 
             logger.info(ls.PASS_4_EMBEDDINGS)
 
-            results = self.ingestor.fetch_all(cs.CYPHER_QUERY_EMBEDDINGS)
-
-            if not results:
-                logger.info(ls.NO_FUNCTIONS_FOR_EMBEDDING)
-                return
-
-            logger.info(ls.GENERATING_EMBEDDINGS.format(count=len(results)))
+            results = self.ingestor.fetch_iter(
+                cs.CYPHER_QUERY_EMBEDDINGS,
+                {cs.KEY_PROJECT_ID: self.project_id},
+                max_rows=settings.MEMGRAPH_FETCH_MAX_ROWS,
+            )
+            logger.info(ls.GENERATING_EMBEDDINGS)
 
+            seen_count = 0
             embedded_count = 0
             for row in results:
+                seen_count += 1
                 parsed = self._parse_embedding_result(row)
                 if parsed is None:
                     continue
@@ -401,13 +425,20 @@ class GraphUpdater:
                 ):
                     try:
                         embedding = embed_code(source_code)
-                        store_embedding(node_id, embedding, qualified_name)
+                        store_embedding(
+                            node_id,
+                            embedding,
+                            qualified_name,
+                            project_id=parsed[cs.KEY_PROJECT_ID],
+                            label=parsed[cs.KEY_LABEL],
+                            module_path=file_path,
+                        )
                         embedded_count += 1
 
                         if embedded_count % settings.EMBEDDING_PROGRESS_INTERVAL == 0:
                             logger.debug(
                                 ls.EMBEDDING_PROGRESS.format(
-                                    done=embedded_count, total=len(results)
+                                    done=embedded_count, total=seen_count
                                 )
                             )
 
@@ -417,7 +448,12 @@ class GraphUpdater:
                         )
                 else:
                     logger.debug(ls.NO_SOURCE_FOR.format(name=qualified_name))
+
+            if not seen_count:
+                logger.info(ls.NO_FUNCTIONS_FOR_EMBEDDING)
+                return
             logger.info(ls.EMBEDDINGS_COMPLETE.format(count=embedded_count))
+            refresh_vector_index(self.project_id)
 
         except Exception as e:
             logger.warning(ls.EMBEDDING_GENERATION_FAILED.format(error=e))
@@ -463,6 +499,8 @@ class GraphUpdater:
         start_line = row.get(cs.KEY_START_LINE)
         end_line = row.get(cs.KEY_END_LINE)
         file_path = row.get(cs.KEY_PATH)
+        project_id = row.get(cs.KEY_PROJECT_ID)
+        labels = row.get(cs.KEY_TYPE)
 
         return EmbeddingQueryResult(
             node_id=node_id,
@@ -470,4 +508,6 @@ class GraphUpdater:
             start_line=start_line if isinstance(start_line, int) else None,
             end_line=end_line if isinstance(end_line, int) else None,
             path=file_path if isinstance(file_path, str) else None,
+            project_id=project_id if isinstance(project_id, str) else None,
+            label=str(labels[0]) if isinstance(labels, list) and labels else None,
         )
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import heapq
+import json
+import math
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+from loguru import logger
+
+from . import constants as cs
+from . import logs as ls
+from .types_defs import LexicalDocument, ResultRow
+
+_WORD_RE = re.compile(cs.LEXICAL_WORD_PATTERN)
+_SUBTOKEN_RE = re.compile(cs.LEXICAL_SUBTOKEN_PATTERN)
+
+_CACHED_INDEXES: dict[str, tuple[float, LexicalIndex | None]] = {}
+
+
+def lexical_index_path(base: Path, project_id: str | None) -> Path:
+    if not project_id:
+        return base
+    suffix = re.sub(cs.QDRANT_COLLECTION_NAME_PATTERN, "_", project_id)
+    return base.with_name(
+        f"{base.stem}{cs.LEXICAL_PROJECT_SEPARATOR}{suffix}{base.suffix}"
+    )
+
+
+def split_identifier(word: str) -> list[str]:
+    return [
+        token.lower()
+        for chunk in word.split(cs.CHAR_UNDERSCORE)
+        for token in _SUBTOKEN_RE.findall(chunk)
+    ]
+
+
+def tokenize(text: str) -> list[str]:
+    tokens: list[str] = []
+    for word in _WORD_RE.findall(text):
+        tokens.append(word.lower())
+        subtokens = split_identifier(word)
+        if len(subtokens) > 1:
+            tokens.extend(subtokens)
+    return tokens
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[tuple[int, float]]], k: int
+) -> list[tuple[int, float]]:
+    fused: dict[int, float] = defaultdict(float)
+    for ranking in rankings:
+        for rank, (node_id, _) in enumerate(ranking, 1):
+            fused[node_id] += 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
+def _matches_filter(
+    doc: LexicalDocument,
+    project_id: str | None,
+    labels: Sequence[str] | None,
+    path_prefix: str | None,
+) -> bool:
+    if project_id and doc.get(cs.KEY_PROJECT_ID) != project_id:
+        return False
+    if labels and doc[cs.KEY_TYPE] not in labels:
+        return False
+    if path_prefix:
+        prefix = path_prefix.strip(cs.SEPARATOR_SLASH)
+        path = doc.get(cs.KEY_PATH) or ""
+        if path != prefix and not path.startswith(prefix + cs.SEPARATOR_SLASH):
+            return False
+    return True
+
+
+class LexicalIndex:
+    def __init__(
+        self,
+        docs: list[LexicalDocument],
+        postings: dict[str, list[list[int]]],
+        doc_lengths: list[int],
+    ) -> None:
+        self.docs = docs
+        self.postings = postings
+        self.doc_lengths = doc_lengths
+        self.avg_length = sum(doc_lengths) / len(doc_lengths) if doc_lengths else 0.0
+        self._by_node_id = {doc["node_id"]: doc for doc in docs}
+        self._by_name: dict[str, list[LexicalDocument]] = defaultdict(list)
+        for doc in docs:
+            self._by_name[doc["name"]].append(doc)
+            self._by_name[doc["qualified_name"]].append(doc)
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    @classmethod
+    def build(cls, rows: Iterable[ResultRow]) -> LexicalIndex:
+        docs: list[LexicalDocument] = []
+        postings: dict[str, list[list[int]]] = defaultdict(list)
+        doc_lengths: list[int] = []
+
+        for row in rows:
+            node_id = row.get(cs.KEY_NODE_ID)
+            qualified_name = row.get(cs.KEY_QUALIFIED_NAME)
+            if not isinstance(node_id, int) or not isinstance(qualified_name, str):
+                continue
+            name = row.get(cs.KEY_NAME)
+            if not isinstance(name, str):
+                name = qualified_name.rsplit(cs.SEPARATOR_DOT, 1)[-1]
+            docstring = row.get(cs.KEY_DOCSTRING)
+            project_id = row.get(cs.KEY_PROJECT_ID)
+            path = row.get(cs.KEY_PATH)
+            labels = row.get(cs.KEY_TYPE)
+            node_type = (
+                str(labels[0])
+                if isinstance(labels, list) and labels
+                else cs.SEMANTIC_TYPE_UNKNOWN
+            )
+
+            counts: Counter[str] = Counter()
+            for token in tokenize(name):
+                counts[token] += cs.LEXICAL_NAME_WEIGHT
+            for token in tokenize(qualified_name):
+                counts[token] += cs.LEXICAL_QN_WEIGHT
+            if isinstance(docstring, str):
+                for token in tokenize(docstring):
+                    counts[token] += cs.LEXICAL_DOC_WEIGHT
+
+            doc_index = len(docs)
+            for token, tf in counts.items():
+                postings[token].append([doc_index, tf])
+            doc_lengths.append(sum(counts.values()))
+            docs.append(
+                LexicalDocument(
+                    node_id=node_id,
+                    qualified_name=qualified_name,
+                    name=name,
+                    type=node_type,
+                    project_id=project_id if isinstance(project_id, str) else None,
+                    path=path if isinstance(path, str) else None,
+                )
+            )
+
+        return cls(docs, dict(postings), doc_lengths)
+
+    def get(self, node_id: int) -> LexicalDocument | None:
+        return self._by_node_id.get(node_id)
+
+    def exact_matches(
+        self,
+        query: str,
+        *,
+        project_id: str | None = None,
+        labels: Sequence[str] | None = None,
+        path_prefix: str | None = None,
+    ) -> list[LexicalDocument]:
+        return [
+            doc
+            for doc in self._by_name.get(query.strip(), [])
+            if _matches_filter(doc, project_id, labels, path_prefix)
+        ]
+
+    def search(
+        self,
+        query: str,
+        top_k: int,
+        *,
+        project_id: str | None = None,
+        labels: Sequence[str] | None = None,
+        path_prefix: str | None = None,
+    ) -> list[tuple[int, float]]:
+        total = len(self.docs)
+        if not total:
+            return []
+
+        filtered = bool(project_id or labels or path_prefix)
+        allowed: dict[int, bool] = {}
+        scores: dict[int, float] = defaultdict(float)
+        k1, b = cs.LEXICAL_BM25_K1, cs.LEXICAL_BM25_B
+        for token in set(tokenize(query)):
+            posting = self.postings.get(token)
+            if not posting:
+                continue
+            idf = math.log(1.0 + (total - len(posting) + 0.5) / (len(posting) + 0.5))
+            for doc_index, tf in posting:
+                if filtered:
+                    if doc_index not in allowed:
+                        allowed[doc_index] = _matches_filter(
+                            self.docs[doc_index], project_id, labels, path_prefix
+                        )
+                    if not allowed[doc_index]:
+                        continue
+                norm = 1.0 - b + b * self.doc_lengths[doc_index] / self.avg_length
+                scores[doc_index] += idf * tf * (k1 + 1.0) / (tf + k1 * norm)
+
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        return [(self.docs[doc_index]["node_id"], score) for doc_index, score in best]
+
+    def save(self, path: Path) -> None:
+        payload = {
+            cs.LEXICAL_KEY_DOCS: self.docs,
+            cs.LEXICAL_KEY_POSTINGS: self.postings,
+            cs.LEXICAL_KEY_DOC_LENGTHS: self.doc_lengths,
+        }
+        tmp_path = path.with_name(path.name + cs.LEXICAL_TMP_SUFFIX)
+        tmp_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(payload), encoding=cs.ENCODING_UTF8)
+        tmp_path.replace(path)
+        logger.info(
+            ls.LEXICAL_INDEX_SAVED.format(
+                docs=len(self.docs), terms=len(self.postings), path=path
+            )
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> LexicalIndex:
+        payload = json.loads(path.read_text(encoding=cs.ENCODING_UTF8))
+        return cls(
+            payload[cs.LEXICAL_KEY_DOCS],
+            payload[cs.LEXICAL_KEY_POSTINGS],
+            payload[cs.LEXICAL_KEY_DOC_LENGTHS],
+        )
+
+
+def get_lexical_index(path: Path) -> LexicalIndex | None:
+    key = str(path.resolve())
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        _CACHED_INDEXES.pop(key, None)
+        return None
+    cached = _CACHED_INDEXES.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    index: LexicalIndex | None
+    try:
+        index = LexicalIndex.load(path)
+    except Exception as e:
+        logger.warning(ls.LEXICAL_INDEX_LOAD_FAILED.format(path=path, error=e))
+        index = None
+    _CACHED_INDEXES[key] = (mtime, index)
+    return index
@@ -4,6 +4,10 @@ PROVIDER_REGISTERED = "Registered provider: {name}"
 # (H) Graph loading logs
 LOADING_GRAPH = "Loading graph from {path}"
 LOADED_GRAPH = "Loaded {nodes} nodes and {relationships} relationships with indexes"
+LOADED_GRAPH_SNAPSHOT = (
+    "Mapped compact snapshot with {nodes} nodes and {relationships} relationships"
+)
+GRAPH_SNAPSHOT_WRITTEN = "Wrote compact graph snapshot ({size} bytes) to {path}"
 ENSURING_PROJECT = "Ensuring Project: {name}"
 
 # (H) Pass logs
@@ -42,14 +46,45 @@ SEMANTIC_NOT_AVAILABLE = (
 )
 INGESTOR_NO_QUERY = "Ingestor does not support querying, skipping embedding generation"
 NO_FUNCTIONS_FOR_EMBEDDING = "No functions or methods found for embedding generation"
-GENERATING_EMBEDDINGS = "Generating embeddings for {count} functions/methods"
-EMBEDDING_PROGRESS = "Generated {done}/{total} embeddings"
+GENERATING_EMBEDDINGS = "Generating embeddings for functions/methods"
+EMBEDDING_PROGRESS = "Generated {done} embeddings from {total} functions/methods"
 EMBEDDING_FAILED = "Failed to embed {name}: {error}"
 NO_SOURCE_FOR = "No source code found for {name}"
 EMBEDDINGS_COMPLETE = "Successfully generated {count} semantic embeddings"
 EMBEDDING_GENERATION_FAILED = "Failed to generate semantic embeddings: {error}"
 EMBEDDING_STORE_FAILED = "Failed to store embedding for {name}: {error}"
 EMBEDDING_SEARCH_FAILED = "Failed to search embeddings: {error}"
+EMBEDDING_DELETE_FAILED = "Failed to delete {count} embeddings: {error}"
+EMBEDDING_MODEL_WARMING = "Preloading embedding model in the background"
+EMBEDDING_MODEL_WARM = "Embedding model ready in {seconds:.2f}s"
+EMBEDDING_MODEL_WARM_FAILED = "Failed to preload embedding model: {error}"
+
+# (H) IVF vector index logs
+IVF_TRAINING = "Training IVF index: {vectors} vectors, {lists} lists, {iterations} k-means iterations"
+IVF_SAVED = "Saved IVF index ({vectors} vectors, {lists} lists) to {path}"
+IVF_LOADED = "Loaded IVF index ({vectors} vectors, {lists} lists) from {path}"
+IVF_STALE = "IVF index at {path} covers {indexed} vectors but collection has {current}; using exact search"
+IVF_STALE_WRITES = (
+    "IVF index at {path} predates later vector writes; using exact search"
+)
+IVF_BELOW_THRESHOLD = (
+    "Collection has {count} vectors (< {threshold}); using exact search"
+)
+IVF_LOAD_FAILED = "Failed to load IVF index from {path}: {error}"
+IVF_BUILD_FAILED = "Failed to build IVF index: {error}"
+IVF_SEARCH_FAILED = "IVF search failed, falling back to exact search: {error}"
+QDRANT_LOCAL_QUANTIZATION = (
+    "Qdrant local mode stores full-precision vectors only; {mode} quantization "
+    "applies to the IVF index (set QDRANT_URL to quantize inside Qdrant)"
+)
+
+# (H) Lexical index logs
+LEXICAL_INDEX_BUILDING = "--- Building lexical index for hybrid search ---"
+LEXICAL_INDEX_SAVED = "Saved lexical index ({docs} symbols, {terms} terms) to {path}"
+LEXICAL_INDEX_EMPTY = "No symbols found for the lexical index"
+LEXICAL_INDEX_FAILED = "Failed to build lexical index: {error}"
+LEXICAL_INDEX_LOAD_FAILED = "Failed to load lexical index from {path}: {error}"
+LEXICAL_EXACT_MATCH = "Exact name match for '{query}': {count} symbols"
 
 # (H) Image logs
 IMAGE_COPIED = "Copied image to temporary path: {path}"
@@ -62,6 +97,9 @@ PROTOBUF_NO_MESSAGE_CLASS = (
 PROTOBUF_NO_ONEOF_MAPPING = (
     "No 'oneof' field mapping found for label '{label}'. Skipping node."
 )
+PROTOBUF_V2_NO_LABEL = (
+    "No v2 index label for '{label}'. Skipping its nodes and relationships."
+)
 PROTOBUF_UNKNOWN_REL_TYPE = (
     "Unknown relationship type '{rel_type}'. Setting to UNSPECIFIED."
 )
@@ -70,6 +108,31 @@ PROTOBUF_INVALID_REL = (
 )
 PROTOBUF_FLUSH_SUCCESS = "Successfully flushed {nodes} unique nodes and {rels} unique relationships to {path}"
 PROTOBUF_FLUSHING = "Flushing data to {path}..."
+PROTOBUF_STREAMING = "Streaming protobuf records to {path}"
+PROTOBUF_READING = "Reading protobuf records from {path}"
+PROTOBUF_OFFSETS_WRITTEN = (
+    "Wrote offset table for {nodes} nodes and {rels} relationships to {path}"
+)
+PROTOBUF_MERGE_DONE = (
+    "Merged {shards} shards into {path}: {nodes} nodes, {rels} relationships, "
+    "{resolved} calls resolved, {unresolved} unresolved"
+)
+PROTOBUF_MERGE_FAILED = "Failed to merge index shards into {path}"
+GRAPH_DIFF_COMPUTED = (
+    "Graph diff: nodes +{added_nodes} ~{updated_nodes} -{removed_nodes}, "
+    "relationships +{added_rels} ~{updated_rels} -{removed_rels}"
+)
+GRAPH_DIFF_FAILED = "Failed to diff protobuf index {path}"
+PROTOBUF_LOAD_START = "Loading {version} protobuf index from {path}"
+PROTOBUF_LOAD_DONE = (
+    "Loaded {nodes} nodes and {rels} relationships from protobuf index "
+    "({skipped} skipped)"
+)
+PROTOBUF_LOAD_FAILED = "Failed to load protobuf index from {path}"
+PROTOBUF_LOAD_SKIPPED_REL = (
+    "Skipping relationship with unknown type or endpoint: "
+    "source_id={source_id}, target_id={target_id}"
+)
 
 # (H) Parser loader logs
 BUILDING_BINDINGS = "Building Python bindings for {lang}..."
@@ -166,8 +229,68 @@ MG_CLEANING_DB = "--- Cleaning database... ---"
 MG_DB_CLEANED = "--- Database cleaned. ---"
 MG_DELETING_PROJECT = "--- Deleting project: {project_name} ---"
 MG_PROJECT_DELETED = "--- Project {project_name} deleted. ---"
+MG_PROJECT_DELETE_PROGRESS = (
+    "Deleted {count} {label} nodes of project {project_id} ({total} so far)"
+)
+MG_PROJECT_NODES_DELETED = "Deleted {total} nodes of project {project_id}"
+MG_NODES_DELETED_BY_KEY = "Deleted {count} nodes by key"
+MG_RELATIONSHIPS_DELETED_BY_KEY = "Deleted {count} relationships by key"
+MG_GENERATION_STARTED = "Indexing project {project_id} as generation {generation}"
+MG_GENERATION_FINISHED = (
+    "Project {project_id} re-indexed in place as generation {generation}; "
+    "older rows stay visible until the cleanup finishes"
+)
+MG_GENERATION_SWEPT = (
+    "Removed {nodes} nodes and {rels} relationships left over from generations "
+    "before {generation} of project {project_id}"
+)
+MG_GENERATION_SWEEP_FAILED = (
+    "Background cleanup of old generations of project {project_id} failed: {error}"
+)
 MG_ENSURING_CONSTRAINTS = "Ensuring constraints..."
 MG_CONSTRAINTS_DONE = "Constraints checked/created."
+MG_ENSURING_INDEXES = "Ensuring label/property indexes..."
+MG_INDEXES_DONE = "Indexes checked: {created} created, {existing} already present."
+MG_INDEX_CREATE_FAILED = "Could not create index on :{label}({prop}): {error}"
+MG_INDEX_INFO_FAILED = "Could not read index info, assuming none exist: {error}"
+MG_INDEXES_DROPPED = "Dropped {count} label/property indexes."
+MG_STORAGE_MODE_SET = "Memgraph storage mode set to {mode}"
+MG_STORAGE_MODE_UNKNOWN = "Could not read Memgraph storage mode; leaving it unchanged"
+MG_BUFFER_MERGED = (
+    "Merged {nodes} repeated node rows and {rels} repeated relationship rows "
+    "in the write buffers"
+)
+MG_BATCH_SPLIT = (
+    "Batch of {rows} rows for {pattern} failed ({error}); "
+    "splitting and retrying with batch size {size}"
+)
+MG_BATCH_SIZES = "Adaptive batch sizes: {sizes}"
+MG_NODE_ID_CACHE_STATS = (
+    "Node id cache: {hits} hits, {misses} misses, {size} cached ids"
+)
+MG_NODE_ID_CACHE_CLEARED = "Cleared node id cache ({size} entries)"
+MG_NODE_ID_CACHE_STALE = (
+    "{count} {pattern} rows missed their cached node ids; retrying by key"
+)
+MG_WRITER_STARTED = "Started background Memgraph writer (queue size {size})"
+MG_WRITER_BACKPRESSURE = "Writer queue full ({size} batches); waiting for Memgraph"
+MG_WRITER_FAILED = "Background Memgraph writer failed: {error}"
+MG_BULK_ENABLED = "Bulk-load mode enabled; staging rows under {path}"
+MG_BULK_LOADING = (
+    "--- Bulk-loading {nodes} nodes and {rels} relationships from staging files ---"
+)
+MG_BULK_LABEL_LOADED = "Bulk-created {count} {label} nodes"
+MG_BULK_TYPE_LOADED = "Bulk-created {created} of {total} {rel_type} relationships"
+MG_BULK_MERGED = "Merged {count} repeated rows for {name}"
+MG_BULK_DONE = "--- Bulk load finished in {seconds:.2f}s ---"
+MG_BULK_STAGING_REMOVED = "Removed bulk staging directory {path}"
+MG_BULK_SKIPPED_NOT_EMPTY = (
+    "Graph already contains data; using incremental MERGE writes instead of bulk load"
+)
+MG_INDEX_BENCHMARK_PASS = (
+    "Index benchmark ({mode}): {rows} rows flushed in {seconds:.2f}s, "
+    "{queries} lookups p50={p50:.2f}ms"
+)
 MG_NODE_BUFFER_FLUSH = (
     "Node buffer reached batch size ({size}). Performing incremental flush."
 )
@@ -188,9 +311,15 @@ MG_RELS_FLUSHED = (
 MG_FLUSH_START = "--- Flushing all pending writes to database... ---"
 MG_FLUSH_COMPLETE = "--- Flushing complete. ---"
 MG_FETCH_QUERY = "Executing fetch query: {query} with params: {params}"
+MG_FETCH_TRUNCATED = "Query returned more than {rows} rows; truncating the result"
 MG_WRITE_QUERY = "Executing write query: {query} with params: {params}"
 MG_EXPORTING = "Exporting graph data..."
 MG_EXPORTED = "Exported {nodes} nodes and {rels} relationships"
+MG_EXPORT_STREAMED = "Streamed {rows} {kind} rows from Memgraph"
+COLUMNAR_TABLE_WRITTEN = "Wrote {kind} table {name} ({rows} rows) to {path}"
+COLUMNAR_COLUMN_FALLBACK = (
+    "Column {column} of {name} changed type; storing value in {extra}"
+)
 
 # (H) LLM/Cypher logs
 CYPHER_GENERATING = "  [CypherGenerator] Generating query for: '{query}'"
@@ -29,10 +29,12 @@ from . import constants as cs
 from . import exceptions as ex
 from . import logs as ls
 from .config import ModelConfig, load_cgrignore_patterns, settings
+from .graph_export import stream_graph_export
 from .models import AppContext
 from .prompts import OPTIMIZATION_PROMPT, OPTIMIZATION_PROMPT_WITH_REFERENCE
 from .providers.base import get_provider_from_config
 from .services import QueryProtocol
+from .services.connection import connect_memgraph
 from .services.graph_service import MemgraphIngestor
 from .services.llm import CypherGenerator, create_rag_orchestrator
 from .tools.code_retrieval import CodeRetriever, create_code_retrieval_tool
@@ -55,12 +57,12 @@ from .types_defs import (
     CancelledResult,
     ConfirmationToolNames,
     CreateFileArgs,
-    GraphData,
     RawToolArgs,
     ReplaceCodeArgs,
     ShellCommandArgs,
     ToolArgs,
 )
+from .utils.dependencies import has_semantic_dependencies
 
 if TYPE_CHECKING:
     from prompt_toolkit.key_binding import KeyPressEvent
@@ -724,30 +726,25 @@ def update_model_settings(
         _update_single_model_setting(cs.ModelRole.CYPHER, cypher)
 
 
-def _write_graph_json(ingestor: MemgraphIngestor, output_path: Path) -> GraphData:
-    graph_data: GraphData = ingestor.export_graph_to_dict()
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, "w", encoding=cs.ENCODING_UTF8) as f:
-        json.dump(graph_data, f, indent=cs.JSON_INDENT, ensure_ascii=False)
-
-    return graph_data
-
-
-def connect_memgraph(batch_size: int) -> MemgraphIngestor:
-    return MemgraphIngestor(
-        host=settings.MEMGRAPH_HOST,
-        port=settings.MEMGRAPH_PORT,
-        batch_size=batch_size,
-    )
-
-
-def export_graph_to_file(ingestor: MemgraphIngestor, output: str) -> bool:
+def export_graph_to_file(
+    ingestor: MemgraphIngestor,
+    output: str,
+    *,
+    fmt: cs.ExportFormat | None = None,
+    compression: cs.ExportCompression | None = None,
+    project_id: str | None = None,
+) -> bool:
     output_path = Path(output)
 
     try:
-        graph_data = _write_graph_json(ingestor, output_path)
-        metadata = graph_data[cs.KEY_METADATA]
+        metadata = stream_graph_export(
+            ingestor,
+            output_path,
+            fmt=fmt,
+            compression=compression,
+            project_id=project_id,
+            page_size=settings.MEMGRAPH_EXPORT_PAGE_SIZE,
+        )
         app_context.console.print(
             cs.UI_GRAPH_EXPORT_SUCCESS.format(path=output_path.absolute())
         )
@@ -982,8 +979,13 @@ def _initialize_services_and_agent(
     shell_command_tool = create_shell_command_tool(shell_commander)
     directory_lister_tool = create_directory_lister_tool(directory_lister)
     document_analyzer_tool = create_document_analyzer_tool(document_analyzer)
-    semantic_search_tool = create_semantic_search_tool()
-    function_source_tool = create_get_function_source_tool()
+    if settings.EMBEDDING_WARMUP and has_semantic_dependencies():
+        from .embedder import warm_up_model
+
+        warm_up_model()
+
+    semantic_search_tool = create_semantic_search_tool(ingestor, project_id)
+    function_source_tool = create_get_function_source_tool(ingestor)
 
     confirmation_tool_names = ConfirmationToolNames(
         replace_code=file_editor_tool.name,
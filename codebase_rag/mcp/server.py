@@ -13,6 +13,7 @@ from codebase_rag import logs as lg
 from codebase_rag import tool_errors as te
 from codebase_rag.config import settings
 from codebase_rag.mcp.tools import create_mcp_tools_registry
+from codebase_rag.services.connection import connect_memgraph
 from codebase_rag.services.graph_service import MemgraphIngestor
 from codebase_rag.services.llm import CypherGenerator
 from codebase_rag.types_defs import MCPToolArguments
@@ -67,11 +68,7 @@ def create_server() -> tuple[Server, MemgraphIngestor]:
 
     logger.info(lg.MCP_SERVER_INIT_SERVICES)
 
-    ingestor = MemgraphIngestor(
-        host=settings.MEMGRAPH_HOST,
-        port=settings.MEMGRAPH_PORT,
-        batch_size=settings.MEMGRAPH_BATCH_SIZE,
-    )
+    ingestor = connect_memgraph(settings.MEMGRAPH_BATCH_SIZE)
 
     cypher_generator = CypherGenerator(project_id=project_id)
 
@@ -1,4 +1,6 @@
 import itertools
+from contextlib import AbstractContextManager, nullcontext
+from functools import partial
 from pathlib import Path
 
 from loguru import logger
@@ -6,6 +8,7 @@ from loguru import logger
 from codebase_rag import constants as cs
 from codebase_rag import logs as lg
 from codebase_rag import tool_errors as te
+from codebase_rag.config import settings
 from codebase_rag.graph_updater import GraphUpdater
 from codebase_rag.models import ToolMetadata
 from codebase_rag.parser_loader import load_parsers
@@ -294,12 +297,20 @@ class MCPToolsRegistry:
     async def index_repository(self) -> str:
         logger.info(lg.MCP_INDEXING_REPO.format(path=self.project_root))
         try:
-            logger.info(f"Clearing existing data for project: {self.project_id}")
-            self.ingestor._execute_query(
-                f"MATCH (n {{project_id: $project_id}}) DETACH DELETE n;",
-                {"project_id": self.project_id}
-            )
-            logger.info(f"Data cleared for project: {self.project_id}")
+            in_place = settings.MEMGRAPH_REINDEX_IN_PLACE
+            if not in_place:
+                logger.info(f"Clearing existing data for project: {self.project_id}")
+                self.ingestor.delete_project_nodes(self.project_id)
+                logger.info(f"Data cleared for project: {self.project_id}")
+
+            if settings.MEMGRAPH_BULK_LOAD:
+                self.ingestor.enable_bulk_load_if_empty(
+                    settings.MEMGRAPH_BULK_STAGING_DIR,
+                    settings.MEMGRAPH_BULK_BATCH_SIZE,
+                    self.project_id,
+                )
+            if not self.ingestor.bulk_load_enabled:
+                self.ingestor.ensure_indexes()
 
             # Update settings so GraphUpdater uses the correct project_id
             settings.TARGET_PROJECT_ID = self.project_id
@@ -310,7 +321,16 @@ class MCPToolsRegistry:
                 parsers=self.parsers,
                 queries=self.queries,
             )
-            updater.run()
+            generation: AbstractContextManager[object] = nullcontext()
+            if in_place:
+                from codebase_rag.vector_store import delete_embeddings
+
+                generation = self.ingestor.project_generation(
+                    self.project_id,
+                    partial(delete_embeddings, project_id=self.project_id),
+                )
+            with generation, self.ingestor.analytical_storage():
+                updater.run()
 
             return cs.MCP_INDEX_SUCCESS.format(path=self.project_root)
         except Exception as e:
@@ -1,3 +1,4 @@
+import json
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -39,6 +40,21 @@ class GraphNode:
     properties: dict[str, PropertyValue]
 
 
+class LazyGraphNode(GraphNode):
+    def __init__(self, node_id: int, labels: list[str], properties_json: str):
+        self.node_id = node_id
+        self.labels = labels
+        self._properties_json = properties_json
+        self._properties: dict[str, PropertyValue] | None = None
+
+    @property
+    def properties(self) -> dict[str, PropertyValue]:
+        if self._properties is None:
+            self._properties = json.loads(self._properties_json)
+            self._properties_json = ""
+        return self._properties
+
+
 @dataclass
 class GraphRelationship:
     from_id: int
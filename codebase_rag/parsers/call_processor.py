@@ -8,7 +8,7 @@ from tree_sitter import Node, QueryCursor
 from .. import constants as cs
 from .. import logs as ls
 from ..language_spec import LanguageSpec
-from ..services import IngestorProtocol
+from ..services import IngestorProtocol, UnresolvedCallProtocol
 from ..types_defs import FunctionRegistryTrieProtocol, LanguageQueries
 from .call_resolver import CallResolver
 from .cpp import utils as cpp_utils
@@ -311,6 +311,11 @@ class CallProcessor:
             ):
                 callee_type, callee_qn = operator_info
             else:
+                self._record_unresolved_call(
+                    (caller_type, cs.KEY_QUALIFIED_NAME, caller_qn),
+                    call_name,
+                    module_qn,
+                )
                 continue
             logger.debug(
                 ls.CALL_FOUND.format(
@@ -327,6 +332,17 @@ class CallProcessor:
                 (callee_type, cs.KEY_QUALIFIED_NAME, callee_qn),
             )
 
+    def _record_unresolved_call(
+        self,
+        caller_spec: tuple[str, str, str],
+        call_name: str,
+        module_qn: str,
+    ) -> None:
+        if not isinstance(self.ingestor, UnresolvedCallProtocol):
+            return
+        if candidates := self._resolver.cross_module_candidates(call_name, module_qn):
+            self.ingestor.record_unresolved_call(caller_spec, call_name, candidates)
+
     def _build_nested_qualified_name(
         self,
         func_node: Node,
@@ -177,15 +177,17 @@ class CallResolver:
                 return result
         return None
 
-    def _try_wildcard_qns(
-        self, call_name: str, imported_qn: str
-    ) -> tuple[str, str] | None:
+    def _wildcard_qns(self, call_name: str, imported_qn: str) -> list[str]:
         potential_qns = []
         if cs.SEPARATOR_DOUBLE_COLON not in imported_qn:
             potential_qns.append(f"{imported_qn}.{call_name}")
         potential_qns.append(f"{imported_qn}{cs.SEPARATOR_DOUBLE_COLON}{call_name}")
+        return potential_qns
 
-        for wildcard_qn in potential_qns:
+    def _try_wildcard_qns(
+        self, call_name: str, imported_qn: str
+    ) -> tuple[str, str] | None:
+        for wildcard_qn in self._wildcard_qns(call_name, imported_qn):
             if wildcard_qn in self.function_registry:
                 logger.debug(
                     ls.CALL_WILDCARD.format(call_name=call_name, qn=wildcard_qn)
@@ -193,6 +195,27 @@ class CallResolver:
                 return self.function_registry[wildcard_qn], wildcard_qn
         return None
 
+    def cross_module_candidates(self, call_name: str, module_qn: str) -> list[str]:
+        import_map = self.import_processor.import_mapping.get(module_qn)
+        if not import_map:
+            return []
+
+        candidates: list[str] = []
+        if call_name in import_map:
+            candidates.append(import_map[call_name])
+        if self._has_separator(call_name):
+            separator = self._get_separator(call_name)
+            head, _, rest = call_name.partition(separator)
+            if head in import_map:
+                registry_separator = (
+                    separator if separator == cs.SEPARATOR_COLON else cs.SEPARATOR_DOT
+                )
+                candidates.append(f"{import_map[head]}{registry_separator}{rest}")
+        for local_name, imported_qn in import_map.items():
+            if local_name.startswith("*"):
+                candidates.extend(self._wildcard_qns(call_name, imported_qn))
+        return candidates
+
     def _try_resolve_same_module(
         self, call_name: str, module_qn: str
     ) -> tuple[str, str] | None:
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from typing import Protocol, runtime_checkable
 
 from ..types_defs import PropertyDict, PropertyValue, ResultRow
@@ -18,10 +19,29 @@ class IngestorProtocol(Protocol):
     def flush_all(self) -> None: ...
 
 
+@runtime_checkable
+class UnresolvedCallProtocol(Protocol):
+    def record_unresolved_call(
+        self,
+        caller_spec: tuple[str, str, str],
+        call_name: str,
+        candidates: list[str],
+    ) -> None: ...
+
+
 @runtime_checkable
 class QueryProtocol(Protocol):
     def fetch_all(
         self, query: str, params: PropertyDict | None = None
     ) -> list[ResultRow]: ...
 
+    def fetch_iter(
+        self,
+        query: str,
+        params: PropertyDict | None = None,
+        *,
+        chunk_size: int | None = None,
+        max_rows: int | None = None,
+    ) -> Iterator[ResultRow]: ...
+
     def execute_write(self, query: str, params: PropertyDict | None = None) -> None: ...
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+
+from .. import constants as cs
+from .. import exceptions as ex
+
+
+class AdaptiveBatchSizer:
+    def __init__(
+        self,
+        *,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        target_seconds: float,
+    ) -> None:
+        if not 1 <= minimum <= maximum:
+            raise ValueError(ex.ADAPTIVE_BATCH_BOUNDS)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.initial = min(max(initial, minimum), maximum)
+        self.target_seconds = target_seconds
+        self._sizes: dict[str, int] = {}
+        self._seconds_per_row: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _clamp(self, size: int) -> int:
+        return min(max(size, self.minimum), self.maximum)
+
+    def size_for(self, pattern: str) -> int:
+        return self._sizes.get(pattern, self.initial)
+
+    def record(self, pattern: str, rows: int, seconds: float) -> int:
+        if rows <= 0:
+            return self.size_for(pattern)
+        observed = seconds / rows
+        with self._lock:
+            previous = self._seconds_per_row.get(pattern)
+            estimate = (
+                observed
+                if previous is None
+                else cs.ADAPTIVE_BATCH_SMOOTHING * observed
+                + (1 - cs.ADAPTIVE_BATCH_SMOOTHING) * previous
+            )
+            self._seconds_per_row[pattern] = estimate
+            current = self._sizes.get(pattern, self.initial)
+            wanted = (
+                int(self.target_seconds / estimate) if estimate > 0 else self.maximum
+            )
+            size = self._clamp(min(wanted, current * cs.ADAPTIVE_BATCH_MAX_GROWTH))
+            self._sizes[pattern] = size
+            return size
+
+    def shrink(self, pattern: str, rows: int) -> int:
+        with self._lock:
+            size = self._clamp(min(rows, self.size_for(pattern)) // 2)
+            self._sizes[pattern] = size
+            return size
+
+    def largest(self) -> int:
+        with self._lock:
+            return max(self._sizes.values(), default=self.initial)
+
+    def sizes(self) -> dict[str, int]:
+        with self._lock:
+            return dict(sorted(self._sizes.items()))
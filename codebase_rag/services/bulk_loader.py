@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import shutil
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO
+
+from loguru import logger
+
+from .. import constants as cs
+from .. import logs as ls
+from ..types_defs import (
+    BatchParams,
+    NodeBatchRow,
+    PropertyDict,
+    PropertyValue,
+    RelBatchRow,
+)
+
+RelPattern = tuple[str, str, str, str, str]
+
+
+@dataclass
+class _StagedFile:
+    path: Path
+    handle: IO[str]
+    rows: int = 0
+
+    def write(self, row: object) -> None:
+        self.handle.write(json.dumps(row, default=list))
+        self.handle.write("\n")
+        self.rows += 1
+
+
+@dataclass
+class BulkLoadStaging:
+    directory: Path
+    node_files: dict[tuple[str, str], _StagedFile] = field(default_factory=dict)
+    node_merge_files: dict[tuple[str, str], _StagedFile] = field(default_factory=dict)
+    rel_files: dict[RelPattern, _StagedFile] = field(default_factory=dict)
+    rel_merge_files: dict[RelPattern, _StagedFile] = field(default_factory=dict)
+    _node_keys: set[tuple[str, PropertyValue]] = field(default_factory=set)
+    _rel_keys: set[int] = field(default_factory=set)
+
+    def _open[K](self, files: dict[K, _StagedFile], key: K, prefix: str) -> _StagedFile:
+        staged = files.get(key)
+        if staged is None:
+            path = self.directory / f"{prefix}{len(files)}{cs.BULK_STAGING_SUFFIX}"
+            staged = _StagedFile(path, path.open("w", encoding=cs.ENCODING_UTF8))
+            files[key] = staged
+        return staged
+
+    def add_node(self, label: str, id_key: str, props: PropertyDict) -> None:
+        node_id = props[id_key]
+        row_props: PropertyDict = {k: v for k, v in props.items() if k != id_key}
+        key = (label, node_id)
+        if key in self._node_keys:
+            files, prefix = self.node_merge_files, cs.BULK_NODE_MERGE_PREFIX
+        else:
+            self._node_keys.add(key)
+            files, prefix = self.node_files, cs.BULK_NODE_PREFIX
+        self._open(files, (label, id_key), prefix).write(
+            NodeBatchRow(id=node_id, props=row_props)
+        )
+
+    def add_relationship(
+        self,
+        from_spec: tuple[str, str, PropertyValue],
+        rel_type: str,
+        to_spec: tuple[str, str, PropertyValue],
+        properties: PropertyDict | None = None,
+    ) -> None:
+        from_label, from_key, from_val = from_spec
+        to_label, to_key, to_val = to_spec
+        pattern = (from_label, from_key, rel_type, to_label, to_key)
+        key = hash((pattern, repr(from_val), repr(to_val)))
+        if key in self._rel_keys:
+            files, prefix = self.rel_merge_files, cs.BULK_REL_MERGE_PREFIX
+        else:
+            self._rel_keys.add(key)
+            files, prefix = self.rel_files, cs.BULK_REL_PREFIX
+        self._open(files, pattern, prefix).write(
+            RelBatchRow(from_val=from_val, to_val=to_val, props=properties or {})
+        )
+
+    @property
+    def node_count(self) -> int:
+        return len(self._node_keys)
+
+    @property
+    def relationship_count(self) -> int:
+        return len(self._rel_keys)
+
+    def close(self) -> None:
+        for files in (
+            self.node_files,
+            self.node_merge_files,
+            self.rel_files,
+            self.rel_merge_files,
+        ):
+            for staged in files.values():
+                staged.handle.close()
+
+    def cleanup(self) -> None:
+        self.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+        logger.debug(ls.MG_BULK_STAGING_REMOVED.format(path=self.directory))
+
+
+def iter_staged_rows(path: Path, chunk_size: int) -> Iterator[list[BatchParams]]:
+    chunk: list[BatchParams] = []
+    with path.open(encoding=cs.ENCODING_UTF8) as f:
+        for line in f:
+            chunk.append(json.loads(line))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from ..config import settings
+from .batch_sizing import AdaptiveBatchSizer
+from .graph_service import MemgraphIngestor
+from .node_id_cache import NodeIdCache
+
+
+def connect_memgraph(batch_size: int) -> MemgraphIngestor:
+    batch_sizer = (
+        AdaptiveBatchSizer(
+            initial=batch_size,
+            minimum=min(settings.MEMGRAPH_BATCH_MIN_SIZE, batch_size),
+            maximum=max(settings.MEMGRAPH_BATCH_MAX_SIZE, batch_size),
+            target_seconds=settings.MEMGRAPH_BATCH_TARGET_SECONDS,
+        )
+        if settings.MEMGRAPH_ADAPTIVE_BATCHING
+        else None
+    )
+    return MemgraphIngestor(
+        host=settings.MEMGRAPH_HOST,
+        port=settings.MEMGRAPH_PORT,
+        batch_size=batch_size,
+        delete_batch_size=settings.MEMGRAPH_DELETE_BATCH_SIZE,
+        fetch_chunk_size=settings.MEMGRAPH_FETCH_CHUNK_SIZE,
+        writer_queue_size=settings.MEMGRAPH_WRITER_QUEUE_SIZE,
+        count_relationships=settings.MEMGRAPH_COUNT_DUPLICATE_RELATIONSHIPS,
+        batch_sizer=batch_sizer,
+        node_id_cache=(
+            NodeIdCache(settings.MEMGRAPH_NODE_ID_CACHE_SIZE)
+            if settings.MEMGRAPH_NODE_ID_CACHE_SIZE > 0
+            else None
+        ),
+        analytical_storage=settings.MEMGRAPH_ANALYTICAL_STORAGE,
+    )
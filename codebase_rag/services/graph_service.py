@@ -1,7 +1,13 @@
+import queue
+import tempfile
+import threading
+import time
+import uuid
 from collections import defaultdict
-from collections.abc import Generator, Sequence
+from collections.abc import Callable, Generator, Iterator, Sequence
 from contextlib import contextmanager
 from datetime import UTC, datetime
+from pathlib import Path
 
 import mgclient  # ty: ignore[unresolved-import]
 from loguru import logger
@@ -11,26 +17,63 @@ from codebase_rag.types_defs import CursorProtocol, ResultValue
 from .. import exceptions as ex
 from .. import logs as ls
 from ..constants import (
+    BULK_STAGING_DIR_PREFIX,
     ERR_SUBSTR_ALREADY_EXISTS,
     ERR_SUBSTR_CONSTRAINT,
+    GENERATION_SWEEP_THREAD_NAME,
+    INDEX_INFO_LABEL,
+    INDEX_INFO_PROPERTY,
+    KEY_COUNT,
     KEY_CREATED,
+    KEY_DELETED,
+    KEY_FROM_ID,
     KEY_FROM_VAL,
+    KEY_GENERATION,
+    KEY_ID,
+    KEY_LIMIT,
     KEY_NAME,
+    KEY_NODE_ID,
+    KEY_NODE_IDS,
+    KEY_PROJECT_ID,
     KEY_PROJECT_NAME,
     KEY_PROPS,
+    KEY_TO_ID,
     KEY_TO_VAL,
+    NODE_PROPERTY_INDEXES,
     NODE_UNIQUE_CONSTRAINTS,
     REL_TYPE_CALLS,
+    STORAGE_INFO_KEY,
+    STORAGE_INFO_MODE,
+    STORAGE_INFO_VALUE,
+    STORAGE_MODE_ANALYTICAL,
+    WRITER_THREAD_NAME,
+    NodeLabel,
 )
 from ..cypher_queries import (
     CYPHER_DELETE_ALL,
-    CYPHER_DELETE_PROJECT,
     CYPHER_EXPORT_NODES,
     CYPHER_EXPORT_RELATIONSHIPS,
+    CYPHER_GRAPH_HAS_NODES,
     CYPHER_LIST_PROJECTS,
+    CYPHER_PROJECT_HAS_NODES,
+    CYPHER_PROJECT_IDS_BY_NAME,
+    CYPHER_SHOW_INDEX_INFO,
+    CYPHER_SHOW_STORAGE_INFO,
     build_constraint_query,
+    build_create_node_query,
+    build_create_relationship_query,
+    build_delete_label_by_project_batch_query,
+    build_delete_nodes_by_key_query,
+    build_delete_relationship_query,
+    build_delete_stale_nodes_query,
+    build_delete_stale_relationships_query,
+    build_drop_index_query,
+    build_index_query,
     build_merge_node_query,
+    build_merge_node_returning_id_query,
+    build_merge_relationship_by_id_query,
     build_merge_relationship_query,
+    build_storage_mode_query,
     wrap_with_unwind,
 )
 from ..types_defs import (
@@ -42,17 +85,57 @@ from ..types_defs import (
     PropertyDict,
     PropertyValue,
     RelBatchRow,
+    RelIdBatchRow,
     ResultRow,
 )
+from .batch_sizing import AdaptiveBatchSizer
+from .bulk_loader import BulkLoadStaging, iter_staged_rows
+from .node_id_cache import NodeIdCache
+
+RelationshipKey = tuple[
+    tuple[str, str, PropertyValue], str, tuple[str, str, PropertyValue]
+]
+NodeIdsCallback = Callable[[list[int]], None]
+
+
+def _node_key(
+    label: str, properties: dict[str, PropertyValue]
+) -> tuple[str, PropertyValue] | None:
+    id_key = NODE_UNIQUE_CONSTRAINTS.get(label)
+    node_id = properties.get(id_key) if id_key else None
+    if node_id is None or isinstance(node_id, list):
+        return None
+    return (label, node_id)
 
 
 class MemgraphIngestor:
-    def __init__(self, host: str, port: int, batch_size: int = 1000):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        batch_size: int = 1000,
+        *,
+        delete_batch_size: int = 10000,
+        fetch_chunk_size: int = 1000,
+        writer_queue_size: int = 0,
+        count_relationships: bool = False,
+        batch_sizer: AdaptiveBatchSizer | None = None,
+        node_id_cache: NodeIdCache | None = None,
+        analytical_storage: bool = False,
+    ):
         self._host = host
         self._port = port
         if batch_size < 1:
             raise ValueError(ex.BATCH_SIZE)
+        if delete_batch_size < 1 or fetch_chunk_size < 1:
+            raise ValueError(ex.BATCH_SIZE)
+        if writer_queue_size < 0:
+            raise ValueError(ex.WRITER_QUEUE_SIZE)
+        self._writer_queue_size = writer_queue_size
+        self._writer: _BackgroundWriter | None = None
         self.batch_size = batch_size
+        self.delete_batch_size = delete_batch_size
+        self.fetch_chunk_size = fetch_chunk_size
         self.conn: mgclient.Connection | None = None
         self.node_buffer: list[tuple[str, dict[str, PropertyValue]]] = []
         self.relationship_buffer: list[
@@ -63,12 +146,33 @@ class MemgraphIngestor:
                 dict[str, PropertyValue] | None,
             ]
         ] = []
+        self._node_index: dict[tuple[str, PropertyValue], int] = {}
+        self._rel_index: dict[RelationshipKey, int] = {}
+        self._count_relationships = count_relationships
+        self._batch_sizer = batch_sizer
+        self._node_ids = node_id_cache
+        self._analytical_storage = analytical_storage
+        self._generation: str | None = None
+        self._merged_nodes = 0
+        self._merged_relationships = 0
+        self._bulk: BulkLoadStaging | None = None
+        self._bulk_batch_size = batch_size
+        self._bulk_merge_nodes = False
 
     def __enter__(self) -> "MemgraphIngestor":
         logger.info(ls.MG_CONNECTING.format(host=self._host, port=self._port))
         self.conn = mgclient.connect(host=self._host, port=self._port)
         self.conn.autocommit = True
         logger.info(ls.MG_CONNECTED)
+        if self._writer_queue_size:
+            self._writer = _BackgroundWriter(
+                host=self._host,
+                port=self._port,
+                batch_size=self.batch_size,
+                queue_size=self._writer_queue_size,
+                batch_sizer=self._batch_sizer,
+                node_id_cache=self._node_ids,
+            )
         return self
 
     def __exit__(
@@ -76,10 +180,15 @@ class MemgraphIngestor:
     ) -> None:
         if exc_type:
             logger.exception(ls.MG_EXCEPTION.format(error=exc_val))
-        self.flush_all()
-        if self.conn:
-            self.conn.close()
-            logger.info(ls.MG_DISCONNECTED)
+        try:
+            self.flush_all()
+        finally:
+            if self._writer is not None:
+                self._writer.stop()
+                self._writer = None
+            if self.conn:
+                self.conn.close()
+                logger.info(ls.MG_DISCONNECTED)
 
     @contextmanager
     def _get_cursor(self) -> Generator[CursorProtocol, None, None]:
@@ -93,6 +202,22 @@ class MemgraphIngestor:
             if cursor:
                 cursor.close()
 
+    @contextmanager
+    def _streaming_cursor(self) -> Generator[CursorProtocol, None, None]:
+        if not self.conn:
+            raise ConnectionError(ex.CONN)
+        # (H) Only a lazy connection pulls rows on fetchmany; the shared one
+        # (H) buffers the whole result on execute. Lazy implies autocommit.
+        conn = mgclient.connect(host=self._host, port=self._port, lazy=True)
+        cursor: CursorProtocol | None = None
+        try:
+            cursor = conn.cursor()
+            yield cursor
+        finally:
+            if cursor:
+                cursor.close()
+            conn.close()
+
     def _cursor_to_results(self, cursor: CursorProtocol) -> list[ResultRow]:
         if not cursor.description:
             return []
@@ -163,9 +288,47 @@ class MemgraphIngestor:
             if cursor:
                 cursor.close()
 
+    def _execute_rows(
+        self, pattern: str, query: str, rows: Sequence[BatchParams]
+    ) -> list[ResultRow]:
+        if self._batch_sizer is None:
+            return self._execute_batch_with_return(query, rows)
+        results: list[ResultRow] = []
+        start = 0
+        while start < len(rows):
+            chunk = rows[start : start + self._batch_sizer.size_for(pattern)]
+            results.extend(self._execute_with_split(pattern, query, chunk))
+            start += len(chunk)
+        return results
+
+    def _execute_with_split(
+        self, pattern: str, query: str, rows: Sequence[BatchParams]
+    ) -> list[ResultRow]:
+        if self._batch_sizer is None:
+            return self._execute_batch_with_return(query, rows)
+        started = time.perf_counter()
+        try:
+            results = self._execute_batch_with_return(query, rows)
+        except Exception as e:
+            if len(rows) <= 1:
+                raise
+            size = self._batch_sizer.shrink(pattern, len(rows))
+            logger.warning(
+                ls.MG_BATCH_SPLIT.format(
+                    rows=len(rows), pattern=pattern, error=e, size=size
+                )
+            )
+            middle = len(rows) // 2
+            return self._execute_with_split(
+                pattern, query, rows[:middle]
+            ) + self._execute_with_split(pattern, query, rows[middle:])
+        self._batch_sizer.record(pattern, len(rows), time.perf_counter() - started)
+        return results
+
     def clean_database(self) -> None:
         logger.info(ls.MG_CLEANING_DB)
         self._execute_query(CYPHER_DELETE_ALL)
+        self.invalidate_node_ids()
         logger.info(ls.MG_DB_CLEANED)
 
     def list_projects(self) -> list[str]:
@@ -174,9 +337,193 @@ class MemgraphIngestor:
 
     def delete_project(self, project_name: str) -> None:
         logger.info(ls.MG_DELETING_PROJECT.format(project_name=project_name))
-        self._execute_query(CYPHER_DELETE_PROJECT, {KEY_PROJECT_NAME: project_name})
+        rows = self._execute_query(
+            CYPHER_PROJECT_IDS_BY_NAME, {KEY_PROJECT_NAME: project_name}
+        )
+        for row in rows:
+            self.delete_project_nodes(str(row[KEY_PROJECT_ID]))
         logger.info(ls.MG_PROJECT_DELETED.format(project_name=project_name))
 
+    def _delete_in_batches(
+        self,
+        label: str,
+        query: str,
+        params: dict[str, PropertyValue],
+        deleted_ids: list[int] | None = None,
+    ) -> int:
+        params = params | {KEY_LIMIT: self.delete_batch_size}
+        total = 0
+        while True:
+            rows = self._execute_query(query, params)
+            deleted = rows[0].get(KEY_DELETED, 0) if rows else 0
+            if not isinstance(deleted, int) or not deleted:
+                return total
+            total += deleted
+            if deleted_ids is not None and isinstance(
+                node_ids := rows[0].get(KEY_NODE_IDS), list
+            ):
+                deleted_ids.extend(i for i in node_ids if isinstance(i, int))
+            logger.info(
+                ls.MG_PROJECT_DELETE_PROGRESS.format(
+                    count=deleted,
+                    label=label,
+                    project_id=params[KEY_PROJECT_ID],
+                    total=total,
+                )
+            )
+            if deleted < self.delete_batch_size:
+                return total
+
+    def delete_project_nodes(self, project_id: str) -> int:
+        self.ensure_indexes()
+        total = 0
+        try:
+            for label in NODE_UNIQUE_CONSTRAINTS:
+                total += self._delete_in_batches(
+                    label,
+                    build_delete_label_by_project_batch_query(label),
+                    {KEY_PROJECT_ID: project_id},
+                )
+        finally:
+            self.invalidate_node_ids()
+        logger.info(
+            ls.MG_PROJECT_NODES_DELETED.format(total=total, project_id=project_id)
+        )
+        return total
+
+    def delete_nodes(self, keys: Sequence[tuple[str, PropertyValue]]) -> int:
+        self._drain_buffers()
+        by_label: defaultdict[str, list[PropertyDict]] = defaultdict(list)
+        for label, node_id in keys:
+            if label in NODE_UNIQUE_CONSTRAINTS:
+                by_label[label].append({KEY_ID: node_id})
+        try:
+            for label, rows in by_label.items():
+                query = build_delete_nodes_by_key_query(
+                    label, NODE_UNIQUE_CONSTRAINTS[label]
+                )
+                for start in range(0, len(rows), self.batch_size):
+                    self._execute_batch(query, rows[start : start + self.batch_size])
+        finally:
+            self.invalidate_node_ids()
+        deleted = sum(len(rows) for rows in by_label.values())
+        logger.info(ls.MG_NODES_DELETED_BY_KEY.format(count=deleted))
+        return deleted
+
+    def delete_relationships(self, keys: Sequence[RelationshipKey]) -> int:
+        self._drain_buffers()
+        by_pattern: defaultdict[tuple[str, str, str, str, str], list[PropertyDict]] = (
+            defaultdict(list)
+        )
+        for (from_label, from_key, from_val), rel_type, (
+            to_label,
+            to_key,
+            to_val,
+        ) in keys:
+            by_pattern[(from_label, from_key, rel_type, to_label, to_key)].append(
+                {KEY_FROM_VAL: from_val, KEY_TO_VAL: to_val}
+            )
+        for pattern, rows in by_pattern.items():
+            query = build_delete_relationship_query(*pattern)
+            for start in range(0, len(rows), self.batch_size):
+                self._execute_batch(query, rows[start : start + self.batch_size])
+        deleted = sum(len(rows) for rows in by_pattern.values())
+        logger.info(ls.MG_RELATIONSHIPS_DELETED_BY_KEY.format(count=deleted))
+        return deleted
+
+    @contextmanager
+    def project_generation(
+        self, project_id: str, on_nodes_deleted: NodeIdsCallback | None = None
+    ) -> Generator[str, None, None]:
+        generation = uuid.uuid4().hex
+        logger.info(
+            ls.MG_GENERATION_STARTED.format(
+                project_id=project_id, generation=generation
+            )
+        )
+        self._generation = generation
+        try:
+            yield generation
+            self.flush_all()
+        finally:
+            self._generation = None
+        logger.info(
+            ls.MG_GENERATION_FINISHED.format(
+                project_id=project_id, generation=generation
+            )
+        )
+        self.delete_stale_generation_in_background(
+            project_id, generation, on_nodes_deleted
+        )
+
+    def delete_stale_generation(
+        self,
+        project_id: str,
+        generation: str,
+        on_nodes_deleted: NodeIdsCallback | None = None,
+    ) -> int:
+        params: dict[str, PropertyValue] = {
+            KEY_PROJECT_ID: project_id,
+            KEY_GENERATION: generation,
+        }
+        nodes = rels = 0
+        deleted_ids: list[int] = []
+        try:
+            for label in NODE_UNIQUE_CONSTRAINTS:
+                if label != NodeLabel.PROJECT:
+                    nodes += self._delete_in_batches(
+                        label,
+                        build_delete_stale_nodes_query(label),
+                        params,
+                        deleted_ids,
+                    )
+                rels += self._delete_in_batches(
+                    label, build_delete_stale_relationships_query(label), params
+                )
+        finally:
+            self.invalidate_node_ids()
+            if on_nodes_deleted is not None and deleted_ids:
+                on_nodes_deleted(deleted_ids)
+        logger.info(
+            ls.MG_GENERATION_SWEPT.format(
+                nodes=nodes, rels=rels, generation=generation, project_id=project_id
+            )
+        )
+        return nodes + rels
+
+    def delete_stale_generation_in_background(
+        self,
+        project_id: str,
+        generation: str,
+        on_nodes_deleted: NodeIdsCallback | None = None,
+    ) -> threading.Thread:
+        thread = threading.Thread(
+            target=self._sweep_generation,
+            args=(project_id, generation, on_nodes_deleted),
+            name=GENERATION_SWEEP_THREAD_NAME,
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _sweep_generation(
+        self,
+        project_id: str,
+        generation: str,
+        on_nodes_deleted: NodeIdsCallback | None = None,
+    ) -> None:
+        try:
+            with MemgraphIngestor(
+                self._host, self._port, delete_batch_size=self.delete_batch_size
+            ) as sweeper:
+                sweeper.delete_stale_generation(
+                    project_id, generation, on_nodes_deleted
+                )
+        except Exception as e:
+            logger.error(
+                ls.MG_GENERATION_SWEEP_FAILED.format(project_id=project_id, error=e)
+            )
+
     def ensure_constraints(self) -> None:
         logger.info(ls.MG_ENSURING_CONSTRAINTS)
         for label, prop in NODE_UNIQUE_CONSTRAINTS.items():
@@ -186,13 +533,149 @@ class MemgraphIngestor:
                 pass
         logger.info(ls.MG_CONSTRAINTS_DONE)
 
+    def list_indexes(self) -> set[tuple[str, str]]:
+        try:
+            rows = self._execute_query(CYPHER_SHOW_INDEX_INFO)
+        except Exception as e:
+            logger.warning(ls.MG_INDEX_INFO_FAILED.format(error=e))
+            return set()
+        indexes: set[tuple[str, str]] = set()
+        for row in rows:
+            label = row.get(INDEX_INFO_LABEL)
+            prop = row.get(INDEX_INFO_PROPERTY)
+            if isinstance(prop, list) and len(prop) == 1:
+                prop = prop[0]
+            if isinstance(label, str) and isinstance(prop, str):
+                indexes.add((label, prop))
+        return indexes
+
+    def ensure_indexes(self) -> int:
+        logger.info(ls.MG_ENSURING_INDEXES)
+        existing = self.list_indexes()
+        created = 0
+        for label, prop in NODE_PROPERTY_INDEXES:
+            if (label, prop) in existing:
+                continue
+            try:
+                self._execute_query(build_index_query(label, prop))
+                created += 1
+            except Exception as e:
+                logger.warning(
+                    ls.MG_INDEX_CREATE_FAILED.format(label=label, prop=prop, error=e)
+                )
+        logger.info(
+            ls.MG_INDEXES_DONE.format(
+                created=created,
+                existing=len(existing.intersection(NODE_PROPERTY_INDEXES)),
+            )
+        )
+        return created
+
+    def drop_indexes(self) -> int:
+        existing = self.list_indexes()
+        dropped = 0
+        for label, prop in NODE_PROPERTY_INDEXES:
+            if (label, prop) in existing:
+                self._execute_query(build_drop_index_query(label, prop))
+                dropped += 1
+        logger.info(ls.MG_INDEXES_DROPPED.format(count=dropped))
+        return dropped
+
+    def storage_mode(self) -> str | None:
+        for row in self._execute_query(CYPHER_SHOW_STORAGE_INFO):
+            if row.get(STORAGE_INFO_KEY) == STORAGE_INFO_MODE:
+                return str(row.get(STORAGE_INFO_VALUE))
+        return None
+
+    def set_storage_mode(self, mode: str) -> None:
+        self._execute_query(build_storage_mode_query(mode))
+        logger.info(ls.MG_STORAGE_MODE_SET.format(mode=mode))
+
+    @contextmanager
+    def analytical_storage(self) -> Generator[None, None, None]:
+        if not self._analytical_storage:
+            yield
+            return
+        previous = self.storage_mode()
+        if previous is None:
+            logger.warning(ls.MG_STORAGE_MODE_UNKNOWN)
+        if previous is None or previous == STORAGE_MODE_ANALYTICAL:
+            yield
+            return
+        self.set_storage_mode(STORAGE_MODE_ANALYTICAL)
+        try:
+            yield
+        finally:
+            if self._writer is not None:
+                self._writer.drain()
+            self.set_storage_mode(previous)
+
+    def has_nodes(self, project_id: str | None = None) -> bool:
+        if project_id is None:
+            return bool(self._execute_query(CYPHER_GRAPH_HAS_NODES))
+        return bool(
+            self._execute_query(CYPHER_PROJECT_HAS_NODES, {KEY_PROJECT_ID: project_id})
+        )
+
+    @property
+    def bulk_load_enabled(self) -> bool:
+        return self._bulk is not None
+
+    def enable_bulk_load(
+        self, staging_dir: str | Path | None = None, batch_size: int | None = None
+    ) -> None:
+        if self._bulk is not None:
+            return
+        self._drain_buffers()
+        directory = Path(
+            tempfile.mkdtemp(prefix=BULK_STAGING_DIR_PREFIX, dir=staging_dir)
+        )
+        self._bulk = BulkLoadStaging(directory)
+        self._bulk_batch_size = batch_size or self.batch_size
+        self._bulk_merge_nodes = False
+        logger.info(ls.MG_BULK_ENABLED.format(path=directory))
+
+    def enable_bulk_load_if_empty(
+        self,
+        staging_dir: str | Path | None = None,
+        batch_size: int | None = None,
+        project_id: str | None = None,
+    ) -> bool:
+        if self.has_nodes(project_id):
+            logger.info(ls.MG_BULK_SKIPPED_NOT_EMPTY)
+            return False
+        self.enable_bulk_load(staging_dir, batch_size)
+        # (H) Other projects may already hold shared nodes (e.g. ExternalPackage),
+        # (H) so a first sighting has to MERGE rather than CREATE.
+        self._bulk_merge_nodes = project_id is not None and self.has_nodes()
+        return True
+
+    def _flush_threshold(self) -> int:
+        if self._batch_sizer is None:
+            return self.batch_size
+        return self._batch_sizer.largest()
+
     def ensure_node_batch(
         self, label: str, properties: dict[str, PropertyValue]
     ) -> None:
+        if self._generation is not None and label != NodeLabel.PROJECT:
+            properties = properties | {KEY_GENERATION: self._generation}
+        if self._bulk is not None:
+            self._stage_node(label, properties)
+            return
+        key = _node_key(label, properties)
+        position = self._node_index.get(key) if key else None
+        if position is not None:
+            _, existing = self.node_buffer[position]
+            self.node_buffer[position] = (label, existing | properties)
+            self._merged_nodes += 1
+            return
+        if key:
+            self._node_index[key] = len(self.node_buffer)
         self.node_buffer.append((label, properties))
-        if len(self.node_buffer) >= self.batch_size:
-            logger.debug(ls.MG_NODE_BUFFER_FLUSH.format(size=self.batch_size))
-            self.flush_nodes()
+        if len(self.node_buffer) >= (threshold := self._flush_threshold()):
+            logger.debug(ls.MG_NODE_BUFFER_FLUSH.format(size=threshold))
+            self._dispatch_nodes()
 
     def ensure_relationship_batch(
         self,
@@ -201,8 +684,26 @@ class MemgraphIngestor:
         to_spec: tuple[str, str, PropertyValue],
         properties: dict[str, PropertyValue] | None = None,
     ) -> None:
+        if self._generation is not None:
+            properties = (properties or {}) | {KEY_GENERATION: self._generation}
+        if self._bulk is not None:
+            self._bulk.add_relationship(from_spec, rel_type, to_spec, properties)
+            return
         from_label, from_key, from_val = from_spec
         to_label, to_key, to_val = to_spec
+        key = (
+            None
+            if isinstance(from_val, list) or isinstance(to_val, list)
+            else (from_spec, rel_type, to_spec)
+        )
+        position = self._rel_index.get(key) if key else None
+        if position is not None:
+            self._merge_relationship(position, properties)
+            return
+        if self._count_relationships:
+            properties = (properties or {}) | {KEY_COUNT: 1}
+        if key:
+            self._rel_index[key] = len(self.relationship_buffer)
         self.relationship_buffer.append(
             (
                 (from_label, from_key, from_val),
@@ -211,10 +712,36 @@ class MemgraphIngestor:
                 properties,
             )
         )
-        if len(self.relationship_buffer) >= self.batch_size:
-            logger.debug(ls.MG_REL_BUFFER_FLUSH.format(size=self.batch_size))
+        if len(self.relationship_buffer) >= (threshold := self._flush_threshold()):
+            logger.debug(ls.MG_REL_BUFFER_FLUSH.format(size=threshold))
+            self._dispatch_nodes()
+            self._dispatch_relationships()
+
+    def _merge_relationship(
+        self, position: int, properties: dict[str, PropertyValue] | None
+    ) -> None:
+        from_spec, rel_type, to_spec, existing = self.relationship_buffer[position]
+        merged = (existing or {}) | (properties or {})
+        if self._count_relationships:
+            count = existing.get(KEY_COUNT) if existing else None
+            merged[KEY_COUNT] = (count if isinstance(count, int) else 1) + 1
+        self.relationship_buffer[position] = (from_spec, rel_type, to_spec, merged)
+        self._merged_relationships += 1
+
+    def _dispatch_nodes(self) -> None:
+        if self._writer is None:
             self.flush_nodes()
+        elif self.node_buffer:
+            rows, self.node_buffer, self._node_index = self.node_buffer, [], {}
+            self._writer.submit_nodes(rows)
+
+    def _dispatch_relationships(self) -> None:
+        if self._writer is None:
             self.flush_relationships()
+        elif self.relationship_buffer:
+            rows, self.relationship_buffer = self.relationship_buffer, []
+            self._rel_index = {}
+            self._writer.submit_relationships(rows)
 
     def flush_nodes(self) -> None:
         if not self.node_buffer:
@@ -255,14 +782,91 @@ class MemgraphIngestor:
 
             flushed_total += len(batch_rows)
 
+            if self._node_ids is not None:
+                query = build_merge_node_returning_id_query(label, id_key)
+                self._cache_node_ids(
+                    label, id_key, self._execute_rows(label, query, batch_rows)
+                )
+                continue
             query = build_merge_node_query(label, id_key)
-            self._execute_batch(query, batch_rows)
+            if self._batch_sizer is None:
+                self._execute_batch(query, batch_rows)
+            else:
+                self._execute_rows(label, query, batch_rows)
         logger.info(
             ls.MG_NODES_FLUSHED.format(flushed=flushed_total, total=buffer_size)
         )
         if skipped_total:
             logger.info(ls.MG_NODES_SKIPPED.format(count=skipped_total))
         self.node_buffer.clear()
+        self._node_index.clear()
+
+    def _cache_node_ids(
+        self, label: str, id_key: str, results: list[ResultRow]
+    ) -> None:
+        if self._node_ids is None:
+            return
+        for r in results:
+            key, node_id = r.get(KEY_ID), r.get(KEY_NODE_ID)
+            if isinstance(node_id, int) and not isinstance(key, list | dict):
+                self._node_ids.put((label, id_key, key), node_id)
+
+    def _split_by_node_id(
+        self, pattern: tuple[str, str, str, str, str], rows: list[RelBatchRow]
+    ) -> tuple[list[tuple[RelIdBatchRow, RelBatchRow]], list[RelBatchRow]]:
+        if self._node_ids is None:
+            return [], rows
+        from_label, from_key, _, to_label, to_key = pattern
+        hits: list[tuple[RelIdBatchRow, RelBatchRow]] = []
+        misses: list[RelBatchRow] = []
+        for row in rows:
+            from_val, to_val = row[KEY_FROM_VAL], row[KEY_TO_VAL]
+            if isinstance(from_val, list) or isinstance(to_val, list):
+                misses.append(row)
+                continue
+            from_id = self._node_ids.get((from_label, from_key, from_val))
+            to_id = (
+                self._node_ids.get((to_label, to_key, to_val))
+                if from_id is not None
+                else None
+            )
+            if from_id is None or to_id is None:
+                misses.append(row)
+            else:
+                hits.append(
+                    (
+                        RelIdBatchRow(
+                            from_id=from_id, to_id=to_id, props=row[KEY_PROPS]
+                        ),
+                        row,
+                    )
+                )
+        return hits, misses
+
+    def _unmatched_by_node_id(
+        self,
+        pattern: tuple[str, str, str, str, str],
+        hits: list[tuple[RelIdBatchRow, RelBatchRow]],
+        matched: list[ResultRow],
+    ) -> list[RelBatchRow]:
+        if self._node_ids is None:
+            return []
+        found = {(r.get(KEY_FROM_ID), r.get(KEY_TO_ID)) for r in matched}
+        from_label, from_key, rel_type, to_label, to_key = pattern
+        unmatched: list[RelBatchRow] = []
+        for id_row, row in hits:
+            if (id_row[KEY_FROM_ID], id_row[KEY_TO_ID]) in found:
+                continue
+            # (H) A cached id whose node was deleted matches nothing; forget both
+            # (H) endpoints and let the property-key query resolve the edge.
+            self._node_ids.discard((from_label, from_key, row[KEY_FROM_VAL]))
+            self._node_ids.discard((to_label, to_key, row[KEY_TO_VAL]))
+            unmatched.append(row)
+        if unmatched:
+            logger.debug(
+                ls.MG_NODE_ID_CACHE_STALE.format(count=len(unmatched), pattern=rel_type)
+            )
+        return unmatched
 
     def flush_relationships(self) -> None:
         if not self.relationship_buffer:
@@ -283,13 +887,27 @@ class MemgraphIngestor:
         for pattern, params_list in rels_by_pattern.items():
             from_label, from_key, rel_type, to_label, to_key = pattern
             has_props = any(p[KEY_PROPS] for p in params_list)
-            query = build_merge_relationship_query(
-                from_label, from_key, rel_type, to_label, to_key, has_props
-            )
+            name = f"{from_label}-{rel_type}->{to_label}"
+            id_hits, property_rows = self._split_by_node_id(pattern, params_list)
 
             total_attempted += len(params_list)
-            results = self._execute_batch_with_return(query, params_list)
             batch_successful = 0
+            if id_hits:
+                matched = self._execute_rows(
+                    f"{name}#id",
+                    build_merge_relationship_by_id_query(rel_type, has_props),
+                    [id_row for id_row, _ in id_hits],
+                )
+                batch_successful += len(matched)
+                property_rows = property_rows + self._unmatched_by_node_id(
+                    pattern, id_hits, matched
+                )
+            results: list[ResultRow] = []
+            if property_rows:
+                query = build_merge_relationship_query(
+                    from_label, from_key, rel_type, to_label, to_key, has_props
+                )
+                results += self._execute_rows(name, query, property_rows)
             for r in results:
                 created = r.get(KEY_CREATED, 0)
                 if isinstance(created, int):
@@ -319,11 +937,112 @@ class MemgraphIngestor:
             )
         )
         self.relationship_buffer.clear()
+        self._rel_index.clear()
+
+    def _stage_node(self, label: str, properties: dict[str, PropertyValue]) -> None:
+        if self._bulk is None:
+            return
+        id_key = NODE_UNIQUE_CONSTRAINTS.get(label)
+        if not id_key:
+            logger.warning(ls.MG_NO_CONSTRAINT.format(label=label))
+            return
+        if id_key not in properties:
+            logger.warning(
+                ls.MG_MISSING_PROP.format(label=label, key=id_key, props=properties)
+            )
+            return
+        self._bulk.add_node(label, id_key, properties)
+
+    def _load_bulk(self) -> None:
+        staging, self._bulk = self._bulk, None
+        if staging is None:
+            return
+        staging.close()
+        started = time.perf_counter()
+        logger.info(
+            ls.MG_BULK_LOADING.format(
+                nodes=staging.node_count, rels=staging.relationship_count
+            )
+        )
+        chunk_size = self._bulk_batch_size
+        try:
+            for (label, id_key), staged in staging.node_files.items():
+                query = (
+                    build_merge_node_query(label, id_key)
+                    if self._bulk_merge_nodes
+                    else build_create_node_query(label, id_key)
+                )
+                for rows in iter_staged_rows(staged.path, chunk_size):
+                    self._execute_batch(query, rows)
+                logger.info(
+                    ls.MG_BULK_LABEL_LOADED.format(count=staged.rows, label=label)
+                )
+            for (label, id_key), staged in staging.node_merge_files.items():
+                query = build_merge_node_query(label, id_key)
+                for rows in iter_staged_rows(staged.path, chunk_size):
+                    self._execute_batch(query, rows)
+                logger.info(ls.MG_BULK_MERGED.format(count=staged.rows, name=label))
+
+            self.ensure_indexes()
+
+            for pattern, staged in staging.rel_files.items():
+                query = build_create_relationship_query(*pattern)
+                created = 0
+                for rows in iter_staged_rows(staged.path, chunk_size):
+                    for r in self._execute_batch_with_return(query, rows):
+                        count = r.get(KEY_CREATED, 0)
+                        if isinstance(count, int):
+                            created += count
+                logger.info(
+                    ls.MG_BULK_TYPE_LOADED.format(
+                        created=created, total=staged.rows, rel_type=pattern[2]
+                    )
+                )
+            for pattern, staged in staging.rel_merge_files.items():
+                query = build_merge_relationship_query(*pattern, has_props=True)
+                for rows in iter_staged_rows(staged.path, chunk_size):
+                    self._execute_batch_with_return(query, rows)
+                logger.info(
+                    ls.MG_BULK_MERGED.format(count=staged.rows, name=pattern[2])
+                )
+        finally:
+            staging.cleanup()
+        logger.info(ls.MG_BULK_DONE.format(seconds=time.perf_counter() - started))
+
+    def _drain_buffers(self) -> None:
+        self._dispatch_nodes()
+        self._dispatch_relationships()
+        if self._writer is not None:
+            self._writer.wait()
 
     def flush_all(self) -> None:
         logger.info(ls.MG_FLUSH_START)
-        self.flush_nodes()
-        self.flush_relationships()
+        self._drain_buffers()
+        if self._batch_sizer is not None and (sizes := self._batch_sizer.sizes()):
+            logger.info(
+                ls.MG_BATCH_SIZES.format(
+                    sizes=", ".join(f"{k}={v}" for k, v in sizes.items())
+                )
+            )
+        if self._merged_nodes or self._merged_relationships:
+            logger.info(
+                ls.MG_BUFFER_MERGED.format(
+                    nodes=self._merged_nodes, rels=self._merged_relationships
+                )
+            )
+            self._merged_nodes = 0
+            self._merged_relationships = 0
+        if self._node_ids is not None and (
+            self._node_ids.hits or self._node_ids.misses
+        ):
+            logger.info(
+                ls.MG_NODE_ID_CACHE_STATS.format(
+                    hits=self._node_ids.hits,
+                    misses=self._node_ids.misses,
+                    size=len(self._node_ids),
+                )
+            )
+        self._load_bulk()
         logger.info(ls.MG_FLUSH_COMPLETE)
 
     def fetch_all(
@@ -332,17 +1051,54 @@ class MemgraphIngestor:
         logger.debug(ls.MG_FETCH_QUERY.format(query=query, params=params))
         return self._execute_query(query, params)
 
+    def fetch_iter(
+        self,
+        query: str,
+        params: dict[str, PropertyValue] | None = None,
+        *,
+        chunk_size: int | None = None,
+        max_rows: int | None = None,
+    ) -> Iterator[ResultRow]:
+        logger.debug(ls.MG_FETCH_QUERY.format(query=query, params=params))
+        size = chunk_size or self.fetch_chunk_size
+        with self._streaming_cursor() as cursor:
+            try:
+                cursor.execute(query, params or {})
+            except Exception as e:
+                logger.error(ls.MG_CYPHER_ERROR.format(error=e))
+                logger.error(ls.MG_CYPHER_QUERY.format(query=query))
+                raise
+            if not cursor.description:
+                return
+            column_names = [desc.name for desc in cursor.description]
+            emitted = 0
+            while rows := cursor.fetchmany(size):
+                for row in rows:
+                    if max_rows is not None and emitted >= max_rows:
+                        logger.warning(ls.MG_FETCH_TRUNCATED.format(rows=max_rows))
+                        return
+                    yield dict[str, ResultValue](zip(column_names, row))
+                    emitted += 1
+
     def execute_write(
         self, query: str, params: dict[str, PropertyValue] | None = None
     ) -> None:
         logger.debug(ls.MG_WRITE_QUERY.format(query=query, params=params))
         self._execute_query(query, params)
+        self.invalidate_node_ids()
+
+    def invalidate_node_ids(self) -> None:
+        if self._node_ids is not None and len(self._node_ids):
+            logger.debug(ls.MG_NODE_ID_CACHE_CLEARED.format(size=len(self._node_ids)))
+            self._node_ids.clear()
 
-    def export_graph_to_dict(self) -> GraphData:
+    def export_graph_to_dict(self, max_rows: int | None = None) -> GraphData:
         logger.info(ls.MG_EXPORTING)
 
-        nodes_data = self.fetch_all(CYPHER_EXPORT_NODES)
-        relationships_data = self.fetch_all(CYPHER_EXPORT_RELATIONSHIPS)
+        nodes_data = list(self.fetch_iter(CYPHER_EXPORT_NODES, max_rows=max_rows))
+        relationships_data = list(
+            self.fetch_iter(CYPHER_EXPORT_RELATIONSHIPS, max_rows=max_rows)
+        )
 
         metadata = GraphMetadata(
             total_nodes=len(nodes_data),
@@ -361,3 +1117,111 @@ class MemgraphIngestor:
 
     def _get_current_timestamp(self) -> str:
         return datetime.now(UTC).isoformat()
+
+
+NodeBuffer = list[tuple[str, dict[str, PropertyValue]]]
+RelationshipBuffer = list[
+    tuple[
+        tuple[str, str, PropertyValue],
+        str,
+        tuple[str, str, PropertyValue],
+        dict[str, PropertyValue] | None,
+    ]
+]
+_WriteJob = tuple[NodeBuffer, None] | tuple[None, RelationshipBuffer]
+
+
+class _BackgroundWriter:
+    def __init__(
+        self,
+        *,
+        host: str,
+        port: int,
+        batch_size: int,
+        queue_size: int,
+        batch_sizer: AdaptiveBatchSizer | None = None,
+        node_id_cache: NodeIdCache | None = None,
+    ):
+        self._host = host
+        self._port = port
+        self._batch_size = batch_size
+        self._batch_sizer = batch_sizer
+        self._node_id_cache = node_id_cache
+        self._queue: queue.Queue[_WriteJob | None] = queue.Queue(maxsize=queue_size)
+        self._error: BaseException | None = None
+        self._connected = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=WRITER_THREAD_NAME, daemon=True
+        )
+        self._thread.start()
+        logger.info(ls.MG_WRITER_STARTED.format(size=queue_size))
+
+    def _raise_if_failed(self) -> None:
+        # (H) The error stays set: once a batch is lost, every later flush must fail.
+        if self._error is not None:
+            raise self._error
+
+    def _put(self, job: _WriteJob) -> None:
+        self._raise_if_failed()
+        if self._queue.full():
+            logger.debug(ls.MG_WRITER_BACKPRESSURE.format(size=self._queue.maxsize))
+        self._queue.put(job)
+
+    def submit_nodes(self, rows: NodeBuffer) -> None:
+        self._put((rows, None))
+
+    def submit_relationships(self, rows: RelationshipBuffer) -> None:
+        self._put((None, rows))
+
+    def drain(self) -> None:
+        self._queue.join()
+
+    def wait(self) -> None:
+        self._connected.wait()
+        self.drain()
+        self._raise_if_failed()
+
+    def stop(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _write(self, writer: MemgraphIngestor, job: _WriteJob) -> None:
+        nodes, relationships = job
+        if nodes is not None:
+            writer.node_buffer = nodes
+            writer.flush_nodes()
+        if relationships is not None:
+            writer.relationship_buffer = relationships
+            writer.flush_relationships()
+
+    def _run(self) -> None:
+        writer: MemgraphIngestor | None = None
+        try:
+            writer = MemgraphIngestor(
+                self._host,
+                self._port,
+                self._batch_size,
+                batch_sizer=self._batch_sizer,
+                node_id_cache=self._node_id_cache,
+            )
+            writer.__enter__()
+        except Exception as e:
+            logger.error(ls.MG_WRITER_FAILED.format(error=e))
+            self._error = e
+            writer = None
+        finally:
+            self._connected.set()
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    break
+                if writer is not None and self._error is None:
+                    self._write(writer, job)
+            except Exception as e:
+                logger.error(ls.MG_WRITER_FAILED.format(error=e))
+                self._error = e
+            finally:
+                self._queue.task_done()
+        if writer is not None and writer.conn:
+            writer.conn.close()
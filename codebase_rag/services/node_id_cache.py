@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+from ..types_defs import PropertyValue
+
+NodeIdKey = tuple[str, str, PropertyValue]
+
+
+class NodeIdCache:
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[NodeIdKey, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: NodeIdKey) -> int | None:
+        with self._lock:
+            node_id = self._entries.get(key)
+            if node_id is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return node_id
+
+    def put(self, key: NodeIdKey, node_id: int) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = node_id
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: NodeIdKey) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+from loguru import logger
+
+import codec.schema_pb2 as pb
+
+from .. import constants as cs
+from .. import logs as ls
+from ..types_defs import PropertyDict, PropertyValue
+from .protobuf_records import RecordFile, iter_raw_records, key_digest
+
+LABEL_TO_PROTO_LABEL: dict[cs.NodeLabel, int] = {
+    cs.NodeLabel.PROJECT: pb.NODE_LABEL_PROJECT,
+    cs.NodeLabel.PACKAGE: pb.NODE_LABEL_PACKAGE,
+    cs.NodeLabel.FOLDER: pb.NODE_LABEL_FOLDER,
+    cs.NodeLabel.MODULE: pb.NODE_LABEL_MODULE,
+    cs.NodeLabel.CLASS: pb.NODE_LABEL_CLASS,
+    cs.NodeLabel.FUNCTION: pb.NODE_LABEL_FUNCTION,
+    cs.NodeLabel.METHOD: pb.NODE_LABEL_METHOD,
+    cs.NodeLabel.FILE: pb.NODE_LABEL_FILE,
+    cs.NodeLabel.EXTERNAL_PACKAGE: pb.NODE_LABEL_EXTERNAL_PACKAGE,
+    cs.NodeLabel.MODULE_IMPLEMENTATION: pb.NODE_LABEL_MODULE_IMPLEMENTATION,
+    cs.NodeLabel.MODULE_INTERFACE: pb.NODE_LABEL_MODULE_INTERFACE,
+}
+
+PROTO_LABEL_TO_LABEL: dict[int, cs.NodeLabel] = {
+    v: k for k, v in LABEL_TO_PROTO_LABEL.items()
+}
+
+
+@cache
+def _proto_label(label: str) -> int | None:
+    proto_label = LABEL_TO_PROTO_LABEL.get(cs.NodeLabel(label))
+    if proto_label is None:
+        logger.warning(ls.PROTOBUF_V2_NO_LABEL.format(label=label))
+    return proto_label
+
+
+@dataclass(frozen=True, slots=True)
+class IndexNode:
+    id: int
+    label: str
+    key: str
+    properties: PropertyDict
+    placeholder: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class IndexRelationship:
+    type: str
+    source_id: int
+    target_id: int
+    properties: PropertyDict
+
+
+class _InternedRecordFile(RecordFile):
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self._strings: dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        index = self._strings.get(value)
+        if index is None:
+            index = len(self._strings)
+            self._strings[value] = index
+            self.write(cs.PROTOBUF_V2_FIELD_STRINGS, value.encode())
+        return index
+
+    def encode_property(self, key: str, value: PropertyValue) -> pb.Property | None:
+        prop = pb.Property(key=self.intern(key))
+        match value:
+            case bool():
+                prop.bool_value = value
+            case int():
+                prop.int_value = value
+            case float():
+                prop.double_value = value
+            case str():
+                prop.string_ref = self.intern(value)
+            case list():
+                prop.string_list.SetInParent()
+                prop.string_list.values.extend(self.intern(str(v)) for v in value)
+            case _:
+                return None
+        return prop
+
+    def encode_properties(self, properties: PropertyDict) -> list[pb.Property]:
+        return [
+            prop
+            for key, value in properties.items()
+            if value is not None
+            and (prop := self.encode_property(key, value)) is not None
+        ]
+
+
+class IndexV2Writer:
+    def __init__(self, output_dir: Path, split_index: bool = False) -> None:
+        self.output_dir = output_dir
+        self.split_index = split_index
+        self._node_ids: dict[int, int] = {}
+        self._complete: set[int] = set()
+        self._relationships: set[tuple[int, int, int]] = set()
+        nodes_name, rels_name = (
+            (cs.PROTOBUF_V2_NODES_FILE, cs.PROTOBUF_V2_RELS_FILE)
+            if split_index
+            else (cs.PROTOBUF_V2_INDEX_FILE, cs.PROTOBUF_V2_INDEX_FILE)
+        )
+        self._nodes_file = _InternedRecordFile(output_dir / nodes_name)
+        self._rels_file = (
+            self._nodes_file
+            if nodes_name == rels_name
+            else _InternedRecordFile(output_dir / rels_name)
+        )
+
+    @property
+    def node_count(self) -> int:
+        return len(self._complete)
+
+    @property
+    def relationship_count(self) -> int:
+        return len(self._relationships)
+
+    def _node_id(self, key: str) -> tuple[int, bool]:
+        digest = key_digest(key)
+        node_id = self._node_ids.get(digest)
+        if node_id is None:
+            node_id = len(self._node_ids)
+            self._node_ids[digest] = node_id
+            return node_id, True
+        return node_id, False
+
+    def _write_node(
+        self,
+        node_id: int,
+        label: int,
+        key_name: str,
+        properties: PropertyDict,
+        placeholder: bool = False,
+    ) -> None:
+        record = pb.NodeRecord(
+            id=node_id,
+            label=label,
+            primary_key=self._nodes_file.intern(key_name),
+            properties=self._nodes_file.encode_properties(properties),
+            placeholder=placeholder,
+        )
+        self._nodes_file.write(cs.PROTOBUF_V2_FIELD_NODES, record.SerializeToString())
+
+    def add_node(
+        self, label: cs.NodeLabel, key_name: str, key: str, properties: PropertyDict
+    ) -> bool:
+        proto_label = _proto_label(label)
+        if proto_label is None:
+            return False
+        node_id, _ = self._node_id(key)
+        if node_id in self._complete:
+            return False
+        self._complete.add(node_id)
+        self._write_node(node_id, proto_label, key_name, properties)
+        return True
+
+    def _endpoint(self, spec: tuple[str, str, PropertyValue]) -> int | None:
+        label, key_name, key = spec
+        proto_label = _proto_label(label)
+        if proto_label is None:
+            return None
+        node_id, is_new = self._node_id(str(key))
+        # (H) Endpoint stubs only resolve ids; readers must not treat them as nodes.
+        if is_new:
+            self._write_node(
+                node_id, proto_label, key_name, {key_name: str(key)}, placeholder=True
+            )
+        return node_id
+
+    def add_relationship(
+        self,
+        from_spec: tuple[str, str, PropertyValue],
+        rel_type: int,
+        to_spec: tuple[str, str, PropertyValue],
+        properties: PropertyDict | None = None,
+    ) -> bool:
+        source_id = self._endpoint(from_spec)
+        target_id = self._endpoint(to_spec)
+        if source_id is None or target_id is None:
+            return False
+        unique_key = (source_id, rel_type, target_id)
+        first_seen = unique_key not in self._relationships
+        if not first_seen and not properties:
+            return False
+        self._relationships.add(unique_key)
+        record = pb.RelationshipRecord(
+            type=rel_type,
+            source_id=source_id,
+            target_id=target_id,
+            properties=self._rels_file.encode_properties(properties or {}),
+        )
+        self._rels_file.write(
+            cs.PROTOBUF_V2_FIELD_RELATIONSHIPS, record.SerializeToString()
+        )
+        return first_seen
+
+    def close(self) -> None:
+        self._nodes_file.touch()
+        self._rels_file.touch()
+        self._nodes_file.close()
+        self._rels_file.close()
+
+
+def _decode_properties(
+    strings: list[str], properties: list[pb.Property]
+) -> PropertyDict:
+    decoded: PropertyDict = {}
+    for prop in properties:
+        kind = prop.WhichOneof(cs.PROTOBUF_V2_PROPERTY_ONEOF)
+        if kind is None:
+            continue
+        if kind == cs.PROTOBUF_V2_STRING_REF:
+            decoded[strings[prop.key]] = strings[prop.string_ref]
+        elif kind == cs.PROTOBUF_V2_STRING_LIST:
+            decoded[strings[prop.key]] = [strings[i] for i in prop.string_list.values]
+        else:
+            decoded[strings[prop.key]] = getattr(prop, kind)
+    return decoded
+
+
+def iter_index_v2_records(path: Path) -> Iterator[IndexNode | IndexRelationship]:
+    strings: list[str] = []
+    for field_number, payload in iter_raw_records(path):
+        if field_number == cs.PROTOBUF_V2_FIELD_STRINGS:
+            strings.append(payload.decode())
+        elif field_number == cs.PROTOBUF_V2_FIELD_NODES:
+            node = pb.NodeRecord.FromString(payload)
+            yield IndexNode(
+                id=node.id,
+                label=PROTO_LABEL_TO_LABEL[node.label].value,
+                key=strings[node.primary_key],
+                properties=_decode_properties(strings, list(node.properties)),
+                placeholder=node.placeholder,
+            )
+        elif field_number == cs.PROTOBUF_V2_FIELD_RELATIONSHIPS:
+            rel = pb.RelationshipRecord.FromString(payload)
+            yield IndexRelationship(
+                type=pb.Relationship.RelationshipType.Name(rel.type),
+                source_id=rel.source_id,
+                target_id=rel.target_id,
+                properties=_decode_properties(strings, list(rel.properties)),
+            )
+
+
+def index_v2_files(output_dir: Path) -> list[Path]:
+    joint = output_dir / cs.PROTOBUF_V2_INDEX_FILE
+    if joint.exists():
+        return [joint]
+    return [
+        path
+        for path in (
+            output_dir / cs.PROTOBUF_V2_NODES_FILE,
+            output_dir / cs.PROTOBUF_V2_RELS_FILE,
+        )
+        if path.exists()
+    ]
+
+
+def iter_graph_index_v2(output_dir: Path) -> Iterator[IndexNode | IndexRelationship]:
+    for path in index_v2_files(output_dir):
+        yield from iter_index_v2_records(path)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from google.protobuf import json_format
+from google.protobuf.message import Message
+from loguru import logger
+
+import codec.schema_pb2 as pb
+
+from .. import constants as cs
+from .. import exceptions as ex
+from .. import logs as ls
+from ..types_defs import PropertyDict, PropertyValue
+from . import IngestorProtocol
+from .protobuf_index_v2 import IndexNode, index_v2_files, iter_index_v2_records
+from .protobuf_service import (
+    ONEOF_FIELD_TO_LABEL,
+    index_files,
+    iter_index_records,
+    primary_key_for,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ProtobufLoadResult:
+    schema_version: cs.ProtobufSchemaVersion
+    nodes: int
+    relationships: int
+    skipped: int
+
+
+def detect_index_schema(index_dir: Path) -> cs.ProtobufSchemaVersion:
+    if index_v2_files(index_dir):
+        return cs.ProtobufSchemaVersion.V2
+    if index_files(index_dir):
+        return cs.ProtobufSchemaVersion.V1
+    raise FileNotFoundError(ex.PROTOBUF_INDEX_NOT_FOUND.format(path=index_dir))
+
+
+def _payload_properties(payload: Message) -> PropertyDict:
+    return {
+        field.name: value if isinstance(value, str | int | float) else list(value)
+        for field, value in payload.ListFields()
+    }
+
+
+def _struct_properties(rel: pb.Relationship) -> PropertyDict | None:
+    if not rel.HasField(cs.PROTOBUF_REL_PROPERTIES_FIELD):
+        return None
+    properties: PropertyDict = {}
+    for key, value in json_format.MessageToDict(rel.properties).items():
+        properties[key] = (
+            int(value) if isinstance(value, float) and value.is_integer() else value
+        )
+    return properties
+
+
+def _with_project(properties: PropertyDict, project_id: str | None) -> PropertyDict:
+    if project_id is None:
+        return properties
+    return properties | {cs.KEY_PROJECT_ID: project_id}
+
+
+def _load_v1(
+    ingestor: IngestorProtocol, index_dir: Path, project_id: str | None
+) -> ProtobufLoadResult:
+    nodes = relationships = skipped = 0
+    for path in index_files(index_dir):
+        for record in iter_index_records(path):
+            if isinstance(record, pb.Node):
+                field = record.WhichOneof(cs.PROTOBUF_NODE_ONEOF)
+                label = ONEOF_FIELD_TO_LABEL.get(field) if field else None
+                if label is None:
+                    skipped += 1
+                    continue
+                ingestor.ensure_node_batch(
+                    label,
+                    _with_project(
+                        _payload_properties(getattr(record, field)), project_id
+                    ),
+                )
+                nodes += 1
+                continue
+            if record.type == pb.Relationship.RELATIONSHIP_TYPE_UNSPECIFIED:
+                logger.warning(
+                    ls.PROTOBUF_LOAD_SKIPPED_REL.format(
+                        source_id=record.source_id, target_id=record.target_id
+                    )
+                )
+                skipped += 1
+                continue
+            source_label = cs.NodeLabel(record.source_label)
+            target_label = cs.NodeLabel(record.target_label)
+            ingestor.ensure_relationship_batch(
+                (source_label, primary_key_for(source_label), record.source_id),
+                pb.Relationship.RelationshipType.Name(record.type),
+                (target_label, primary_key_for(target_label), record.target_id),
+                _struct_properties(record),
+            )
+            relationships += 1
+    return ProtobufLoadResult(
+        schema_version=cs.ProtobufSchemaVersion.V1,
+        nodes=nodes,
+        relationships=relationships,
+        skipped=skipped,
+    )
+
+
+def _load_v2(
+    ingestor: IngestorProtocol, index_dir: Path, project_id: str | None
+) -> ProtobufLoadResult:
+    endpoints: dict[int, tuple[str, str, PropertyValue]] = {}
+    nodes = relationships = skipped = 0
+    for path in index_v2_files(index_dir):
+        for record in iter_index_v2_records(path):
+            if isinstance(record, IndexNode):
+                endpoints[record.id] = (
+                    record.label,
+                    record.key,
+                    record.properties.get(record.key),
+                )
+                # (H) Stubs only map ids to keys; the real record carries the node.
+                if record.placeholder:
+                    continue
+                ingestor.ensure_node_batch(
+                    record.label, _with_project(record.properties, project_id)
+                )
+                nodes += 1
+                continue
+            source = endpoints.get(record.source_id)
+            target = endpoints.get(record.target_id)
+            if source is None or target is None:
+                logger.warning(
+                    ls.PROTOBUF_LOAD_SKIPPED_REL.format(
+                        source_id=record.source_id, target_id=record.target_id
+                    )
+                )
+                skipped += 1
+                continue
+            ingestor.ensure_relationship_batch(
+                source, record.type, target, record.properties or None
+            )
+            relationships += 1
+    return ProtobufLoadResult(
+        schema_version=cs.ProtobufSchemaVersion.V2,
+        nodes=nodes,
+        relationships=relationships,
+        skipped=skipped,
+    )
+
+
+def load_protobuf_index(
+    ingestor: IngestorProtocol, index_dir: Path, project_id: str | None = None
+) -> ProtobufLoadResult:
+    schema_version = detect_index_schema(index_dir)
+    logger.info(
+        ls.PROTOBUF_LOAD_START.format(path=index_dir, version=schema_version.value)
+    )
+    if schema_version == cs.ProtobufSchemaVersion.V2:
+        result = _load_v2(ingestor, index_dir, project_id)
+    else:
+        result = _load_v1(ingestor, index_dir, project_id)
+    ingestor.flush_all()
+    logger.success(
+        ls.PROTOBUF_LOAD_DONE.format(
+            nodes=result.nodes, rels=result.relationships, skipped=result.skipped
+        )
+    )
+    return result
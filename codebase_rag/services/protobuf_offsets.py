@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import mmap
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import NamedTuple
+
+from loguru import logger
+
+import codec.schema_pb2 as pb
+
+from .. import constants as cs
+from .. import exceptions as ex
+from .. import logs as ls
+from .protobuf_records import iter_record_spans, key_digest
+from .protobuf_service import index_files, index_node_key
+
+_HEADER = struct.Struct(cs.PROTOBUF_OFFSETS_HEADER_FORMAT)
+_NAME = struct.Struct(cs.PROTOBUF_OFFSETS_NAME_FORMAT)
+_SLOT = struct.Struct(cs.PROTOBUF_OFFSETS_SLOT_FORMAT)
+_NODE = struct.Struct(cs.PROTOBUF_OFFSETS_NODE_FORMAT)
+_REL = struct.Struct(cs.PROTOBUF_OFFSETS_REL_FORMAT)
+_ADJACENCY = struct.Struct(cs.PROTOBUF_OFFSETS_ADJACENCY_FORMAT)
+
+RecordSpan = tuple[int, int, int]
+
+
+@dataclass(slots=True)
+class _NodeEntry:
+    record: RecordSpan | None = None
+    outgoing: list[int] = field(default_factory=list)
+    incoming: list[int] = field(default_factory=list)
+
+
+class _IndexedNode(NamedTuple):
+    key_offset: int
+    key_length: int
+    file_no: int
+    offset: int
+    length: int
+    out_start: int
+    out_count: int
+    in_start: int
+    in_count: int
+
+
+def _slot_count(node_count: int) -> int:
+    target = max(1, node_count * cs.PROTOBUF_OFFSETS_SLOTS_PER_NODE)
+    return 1 << (target - 1).bit_length()
+
+
+def build_offset_table(index_dir: Path) -> Path:
+    files = index_files(index_dir)
+    if not files:
+        raise FileNotFoundError(ex.PROTOBUF_INDEX_NOT_FOUND.format(path=index_dir))
+
+    nodes: dict[str, _NodeEntry] = {}
+    relationships: list[RecordSpan] = []
+    for file_no, path in enumerate(files):
+        for field_number, offset, payload in iter_record_spans(path):
+            span = (file_no, offset, len(payload))
+            if field_number == cs.PROTOBUF_FIELD_NODES:
+                if node_key := index_node_key(pb.Node.FromString(payload)):
+                    nodes.setdefault(node_key[1], _NodeEntry()).record = span
+            elif field_number == cs.PROTOBUF_FIELD_RELATIONSHIPS:
+                rel = pb.Relationship.FromString(payload)
+                ordinal = len(relationships)
+                relationships.append(span)
+                nodes.setdefault(rel.source_id, _NodeEntry()).outgoing.append(ordinal)
+                nodes.setdefault(rel.target_id, _NodeEntry()).incoming.append(ordinal)
+
+    slot_count = _slot_count(len(nodes))
+    slots: list[tuple[int, int]] = [(0, 0)] * slot_count
+    for ordinal, key in enumerate(nodes):
+        digest = key_digest(key)
+        position = digest & (slot_count - 1)
+        while slots[position][1]:
+            position = (position + 1) & (slot_count - 1)
+        slots[position] = (digest, ordinal + 1)
+
+    output = index_dir / cs.PROTOBUF_OFFSETS_FILE
+    adjacency_count = sum(len(e.outgoing) + len(e.incoming) for e in nodes.values())
+    with open(output, "wb", buffering=cs.PROTOBUF_STREAM_BUFFER_BYTES) as f:
+        f.write(
+            _HEADER.pack(
+                cs.PROTOBUF_OFFSETS_MAGIC,
+                len(files),
+                slot_count,
+                len(nodes),
+                len(relationships),
+                adjacency_count,
+            )
+        )
+        for path in files:
+            name = path.name.encode()
+            f.write(_NAME.pack(len(name)))
+            f.write(name)
+        for digest, ordinal in slots:
+            f.write(_SLOT.pack(digest, ordinal))
+        key_offset = adjacency_start = 0
+        for key, entry in nodes.items():
+            file_no, offset, length = entry.record or (0, 0, 0)
+            key_length = len(key.encode())
+            out_count, in_count = len(entry.outgoing), len(entry.incoming)
+            f.write(
+                _NODE.pack(
+                    key_offset,
+                    key_length,
+                    file_no,
+                    offset,
+                    length,
+                    adjacency_start,
+                    out_count,
+                    adjacency_start + out_count,
+                    in_count,
+                )
+            )
+            key_offset += key_length
+            adjacency_start += out_count + in_count
+        for span in relationships:
+            f.write(_REL.pack(*span))
+        for entry in nodes.values():
+            for ordinal in (*entry.outgoing, *entry.incoming):
+                f.write(_ADJACENCY.pack(ordinal))
+        for key in nodes:
+            f.write(key.encode())
+
+    logger.info(
+        ls.PROTOBUF_OFFSETS_WRITTEN.format(
+            nodes=len(nodes), rels=len(relationships), path=output
+        )
+    )
+    return output
+
+
+def _map(path: Path) -> mmap.mmap | bytes:
+    with open(path, "rb") as f:
+        if not path.stat().st_size:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class MmapIndexReader:
+    def __init__(self, index_dir: Path) -> None:
+        path = index_dir / cs.PROTOBUF_OFFSETS_FILE
+        if not path.is_file():
+            raise FileNotFoundError(ex.PROTOBUF_OFFSETS_NOT_FOUND.format(path=path))
+        self.index_dir = index_dir
+        self._table = _map(path)
+        if len(self._table) < _HEADER.size:
+            raise ValueError(ex.PROTOBUF_OFFSETS_BAD_MAGIC.format(path=path))
+        (
+            magic,
+            file_count,
+            self._slot_count,
+            self._node_count,
+            rel_count,
+            adjacency_count,
+        ) = _HEADER.unpack_from(self._table, 0)
+        if magic != cs.PROTOBUF_OFFSETS_MAGIC:
+            raise ValueError(ex.PROTOBUF_OFFSETS_BAD_MAGIC.format(path=path))
+
+        position = _HEADER.size
+        self._records: list[mmap.mmap | bytes] = []
+        for _ in range(file_count):
+            (size,) = _NAME.unpack_from(self._table, position)
+            position += _NAME.size
+            name = bytes(self._table[position : position + size]).decode()
+            position += size
+            self._records.append(_map(index_dir / name))
+        self._slots_at = position
+        self._nodes_at = self._slots_at + self._slot_count * _SLOT.size
+        self._rels_at = self._nodes_at + self._node_count * _NODE.size
+        self._adjacency_at = self._rels_at + rel_count * _REL.size
+        self._keys_at = self._adjacency_at + adjacency_count * _ADJACENCY.size
+
+    def __enter__(self) -> MmapIndexReader:
+        return self
+
+    def __exit__(
+        self, exc_type: type | None, exc_val: Exception | None, exc_tb: object
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._node_count
+
+    def __contains__(self, key: str) -> bool:
+        return self._find(key) is not None
+
+    def close(self) -> None:
+        for mapped in (self._table, *self._records):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+        self._records = []
+
+    def _entry(self, ordinal: int) -> _IndexedNode:
+        return _IndexedNode._make(
+            _NODE.unpack_from(self._table, self._nodes_at + ordinal * _NODE.size)
+        )
+
+    def _find(self, key: str) -> _IndexedNode | None:
+        digest = key_digest(key)
+        encoded = key.encode()
+        mask = self._slot_count - 1
+        position = digest & mask
+        while True:
+            slot_digest, ordinal = _SLOT.unpack_from(
+                self._table, self._slots_at + position * _SLOT.size
+            )
+            if not ordinal:
+                return None
+            if slot_digest == digest:
+                entry = self._entry(ordinal - 1)
+                start = self._keys_at + entry.key_offset
+                if self._table[start : start + entry.key_length] == encoded:
+                    return entry
+            position = (position + 1) & mask
+
+    def _record(self, file_no: int, offset: int, length: int) -> bytes:
+        return self._records[file_no][offset : offset + length]
+
+    def _relationships(self, start: int, count: int) -> list[pb.Relationship]:
+        relationships = []
+        for i in range(start, start + count):
+            (ordinal,) = _ADJACENCY.unpack_from(
+                self._table, self._adjacency_at + i * _ADJACENCY.size
+            )
+            span = _REL.unpack_from(self._table, self._rels_at + ordinal * _REL.size)
+            relationships.append(pb.Relationship.FromString(self._record(*span)))
+        return relationships
+
+    def get_node(self, key: str) -> pb.Node | None:
+        entry = self._find(key)
+        if entry is None or not entry.length:
+            return None
+        return pb.Node.FromString(
+            self._record(entry.file_no, entry.offset, entry.length)
+        )
+
+    def outgoing(self, key: str) -> list[pb.Relationship]:
+        entry = self._find(key)
+        return (
+            []
+            if entry is None
+            else self._relationships(entry.out_start, entry.out_count)
+        )
+
+    def incoming(self, key: str) -> list[pb.Relationship]:
+        entry = self._find(key)
+        return (
+            [] if entry is None else self._relationships(entry.in_start, entry.in_count)
+        )
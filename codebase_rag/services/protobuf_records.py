@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO
+
+from loguru import logger
+
+from .. import constants as cs
+from .. import exceptions as ex
+from .. import logs as ls
+
+
+def encode_varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_varint(stream: IO[bytes], path: Path, offset: int) -> tuple[int, int] | None:
+    result = 0
+    shift = 0
+    consumed = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            if consumed == 0:
+                return None
+            raise ValueError(
+                ex.PROTOBUF_STREAM_TRUNCATED.format(path=path, offset=offset)
+            )
+        consumed += 1
+        result |= (byte[0] & 0x7F) << shift
+        if not byte[0] & 0x80:
+            return result, consumed
+        shift += 7
+
+
+def write_record(stream: IO[bytes], field_number: int, payload: bytes) -> None:
+    stream.write(encode_varint((field_number << 3) | cs.PROTOBUF_WIRE_TYPE_LEN))
+    stream.write(encode_varint(len(payload)))
+    stream.write(payload)
+
+
+def iter_raw_records(path: Path) -> Iterator[tuple[int, bytes]]:
+    for field_number, _, payload in iter_record_spans(path):
+        yield field_number, payload
+
+
+def iter_record_spans(path: Path) -> Iterator[tuple[int, int, bytes]]:
+    logger.debug(ls.PROTOBUF_READING.format(path=path))
+    offset = 0
+    with open(path, "rb", buffering=cs.PROTOBUF_STREAM_BUFFER_BYTES) as stream:
+        while (tag := _read_varint(stream, path, offset)) is not None:
+            tag_value, tag_size = tag
+            if tag_value & 0x7 != cs.PROTOBUF_WIRE_TYPE_LEN:
+                raise ValueError(
+                    ex.PROTOBUF_STREAM_UNKNOWN_TAG.format(
+                        tag=tag_value, path=path, offset=offset
+                    )
+                )
+            length = _read_varint(stream, path, offset + tag_size)
+            if length is None:
+                raise ValueError(
+                    ex.PROTOBUF_STREAM_TRUNCATED.format(path=path, offset=offset)
+                )
+            size, length_size = length
+            payload = stream.read(size)
+            if len(payload) != size:
+                raise ValueError(
+                    ex.PROTOBUF_STREAM_TRUNCATED.format(path=path, offset=offset)
+                )
+            yield tag_value >> 3, offset + tag_size + length_size, payload
+            offset += tag_size + length_size + size
+
+
+class RecordFile:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._stream: IO[bytes] | None = None
+        self._started = False
+
+    @property
+    def stream(self) -> IO[bytes]:
+        if self._stream is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if not self._started:
+                logger.info(ls.PROTOBUF_STREAMING.format(path=self.path))
+            self._stream = open(
+                self.path,
+                "ab" if self._started else "wb",
+                buffering=cs.PROTOBUF_STREAM_BUFFER_BYTES,
+            )
+            self._started = True
+        return self._stream
+
+    def touch(self) -> None:
+        self.stream
+
+    def write(self, field_number: int, payload: bytes) -> None:
+        write_record(self.stream, field_number, payload)
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+def key_digest(key: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(
+            key.encode(), digest_size=cs.PROTOBUF_SEEN_DIGEST_BYTES
+        ).digest()
+    )
+
+
+class SeenIdFilter:
+    def __init__(self) -> None:
+        self._digests: set[int] = set()
+
+    def __contains__(self, key: str) -> bool:
+        return key_digest(key) in self._digests
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def add(self, key: str) -> bool:
+        digest = key_digest(key)
+        if digest in self._digests:
+            return False
+        self._digests.add(digest)
+        return True
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
+from typing import IO
 
+from google.protobuf.message import Message
 from loguru import logger
 
 import codec.schema_pb2 as pb
@@ -9,6 +14,8 @@ import codec.schema_pb2 as pb
 from .. import constants as cs
 from .. import logs as ls
 from ..types_defs import PropertyDict, PropertyValue
+from .protobuf_index_v2 import IndexV2Writer
+from .protobuf_records import RecordFile, SeenIdFilter, iter_raw_records, write_record
 
 LABEL_TO_ONEOF_FIELD: dict[cs.NodeLabel, str] = {
     cs.NodeLabel.PROJECT: cs.ONEOF_PROJECT,
@@ -31,55 +38,164 @@ ONEOF_FIELD_TO_LABEL: dict[str, cs.NodeLabel] = {
 PATH_BASED_LABELS = frozenset({cs.NodeLabel.FOLDER, cs.NodeLabel.FILE})
 NAME_BASED_LABELS = frozenset({cs.NodeLabel.EXTERNAL_PACKAGE, cs.NodeLabel.PROJECT})
 
+IndexRecord = pb.Node | pb.Relationship
+
+
+@dataclass(frozen=True, slots=True)
+class _PayloadSpec:
+    message_class: type[Message]
+    oneof_field: str
+    fields: frozenset[str]
+
+
+@cache
+def _payload_spec(label: cs.NodeLabel) -> _PayloadSpec | None:
+    message_class = getattr(pb, label, None)
+    if not message_class:
+        logger.warning(ls.PROTOBUF_NO_MESSAGE_CLASS.format(label=label))
+        return None
+    oneof_field = LABEL_TO_ONEOF_FIELD.get(label)
+    if not oneof_field:
+        logger.warning(ls.PROTOBUF_NO_ONEOF_MAPPING.format(label=label))
+        return None
+    return _PayloadSpec(
+        message_class=message_class,
+        oneof_field=oneof_field,
+        fields=frozenset(message_class.DESCRIPTOR.fields_by_name),
+    )
+
+
+def payload_fields(label: cs.NodeLabel) -> frozenset[str]:
+    spec = _payload_spec(label)
+    return spec.fields if spec else frozenset()
+
+
+def primary_key_for(label: cs.NodeLabel) -> str:
+    if label in PATH_BASED_LABELS:
+        return cs.KEY_PATH
+    if label in NAME_BASED_LABELS:
+        return cs.KEY_NAME
+    return cs.KEY_QUALIFIED_NAME
+
+
+def index_node_key(node: pb.Node) -> tuple[cs.NodeLabel, str] | None:
+    oneof_field = node.WhichOneof(cs.PROTOBUF_NODE_ONEOF)
+    label = ONEOF_FIELD_TO_LABEL.get(oneof_field) if oneof_field else None
+    if label is None:
+        return None
+    key = getattr(getattr(node, oneof_field), primary_key_for(label), "")
+    return (label, key) if key else None
+
+
+def write_index_record(stream: IO[bytes], record: IndexRecord) -> None:
+    write_record(
+        stream,
+        cs.PROTOBUF_FIELD_NODES
+        if isinstance(record, pb.Node)
+        else cs.PROTOBUF_FIELD_RELATIONSHIPS,
+        record.SerializeToString(),
+    )
+
+
+def iter_index_records(path: Path) -> Iterator[IndexRecord]:
+    for field_number, payload in iter_raw_records(path):
+        if field_number == cs.PROTOBUF_FIELD_NODES:
+            yield pb.Node.FromString(payload)
+        elif field_number == cs.PROTOBUF_FIELD_RELATIONSHIPS:
+            yield pb.Relationship.FromString(payload)
+
+
+def index_files(output_dir: Path) -> list[Path]:
+    joint = output_dir / cs.PROTOBUF_INDEX_FILE
+    if joint.exists():
+        return [joint]
+    return [
+        path
+        for path in (
+            output_dir / cs.PROTOBUF_NODES_FILE,
+            output_dir / cs.PROTOBUF_RELS_FILE,
+        )
+        if path.exists()
+    ]
+
+
+def iter_graph_index(output_dir: Path) -> Iterator[IndexRecord]:
+    for path in index_files(output_dir):
+        yield from iter_index_records(path)
+
 
 class ProtobufFileIngestor:
-    def __init__(self, output_path: str, split_index: bool = False):
+    def __init__(
+        self,
+        output_path: str,
+        split_index: bool = False,
+        *,
+        streaming: bool = False,
+        schema_version: cs.ProtobufSchemaVersion = cs.ProtobufSchemaVersion.V1,
+    ):
         self.output_dir = Path(output_path)
         self._nodes: dict[str, pb.Node] = {}
         self._relationships: dict[tuple[str, int, str], pb.Relationship] = {}
         self.split_index = split_index
+        self.streaming = streaming
+        self._seen_nodes = SeenIdFilter()
+        self._seen_relationships = SeenIdFilter()
+        self._files: dict[Path, RecordFile] = {}
+        self._v2 = (
+            IndexV2Writer(self.output_dir, split_index)
+            if schema_version == cs.ProtobufSchemaVersion.V2
+            else None
+        )
         logger.info(ls.PROTOBUF_INIT.format(path=self.output_dir))
 
+    def _stream(self, field_number: int) -> IO[bytes]:
+        if not self.split_index:
+            path = self.output_dir / cs.PROTOBUF_INDEX_FILE
+        elif field_number == cs.PROTOBUF_FIELD_NODES:
+            path = self.output_dir / cs.PROTOBUF_NODES_FILE
+        else:
+            path = self.output_dir / cs.PROTOBUF_RELS_FILE
+        if path not in self._files:
+            self._files[path] = RecordFile(path)
+        return self._files[path].stream
+
+    def _has_node(self, node_id: str) -> bool:
+        return node_id in (self._seen_nodes if self.streaming else self._nodes)
+
     def _get_node_id(self, label: cs.NodeLabel, properties: PropertyDict) -> str:
-        if label in PATH_BASED_LABELS:
-            return str(properties.get(cs.KEY_PATH, ""))
-        if label in NAME_BASED_LABELS:
-            return str(properties.get(cs.KEY_NAME, ""))
-        return str(properties.get(cs.KEY_QUALIFIED_NAME, ""))
+        return str(properties.get(primary_key_for(label), ""))
 
     def ensure_node_batch(self, label: str, properties: PropertyDict) -> None:
         node_label = cs.NodeLabel(label)
         node_id = self._get_node_id(node_label, properties)
-        if not node_id or node_id in self._nodes:
+        if not node_id:
             return
-
-        payload_message_class = getattr(pb, label, None)
-        if not payload_message_class:
-            logger.warning(ls.PROTOBUF_NO_MESSAGE_CLASS.format(label=label))
+        if self._v2 is not None:
+            self._v2.add_node(
+                node_label, primary_key_for(node_label), node_id, properties
+            )
+            return
+        if self._has_node(node_id):
             return
 
-        payload_message = payload_message_class()
-
-        for key, value in properties.items():
-            if hasattr(payload_message, key):
-                if value is None:
-                    continue
-                destination_attribute = getattr(payload_message, key)
-                if hasattr(destination_attribute, "extend") and isinstance(value, list):
-                    destination_attribute.extend(value)
-                else:
-                    setattr(payload_message, key, value)
-
-        node = pb.Node()
-
-        payload_field_name = LABEL_TO_ONEOF_FIELD.get(node_label)
-        if not payload_field_name:
-            logger.warning(ls.PROTOBUF_NO_ONEOF_MAPPING.format(label=label))
+        spec = _payload_spec(node_label)
+        if spec is None:
             return
 
-        getattr(node, payload_field_name).CopyFrom(payload_message)
+        payload_message = spec.message_class(
+            **{
+                key: value
+                for key, value in properties.items()
+                if key in spec.fields and value is not None
+            }
+        )
+        node = pb.Node(**{spec.oneof_field: payload_message})
 
-        self._nodes[node_id] = node
+        if self.streaming:
+            self._seen_nodes.add(node_id)
+            write_index_record(self._stream(cs.PROTOBUF_FIELD_NODES), node)
+        else:
+            self._nodes[node_id] = node
 
     def ensure_relationship_batch(
         self,
@@ -114,11 +230,23 @@ class ProtobufFileIngestor:
             )
             return
 
+        if self._v2 is not None:
+            self._v2.add_relationship(from_spec, rel.type, to_spec, properties)
+            return
+
         if properties:
             rel.properties.update(properties)
 
         unique_key = (rel.source_id, rel.type, rel.target_id)
-        if unique_key in self._relationships:
+        if self.streaming:
+            first_seen = self._seen_relationships.add(
+                cs.PROTOBUF_KEY_SEPARATOR.join(
+                    (rel.source_id, str(rel.type), rel.target_id)
+                )
+            )
+            if first_seen or properties:
+                write_index_record(self._stream(cs.PROTOBUF_FIELD_RELATIONSHIPS), rel)
+        elif unique_key in self._relationships:
             if properties:
                 existing_rel = self._relationships[unique_key]
                 existing_rel.properties.update(properties)
@@ -171,7 +299,38 @@ class ProtobufFileIngestor:
             )
         )
 
+    def _flush_streams(self) -> None:
+        for field_number in (
+            cs.PROTOBUF_FIELD_NODES,
+            cs.PROTOBUF_FIELD_RELATIONSHIPS,
+        ):
+            self._stream(field_number)
+        for record_file in self._files.values():
+            record_file.close()
+
+        logger.success(
+            ls.PROTOBUF_FLUSH_SUCCESS.format(
+                nodes=len(self._seen_nodes),
+                rels=len(self._seen_relationships),
+                path=self.output_dir,
+            )
+        )
+
+    def _flush_v2(self, writer: IndexV2Writer) -> None:
+        writer.close()
+        logger.success(
+            ls.PROTOBUF_FLUSH_SUCCESS.format(
+                nodes=writer.node_count,
+                rels=writer.relationship_count,
+                path=self.output_dir,
+            )
+        )
+
     def flush_all(self) -> None:
         logger.info(ls.PROTOBUF_FLUSHING.format(path=self.output_dir))
 
+        if self._v2 is not None:
+            return self._flush_v2(self._v2)
+        if self.streaming:
+            return self._flush_streams()
         return self._flush_split() if self.split_index else self._flush_joint()
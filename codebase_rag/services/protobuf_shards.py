@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+import codec.schema_pb2 as pb
+
+from .. import constants as cs
+from .. import exceptions as ex
+from .. import logs as ls
+from .protobuf_records import (
+    RecordFile,
+    SeenIdFilter,
+    iter_raw_records,
+    write_record,
+)
+from .protobuf_service import ProtobufFileIngestor, index_files, index_node_key
+
+CALL_TARGET_LABELS = frozenset(
+    {cs.NodeLabel.FUNCTION, cs.NodeLabel.METHOD, cs.NodeLabel.CLASS}
+)
+
+
+class ShardIngestor(ProtobufFileIngestor):
+    def __init__(self, output_path: str, split_index: bool = False) -> None:
+        super().__init__(output_path, split_index, streaming=True)
+        self._seen_calls = SeenIdFilter()
+        self.unresolved_calls = 0
+
+    def record_unresolved_call(
+        self,
+        caller_spec: tuple[str, str, str],
+        call_name: str,
+        candidates: list[str],
+    ) -> None:
+        caller_label, _, caller_id = caller_spec
+        if not self._seen_calls.add(
+            cs.PROTOBUF_KEY_SEPARATOR.join((caller_id, call_name))
+        ):
+            return
+        call = pb.UnresolvedCall(
+            caller_id=caller_id,
+            caller_label=caller_label,
+            call_name=call_name,
+            candidates=candidates,
+        )
+        write_record(
+            self._stream(cs.PROTOBUF_FIELD_UNRESOLVED_CALLS),
+            cs.PROTOBUF_FIELD_UNRESOLVED_CALLS,
+            call.SerializeToString(),
+        )
+        self.unresolved_calls += 1
+
+
+@dataclass(frozen=True, slots=True)
+class MergeResult:
+    shards: int
+    nodes: int
+    relationships: int
+    resolved_calls: int
+    unresolved_calls: int
+
+
+class _MergeWriter:
+    def __init__(self, output_dir: Path, split_index: bool) -> None:
+        self._nodes_file = RecordFile(
+            output_dir
+            / (cs.PROTOBUF_NODES_FILE if split_index else cs.PROTOBUF_INDEX_FILE)
+        )
+        self._rels_file = (
+            RecordFile(output_dir / cs.PROTOBUF_RELS_FILE)
+            if split_index
+            else self._nodes_file
+        )
+        self._relationships = SeenIdFilter()
+
+    @property
+    def relationship_count(self) -> int:
+        return len(self._relationships)
+
+    def add_node(self, payload: bytes) -> None:
+        self._nodes_file.write(cs.PROTOBUF_FIELD_NODES, payload)
+
+    def add_relationship(self, rel: pb.Relationship, payload: bytes) -> bool:
+        first_seen = self._relationships.add(
+            cs.PROTOBUF_KEY_SEPARATOR.join(
+                (rel.source_id, str(rel.type), rel.target_id)
+            )
+        )
+        if first_seen or rel.HasField(cs.PROTOBUF_REL_PROPERTIES_FIELD):
+            self._rels_file.write(cs.PROTOBUF_FIELD_RELATIONSHIPS, payload)
+        return first_seen
+
+    def close(self) -> None:
+        self._nodes_file.touch()
+        self._rels_file.touch()
+        self._nodes_file.close()
+        self._rels_file.close()
+
+
+def _shard_files(shard_dirs: list[Path]) -> list[Path]:
+    files: list[Path] = []
+    for shard_dir in shard_dirs:
+        if not (found := index_files(shard_dir)):
+            raise FileNotFoundError(ex.PROTOBUF_INDEX_NOT_FOUND.format(path=shard_dir))
+        files.extend(found)
+    return files
+
+
+def _resolve_call(
+    call: pb.UnresolvedCall, call_targets: dict[str, cs.NodeLabel]
+) -> pb.Relationship | None:
+    for candidate in call.candidates:
+        if (label := call_targets.get(candidate)) is not None:
+            return pb.Relationship(
+                type=pb.Relationship.CALLS,
+                source_id=call.caller_id,
+                source_label=call.caller_label,
+                target_id=candidate,
+                target_label=label,
+            )
+    return None
+
+
+def merge_index_shards(
+    shard_dirs: list[Path], output_dir: Path, *, split_index: bool = False
+) -> MergeResult:
+    files = _shard_files(shard_dirs)
+    writer = _MergeWriter(output_dir, split_index)
+    seen_nodes = SeenIdFilter()
+    call_targets: dict[str, cs.NodeLabel] = {}
+    resolved = unresolved = 0
+
+    try:
+        for path in files:
+            for field_number, payload in iter_raw_records(path):
+                if field_number != cs.PROTOBUF_FIELD_NODES:
+                    continue
+                node_key = index_node_key(pb.Node.FromString(payload))
+                if node_key is None or not seen_nodes.add(node_key[1]):
+                    continue
+                label, key = node_key
+                if label in CALL_TARGET_LABELS:
+                    call_targets[key] = label
+                writer.add_node(payload)
+
+        for path in files:
+            for field_number, payload in iter_raw_records(path):
+                if field_number == cs.PROTOBUF_FIELD_RELATIONSHIPS:
+                    writer.add_relationship(
+                        pb.Relationship.FromString(payload), payload
+                    )
+                elif field_number == cs.PROTOBUF_FIELD_UNRESOLVED_CALLS:
+                    call = pb.UnresolvedCall.FromString(payload)
+                    rel = _resolve_call(call, call_targets)
+                    if rel is None:
+                        unresolved += 1
+                        continue
+                    if writer.add_relationship(rel, rel.SerializeToString()):
+                        resolved += 1
+    finally:
+        writer.close()
+
+    result = MergeResult(
+        shards=len(shard_dirs),
+        nodes=len(seen_nodes),
+        relationships=writer.relationship_count,
+        resolved_calls=resolved,
+        unresolved_calls=unresolved,
+    )
+    logger.success(
+        ls.PROTOBUF_MERGE_DONE.format(
+            shards=result.shards,
+            nodes=result.nodes,
+            rels=result.relationships,
+            resolved=result.resolved_calls,
+            unresolved=result.unresolved_calls,
+            path=output_dir,
+        )
+    )
+    return result
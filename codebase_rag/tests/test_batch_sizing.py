@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from codebase_rag.services.batch_sizing import AdaptiveBatchSizer
+from codebase_rag.services.graph_service import MemgraphIngestor
+
+
+def _sizer(**overrides: float) -> AdaptiveBatchSizer:
+    params = {"initial": 100, "minimum": 10, "maximum": 1000, "target_seconds": 1.0}
+    params.update(overrides)
+    return AdaptiveBatchSizer(**params)  # ty: ignore[invalid-argument-type]
+
+
+class TestAdaptiveBatchSizer:
+    def test_rejects_invalid_bounds(self) -> None:
+        with pytest.raises(ValueError, match="minimum"):
+            _sizer(minimum=0)
+        with pytest.raises(ValueError, match="maximum"):
+            _sizer(minimum=50, maximum=10)
+
+    def test_initial_size_is_clamped(self) -> None:
+        assert _sizer(initial=5000).size_for("Function") == 1000
+
+    def test_fast_batches_grow_at_most_twofold(self) -> None:
+        sizer = _sizer()
+
+        assert sizer.record("Function", 100, 0.001) == 200
+        assert sizer.record("Function", 200, 0.002) == 400
+
+    def test_slow_batches_shrink_towards_target(self) -> None:
+        sizer = _sizer()
+
+        assert sizer.record("Function-CALLS->Function", 100, 4.0) == 25
+
+    def test_sizes_are_tracked_per_pattern_and_bounded(self) -> None:
+        sizer = _sizer()
+
+        sizer.record("slow", 100, 1000.0)
+        sizer.record("fast", 100, 0.0)
+
+        assert sizer.sizes() == {"fast": 200, "slow": 10}
+
+    def test_largest_tracks_the_biggest_pattern_size(self) -> None:
+        sizer = _sizer()
+
+        assert sizer.largest() == 100
+        sizer.record("fast", 100, 0.0)
+        sizer.record("slow", 100, 1000.0)
+
+        assert sizer.largest() == 200
+
+    def test_shrink_halves_failed_batch(self) -> None:
+        sizer = _sizer()
+
+        assert sizer.shrink("Module", 60) == 30
+        assert sizer.shrink("Module", 12) == 10
+
+
+class TestIngestorSplitRetry:
+    def test_chunks_rows_by_pattern_size(self) -> None:
+        sizer = _sizer(initial=10, minimum=1)
+        ingestor = MemgraphIngestor("localhost", 7687, batch_sizer=sizer)
+        rows = [{"id": i} for i in range(25)]
+
+        with patch.object(
+            ingestor, "_execute_batch_with_return", return_value=[]
+        ) as execute:
+            ingestor._execute_rows("Function", "MERGE", rows)
+
+        assert [len(c.args[1]) for c in execute.call_args_list] == [10, 15]
+
+    def test_failed_batch_is_split_and_retried(self) -> None:
+        sizer = _sizer(initial=8, minimum=1)
+        ingestor = MemgraphIngestor("localhost", 7687, batch_sizer=sizer)
+        rows = [{"id": i} for i in range(8)]
+        sent: list[int] = []
+
+        def execute(query: str, batch: list[dict[str, int]]) -> list[dict[str, int]]:
+            sent.append(len(batch))
+            if len(batch) > 2:
+                raise RuntimeError("query timed out")
+            return [{"created": len(batch)}]
+
+        with patch.object(ingestor, "_execute_batch_with_return", side_effect=execute):
+            results = ingestor._execute_rows("Function", "MERGE", rows)
+
+        assert sum(r["created"] for r in results) == 8
+        assert sent == [8, 4, 2, 2, 4, 2, 2]
+
+    def test_single_failing_row_is_raised(self) -> None:
+        sizer = _sizer(initial=4, minimum=1)
+        ingestor = MemgraphIngestor("localhost", 7687, batch_sizer=sizer)
+
+        with (
+            patch.object(
+                ingestor,
+                "_execute_batch_with_return",
+                side_effect=RuntimeError("bad row"),
+            ),
+            pytest.raises(RuntimeError, match="bad row"),
+        ):
+            ingestor._execute_rows("Function", "MERGE", [{"id": 1}, {"id": 2}])
+
+    def test_flush_nodes_uses_adaptive_chunks(self) -> None:
+        sizer = _sizer(initial=2, minimum=1)
+        ingestor = MemgraphIngestor(
+            "localhost", 7687, batch_size=100, batch_sizer=sizer
+        )
+        ingestor.conn = MagicMock()
+        cursor = ingestor.conn.cursor.return_value
+        cursor.description = None
+
+        for i in range(5):
+            ingestor.ensure_node_batch("Module", {"qualified_name": f"m{i}"})
+        ingestor.flush_nodes()
+
+        sent = [len(c.args[1]["batch"]) for c in cursor.execute.call_args_list]
+        assert sent == [2, 3]
+        assert sizer.sizes() == {"Module": 8}
+
+    def test_buffer_flush_threshold_follows_sizer(self) -> None:
+        sizer = _sizer(initial=2, minimum=1)
+        ingestor = MemgraphIngestor("localhost", 7687, batch_size=2, batch_sizer=sizer)
+        sizer.record("Module", 2, 0.0)
+        sizer.record("Module", 4, 0.0)
+
+        with patch.object(ingestor, "_dispatch_nodes") as dispatch:
+            for i in range(7):
+                ingestor.ensure_node_batch("Module", {"qualified_name": f"m{i}"})
+            assert dispatch.call_count == 0
+            ingestor.ensure_node_batch("Module", {"qualified_name": "m7"})
+
+        assert dispatch.call_count == 1
+        assert len(ingestor.node_buffer) == 8
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from codebase_rag.services.bulk_loader import BulkLoadStaging, iter_staged_rows
+from codebase_rag.services.graph_service import MemgraphIngestor
+
+
+class TestBulkLoadStaging:
+    def test_routes_repeated_nodes_to_merge_files(self, tmp_path: Path) -> None:
+        staging = BulkLoadStaging(tmp_path)
+
+        staging.add_node("Function", "qualified_name", {"qualified_name": "a.f"})
+        staging.add_node("Function", "qualified_name", {"qualified_name": "a.g"})
+        staging.add_node(
+            "Function", "qualified_name", {"qualified_name": "a.f", "name": "f"}
+        )
+        staging.close()
+
+        created = staging.node_files[("Function", "qualified_name")]
+        merged = staging.node_merge_files[("Function", "qualified_name")]
+        assert (created.rows, merged.rows) == (2, 1)
+        assert staging.node_count == 2
+        assert list(iter_staged_rows(merged.path, 10)) == [
+            [{"id": "a.f", "props": {"name": "f"}}]
+        ]
+
+    def test_dedups_relationships_per_pattern(self, tmp_path: Path) -> None:
+        staging = BulkLoadStaging(tmp_path)
+        src = ("Function", "qualified_name", "a.f")
+        dst = ("Function", "qualified_name", "a.g")
+
+        staging.add_relationship(src, "CALLS", dst)
+        staging.add_relationship(src, "CALLS", dst)
+        staging.add_relationship(dst, "CALLS", src, {"line": 3})
+        staging.close()
+
+        pattern = ("Function", "qualified_name", "CALLS", "Function", "qualified_name")
+        assert staging.rel_files[pattern].rows == 2
+        assert staging.rel_merge_files[pattern].rows == 1
+        rows = next(iter_staged_rows(staging.rel_files[pattern].path, 10))
+        assert rows[1] == {"from_val": "a.g", "to_val": "a.f", "props": {"line": 3}}
+
+    def test_iter_staged_rows_chunks(self, tmp_path: Path) -> None:
+        staging = BulkLoadStaging(tmp_path)
+        for i in range(5):
+            staging.add_node("Module", "qualified_name", {"qualified_name": f"m{i}"})
+        staging.close()
+
+        path = staging.node_files[("Module", "qualified_name")].path
+        assert [len(c) for c in iter_staged_rows(path, 2)] == [2, 2, 1]
+
+    def test_cleanup_removes_directory(self, tmp_path: Path) -> None:
+        directory = tmp_path / "stage"
+        directory.mkdir()
+        staging = BulkLoadStaging(directory)
+        staging.add_node("Module", "qualified_name", {"qualified_name": "m"})
+
+        staging.cleanup()
+
+        assert not directory.exists()
+
+
+class TestIngestorBulkLoad:
+    @pytest.fixture
+    def ingestor(self) -> MemgraphIngestor:
+        ingestor = MemgraphIngestor(host="localhost", port=7687, batch_size=2)
+        ingestor.conn = MagicMock()
+        return ingestor
+
+    def test_stages_instead_of_flushing(
+        self, ingestor: MemgraphIngestor, tmp_path: Path
+    ) -> None:
+        ingestor.enable_bulk_load(tmp_path)
+
+        with patch.object(ingestor, "_execute_batch") as execute_batch:
+            for i in range(5):
+                ingestor.ensure_node_batch("Function", {"qualified_name": f"f{i}"})
+            ingestor.ensure_node_batch("Unknown", {"x": 1})
+            ingestor.ensure_node_batch("Function", {"name": "missing key"})
+
+        execute_batch.assert_not_called()
+        assert ingestor.node_buffer == []
+        assert ingestor.bulk_load_enabled
+
+    def test_flush_all_creates_nodes_then_indexes_then_relationships(
+        self, ingestor: MemgraphIngestor, tmp_path: Path
+    ) -> None:
+        calls: list[str] = []
+        ingestor.enable_bulk_load(tmp_path, batch_size=10)
+        staging_dir = next(tmp_path.iterdir())
+
+        ingestor.ensure_node_batch("Module", {"qualified_name": "m"})
+        ingestor.ensure_node_batch("Function", {"qualified_name": "m.f"})
+        ingestor.ensure_node_batch("Function", {"qualified_name": "m.f", "x": 1})
+        ingestor.ensure_relationship_batch(
+            ("Module", "qualified_name", "m"),
+            "DEFINES",
+            ("Function", "qualified_name", "m.f"),
+        )
+
+        with (
+            patch.object(
+                ingestor,
+                "_execute_batch",
+                side_effect=lambda q, rows: calls.append(q.split()[0]),
+            ),
+            patch.object(
+                ingestor, "ensure_indexes", side_effect=lambda: calls.append("INDEX")
+            ),
+            patch.object(
+                ingestor,
+                "_execute_batch_with_return",
+                side_effect=lambda q, rows: (
+                    calls.append(q.splitlines()[1].split()[0])
+                    or [{"created": len(rows)}]
+                ),
+            ),
+        ):
+            ingestor.flush_all()
+
+        assert calls == ["CREATE", "CREATE", "MERGE", "INDEX", "CREATE"]
+        assert not ingestor.bulk_load_enabled
+        assert not staging_dir.exists()
+
+    def test_enable_if_empty_checks_graph(
+        self, ingestor: MemgraphIngestor, tmp_path: Path
+    ) -> None:
+        with patch.object(ingestor, "_execute_query", return_value=[{"found": 1}]):
+            assert ingestor.enable_bulk_load_if_empty(tmp_path) is False
+        assert not ingestor.bulk_load_enabled
+
+        with patch.object(ingestor, "_execute_query", return_value=[]):
+            assert ingestor.enable_bulk_load_if_empty(tmp_path) is True
+        assert ingestor.bulk_load_enabled
+
+    def test_enable_if_empty_checks_only_the_target_project(
+        self, ingestor: MemgraphIngestor, tmp_path: Path
+    ) -> None:
+        def other_project_only(query: str, params: dict | None = None) -> list:
+            return [] if params else [{"found": 1}]
+
+        with patch.object(ingestor, "_execute_query", side_effect=other_project_only):
+            assert ingestor.enable_bulk_load_if_empty(tmp_path, project_id="p")
+        ingestor.ensure_node_batch("Function", {"qualified_name": "p.f"})
+
+        queries: list[str] = []
+        with (
+            patch.object(
+                ingestor,
+                "_execute_batch",
+                side_effect=lambda q, rows: queries.append(q.split()[0]),
+            ),
+            patch.object(ingestor, "ensure_indexes"),
+        ):
+            ingestor.flush_all()
+
+        assert queries == ["MERGE"]
@@ -6,6 +6,7 @@ import pytest
 from pydantic_ai import Tool
 from rich.console import Console
 
+from codebase_rag.config import settings
 from codebase_rag.exceptions import LLMGenerationError
 from codebase_rag.tools.codebase_query import create_query_tool
 
@@ -20,7 +21,7 @@ def anyio_backend(request: pytest.FixtureRequest) -> str:
 @pytest.fixture
 def mock_ingestor() -> MagicMock:
     ingestor = MagicMock()
-    ingestor.fetch_all.return_value = [
+    ingestor.fetch_iter.return_value = [
         {"name": "func1", "type": "Function"},
         {"name": "func2", "type": "Method"},
     ]
@@ -94,7 +95,7 @@ class TestQueryCodebaseKnowledgeGraph:
         await tool.function(natural_language_query="Show me all classes")
         mock_cypher_gen.generate.assert_called_once_with("Show me all classes")
 
-    async def test_query_calls_ingestor_fetch_all(
+    async def test_query_calls_ingestor_fetch_iter(
         self,
         mock_ingestor: MagicMock,
         mock_cypher_gen: MagicMock,
@@ -102,7 +103,9 @@ class TestQueryCodebaseKnowledgeGraph:
     ) -> None:
         tool = create_query_tool(mock_ingestor, mock_cypher_gen, console=mock_console)
         await tool.function(natural_language_query="Find functions")
-        mock_ingestor.fetch_all.assert_called_once_with("MATCH (n) RETURN n")
+        mock_ingestor.fetch_iter.assert_called_once_with(
+            "MATCH (n) RETURN n", max_rows=settings.QUERY_MAX_ROWS
+        )
 
     async def test_empty_results_returns_zero_count(
         self,
@@ -110,7 +113,7 @@ class TestQueryCodebaseKnowledgeGraph:
         mock_cypher_gen: MagicMock,
         mock_console: Console,
     ) -> None:
-        mock_ingestor.fetch_all.return_value = []
+        mock_ingestor.fetch_iter.return_value = []
         tool = create_query_tool(mock_ingestor, mock_cypher_gen, console=mock_console)
         result = await tool.function(natural_language_query="Find nonexistent")
         assert result.results == []
@@ -139,7 +142,7 @@ class TestQueryCodebaseKnowledgeGraph:
         mock_cypher_gen: MagicMock,
         mock_console: Console,
     ) -> None:
-        mock_ingestor.fetch_all.side_effect = Exception("Database connection failed")
+        mock_ingestor.fetch_iter.side_effect = Exception("Database connection failed")
         tool = create_query_tool(mock_ingestor, mock_cypher_gen, console=mock_console)
         result = await tool.function(natural_language_query="Find functions")
         assert result.results == []
@@ -166,7 +169,7 @@ class TestQueryResultFormatting:
         mock_cypher_gen: MagicMock,
         mock_console: Console,
     ) -> None:
-        mock_ingestor.fetch_all.return_value = [
+        mock_ingestor.fetch_iter.return_value = [
             {"name": "a"},
             {"name": "b"},
             {"name": "c"},
@@ -183,7 +186,7 @@ class TestQueryWithVariousDataTypes:
         mock_cypher_gen: MagicMock,
         mock_console: Console,
     ) -> None:
-        mock_ingestor.fetch_all.return_value = [
+        mock_ingestor.fetch_iter.return_value = [
             {"name": "func1", "description": None},
         ]
         tool = create_query_tool(mock_ingestor, mock_cypher_gen, console=mock_console)
@@ -196,7 +199,7 @@ class TestQueryWithVariousDataTypes:
         mock_cypher_gen: MagicMock,
         mock_console: Console,
     ) -> None:
-        mock_ingestor.fetch_all.return_value = [
+        mock_ingestor.fetch_iter.return_value = [
             {"name": "func1", "is_async": True},
             {"name": "func2", "is_async": False},
         ]
@@ -210,7 +213,7 @@ class TestQueryWithVariousDataTypes:
         mock_cypher_gen: MagicMock,
         mock_console: Console,
     ) -> None:
-        mock_ingestor.fetch_all.return_value = [
+        mock_ingestor.fetch_iter.return_value = [
             {"name": "func1", "line_count": 42, "complexity": 3.14},
         ]
         tool = create_query_tool(mock_ingestor, mock_cypher_gen, console=mock_console)
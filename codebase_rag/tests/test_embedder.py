@@ -192,3 +192,85 @@ def test_embed_code_raises_without_dependencies() -> None:
 
     with pytest.raises(RuntimeError, match="Semantic search requires"):
         embed_code("x = 1")
+
+
+class TestQueryEmbeddingCache:
+    def test_evicts_least_recently_used(self) -> None:
+        from codebase_rag.embedder import QueryEmbeddingCache
+
+        cache = QueryEmbeddingCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", [1.0])
+        cache.put("b", [2.0])
+        assert cache.get("a") == [1.0]
+
+        cache.put("c", [3.0])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == [1.0]
+        assert cache.get("c") == [3.0]
+        assert len(cache) == 2
+
+    def test_expires_entries_after_ttl(self) -> None:
+        from codebase_rag.embedder import QueryEmbeddingCache
+
+        cache = QueryEmbeddingCache(max_entries=4, ttl_seconds=10)
+        with patch("codebase_rag.embedder.time.monotonic", return_value=100.0):
+            cache.put("q", [0.5])
+        with patch("codebase_rag.embedder.time.monotonic", return_value=105.0):
+            assert cache.get("q") == [0.5]
+        with patch("codebase_rag.embedder.time.monotonic", return_value=111.0):
+            assert cache.get("q") is None
+        assert len(cache) == 0
+
+    def test_zero_size_disables_cache(self) -> None:
+        from codebase_rag.embedder import QueryEmbeddingCache
+
+        cache = QueryEmbeddingCache(max_entries=0, ttl_seconds=10)
+        cache.put("q", [0.5])
+
+        assert cache.get("q") is None
+
+
+def test_embed_query_reuses_cached_embedding() -> None:
+    from codebase_rag.embedder import embed_query, query_embedding_cache
+
+    query_embedding_cache.clear()
+    mock_embed = MagicMock(return_value=[0.25] * 768)
+
+    with patch("codebase_rag.embedder.embed_code", mock_embed):
+        first = embed_query("find the parser")
+        second = embed_query("find the parser")
+
+    assert first == second == [0.25] * 768
+    mock_embed.assert_called_once_with("find the parser")
+    query_embedding_cache.clear()
+
+
+def test_embed_query_cached_vector_cannot_be_mutated_by_callers() -> None:
+    from codebase_rag.embedder import embed_query, query_embedding_cache
+
+    query_embedding_cache.clear()
+    with patch("codebase_rag.embedder.embed_code", return_value=[0.5] * 4):
+        embed_query("q").append(1.0)
+        cached = embed_query("q")
+        cached[0] = 9.0
+
+    assert embed_query("q") == [0.5] * 4
+    query_embedding_cache.clear()
+
+
+@pytest.mark.skipif(not _has_semantic_deps(), reason="torch/transformers not installed")
+def test_warm_up_model_loads_model_in_background(
+    mock_unixcoder: MagicMock, reset_model_cache: None
+) -> None:
+    from codebase_rag.embedder import (
+        get_model,  # ty: ignore[possibly-missing-import]
+        warm_up_model,
+    )
+
+    with patch("codebase_rag.embedder.UniXcoder", return_value=mock_unixcoder):
+        thread = warm_up_model()
+        assert thread is not None
+        thread.join(timeout=5)
+
+        assert get_model() is mock_unixcoder
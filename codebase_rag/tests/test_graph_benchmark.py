@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag.graph_benchmark import benchmark_index_impact, benchmark_storage_modes
+
+
+def test_benchmark_runs_without_then_with_indexes() -> None:
+    ingestor = MagicMock()
+    calls: list[str] = []
+    ingestor.drop_indexes.side_effect = lambda: calls.append("drop")
+    ingestor.ensure_indexes.side_effect = lambda: calls.append("ensure")
+    ingestor.flush_all.side_effect = lambda: calls.append("flush")
+
+    report = benchmark_index_impact(ingestor, num_nodes=120, num_queries=10)
+
+    assert calls == ["drop", "flush", "ensure", "flush"]
+    assert report["num_nodes"] == 123
+    assert report["num_relationships"] == 360
+    assert ingestor.ensure_node_batch.call_count == 2 * 123
+    assert ingestor.ensure_relationship_batch.call_count == 2 * 360
+    assert ingestor.fetch_all.call_count == 20
+    for result in (report["without_indexes"], report["with_indexes"]):
+        assert result["flush_seconds"] >= 0
+        assert result["lookup_p95_ms"] >= result["lookup_p50_ms"]
+
+
+def test_benchmark_restores_indexes_on_failure() -> None:
+    ingestor = MagicMock()
+    ingestor.flush_all.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        benchmark_index_impact(ingestor, num_nodes=5, num_queries=1)
+
+    ingestor.ensure_indexes.assert_called_once()
+
+
+def test_benchmark_clears_scratch_project() -> None:
+    ingestor = MagicMock()
+
+    benchmark_index_impact(ingestor, num_nodes=5, num_queries=2)
+
+    deletes = [
+        c.args[0]
+        for c in ingestor.execute_write.call_args_list
+        if "DETACH DELETE" in c.args[0]
+    ]
+    assert len(deletes) == 8
+    assert all(
+        c.args[1] == {"project_id": "__cgr_index_benchmark__"}
+        for c in ingestor.execute_write.call_args_list
+    )
+
+
+def test_storage_benchmark_restores_original_mode() -> None:
+    ingestor = MagicMock()
+    ingestor.storage_mode.return_value = "IN_MEMORY_TRANSACTIONAL"
+
+    report = benchmark_storage_modes(ingestor, num_nodes=5, num_queries=2)
+
+    assert [c.args[0] for c in ingestor.set_storage_mode.call_args_list] == [
+        "IN_MEMORY_TRANSACTIONAL",
+        "IN_MEMORY_ANALYTICAL",
+        "IN_MEMORY_TRANSACTIONAL",
+    ]
+    assert ingestor.flush_all.call_count == 2
+    assert report["analytical"]["flush_seconds"] >= 0
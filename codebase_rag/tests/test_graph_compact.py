@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from codebase_rag.graph_compact import CompactGraphLoader, load_compact_graph
+from codebase_rag.graph_loader import GraphLoader, load_graph
+from codebase_rag.types_defs import GraphData
+
+
+def _graph() -> GraphData:
+    return {
+        "nodes": [
+            {
+                "node_id": 10,
+                "labels": ["Function"],
+                "properties": {
+                    "name": "foo",
+                    "qualified_name": "mod.foo",
+                    "start_line": 3,
+                    "decorators": ["@cache"],
+                    "is_async": True,
+                },
+            },
+            {
+                "node_id": 2,
+                "labels": ["Function", "Exported"],
+                "properties": {"name": "bar", "qualified_name": "mod.bar"},
+            },
+            {
+                "node_id": 7,
+                "labels": ["Module"],
+                "properties": {"name": "mod", "path": "mod.py", "score": 0.5},
+            },
+            {"node_id": 4, "labels": [], "properties": {"name": "foo"}},
+        ],
+        "relationships": [
+            {"from_id": 7, "to_id": 10, "type": "DEFINES", "properties": {}},
+            {"from_id": 7, "to_id": 2, "type": "DEFINES", "properties": {}},
+            {"from_id": 10, "to_id": 2, "type": "CALLS", "properties": {"line": 10}},
+            {"from_id": 10, "to_id": 99, "type": "CALLS", "properties": {}},
+        ],
+        "metadata": {
+            "total_nodes": 4,
+            "total_relationships": 4,
+            "exported_at": "2025-01-01T00:00:00Z",
+        },
+    }
+
+
+@pytest.fixture
+def graph_file(tmp_path: Path) -> Path:
+    path = tmp_path / "graph.json"
+    path.write_text(json.dumps(_graph()))
+    return path
+
+
+@pytest.fixture(params=["export", "snapshot"])
+def compact(request: pytest.FixtureRequest, graph_file: Path) -> CompactGraphLoader:
+    loader = load_compact_graph(str(graph_file))
+    if request.param == "export":
+        return loader
+    snapshot = graph_file.with_suffix(".cgr")
+    loader.save_snapshot(snapshot)
+    return load_compact_graph(str(snapshot))
+
+
+def test_matches_graph_loader(compact: CompactGraphLoader, graph_file: Path) -> None:
+    reference = load_graph(str(graph_file))
+
+    assert compact.nodes == reference.nodes
+    assert compact.relationships == reference.relationships
+    assert compact.summary() == reference.summary()
+    for label in ("Function", "Exported", "Module", "Missing"):
+        assert compact.find_nodes_by_label(label) == reference.find_nodes_by_label(
+            label
+        )
+    for node_id in (10, 2, 7, 4, 99):
+        assert compact.get_node_by_id(node_id) == reference.get_node_by_id(node_id)
+        assert compact.get_relationships_for_node(
+            node_id
+        ) == reference.get_relationships_for_node(node_id)
+
+
+def test_property_lookup(compact: CompactGraphLoader) -> None:
+    assert [n.node_id for n in compact.find_node_by_property("name", "foo")] == [
+        10,
+        4,
+    ]
+    assert [n.node_id for n in compact.find_node_by_property("score", 0.5)] == [7]
+    assert compact.find_node_by_property("missing", "x") == []
+
+
+def test_snapshot_is_memory_mapped(graph_file: Path, tmp_path: Path) -> None:
+    snapshot = tmp_path / "graph.cgr"
+    load_compact_graph(str(graph_file)).save_snapshot(snapshot)
+
+    loader = CompactGraphLoader(str(snapshot))
+
+    assert isinstance(loader, GraphLoader)
+    assert loader.metadata["exported_at"] == "2025-01-01T00:00:00Z"
+    graph = loader._graph
+    assert graph is not None
+    assert graph.out_indptr.base is not None
+    assert not graph.node_ids.flags.writeable
+
+
+def test_rejects_truncated_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "broken.cgr"
+    path.write_bytes(b"CGRSNAP1")
+
+    with pytest.raises(ValueError):
+        load_compact_graph(str(path))
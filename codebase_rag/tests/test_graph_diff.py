@@ -0,0 +1,165 @@
+from pathlib import Path
+from unittest.mock import MagicMock, call
+
+from codebase_rag import constants as cs
+from codebase_rag.graph_diff import (
+    GraphSnapshot,
+    apply_graph_diff,
+    diff_snapshots,
+    snapshot_from_index,
+    snapshot_from_memgraph,
+)
+from codebase_rag.services.protobuf_service import ProtobufFileIngestor
+
+MODULE = ("Module", "qualified_name", "proj.mod")
+
+
+def _write_index(output_dir: Path, functions: dict[str, int]) -> Path:
+    ingestor = ProtobufFileIngestor(str(output_dir))
+    ingestor.ensure_node_batch(
+        "Module", {"qualified_name": "proj.mod", "name": "mod", "path": "mod.py"}
+    )
+    for name, start_line in functions.items():
+        ingestor.ensure_node_batch(
+            "Function",
+            {
+                "qualified_name": f"proj.mod.{name}",
+                "name": name,
+                "start_line": start_line,
+            },
+        )
+        ingestor.ensure_relationship_batch(
+            MODULE,
+            "DEFINES",
+            ("Function", "qualified_name", f"proj.mod.{name}"),
+        )
+    ingestor.flush_all()
+    return output_dir
+
+
+def test_diff_between_indexes(tmp_path: Path) -> None:
+    old = snapshot_from_index(_write_index(tmp_path / "old", {"a": 1, "b": 5}))
+    new = snapshot_from_index(_write_index(tmp_path / "new", {"a": 3, "c": 9}))
+
+    diff = diff_snapshots(old, new)
+
+    assert diff.added_nodes == [
+        (
+            ("Function", "proj.mod.c"),
+            {"qualified_name": "proj.mod.c", "name": "c", "start_line": 9},
+        )
+    ]
+    assert diff.updated_nodes == [(("Function", "proj.mod.a"), {"start_line": 3})]
+    assert diff.removed_nodes == [("Function", "proj.mod.b")]
+    assert [key for key, _ in diff.added_relationships] == [
+        (("Module", "proj.mod"), "DEFINES", ("Function", "proj.mod.c"))
+    ]
+    assert diff.updated_relationships == []
+    assert diff.removed_relationships == [
+        (("Module", "proj.mod"), "DEFINES", ("Function", "proj.mod.b"))
+    ]
+    assert diff_snapshots(new, new).is_empty
+
+
+def test_diff_detects_changes_to_falsy_values(tmp_path: Path) -> None:
+    old = snapshot_from_index(_write_index(tmp_path, {"a": 1}))
+    new = snapshot_from_index(_write_index(tmp_path, {"a": 1}))
+    new.nodes[("Function", "proj.mod.a")]["start_line"] = 0
+    new.nodes[("Function", "proj.mod.a")]["is_exported"] = False
+
+    diff = diff_snapshots(old, new)
+
+    assert diff.updated_nodes == [
+        (("Function", "proj.mod.a"), {"start_line": 0, "is_exported": False})
+    ]
+
+
+def test_v2_snapshot_skips_placeholder_endpoints(tmp_path: Path) -> None:
+    ingestor = ProtobufFileIngestor(
+        str(tmp_path), schema_version=cs.ProtobufSchemaVersion.V2
+    )
+    ingestor.ensure_node_batch(
+        "Module", {"qualified_name": "proj.mod", "name": "mod", "path": "mod.py"}
+    )
+    ingestor.ensure_relationship_batch(
+        MODULE, "DEFINES", ("Function", "qualified_name", "proj.mod.a")
+    )
+    ingestor.flush_all()
+
+    snapshot = snapshot_from_index(tmp_path)
+    diff = diff_snapshots(GraphSnapshot(), snapshot)
+    writer = MagicMock()
+    apply_graph_diff(writer, diff, "proj")
+
+    assert list(snapshot.nodes) == [("Module", "proj.mod")]
+    assert [c.args[0] for c in writer.ensure_node_batch.call_args_list] == ["Module"]
+    writer.ensure_relationship_batch.assert_called_once()
+
+
+def test_live_snapshot_matches_index(tmp_path: Path) -> None:
+    index = snapshot_from_index(_write_index(tmp_path, {"a": 1}))
+    ingestor = MagicMock()
+    ingestor.fetch_iter.side_effect = [
+        iter(
+            [
+                {
+                    "node_id": 0,
+                    "labels": ["Module"],
+                    "properties": {
+                        "qualified_name": "proj.mod",
+                        "name": "mod",
+                        "path": "mod.py",
+                        "project_id": "proj",
+                        "generation": "g1",
+                    },
+                },
+                {
+                    "node_id": 1,
+                    "labels": ["Function"],
+                    "properties": {
+                        "qualified_name": "proj.mod.a",
+                        "name": "a",
+                        "start_line": 1,
+                        "decorators": [],
+                    },
+                },
+                {"node_id": 2, "labels": ["Enum"], "properties": {}},
+            ]
+        ),
+        iter(
+            [
+                {"from_id": 0, "to_id": 1, "type": "DEFINES", "properties": {}},
+                {"from_id": 1, "to_id": 2, "type": "CALLS", "properties": {}},
+            ]
+        ),
+    ]
+
+    live = snapshot_from_memgraph(ingestor)
+
+    assert diff_snapshots(live, index).is_empty
+
+
+def test_apply_deletes_before_writes(tmp_path: Path) -> None:
+    old = snapshot_from_index(_write_index(tmp_path / "old", {"a": 1, "b": 5}))
+    new = snapshot_from_index(_write_index(tmp_path / "new", {"a": 3}))
+    new.relationships[
+        (("Function", "proj.mod.a"), "CALLS", ("Function", "proj.mod.a"))
+    ] = {}
+    del new.relationships[
+        (("Module", "proj.mod"), "DEFINES", ("Function", "proj.mod.a"))
+    ]
+    ingestor = MagicMock()
+
+    apply_graph_diff(ingestor, diff_snapshots(old, new), "proj")
+
+    function_a = ("Function", "qualified_name", "proj.mod.a")
+    assert ingestor.mock_calls == [
+        call.delete_relationships([(MODULE, "DEFINES", function_a)]),
+        call.delete_nodes([("Function", "proj.mod.b")]),
+        call.ensure_node_batch(
+            "Function",
+            {"start_line": 3, "qualified_name": "proj.mod.a", "project_id": "proj"},
+        ),
+        call.ensure_relationship_batch(function_a, "CALLS", function_a, None),
+        call.flush_all(),
+    ]
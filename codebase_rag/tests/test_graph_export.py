@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag import constants as cs
+from codebase_rag.graph_columnar import read_columnar_graph, write_columnar_graph
+from codebase_rag.graph_export import (
+    infer_export_compression,
+    infer_export_format,
+    stream_graph_export,
+)
+from codebase_rag.graph_loader import GraphLoader
+
+NODES = [
+    {"node_id": 0, "labels": ["Project"], "properties": {"name": "p"}},
+    {"node_id": 1, "labels": ["Module"], "properties": {"qualified_name": "p.m"}},
+    {"node_id": 2, "labels": ["Function"], "properties": {"qualified_name": "p.m.f"}},
+]
+RELATIONSHIPS = [
+    {"from_id": 0, "to_id": 1, "type": "CONTAINS_MODULE", "properties": {}},
+    {"from_id": 1, "to_id": 2, "type": "DEFINES", "properties": {}},
+]
+
+
+def _rows(query: str, params: dict, **kwargs: object) -> list[dict]:
+    return NODES if "labels(n)" in query else RELATIONSHIPS
+
+
+@pytest.fixture
+def ingestor() -> MagicMock:
+    ingestor = MagicMock()
+    ingestor.fetch_iter.side_effect = lambda q, p, **kw: iter(_rows(q, p, **kw))
+    return ingestor
+
+
+class TestStreamGraphExport:
+    def test_json_export_is_loadable(self, ingestor: MagicMock, tmp_path: Path) -> None:
+        output = tmp_path / "graph.json"
+
+        metadata = stream_graph_export(ingestor, output, page_size=2)
+
+        data = json.loads(output.read_text())
+        assert data["nodes"] == NODES
+        assert data["relationships"] == RELATIONSHIPS
+        assert metadata["total_nodes"] == 3
+        assert data["metadata"]["total_relationships"] == 2
+        assert ingestor.fetch_iter.call_count == 2
+        for call in ingestor.fetch_iter.call_args_list:
+            assert call.kwargs == {"chunk_size": 2}
+
+        loader = GraphLoader(str(output))
+        loader.load()
+        assert len(loader.find_nodes_by_label("Function")) == 1
+
+    def test_jsonl_lines_carry_kind(self, ingestor: MagicMock, tmp_path: Path) -> None:
+        output = tmp_path / "graph.jsonl"
+
+        stream_graph_export(ingestor, output, page_size=10)
+
+        kinds = [json.loads(line)["kind"] for line in output.read_text().splitlines()]
+        assert kinds == ["node"] * 3 + ["relationship"] * 2 + ["metadata"]
+
+    def test_gzip_round_trip(self, ingestor: MagicMock, tmp_path: Path) -> None:
+        output = tmp_path / "graph.json.gz"
+
+        stream_graph_export(ingestor, output)
+
+        with gzip.open(output, "rt", encoding="utf-8") as f:
+            assert json.load(f)["metadata"]["total_nodes"] == 3
+
+    def test_project_filter_is_passed_to_queries(
+        self, ingestor: MagicMock, tmp_path: Path
+    ) -> None:
+        stream_graph_export(ingestor, tmp_path / "graph.json", project_id="p")
+
+        for call in ingestor.fetch_iter.call_args_list:
+            query, params = call.args
+            assert "$project_id" in query
+            assert params["project_id"] == "p"
+
+    def test_empty_graph(self, ingestor: MagicMock, tmp_path: Path) -> None:
+        ingestor.fetch_iter.side_effect = lambda q, p, **kw: iter([])
+        output = tmp_path / "graph.json"
+
+        metadata = stream_graph_export(ingestor, output)
+
+        assert metadata["total_nodes"] == 0
+        assert json.loads(output.read_text())["nodes"] == []
+        ingestor.fetch_all.assert_not_called()
+
+
+@pytest.mark.parametrize("fmt", [cs.ExportFormat.PARQUET, cs.ExportFormat.ARROW])
+class TestColumnarExport:
+    def test_round_trips_through_graph_loader(
+        self, ingestor: MagicMock, tmp_path: Path, fmt: cs.ExportFormat
+    ) -> None:
+        pytest.importorskip("pyarrow")
+        output = tmp_path / "graph"
+
+        metadata = stream_graph_export(ingestor, output, fmt=fmt)
+
+        assert metadata["total_nodes"] == 3
+        assert (output / "nodes" / f"Function.{fmt}").is_file()
+        assert (output / "relationships" / f"DEFINES.{fmt}").is_file()
+        loader = GraphLoader(str(output))
+        loader.load()
+        assert sorted(n.node_id for n in loader.nodes) == [0, 1, 2]
+        assert loader.find_node_by_property("qualified_name", "p.m.f")[0].labels == [
+            "Function"
+        ]
+        assert [r.type for r in loader.get_outgoing_relationships(1)] == ["DEFINES"]
+        assert loader.metadata["total_relationships"] == 2
+
+    def test_typed_columns_with_extra_fallback(
+        self, tmp_path: Path, fmt: cs.ExportFormat
+    ) -> None:
+        pytest.importorskip("pyarrow")
+        nodes = [
+            {
+                "node_id": i,
+                "labels": ["Function"],
+                "properties": {"qualified_name": f"m.f{i}", "start_line": i},
+            }
+            for i in range(3)
+        ] + [
+            {
+                "node_id": 3,
+                "labels": ["Function"],
+                "properties": {"qualified_name": "m.g", "start_line": "?"},
+            }
+        ]
+
+        write_columnar_graph(
+            tmp_path, nodes, [], fmt=fmt, exported_at="now", row_group_size=2
+        )
+
+        data = read_columnar_graph(tmp_path)
+        assert [n["properties"]["start_line"] for n in data["nodes"]] == [
+            0,
+            1,
+            2,
+            "?",
+        ]
+
+
+@pytest.mark.parametrize(
+    ("name", "fmt", "compression"),
+    [
+        ("graph.json", cs.ExportFormat.JSON, cs.ExportCompression.NONE),
+        ("graph.jsonl", cs.ExportFormat.JSONL, cs.ExportCompression.NONE),
+        ("graph.jsonl.gz", cs.ExportFormat.JSONL, cs.ExportCompression.GZIP),
+        ("graph.json.zst", cs.ExportFormat.JSON, cs.ExportCompression.ZSTD),
+        ("graph.parquet", cs.ExportFormat.PARQUET, cs.ExportCompression.NONE),
+    ],
+)
+def test_infers_format_and_compression_from_suffix(
+    name: str, fmt: cs.ExportFormat, compression: cs.ExportCompression
+) -> None:
+    assert infer_export_format(Path(name)) == fmt
+    assert infer_export_compression(Path(name)) == compression
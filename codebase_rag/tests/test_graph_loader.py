@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gzip
+import io
 import json
 from collections.abc import Generator
 from pathlib import Path
@@ -8,6 +10,7 @@ from tempfile import NamedTemporaryFile
 import pytest
 
 from codebase_rag.graph_loader import GraphLoader, load_graph
+from codebase_rag.graph_stream import _JsonReader, iter_graph_records
 from codebase_rag.types_defs import GraphData
 
 
@@ -81,9 +84,9 @@ class TestGraphLoaderLoad:
 
     def test_lazy_loading(self, graph_file: str) -> None:
         loader = GraphLoader(graph_file)
-        assert loader._data is None
+        assert loader._nodes is None
         _ = loader.nodes
-        assert loader._data is not None
+        assert loader._nodes is not None
 
 
 class TestGraphLoaderNodeLookup:
@@ -191,5 +194,81 @@ class TestGraphLoaderSummary:
 class TestLoadGraphFunction:
     def test_load_graph_returns_loaded_loader(self, graph_file: str) -> None:
         loader = load_graph(graph_file)
-        assert loader._data is not None
+        assert loader._nodes is not None
         assert len(loader.nodes) == 4
+
+
+class TestGraphLoaderStreaming:
+    def test_lazy_properties_decode_on_access(self, graph_file: str) -> None:
+        loader = load_graph(graph_file, lazy_properties=True)
+
+        node = loader.get_node_by_id(1)
+        assert node is not None
+        assert node.properties == {"name": "foo", "qualified_name": "mod.foo"}
+        assert [n.node_id for n in loader.find_node_by_property("name", "bar")] == [2]
+
+    def test_jsonl_and_gzip_exports(self, tmp_path: Path) -> None:
+        data = create_test_graph()
+        path = tmp_path / "graph.jsonl.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            for kind, rows in (
+                ("node", data["nodes"]),
+                ("relationship", data["relationships"]),
+                ("metadata", [data["metadata"]]),
+            ):
+                for row in rows:
+                    f.write(json.dumps({"kind": kind} | dict(row)) + "\n")
+
+        loader = load_graph(str(path))
+
+        assert loader.summary()["relationship_types"] == {"DEFINES": 3, "CALLS": 1}
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64])
+    def test_stream_handles_chunk_boundaries(
+        self, graph_file: str, chunk_size: int
+    ) -> None:
+        records = list(iter_graph_records(Path(graph_file), chunk_size=chunk_size))
+
+        assert [kind for kind, _ in records].count("node") == 4
+        assert records[3] == ("node", create_test_graph()["nodes"][3])
+        assert records[-1] == ("metadata", create_test_graph()["metadata"])
+
+    def test_malformed_export_raises(self, tmp_path: Path) -> None:
+        path = tmp_path / "graph.json"
+        path.write_text('{"nodes": [] "relationships": []}')
+
+        with pytest.raises(ValueError):
+            load_graph(str(path))
+
+    def test_decode_error_is_raised_without_buffering_the_rest(self) -> None:
+        f = io.StringIO('{"nodes": [{"node_id": 1, oops}, ' + " " * 4096 + "]}")
+        reader = _JsonReader(f, Path("graph.json"), chunk_size=16, max_value_chars=64)
+        reader.expect("{")
+        reader.value()
+        reader.expect(":")
+        reader.expect("[")
+
+        with pytest.raises(json.JSONDecodeError):
+            reader.value()
+        assert f.tell() < 256
+
+    def test_failed_load_leaves_no_partial_graph(self, tmp_path: Path) -> None:
+        data = create_test_graph()
+        path = tmp_path / "graph.json"
+        path.write_text(json.dumps({"nodes": data["nodes"]})[:-1] + ", oops}")
+        loader = GraphLoader(str(path))
+
+        with pytest.raises(ValueError):
+            loader.load()
+
+        assert loader._nodes is None
+        assert loader._nodes_by_id == {}
+        with pytest.raises(ValueError):
+            _ = loader.nodes
+
+    def test_lazy_properties_are_decoded_once(self, graph_file: str) -> None:
+        loader = load_graph(graph_file, lazy_properties=True)
+        node = loader.get_node_by_id(1)
+        assert node is not None
+
+        assert node.properties is node.properties
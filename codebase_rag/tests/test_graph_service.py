@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from codebase_rag.constants import NODE_UNIQUE_CONSTRAINTS
+from codebase_rag.constants import NODE_PROPERTY_INDEXES, NODE_UNIQUE_CONSTRAINTS
 from codebase_rag.cypher_queries import wrap_with_unwind
 from codebase_rag.services.graph_service import MemgraphIngestor
 
@@ -288,6 +289,124 @@ class TestEnsureConstraints:
         assert call_count == len(NODE_UNIQUE_CONSTRAINTS)
 
 
+class TestEnsureIndexes:
+    def test_covers_unique_keys_and_project_id(self) -> None:
+        for label, prop in NODE_UNIQUE_CONSTRAINTS.items():
+            assert (label, prop) in NODE_PROPERTY_INDEXES
+            assert (label, "project_id") in NODE_PROPERTY_INDEXES
+        assert len(set(NODE_PROPERTY_INDEXES)) == len(NODE_PROPERTY_INDEXES)
+
+    def test_creates_only_missing_indexes(self) -> None:
+        ingestor = MemgraphIngestor(host="localhost", port=7687)
+        executed_queries: list[str] = []
+
+        def capture_query(query: str) -> list[dict[str, object]]:
+            executed_queries.append(query)
+            if query == "SHOW INDEX INFO;":
+                return [
+                    {
+                        "index type": "label+property",
+                        "label": "Function",
+                        "property": "qualified_name",
+                    },
+                    {
+                        "index type": "label+property",
+                        "label": "Module",
+                        "property": ["project_id"],
+                    },
+                    {"index type": "label", "label": "File", "property": None},
+                ]
+            return []
+
+        with patch.object(ingestor, "_execute_query", side_effect=capture_query):
+            created = ingestor.ensure_indexes()
+
+        assert created == len(NODE_PROPERTY_INDEXES) - 2
+        assert "CREATE INDEX ON :Function(qualified_name);" not in executed_queries
+        assert "CREATE INDEX ON :Module(project_id);" not in executed_queries
+        assert "CREATE INDEX ON :Function(project_id);" in executed_queries
+        assert "CREATE INDEX ON :File(path);" in executed_queries
+
+    def test_tolerates_index_info_and_create_failures(self) -> None:
+        ingestor = MemgraphIngestor(host="localhost", port=7687)
+
+        def fail(query: str) -> list[dict[str, object]]:
+            raise RuntimeError("unsupported")
+
+        with patch.object(ingestor, "_execute_query", side_effect=fail):
+            assert ingestor.list_indexes() == set()
+            assert ingestor.ensure_indexes() == 0
+
+    def test_drop_indexes_only_drops_managed_existing(self) -> None:
+        ingestor = MemgraphIngestor(host="localhost", port=7687)
+        existing = {("Function", "qualified_name"), ("Custom", "prop")}
+
+        with (
+            patch.object(ingestor, "list_indexes", return_value=existing),
+            patch.object(ingestor, "_execute_query") as mock_execute,
+        ):
+            dropped = ingestor.drop_indexes()
+
+        assert dropped == 1
+        mock_execute.assert_called_once_with("DROP INDEX ON :Function(qualified_name);")
+
+
+class TestAnalyticalStorage:
+    @staticmethod
+    def _capture(executed: list[str], mode: str):
+        def execute(query: str) -> list[dict[str, object]]:
+            executed.append(query)
+            if query == "SHOW STORAGE INFO;":
+                return [
+                    {"storage info": "vertex_count", "value": 0},
+                    {"storage info": "storage_mode", "value": mode},
+                ]
+            return []
+
+        return execute
+
+    def test_switches_and_restores_on_failure(self) -> None:
+        ingestor = MemgraphIngestor(
+            host="localhost", port=7687, analytical_storage=True
+        )
+        executed: list[str] = []
+
+        with (
+            patch.object(
+                ingestor,
+                "_execute_query",
+                side_effect=self._capture(executed, "IN_MEMORY_TRANSACTIONAL"),
+            ),
+            pytest.raises(RuntimeError, match="boom"),
+            ingestor.analytical_storage(),
+        ):
+            raise RuntimeError("boom")
+
+        assert executed == [
+            "SHOW STORAGE INFO;",
+            "STORAGE MODE IN_MEMORY_ANALYTICAL;",
+            "STORAGE MODE IN_MEMORY_TRANSACTIONAL;",
+        ]
+
+    def test_leaves_mode_alone_when_disabled_or_already_analytical(self) -> None:
+        executed: list[str] = []
+        for enabled in (False, True):
+            ingestor = MemgraphIngestor(
+                host="localhost", port=7687, analytical_storage=enabled
+            )
+            with (
+                patch.object(
+                    ingestor,
+                    "_execute_query",
+                    side_effect=self._capture(executed, "IN_MEMORY_ANALYTICAL"),
+                ),
+                ingestor.analytical_storage(),
+            ):
+                pass
+
+        assert executed == ["SHOW STORAGE INFO;"]
+
+
 class TestFlushNodesEdgeCases:
     def test_skips_nodes_with_unknown_label(self) -> None:
         ingestor = MemgraphIngestor(host="localhost", port=7687, batch_size=10)
@@ -361,9 +480,11 @@ class TestExportGraphToDict:
         mock_cursor.description[0].name = "node_id"
         mock_cursor.description[1].name = "labels"
         mock_cursor.description[2].name = "properties"
-        mock_cursor.fetchall.return_value = []
+        mock_cursor.fetchmany.return_value = []
 
-        result = ingestor.export_graph_to_dict()
+        with patch("codebase_rag.services.graph_service.mgclient") as mock_mgclient:
+            mock_mgclient.connect.return_value = mock_conn
+            result = ingestor.export_graph_to_dict()
 
         assert "nodes" in result
         assert "relationships" in result
@@ -376,14 +497,14 @@ class TestExportGraphToDict:
         ingestor = MemgraphIngestor(host="localhost", port=7687)
         call_count = 0
 
-        def mock_fetch_all(query: str, params: dict | None = None) -> list[dict]:
+        def mock_fetch_iter(query: str, **kwargs: object) -> Iterator[dict]:
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                return [{"node_id": 1}, {"node_id": 2}, {"node_id": 3}]
-            return [{"from_id": 1, "to_id": 2}]
+                return iter([{"node_id": 1}, {"node_id": 2}, {"node_id": 3}])
+            return iter([{"from_id": 1, "to_id": 2}])
 
-        with patch.object(ingestor, "fetch_all", side_effect=mock_fetch_all):
+        with patch.object(ingestor, "fetch_iter", side_effect=mock_fetch_iter):
             result = ingestor.export_graph_to_dict()
 
         assert result["metadata"]["total_nodes"] == 3
@@ -416,6 +537,33 @@ class TestFetchAllAndExecuteWrite:
             mock_exec.assert_called_once_with("MATCH (n) RETURN n", {"limit": 10})
             assert result == [{"n": "result"}]
 
+    def test_fetch_iter_reads_in_chunks_and_caps_rows(self) -> None:
+        ingestor = MemgraphIngestor(host="localhost", port=7687)
+        cursor = MagicMock()
+        cursor.description = [MagicMock(), MagicMock()]
+        cursor.description[0].name = "a"
+        cursor.description[1].name = "b"
+        cursor.fetchmany.side_effect = [[(1, 2), (3, 4)], [(5, 6), (7, 8)], []]
+        ingestor.conn = MagicMock()
+
+        with patch("codebase_rag.services.graph_service.mgclient") as mock_mgclient:
+            lazy_conn = mock_mgclient.connect.return_value
+            lazy_conn.cursor.return_value = cursor
+            rows = list(
+                ingestor.fetch_iter("MATCH (n) RETURN n", chunk_size=2, max_rows=3)
+            )
+
+        assert rows == [{"a": 1, "b": 2}, {"a": 3, "b": 4}, {"a": 5, "b": 6}]
+        mock_mgclient.connect.assert_called_once_with(
+            host="localhost", port=7687, lazy=True
+        )
+        ingestor.conn.cursor.assert_not_called()
+        cursor.fetchmany.assert_called_with(2)
+        assert cursor.fetchmany.call_count == 2
+        cursor.fetchall.assert_not_called()
+        cursor.close.assert_called_once()
+        lazy_conn.close.assert_called_once()
+
     def test_execute_write_delegates_to_execute_query(self) -> None:
         ingestor = MemgraphIngestor(host="localhost", port=7687)
 
@@ -433,3 +581,123 @@ class TestGetCurrentTimestamp:
 
         assert "T" in result
         assert len(result) > 10
+
+
+class TestDeleteProject:
+    def test_deletes_in_label_scoped_batches(self) -> None:
+        ingestor = MemgraphIngestor(host="localhost", port=7687, delete_batch_size=2)
+        remaining = {"Function": 5, "Module": 1}
+        executed: list[tuple[str, dict[str, object]]] = []
+
+        def execute(query: str, params: dict[str, object]) -> list[dict[str, object]]:
+            executed.append((query, params))
+            if "Project {name" in query:
+                return [{"project_id": "proj-id"}]
+            label = query.split(":", 1)[1].split(maxsplit=1)[0]
+            deleted = min(remaining.get(label, 0), 2)
+            remaining[label] = remaining.get(label, 0) - deleted
+            return [{"deleted": deleted}]
+
+        with (
+            patch.object(ingestor, "ensure_indexes") as ensure_indexes,
+            patch.object(ingestor, "_execute_query", side_effect=execute),
+        ):
+            ingestor.delete_project("proj")
+
+        ensure_indexes.assert_called_once()
+        function_batches = [q for q, _ in executed if "(n:Function " in q]
+        module_batches = [q for q, _ in executed if "(n:Module " in q]
+        assert len(function_batches) == 3
+        assert len(module_batches) == 1
+        assert all("LIMIT $limit" in q for q, _ in executed[1:])
+        assert all(p == {"project_id": "proj-id", "limit": 2} for _, p in executed[1:])
+        assert remaining["Function"] == remaining["Module"] == 0
+
+    def test_unknown_project_deletes_nothing(self) -> None:
+        ingestor = MemgraphIngestor(host="localhost", port=7687)
+
+        with (
+            patch.object(ingestor, "ensure_indexes") as ensure_indexes,
+            patch.object(ingestor, "_execute_query", return_value=[]) as execute,
+        ):
+            ingestor.delete_project("missing")
+
+        execute.assert_called_once()
+        ensure_indexes.assert_not_called()
+
+
+class TestProjectGeneration:
+    @pytest.fixture
+    def ingestor(self) -> MemgraphIngestor:
+        ingestor = MemgraphIngestor(host="localhost", port=7687, batch_size=100)
+        ingestor.conn = MagicMock()
+        return ingestor
+
+    def test_stamps_rows_then_sweeps(self, ingestor: MemgraphIngestor) -> None:
+        on_deleted = MagicMock()
+        with (
+            patch.object(ingestor, "flush_all") as flush_all,
+            patch.object(ingestor, "delete_stale_generation_in_background") as sweep,
+        ):
+            with ingestor.project_generation("proj", on_deleted) as generation:
+                ingestor.ensure_node_batch("Project", {"name": "proj"})
+                ingestor.ensure_node_batch("Module", {"qualified_name": "proj.m"})
+                ingestor.ensure_relationship_batch(
+                    ("Project", "name", "proj"),
+                    "CONTAINS_MODULE",
+                    ("Module", "qualified_name", "proj.m"),
+                )
+            ingestor.ensure_node_batch("Module", {"qualified_name": "proj.n"})
+
+        flush_all.assert_called_once()
+        sweep.assert_called_once_with("proj", generation, on_deleted)
+        project, module, later = (props for _, props in ingestor.node_buffer)
+        assert "generation" not in project
+        assert module["generation"] == generation
+        assert "generation" not in later
+        assert ingestor.relationship_buffer[0][3] == {"generation": generation}
+
+    def test_failed_run_keeps_current_generation(
+        self, ingestor: MemgraphIngestor
+    ) -> None:
+        with (
+            patch.object(ingestor, "delete_stale_generation_in_background") as sweep,
+            pytest.raises(RuntimeError, match="boom"),
+            ingestor.project_generation("proj"),
+        ):
+            raise RuntimeError("boom")
+
+        sweep.assert_not_called()
+
+    def test_sweep_keeps_project_node_but_drops_its_stale_edges(
+        self, ingestor: MemgraphIngestor
+    ) -> None:
+        executed: list[tuple[str, dict[str, object]]] = []
+
+        def execute(query: str, params: dict[str, object]) -> list[dict[str, object]]:
+            executed.append((query, params))
+            return [{"deleted": 1 if "(n:Function " in query else 0}]
+
+        with patch.object(ingestor, "_execute_query", side_effect=execute):
+            removed = ingestor.delete_stale_generation("proj", "gen-2")
+
+        assert removed == 2
+        project_queries = [q for q, _ in executed if "(n:Project " in q]
+        assert project_queries
+        assert all("DELETE r" in q for q in project_queries)
+        assert all(
+            p == {"project_id": "proj", "generation": "gen-2", "limit": 10000}
+            for _, p in executed
+        )
+
+    def test_sweep_reports_deleted_node_ids(self, ingestor: MemgraphIngestor) -> None:
+        def execute(query: str, params: dict[str, object]) -> list[dict[str, object]]:
+            if "(n:Function " in query and "DETACH DELETE n" in query:
+                return [{"deleted": 2, "node_ids": [7, 9]}]
+            return [{"deleted": 0}]
+
+        on_deleted = MagicMock()
+        with patch.object(ingestor, "_execute_query", side_effect=execute):
+            ingestor.delete_stale_generation("proj", "gen-2", on_deleted)
+
+        on_deleted.assert_called_once_with([7, 9])
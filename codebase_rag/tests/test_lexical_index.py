@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from codebase_rag.lexical_index import (
+    LexicalIndex,
+    get_lexical_index,
+    lexical_index_path,
+    reciprocal_rank_fusion,
+    split_identifier,
+    tokenize,
+)
+from codebase_rag.types_defs import ResultRow
+
+
+@pytest.fixture
+def rows() -> list[ResultRow]:
+    return [
+        {
+            "node_id": 1,
+            "qualified_name": "proj.parsers.rust.parse_rust_use_declaration",
+            "name": "parse_rust_use_declaration",
+            "docstring": "Parse a Rust use declaration into imports.",
+            "type": ["Function"],
+            "project_id": "proj",
+            "path": "parsers/rust.py",
+        },
+        {
+            "node_id": 2,
+            "qualified_name": "proj.parsers.python.parse_python_import",
+            "name": "parse_python_import",
+            "docstring": None,
+            "type": ["Function"],
+            "project_id": "other",
+            "path": "parsers/python.py",
+        },
+        {
+            "node_id": 3,
+            "qualified_name": "proj.services.GraphLoader.loadNodes",
+            "name": "loadNodes",
+            "docstring": "Load nodes from the exported graph.",
+            "type": ["Method"],
+            "project_id": "proj",
+            "path": "services/loader.py",
+        },
+        {"node_id": None, "qualified_name": "broken"},
+    ]
+
+
+@pytest.fixture
+def index(rows: list[ResultRow]) -> LexicalIndex:
+    return LexicalIndex.build(rows)
+
+
+class TestTokenize:
+    def test_splits_snake_case(self) -> None:
+        assert split_identifier("parse_rust_use") == ["parse", "rust", "use"]
+
+    def test_splits_camel_case_and_acronyms(self) -> None:
+        assert split_identifier("HTTPServerError2") == ["http", "server", "error", "2"]
+
+    def test_keeps_whole_identifier(self) -> None:
+        assert tokenize("proj.loadNodes") == ["proj", "loadnodes", "load", "nodes"]
+
+
+class TestLexicalIndex:
+    def test_skips_rows_without_ids(self, index: LexicalIndex) -> None:
+        assert len(index) == 3
+
+    def test_identifier_query_ranks_exact_symbol_first(
+        self, index: LexicalIndex
+    ) -> None:
+        results = index.search("parse_rust_use_declaration", top_k=2)
+
+        assert results[0][0] == 1
+        assert [node_id for node_id, _ in results] == [1, 2]
+
+    def test_matches_camel_case_subtokens(self, index: LexicalIndex) -> None:
+        results = index.search("load nodes", top_k=5)
+
+        assert results[0][0] == 3
+
+    def test_matches_docstring_terms(self, index: LexicalIndex) -> None:
+        results = index.search("exported graph", top_k=5)
+
+        assert [node_id for node_id, _ in results] == [3]
+
+    def test_unknown_terms_return_nothing(self, index: LexicalIndex) -> None:
+        assert index.search("nonexistent", top_k=5) == []
+
+    def test_exact_matches_by_name_and_qualified_name(
+        self, index: LexicalIndex
+    ) -> None:
+        by_name = index.exact_matches("loadNodes")
+        by_qn = index.exact_matches(" proj.parsers.python.parse_python_import ")
+
+        assert [doc["node_id"] for doc in by_name] == [3]
+        assert by_name[0]["type"] == "Method"
+        assert [doc["node_id"] for doc in by_qn] == [2]
+        assert index.exact_matches("load") == []
+
+    def test_search_applies_filters(self, index: LexicalIndex) -> None:
+        assert [n for n, _ in index.search("parse", 5, project_id="proj")] == [1]
+        assert index.search("parse", 5, labels=["Method"]) == []
+        assert {n for n, _ in index.search("parse", 5, path_prefix="parsers/")} == {
+            1,
+            2,
+        }
+        assert index.search("parse", 5, path_prefix="pars") == []
+        assert index.exact_matches("loadNodes", project_id="other") == []
+
+    def test_save_and_load_roundtrip(self, index: LexicalIndex, tmp_path: Path) -> None:
+        path = tmp_path / "lexical.json"
+
+        index.save(path)
+        loaded = LexicalIndex.load(path)
+
+        assert loaded.search("rust use", 3) == index.search("rust use", 3)
+        assert loaded.get(3) == index.get(3)
+
+    def test_get_lexical_index_caches_until_file_changes(
+        self, index: LexicalIndex, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "lexical.json"
+        assert get_lexical_index(path) is None
+
+        index.save(path)
+        first = get_lexical_index(path)
+
+        assert first is not None
+        assert get_lexical_index(path) is first
+
+    def test_each_project_has_its_own_cached_index(
+        self, rows: list[ResultRow], tmp_path: Path
+    ) -> None:
+        base = tmp_path / "lexical.json"
+        proj, other = lexical_index_path(base, "proj"), lexical_index_path(base, "o/x")
+        LexicalIndex.build(rows[:1]).save(proj)
+        LexicalIndex.build(rows[1:3]).save(other)
+
+        assert lexical_index_path(base, None) == base
+        assert other.name == "lexical__o_x.json"
+        first, second = get_lexical_index(proj), get_lexical_index(other)
+        assert first is not None and second is not None
+        assert (len(first), len(second)) == (1, 2)
+        assert get_lexical_index(proj) is first
+
+
+def test_reciprocal_rank_fusion_rewards_agreement() -> None:
+    lexical = [(1, 9.0), (2, 5.0)]
+    vector = [(3, 0.9), (1, 0.8)]
+
+    fused = reciprocal_rank_fusion([lexical, vector], k=60)
+
+    assert [node_id for node_id, _ in fused] == [1, 3, 2]
+    assert fused[0][1] == pytest.approx(1 / 61 + 1 / 62)
+
+
+def test_semantic_code_search_short_circuits_exact_names(index: LexicalIndex) -> None:
+    from codebase_rag.tools.semantic_search import semantic_code_search
+
+    embed = MagicMock()
+    with (
+        patch(
+            "codebase_rag.tools.semantic_search.get_lexical_index",
+            return_value=index,
+        ),
+        patch("codebase_rag.embedder.embed_code", embed),
+    ):
+        results = semantic_code_search("parse_rust_use_declaration")
+
+    assert [r["node_id"] for r in results] == [1]
+    assert results[0]["score"] == 1.0
+    assert results[0]["score_type"] == "exact"
+    embed.assert_not_called()
+
+
+def test_semantic_code_search_scales_lexical_only_scores(
+    index: LexicalIndex,
+) -> None:
+    from codebase_rag.tools.semantic_search import semantic_code_search
+
+    with (
+        patch(
+            "codebase_rag.tools.semantic_search.get_lexical_index",
+            return_value=index,
+        ),
+        patch(
+            "codebase_rag.tools.semantic_search.has_semantic_dependencies",
+            return_value=False,
+        ),
+    ):
+        results = semantic_code_search("rust use declaration", top_k=3)
+
+    assert results[0]["node_id"] == 1
+    assert results[0]["score"] == 1.0
+    assert {r["score_type"] for r in results} == {"lexical"}
+    assert all(0 < r["score"] <= 1 for r in results)
+
+
+def test_semantic_code_search_fuses_lexical_and_vector_hits(
+    index: LexicalIndex,
+) -> None:
+    from codebase_rag.tools.semantic_search import semantic_code_search
+
+    search = MagicMock(return_value=[(3, 0.9), (1, 0.7)])
+    with (
+        patch(
+            "codebase_rag.tools.semantic_search.get_lexical_index",
+            return_value=index,
+        ),
+        patch(
+            "codebase_rag.tools.semantic_search.has_semantic_dependencies",
+            return_value=True,
+        ),
+        patch("codebase_rag.embedder.embed_code", return_value=[0.1] * 768),
+        patch("codebase_rag.vector_store.search_embeddings", search),
+        patch("codebase_rag.services.graph_service.MemgraphIngestor") as ingestor,
+    ):
+        results = semantic_code_search("rust use declaration", top_k=2)
+
+    assert [r["node_id"] for r in results] == [1, 3]
+    assert results[0]["qualified_name"].endswith("parse_rust_use_declaration")
+    assert {r["score_type"] for r in results} == {"hybrid"}
+    assert all(0 < r["score"] <= 1 for r in results)
+    search.assert_called_once_with([0.1] * 768, top_k=8)
+    ingestor.assert_not_called()
+
+
+def test_semantic_code_search_forwards_filters(index: LexicalIndex) -> None:
+    from codebase_rag.tools.semantic_search import (
+        build_search_filters,
+        semantic_code_search,
+    )
+
+    search = MagicMock(return_value=[(3, 0.9)])
+    filters = build_search_filters("proj", ["Method"], None)
+    with (
+        patch(
+            "codebase_rag.tools.semantic_search.get_lexical_index",
+            return_value=index,
+        ),
+        patch(
+            "codebase_rag.tools.semantic_search.has_semantic_dependencies",
+            return_value=True,
+        ),
+        patch("codebase_rag.embedder.embed_code", return_value=[0.3] * 768),
+        patch("codebase_rag.vector_store.search_embeddings", search),
+    ):
+        results = semantic_code_search("parse", top_k=2, filters=filters)
+
+    assert filters == {"project_id": "proj", "labels": ["Method"]}
+    assert [r["node_id"] for r in results] == [3]
+    search.assert_called_once_with(
+        [0.3] * 768, top_k=8, project_id="proj", labels=["Method"]
+    )
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from codebase_rag.services.graph_service import MemgraphIngestor
 
 
@@ -88,3 +91,211 @@ def test_relationship_batch_flushes_after_threshold_and_respects_node_flush() ->
     executed_query = cursor_mock.execute.call_args[0][0]
     assert "UNWIND $batch" in executed_query
     cursor_mock.close.assert_called()
+
+
+def _connect_background_ingestor(
+    mock_mgclient: MagicMock, queue_size: int = 1
+) -> tuple[MemgraphIngestor, MagicMock]:
+    main_conn = MagicMock()
+    writer_conn = MagicMock()
+    writer_cursor = MagicMock()
+    writer_conn.cursor.return_value = writer_cursor
+    mock_mgclient.connect.side_effect = [main_conn, writer_conn]
+    ingestor = MemgraphIngestor(
+        host="localhost", port=7687, batch_size=2, writer_queue_size=queue_size
+    )
+    ingestor.__enter__()
+    return ingestor, writer_cursor
+
+
+def test_background_writer_flushes_on_its_own_connection() -> None:
+    with patch("codebase_rag.services.graph_service.mgclient") as mock_mgclient:
+        ingestor, writer_cursor = _connect_background_ingestor(mock_mgclient)
+
+        ingestor.ensure_node_batch("File", {"path": "a"})
+        ingestor.ensure_node_batch("File", {"path": "b"})
+        ingestor.ensure_relationship_batch(
+            ("File", "path", "a"), "IMPORTS", ("File", "path", "b")
+        )
+        ingestor.ensure_node_batch("File", {"path": "c"})
+        ingestor.flush_all()
+
+        queries = [c.args[0] for c in writer_cursor.execute.call_args_list]
+        assert ingestor.node_buffer == []
+        assert ingestor.relationship_buffer == []
+        assert len(queries) == 3
+        assert "MERGE (n:File" in queries[0]
+        assert "MERGE (n:File" in queries[1]
+        assert "MERGE (a)-[r:IMPORTS]->(b)" in queries[2]
+        assert ingestor.conn is not None
+        ingestor.conn.cursor.assert_not_called()
+
+        ingestor.__exit__(None, None, None)
+
+
+def test_background_writer_keeps_nodes_before_relationships() -> None:
+    with patch("codebase_rag.services.graph_service.mgclient") as mock_mgclient:
+        ingestor, writer_cursor = _connect_background_ingestor(mock_mgclient)
+
+        ingestor.ensure_node_batch("File", {"path": "a"})
+        ingestor.ensure_relationship_batch(
+            ("File", "path", "a"), "IMPORTS", ("File", "path", "b")
+        )
+        ingestor.ensure_relationship_batch(
+            ("File", "path", "b"), "IMPORTS", ("File", "path", "a")
+        )
+        ingestor.__exit__(None, None, None)
+
+        queries = [c.args[0] for c in writer_cursor.execute.call_args_list]
+        assert "MERGE (n:File" in queries[0]
+        assert "IMPORTS" in queries[1]
+
+
+def test_background_writer_errors_reach_the_caller() -> None:
+    with patch("codebase_rag.services.graph_service.mgclient") as mock_mgclient:
+        ingestor, writer_cursor = _connect_background_ingestor(mock_mgclient)
+        writer_cursor.execute.side_effect = RuntimeError("write failed")
+
+        ingestor.ensure_node_batch("File", {"path": "a"})
+        ingestor.ensure_node_batch("File", {"path": "b"})
+
+        with pytest.raises(RuntimeError, match="write failed"):
+            ingestor.flush_all()
+
+        writer_cursor.execute.side_effect = None
+        with pytest.raises(RuntimeError, match="write failed"):
+            ingestor.ensure_node_batch("File", {"path": "c"})
+            ingestor.ensure_node_batch("File", {"path": "d"})
+        assert ingestor.node_buffer == []
+        with pytest.raises(RuntimeError, match="write failed"):
+            ingestor.__exit__(None, None, None)
+
+
+def test_background_writer_connection_failure_fails_every_flush() -> None:
+    with patch("codebase_rag.services.graph_service.mgclient") as mock_mgclient:
+        mock_mgclient.connect.side_effect = [MagicMock(), ConnectionError("down")]
+        ingestor = MemgraphIngestor(
+            host="localhost", port=7687, batch_size=1, writer_queue_size=1
+        )
+        ingestor.__enter__()
+
+        with pytest.raises(ConnectionError, match="down"):
+            ingestor.flush_all()
+        with pytest.raises(ConnectionError, match="down"):
+            ingestor.ensure_node_batch("File", {"path": "a"})
+        with pytest.raises(ConnectionError, match="down"):
+            ingestor.flush_all()
+        with pytest.raises(ConnectionError, match="down"):
+            ingestor.__exit__(None, None, None)
+
+
+def test_background_writer_applies_backpressure() -> None:
+    release = threading.Event()
+    with patch("codebase_rag.services.graph_service.mgclient") as mock_mgclient:
+        ingestor, writer_cursor = _connect_background_ingestor(mock_mgclient)
+        writer_cursor.execute.side_effect = lambda *_: release.wait(5)
+
+        for i in range(4):
+            ingestor.ensure_node_batch("File", {"path": f"p{i}"})
+
+        producer = threading.Thread(
+            target=ingestor.ensure_node_batch, args=("File", {"path": "x"})
+        )
+        ingestor.ensure_node_batch("File", {"path": "p4"})
+        producer.start()
+        producer.join(0.2)
+
+        assert producer.is_alive()
+
+        release.set()
+        producer.join(5)
+        ingestor.__exit__(None, None, None)
+
+        assert writer_cursor.execute.call_count == 3
+
+
+def test_rejects_negative_writer_queue_size() -> None:
+    with pytest.raises(ValueError, match="writer_queue_size"):
+        MemgraphIngestor(host="localhost", port=7687, writer_queue_size=-1)
+
+
+def test_node_buffer_merges_repeated_keys() -> None:
+    ingestor, cursor_mock = _create_ingestor_with_mocked_connection(batch_size=3)
+
+    ingestor.ensure_node_batch("Folder", {"path": "src", "name": "src"})
+    ingestor.ensure_node_batch("Folder", {"path": "src", "project_id": "p"})
+    ingestor.ensure_node_batch("Module", {"qualified_name": "m", "name": "m"})
+
+    assert ingestor.node_buffer == [
+        ("Folder", {"path": "src", "name": "src", "project_id": "p"}),
+        ("Module", {"qualified_name": "m", "name": "m"}),
+    ]
+    cursor_mock.execute.assert_not_called()
+
+    ingestor.flush_nodes()
+    ingestor.ensure_node_batch("Folder", {"path": "src"})
+
+    assert len(ingestor.node_buffer) == 1
+
+
+def test_relationship_buffer_merges_repeated_edges() -> None:
+    ingestor, _ = _create_ingestor_with_mocked_connection(batch_size=10)
+    caller = ("Function", "qualified_name", "m.f")
+    callee = ("Function", "qualified_name", "m.log")
+
+    for _ in range(40):
+        ingestor.ensure_relationship_batch(caller, "CALLS", callee)
+    ingestor.ensure_relationship_batch(caller, "CALLS", callee, {"line": 7})
+    ingestor.ensure_relationship_batch(callee, "CALLS", caller)
+
+    assert ingestor.relationship_buffer == [
+        (caller, "CALLS", callee, {"line": 7}),
+        (callee, "CALLS", caller, None),
+    ]
+
+
+def test_relationship_buffer_can_count_call_sites() -> None:
+    ingestor = MemgraphIngestor(
+        host="localhost", port=7687, batch_size=10, count_relationships=True
+    )
+    caller = ("Function", "qualified_name", "m.f")
+    callee = ("Function", "qualified_name", "m.log")
+
+    for _ in range(3):
+        ingestor.ensure_relationship_batch(caller, "CALLS", callee)
+    ingestor.ensure_relationship_batch(callee, "CALLS", caller)
+
+    assert ingestor.relationship_buffer == [
+        (caller, "CALLS", callee, {"count": 3}),
+        (callee, "CALLS", caller, {"count": 1}),
+    ]
+
+
+def test_delete_by_key_batches_per_label_and_pattern() -> None:
+    ingestor, cursor_mock = _create_ingestor_with_mocked_connection()
+
+    deleted = ingestor.delete_nodes(
+        [("Function", "a.f"), ("Function", "a.g"), ("Function", "a.h"), ("File", "a")]
+    )
+    ingestor.delete_relationships(
+        [
+            (
+                ("Module", "qualified_name", "a"),
+                "DEFINES",
+                ("Function", "qualified_name", "a.f"),
+            )
+        ]
+    )
+
+    assert deleted == 4
+    queries = [c.args[0] for c in cursor_mock.execute.call_args_list]
+    assert [c.args[1]["batch"] for c in cursor_mock.execute.call_args_list] == [
+        [{"id": "a.f"}, {"id": "a.g"}],
+        [{"id": "a.h"}],
+        [{"id": "a"}],
+        [{"from_val": "a", "to_val": "a.f"}],
+    ]
+    assert "MATCH (n:Function {qualified_name: row.id})" in queries[0]
+    assert "DETACH DELETE n" in queries[0]
+    assert "-[r:DEFINES]->" in queries[3]
+    assert queries[3].endswith("DELETE r")
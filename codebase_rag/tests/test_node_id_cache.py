@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from codebase_rag.services.graph_service import MemgraphIngestor
+from codebase_rag.services.node_id_cache import NodeIdCache
+from codebase_rag.types_defs import BatchParams, ResultRow
+
+
+class TestNodeIdCache:
+    def test_evicts_least_recently_used(self) -> None:
+        cache = NodeIdCache(2)
+        cache.put(("Function", "qualified_name", "a"), 1)
+        cache.put(("Function", "qualified_name", "b"), 2)
+        assert cache.get(("Function", "qualified_name", "a")) == 1
+
+        cache.put(("Function", "qualified_name", "c"), 3)
+
+        assert len(cache) == 2
+        assert cache.get(("Function", "qualified_name", "b")) is None
+        assert cache.get(("Function", "qualified_name", "a")) == 1
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_zero_size_disables_storage(self) -> None:
+        cache = NodeIdCache(0)
+        cache.put(("Module", "qualified_name", "m"), 1)
+        assert len(cache) == 0
+
+
+class TestIngestorNodeIds:
+    @pytest.fixture
+    def ingestor(self) -> MemgraphIngestor:
+        ingestor = MemgraphIngestor(
+            host="localhost", port=7687, batch_size=100, node_id_cache=NodeIdCache(10)
+        )
+        ingestor.conn = MagicMock()
+        return ingestor
+
+    @staticmethod
+    def _fake_execute(queries: list[str], live_ids: bool = True):
+        def execute(query: str, rows: list[BatchParams]) -> list[ResultRow]:
+            queries.append(query)
+            if "node_id" in query:
+                return [
+                    {"id": row["id"], "node_id": 100 + i}  # ty: ignore[invalid-argument-type]
+                    for i, row in enumerate(rows)
+                ]
+            if "id(a) = row.from_id" in query:
+                return [
+                    {"from_id": row["from_id"], "to_id": row["to_id"]}  # ty: ignore[invalid-argument-type]
+                    for row in rows
+                    if live_ids
+                ]
+            return [{"created": len(rows)}]
+
+        return execute
+
+    def test_relationships_use_cached_ids_and_fall_back_on_miss(
+        self, ingestor: MemgraphIngestor
+    ) -> None:
+        queries: list[str] = []
+        ingestor.ensure_node_batch("Function", {"qualified_name": "m.f"})
+        ingestor.ensure_node_batch("Function", {"qualified_name": "m.g"})
+        ingestor.ensure_relationship_batch(
+            ("Function", "qualified_name", "m.f"),
+            "CALLS",
+            ("Function", "qualified_name", "m.g"),
+        )
+        ingestor.ensure_relationship_batch(
+            ("Function", "qualified_name", "m.f"),
+            "CALLS",
+            ("Function", "qualified_name", "other.h"),
+        )
+
+        with patch.object(
+            ingestor,
+            "_execute_batch_with_return",
+            side_effect=self._fake_execute(queries),
+        ) as execute:
+            ingestor.flush_all()
+
+        assert "RETURN row.id AS id, id(n) AS node_id" in queries[0]
+        by_id = [q for q in queries if "id(a) = row.from_id" in q]
+        by_property = [q for q in queries if "row.from_val" in q]
+        assert len(by_id) == len(by_property) == 1
+        id_rows = next(
+            c.args[1] for c in execute.call_args_list if c.args[0] == by_id[0]
+        )
+        assert id_rows == [{"from_id": 100, "to_id": 101, "props": {}}]
+
+    def test_deletes_invalidate_cached_ids(self, ingestor: MemgraphIngestor) -> None:
+        ingestor.ensure_node_batch("Module", {"qualified_name": "m"})
+        with patch.object(
+            ingestor, "_execute_batch_with_return", side_effect=self._fake_execute([])
+        ):
+            ingestor.flush_nodes()
+        assert ingestor._node_ids is not None
+        assert len(ingestor._node_ids) == 1
+
+        with patch.object(ingestor, "_execute_query", return_value=[]):
+            ingestor.delete_project_nodes("proj")
+
+        assert len(ingestor._node_ids) == 0
+
+    def test_stale_cached_ids_fall_back_to_property_keys(
+        self, ingestor: MemgraphIngestor
+    ) -> None:
+        ingestor.ensure_node_batch("Function", {"qualified_name": "m.f"})
+        ingestor.ensure_node_batch("Function", {"qualified_name": "m.g"})
+        with patch.object(
+            ingestor, "_execute_batch_with_return", side_effect=self._fake_execute([])
+        ):
+            ingestor.flush_nodes()
+
+        queries: list[str] = []
+        ingestor.ensure_relationship_batch(
+            ("Function", "qualified_name", "m.f"),
+            "CALLS",
+            ("Function", "qualified_name", "m.g"),
+        )
+        with patch.object(
+            ingestor,
+            "_execute_batch_with_return",
+            side_effect=self._fake_execute(queries, live_ids=False),
+        ) as execute:
+            ingestor.flush_relationships()
+
+        assert "id(a) = row.from_id" in queries[0]
+        assert "row.from_val" in queries[1]
+        assert execute.call_args_list[1].args[1] == [
+            {"from_val": "m.f", "to_val": "m.g", "props": {}}
+        ]
+        assert ingestor._node_ids is not None
+        assert len(ingestor._node_ids) == 0
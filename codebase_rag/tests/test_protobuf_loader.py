@@ -0,0 +1,142 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag import constants as cs
+from codebase_rag.services.protobuf_loader import (
+    detect_index_schema,
+    load_protobuf_index,
+)
+from codebase_rag.services.protobuf_service import ProtobufFileIngestor
+
+
+def _write_index(output_dir: Path, **kwargs: object) -> None:
+    ingestor = ProtobufFileIngestor(str(output_dir), **kwargs)  # type: ignore[arg-type]
+    ingestor.ensure_node_batch(
+        "Module", {"qualified_name": "proj.mod", "name": "mod", "path": "mod.py"}
+    )
+    ingestor.ensure_node_batch(
+        "Function",
+        {
+            "qualified_name": "proj.mod.f",
+            "name": "f",
+            "start_line": 3,
+            "decorators": ["@cache"],
+        },
+    )
+    ingestor.ensure_node_batch("Folder", {"path": "pkg", "name": "pkg"})
+    ingestor.ensure_relationship_batch(
+        ("Module", "qualified_name", "proj.mod"),
+        "DEFINES",
+        ("Function", "qualified_name", "proj.mod.f"),
+    )
+    ingestor.ensure_relationship_batch(
+        ("Function", "qualified_name", "proj.mod.f"),
+        "CALLS",
+        ("Function", "qualified_name", "proj.mod.f"),
+        {"line": 7},
+    )
+    ingestor.flush_all()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"split_index": True},
+        {"streaming": True},
+        {"schema_version": cs.ProtobufSchemaVersion.V2},
+        {"split_index": True, "schema_version": cs.ProtobufSchemaVersion.V2},
+    ],
+)
+def test_loads_every_index_layout(tmp_path: Path, kwargs: dict[str, object]) -> None:
+    _write_index(tmp_path, **kwargs)
+    ingestor = MagicMock()
+
+    result = load_protobuf_index(ingestor, tmp_path)
+
+    nodes = {
+        props.get("qualified_name") or props["path"]: (label, props)
+        for (label, props), _ in ingestor.ensure_node_batch.call_args_list
+    }
+    assert nodes["proj.mod.f"] == (
+        "Function",
+        {
+            "qualified_name": "proj.mod.f",
+            "name": "f",
+            "start_line": 3,
+            "decorators": ["@cache"],
+        },
+    )
+    assert nodes["pkg"][0] == "Folder"
+    rels = [c.args for c in ingestor.ensure_relationship_batch.call_args_list]
+    assert rels == [
+        (
+            ("Module", "qualified_name", "proj.mod"),
+            "DEFINES",
+            ("Function", "qualified_name", "proj.mod.f"),
+            None,
+        ),
+        (
+            ("Function", "qualified_name", "proj.mod.f"),
+            "CALLS",
+            ("Function", "qualified_name", "proj.mod.f"),
+            {"line": 7},
+        ),
+    ]
+    assert result.relationships == 2
+    assert result.skipped == 0
+    ingestor.flush_all.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"schema_version": cs.ProtobufSchemaVersion.V2}]
+)
+def test_project_id_is_stamped_on_every_node(
+    tmp_path: Path, kwargs: dict[str, object]
+) -> None:
+    _write_index(tmp_path, **kwargs)
+    ingestor = MagicMock()
+
+    load_protobuf_index(ingestor, tmp_path, project_id="proj")
+
+    calls = ingestor.ensure_node_batch.call_args_list
+    assert len(calls) == 3
+    assert all(props["project_id"] == "proj" for (_, props), _ in calls)
+
+
+def test_v2_placeholders_resolve_endpoints_but_are_not_loaded(tmp_path: Path) -> None:
+    writer = ProtobufFileIngestor(
+        str(tmp_path), schema_version=cs.ProtobufSchemaVersion.V2
+    )
+    writer.ensure_relationship_batch(
+        ("Function", "qualified_name", "proj.f"),
+        "CALLS",
+        ("Function", "qualified_name", "proj.g"),
+    )
+    writer.ensure_node_batch("Function", {"qualified_name": "proj.f", "name": "f"})
+    writer.flush_all()
+    ingestor = MagicMock()
+
+    result = load_protobuf_index(ingestor, tmp_path)
+
+    calls = ingestor.ensure_node_batch.call_args_list
+    assert [c.args for c in calls] == [
+        ("Function", {"qualified_name": "proj.f", "name": "f"})
+    ]
+    assert (result.nodes, result.relationships) == (1, 1)
+    ingestor.ensure_relationship_batch.assert_called_once_with(
+        ("Function", "qualified_name", "proj.f"),
+        "CALLS",
+        ("Function", "qualified_name", "proj.g"),
+        None,
+    )
+
+
+def test_detects_schema_and_rejects_empty_directory(tmp_path: Path) -> None:
+    _write_index(tmp_path / "v2", schema_version=cs.ProtobufSchemaVersion.V2)
+
+    assert detect_index_schema(tmp_path / "v2") == cs.ProtobufSchemaVersion.V2
+    with pytest.raises(FileNotFoundError):
+        detect_index_schema(tmp_path)
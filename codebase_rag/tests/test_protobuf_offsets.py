@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import pytest
+
+from codebase_rag import constants as cs
+from codebase_rag.services.protobuf_offsets import MmapIndexReader, build_offset_table
+from codebase_rag.services.protobuf_service import ProtobufFileIngestor
+
+
+def _write_calls_index(output_dir: Path, count: int, **kwargs: bool) -> None:
+    ingestor = ProtobufFileIngestor(str(output_dir), **kwargs)
+    for i in range(count):
+        ingestor.ensure_node_batch(
+            "Function", {"qualified_name": f"proj.mod.f{i}", "name": f"f{i}"}
+        )
+    for i in range(count):
+        ingestor.ensure_relationship_batch(
+            ("Function", "qualified_name", f"proj.mod.f{i}"),
+            "CALLS",
+            ("Function", "qualified_name", f"proj.mod.f{(i + 1) % count}"),
+        )
+    ingestor.ensure_relationship_batch(
+        ("Function", "qualified_name", "proj.mod.f0"),
+        "CALLS",
+        ("Function", "qualified_name", "external.g"),
+    )
+    ingestor.flush_all()
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"split_index": True}, {"streaming": True}], ids=str
+)
+def test_random_access_by_key(tmp_path: Path, kwargs: dict[str, bool]) -> None:
+    _write_calls_index(tmp_path, 50, **kwargs)
+
+    build_offset_table(tmp_path)
+
+    with MmapIndexReader(tmp_path) as reader:
+        assert len(reader) == 51
+        node = reader.get_node("proj.mod.f7")
+        assert node is not None
+        assert node.function.name == "f7"
+        assert [r.target_id for r in reader.outgoing("proj.mod.f7")] == ["proj.mod.f8"]
+        assert [r.source_id for r in reader.incoming("proj.mod.f7")] == ["proj.mod.f6"]
+        assert sorted(r.target_id for r in reader.outgoing("proj.mod.f0")) == [
+            "external.g",
+            "proj.mod.f1",
+        ]
+        assert "external.g" in reader
+        assert reader.get_node("external.g") is None
+        assert "proj.mod.missing" not in reader
+        assert reader.outgoing("proj.mod.missing") == []
+
+
+def test_reader_requires_offset_table(tmp_path: Path) -> None:
+    _write_calls_index(tmp_path, 3)
+
+    with pytest.raises(FileNotFoundError):
+        MmapIndexReader(tmp_path)
+
+    (tmp_path / cs.PROTOBUF_OFFSETS_FILE).write_bytes(b"not an offset table" * 4)
+    with pytest.raises(ValueError):
+        MmapIndexReader(tmp_path)
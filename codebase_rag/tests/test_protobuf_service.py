@@ -1,8 +1,20 @@
 from pathlib import Path
 from typing import Any, cast
 
+import pytest
+
 import codec.schema_pb2 as pb
-from codebase_rag.services.protobuf_service import ProtobufFileIngestor
+from codebase_rag import constants as cs
+from codebase_rag.services.protobuf_index_v2 import (
+    IndexNode,
+    IndexRelationship,
+    iter_graph_index_v2,
+)
+from codebase_rag.services.protobuf_service import (
+    ProtobufFileIngestor,
+    iter_graph_index,
+    iter_index_records,
+)
 from codebase_rag.types_defs import NodeType
 
 SAMPLE_NODES = {
@@ -169,3 +181,171 @@ def test_protobuf_ingestor_split_index_serialization_and_deserialization(
     assert rel.target_id == "test_project.UserService.get_user"
     assert rel.source_label == NodeType.CLASS
     assert rel.target_label == NodeType.METHOD
+
+
+def _ingest_samples(ingestor: ProtobufFileIngestor) -> None:
+    for node_data in SAMPLE_NODES.values():
+        ingestor.ensure_node_batch(
+            str(node_data["label"]), cast(dict[str, Any], node_data["properties"])
+        )
+    for rel_data in SAMPLE_RELATIONSHIPS:
+        ingestor.ensure_relationship_batch(
+            cast(tuple[str, str, Any], rel_data["from_spec"]),
+            str(rel_data["rel_type"]),
+            cast(tuple[str, str, Any], rel_data["to_spec"]),
+        )
+
+
+def test_streaming_joint_output_is_a_valid_graph_code_index(tmp_path: Path) -> None:
+    ingestor = ProtobufFileIngestor(str(tmp_path), streaming=True)
+
+    _ingest_samples(ingestor)
+    _ingest_samples(ingestor)
+    assert ingestor._nodes == {}
+    ingestor.flush_all()
+
+    index = pb.GraphCodeIndex()
+    index.ParseFromString((tmp_path / "index.bin").read_bytes())
+    assert len(index.nodes) == 3
+    assert len(index.relationships) == 1
+
+    records = list(iter_index_records(tmp_path / "index.bin"))
+    assert [type(r) for r in records] == [pb.Node] * 3 + [pb.Relationship]
+    assert records[1].class_node.decorators == ["@injectable"]
+
+
+def test_streaming_split_output_round_trips(tmp_path: Path) -> None:
+    ingestor = ProtobufFileIngestor(str(tmp_path), split_index=True, streaming=True)
+
+    _ingest_samples(ingestor)
+    ingestor.flush_all()
+
+    assert len(list(iter_index_records(tmp_path / "nodes.bin"))) == 3
+    rels = list(iter_index_records(tmp_path / "relationships.bin"))
+    assert rels[0].target_id == "test_project.UserService.get_user"
+    assert len(list(iter_graph_index(tmp_path))) == 4
+
+
+def test_reader_handles_buffered_output(tmp_path: Path) -> None:
+    ingestor = ProtobufFileIngestor(str(tmp_path))
+
+    _ingest_samples(ingestor)
+    ingestor.flush_all()
+
+    assert len(list(iter_graph_index(tmp_path))) == 4
+
+
+def test_reader_rejects_truncated_records(tmp_path: Path) -> None:
+    ingestor = ProtobufFileIngestor(str(tmp_path), streaming=True)
+    _ingest_samples(ingestor)
+    ingestor.flush_all()
+    path = tmp_path / "index.bin"
+    path.write_bytes(path.read_bytes()[:-3])
+
+    with pytest.raises(ValueError, match="Truncated"):
+        list(iter_index_records(path))
+
+
+def _ingest_calls_graph(ingestor: ProtobufFileIngestor, count: int) -> None:
+    for i in range(count):
+        ingestor.ensure_node_batch(
+            "Function",
+            {
+                "qualified_name": f"test_project.pkg.module.function_{i}",
+                "name": f"function_{i}",
+                "start_line": i,
+                "decorators": ["@cached"],
+            },
+        )
+    for i in range(count):
+        for j in range(5):
+            ingestor.ensure_relationship_batch(
+                ("Function", "qualified_name", f"test_project.pkg.module.function_{i}"),
+                "CALLS",
+                (
+                    "Function",
+                    "qualified_name",
+                    f"test_project.pkg.module.function_{(i + j + 1) % count}",
+                ),
+            )
+
+
+def test_v2_index_round_trips(tmp_path: Path) -> None:
+    ingestor = ProtobufFileIngestor(
+        str(tmp_path), schema_version=cs.ProtobufSchemaVersion.V2
+    )
+
+    _ingest_samples(ingestor)
+    ingestor.ensure_relationship_batch(
+        ("Method", "qualified_name", "test_project.UserService.get_user"),
+        "CALLS",
+        ("Function", "qualified_name", "test_project.helper"),
+        {"line": 3},
+    )
+    ingestor.ensure_node_batch(
+        "Function", {"qualified_name": "test_project.helper", "name": "helper"}
+    )
+    ingestor.flush_all()
+
+    records = list(iter_graph_index_v2(tmp_path))
+    nodes = [r for r in records if isinstance(r, IndexNode)]
+    rels = [r for r in records if isinstance(r, IndexRelationship)]
+    by_id = {n.id: n for n in nodes}
+    assert nodes[1].label == "Class"
+    assert nodes[1].properties["decorators"] == ["@injectable"]
+    assert nodes[1].properties["start_line"] == 10
+    assert nodes[1].properties["is_exported"] is False
+    assert rels[0].type == "DEFINES_METHOD"
+    assert by_id[rels[0].target_id].properties["qualified_name"] == (
+        "test_project.UserService.get_user"
+    )
+    assert rels[1].properties == {"line": 3}
+    helper = [n for n in nodes if n.id == rels[1].target_id]
+    assert [n.properties for n in helper] == [
+        {"qualified_name": "test_project.helper"},
+        {"qualified_name": "test_project.helper", "name": "helper"},
+    ]
+    assert [n.placeholder for n in helper] == [True, False]
+    assert helper[0].key == "qualified_name"
+    assert not any(n.placeholder for n in nodes if n.id != helper[0].id)
+
+
+def test_v2_split_index_and_size(tmp_path: Path) -> None:
+    v1_dir, v2_dir = tmp_path / "v1", tmp_path / "v2"
+    v1 = ProtobufFileIngestor(str(v1_dir))
+    v2 = ProtobufFileIngestor(
+        str(v2_dir), split_index=True, schema_version=cs.ProtobufSchemaVersion.V2
+    )
+
+    _ingest_calls_graph(v1, 200)
+    _ingest_calls_graph(v2, 200)
+    v1.flush_all()
+    v2.flush_all()
+
+    v2_files = [v2_dir / "nodes.v2.bin", v2_dir / "relationships.v2.bin"]
+    rels = list(iter_graph_index_v2(v2_dir))
+    assert sum(isinstance(r, IndexRelationship) for r in rels) == 1000
+    v2_size = sum(p.stat().st_size for p in v2_files)
+    assert v2_size < 0.4 * (v1_dir / "index.bin").stat().st_size
+
+
+def test_v2_skips_labels_without_a_proto_label(tmp_path: Path) -> None:
+    ingestor = ProtobufFileIngestor(
+        str(tmp_path), schema_version=cs.ProtobufSchemaVersion.V2
+    )
+
+    ingestor.ensure_node_batch(
+        "Function", {"qualified_name": "test_project.helper", "name": "helper"}
+    )
+    for label in ("Interface", "Enum", "Type", "Union"):
+        ingestor.ensure_node_batch(label, {"qualified_name": f"test_project.{label}"})
+        ingestor.ensure_relationship_batch(
+            ("Function", "qualified_name", "test_project.helper"),
+            "CALLS",
+            (label, "qualified_name", f"test_project.{label}"),
+        )
+    ingestor.flush_all()
+
+    records = list(iter_graph_index_v2(tmp_path))
+    assert [r.label for r in records if isinstance(r, IndexNode)] == ["Function"]
+    assert not any(isinstance(r, IndexRelationship) for r in records)
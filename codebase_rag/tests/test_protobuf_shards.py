@@ -0,0 +1,109 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+import codec.schema_pb2 as pb
+from codebase_rag.parsers.call_resolver import CallResolver
+from codebase_rag.services import UnresolvedCallProtocol
+from codebase_rag.services.protobuf_service import iter_graph_index
+from codebase_rag.services.protobuf_shards import ShardIngestor, merge_index_shards
+
+
+def _function(ingestor: ShardIngestor, qualified_name: str) -> None:
+    ingestor.ensure_node_batch(
+        "Function",
+        {
+            "qualified_name": qualified_name,
+            "name": qualified_name.rsplit(".", maxsplit=1)[-1],
+        },
+    )
+
+
+def _write_shards(tmp_path: Path) -> tuple[Path, Path]:
+    shard_a, shard_b = tmp_path / "a", tmp_path / "b"
+    a = ShardIngestor(str(shard_a))
+    a.ensure_node_batch("Project", {"name": "mono"})
+    _function(a, "mono.billing.api.charge")
+    a.record_unresolved_call(
+        ("Function", "qualified_name", "mono.billing.api.charge"),
+        "audit.log_event",
+        ["mono.billing.audit.log_event", "mono.common.audit.log_event"],
+    )
+    a.record_unresolved_call(
+        ("Function", "qualified_name", "mono.billing.api.charge"),
+        "missing",
+        ["mono.nowhere.missing"],
+    )
+    a.flush_all()
+
+    b = ShardIngestor(str(shard_b), split_index=True)
+    b.ensure_node_batch("Project", {"name": "mono"})
+    _function(b, "mono.common.audit.log_event")
+    b.ensure_relationship_batch(
+        ("Project", "name", "mono"),
+        "CONTAINS_MODULE",
+        ("Module", "qualified_name", "mono.common.audit"),
+    )
+    b.flush_all()
+    return shard_a, shard_b
+
+
+@pytest.mark.parametrize("split_index", [False, True])
+def test_merge_resolves_cross_shard_calls(tmp_path: Path, split_index: bool) -> None:
+    shards = _write_shards(tmp_path)
+    output = tmp_path / "merged"
+
+    result = merge_index_shards(list(shards), output, split_index=split_index)
+
+    records = list(iter_graph_index(output))
+    nodes = [r for r in records if isinstance(r, pb.Node)]
+    rels = [r for r in records if isinstance(r, pb.Relationship)]
+    assert len(nodes) == result.nodes == 3
+    calls = [r for r in rels if r.type == pb.Relationship.CALLS]
+    assert [(r.source_id, r.target_id, r.target_label) for r in calls] == [
+        ("mono.billing.api.charge", "mono.common.audit.log_event", "Function")
+    ]
+    assert result.resolved_calls == 1
+    assert result.unresolved_calls == 1
+    assert result.relationships == len(rels) == 2
+
+
+def test_shard_records_each_call_site_once(tmp_path: Path) -> None:
+    ingestor = ShardIngestor(str(tmp_path))
+    caller = ("Function", "qualified_name", "mono.f")
+
+    ingestor.record_unresolved_call(caller, "g", ["mono.other.g"])
+    ingestor.record_unresolved_call(caller, "g", ["mono.other.g"])
+    ingestor.flush_all()
+
+    assert isinstance(ingestor, UnresolvedCallProtocol)
+    assert ingestor.unresolved_calls == 1
+    assert list(iter_graph_index(tmp_path)) == []
+
+
+def test_merge_requires_index_files(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        merge_index_shards([tmp_path / "empty"], tmp_path / "out")
+
+
+def test_cross_module_candidates_follow_imports() -> None:
+    import_processor = MagicMock()
+    import_processor.import_mapping = {
+        "mono.billing.api": {
+            "log_event": "mono.common.audit.log_event",
+            "audit": "mono.common.audit",
+            "*mono.common.helpers": "mono.common.helpers",
+        }
+    }
+    resolver = CallResolver(MagicMock(), import_processor, MagicMock(), {})
+
+    assert resolver.cross_module_candidates("log_event", "mono.billing.api") == [
+        "mono.common.audit.log_event",
+        "mono.common.helpers.log_event",
+        "mono.common.helpers::log_event",
+    ]
+    assert resolver.cross_module_candidates("audit.flush", "mono.billing.api")[0] == (
+        "mono.common.audit.flush"
+    )
+    assert resolver.cross_module_candidates("f", "mono.unknown") == []
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,6 +8,15 @@ import pytest
 from codebase_rag.utils.dependencies import has_semantic_dependencies
 
 
+@pytest.fixture(autouse=True)
+def clear_query_embedding_cache() -> Generator[None, None, None]:
+    from codebase_rag.embedder import query_embedding_cache
+
+    query_embedding_cache.clear()
+    yield
+    query_embedding_cache.clear()
+
+
 @pytest.fixture
 def mock_embed_code() -> MagicMock:
     mock = MagicMock()
@@ -440,3 +450,30 @@ async def test_get_function_source_tool_handles_not_found(
         result = await tool.function(999)
 
     assert "Could not retrieve source code" in result
+
+
+@pytest.mark.skipif(
+    not has_semantic_dependencies(), reason="semantic dependencies not installed"
+)
+def test_semantic_code_search_reuses_shared_ingestor(
+    mock_embed_code: MagicMock,
+    mock_search_embeddings: MagicMock,
+    mock_ingestor: MagicMock,
+) -> None:
+    from codebase_rag.tools.semantic_search import semantic_code_search
+
+    shared = MagicMock()
+    shared.fetch_all.return_value = mock_ingestor._execute_query.return_value
+
+    with (
+        patch("codebase_rag.embedder.embed_code", mock_embed_code),
+        patch("codebase_rag.vector_store.search_embeddings", mock_search_embeddings),
+        patch("codebase_rag.services.graph_service.MemgraphIngestor") as fresh,
+    ):
+        results = semantic_code_search("auth", top_k=3, ingestor=shared)
+        semantic_code_search("auth", top_k=3, ingestor=shared)
+
+    assert [r["node_id"] for r in results] == [1, 2, 3]
+    assert shared.fetch_all.call_count == 2
+    fresh.assert_not_called()
+    mock_embed_code.assert_called_once_with("auth")
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from codebase_rag.constants import VectorQuantization
+from codebase_rag.utils.dependencies import has_qdrant_client
+from codebase_rag.vector_index import (
+    IVFIndex,
+    binary_similarity,
+    default_n_lists,
+    normalize_rows,
+    quantize_binary,
+    quantize_int8,
+    top_k_indices,
+)
+
+
+@pytest.fixture
+def clustered_vectors() -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(42)
+    centers = rng.normal(size=(16, 32))
+    labels = rng.integers(0, 16, size=2000)
+    vectors = centers[labels] + rng.normal(scale=0.1, size=(2000, 32))
+    ids = np.arange(1000, 3000, dtype=np.int64)
+    return ids, vectors.astype(np.float32)
+
+
+def test_normalize_rows_handles_zero_vectors() -> None:
+    result = normalize_rows(np.array([[3.0, 4.0], [0.0, 0.0]], dtype=np.float32))
+
+    np.testing.assert_allclose(result[0], [0.6, 0.8], rtol=1e-6)
+    np.testing.assert_array_equal(result[1], [0.0, 0.0])
+
+
+def test_default_n_lists_scales_with_sqrt() -> None:
+    assert default_n_lists(1) == 1
+    assert default_n_lists(10_000) == 400
+    assert default_n_lists(3) == 3
+
+
+def test_top_k_indices_returns_sorted_best() -> None:
+    scores = np.array([0.1, 0.9, 0.5, 0.7], dtype=np.float32)
+
+    assert top_k_indices(scores, 2).tolist() == [1, 3]
+    assert top_k_indices(scores, 10).tolist() == [1, 3, 2, 0]
+
+
+def test_build_partitions_every_vector(
+    clustered_vectors: tuple[np.ndarray, np.ndarray],
+) -> None:
+    ids, vectors = clustered_vectors
+
+    index = IVFIndex.build(ids, vectors, n_lists=16, iterations=5)
+
+    assert len(index) == len(ids)
+    assert index.n_lists == 16
+    assert index.offsets[0] == 0
+    assert index.offsets[-1] == len(ids)
+    assert sorted(index.ids.tolist()) == ids.tolist()
+
+
+def test_build_samples_at_least_one_vector_per_list() -> None:
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(500, 8)).astype(np.float32)
+
+    index = IVFIndex.build(
+        np.arange(500), vectors, n_lists=300, iterations=1, sample_size=100
+    )
+
+    assert index.n_lists == 300
+    assert len(index) == 500
+
+
+def test_search_matches_exact_search_with_full_probe(
+    clustered_vectors: tuple[np.ndarray, np.ndarray],
+) -> None:
+    ids, vectors = clustered_vectors
+    index = IVFIndex.build(ids, vectors, n_lists=16, iterations=5)
+    query = vectors[7]
+
+    approx = index.search(query, top_k=5, nprobe=16)
+    exact = index.exact_search(query, top_k=5)
+
+    assert [node_id for node_id, _ in approx] == [node_id for node_id, _ in exact]
+    assert approx[0][0] == 1007
+    assert approx[0][1] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_search_returns_cosine_scores_in_descending_order(
+    clustered_vectors: tuple[np.ndarray, np.ndarray],
+) -> None:
+    ids, vectors = clustered_vectors
+    index = IVFIndex.build(ids, vectors, n_lists=16, iterations=5)
+
+    results = index.search(vectors[0] * 10, top_k=10, nprobe=2)
+
+    scores = [score for _, score in results]
+    assert len(results) == 10
+    assert scores == sorted(scores, reverse=True)
+    assert all(-1.0 <= s <= 1.0 + 1e-6 for s in scores)
+
+
+def test_save_and_load_roundtrip(
+    clustered_vectors: tuple[np.ndarray, np.ndarray], tmp_path: Path
+) -> None:
+    ids, vectors = clustered_vectors
+    index = IVFIndex.build(ids, vectors, n_lists=8, iterations=3)
+    target = tmp_path / "ivf"
+
+    index.save(target)
+    loaded = IVFIndex.load(target)
+
+    assert loaded is not None
+    assert len(loaded) == len(index)
+    assert isinstance(loaded.vectors, np.memmap)
+    assert loaded.search(vectors[3], 5, 4) == index.search(vectors[3], 5, 4)
+
+
+def test_search_filters_candidates_by_attribute(
+    clustered_vectors: tuple[np.ndarray, np.ndarray], tmp_path: Path
+) -> None:
+    ids, vectors = clustered_vectors
+    projects = ["even" if i % 2 == 0 else "odd" for i in range(len(ids))]
+    index = IVFIndex.build(
+        ids, vectors, n_lists=8, iterations=3, attributes={"project_id": projects}
+    )
+    index.save(tmp_path / "ivf")
+    loaded = IVFIndex.load(tmp_path / "ivf")
+    assert loaded is not None
+    assert loaded.supports_filters(["project_id"])
+    assert not loaded.supports_filters(["label"])
+
+    results = loaded.search(vectors[11], 10, 8, predicates={"project_id": "odd".__eq__})
+
+    assert results[0][0] == 1011
+    assert all(node_id % 2 == 1 for node_id, _ in results)
+    assert (
+        loaded.search(vectors[11], 10, 8, predicates={"project_id": "x".__eq__}) == []
+    )
+
+
+def test_load_returns_none_for_missing_index(tmp_path: Path) -> None:
+    assert IVFIndex.load(tmp_path / "missing") is None
+
+
+def test_benchmark_reports_recall_and_latency(
+    clustered_vectors: tuple[np.ndarray, np.ndarray],
+) -> None:
+    ids, vectors = clustered_vectors
+    index = IVFIndex.build(ids, vectors, n_lists=16, iterations=5)
+
+    report = index.benchmark(num_queries=20, top_k=10, nprobe=16)
+
+    assert report["num_queries"] == 20
+    assert report["num_vectors"] == 2000
+    assert report["recall_at_k"] == pytest.approx(1.0)
+    assert report["ivf_p50_ms"] >= 0.0
+    assert report["exact_p95_ms"] >= report["exact_p50_ms"]
+
+
+def test_quantize_int8_roundtrip_is_close(
+    clustered_vectors: tuple[np.ndarray, np.ndarray],
+) -> None:
+    vectors = normalize_rows(clustered_vectors[1])
+
+    codes, scale = quantize_int8(vectors)
+
+    assert codes.dtype == np.int8
+    assert scale.shape == (vectors.shape[1],)
+    np.testing.assert_allclose(codes * scale, vectors, atol=float(scale.max()))
+
+
+def test_binary_similarity_prefers_matching_signs() -> None:
+    vectors = np.array([[1.0, -1.0, 1.0], [-1.0, 1.0, -1.0]], dtype=np.float32)
+    codes = quantize_binary(vectors)
+
+    scores = binary_similarity(codes, quantize_binary(vectors[0]))
+
+    assert codes.shape == (2, 1)
+    assert scores[0] > scores[1]
+
+
+@pytest.mark.parametrize("mode", [VectorQuantization.INT8, VectorQuantization.BINARY])
+def test_quantized_search_reranks_with_full_vectors(
+    clustered_vectors: tuple[np.ndarray, np.ndarray],
+    mode: VectorQuantization,
+    tmp_path: Path,
+) -> None:
+    ids, vectors = clustered_vectors
+    index = IVFIndex.build(ids, vectors, n_lists=8, iterations=3, quantization=mode)
+
+    assert index.quantization == mode
+    assert index.code_bytes < index.vector_bytes
+
+    results = index.search(vectors[11], top_k=5, nprobe=8, rerank_factor=20)
+    assert results[0][0] == 1011
+    assert results[0][1] == pytest.approx(1.0, abs=1e-5)
+
+    index.save(tmp_path / "ivf")
+    loaded = IVFIndex.load(tmp_path / "ivf")
+    assert loaded is not None
+    assert loaded.quantization == mode
+    assert isinstance(loaded.vectors, np.memmap)
+    assert loaded.search(vectors[11], 5, 8, 20) == pytest.approx(results)
+
+    report = loaded.benchmark(num_queries=10, top_k=5, nprobe=8, rerank_factor=20)
+    assert report["quantization"] == str(mode)
+    assert report["recall_at_k"] >= 0.8
+    assert report["code_bytes"] < report["vector_bytes"]
+
+
+@pytest.mark.skipif(not has_qdrant_client(), reason="qdrant-client not installed")
+def test_search_embeddings_uses_ivf_index_when_available() -> None:
+    import codebase_rag.vector_store as vs
+
+    index = MagicMock()
+    index.search.return_value = [(5, 0.9)]
+    client = MagicMock()
+
+    with (
+        patch.object(vs, "get_ivf_index", return_value=index),
+        patch.object(vs, "get_qdrant_client", return_value=client),
+    ):
+        results = vs.search_embeddings([0.1] * 768, top_k=3)
+
+    assert results == [(5, 0.9)]
+    index.search.assert_called_once_with(
+        [0.1] * 768,
+        3,
+        vs.settings.IVF_NPROBE,
+        vs.settings.QUANTIZATION_RERANK_FACTOR,
+        None,
+    )
+    client.query_points.assert_not_called()
+
+
+@pytest.mark.skipif(not has_qdrant_client(), reason="qdrant-client not installed")
+def test_ivf_index_skipped_below_threshold() -> None:
+    import codebase_rag.vector_store as vs
+
+    client = MagicMock()
+    client.count.return_value.count = 10
+
+    with patch.object(vs.settings, "IVF_INDEX_MIN_VECTORS", 100):
+        assert vs._load_ivf_index(client) is None
@@ -28,9 +28,13 @@ def reset_global_client() -> Generator[None, None, None]:
 
     if has_qdrant_client():
         vs._CLIENT = None
+        vs._KNOWN_COLLECTIONS.clear()
+        vs._IVF_INDEXES.clear()
     yield
     if has_qdrant_client():
         vs._CLIENT = None
+        vs._KNOWN_COLLECTIONS.clear()
+        vs._IVF_INDEXES.clear()
 
 
 @pytest.fixture
@@ -242,9 +246,265 @@ def test_upsert_updates_existing(integration_client: QdrantClient) -> None:
     assert results[0][1] > 0.99
 
 
+@pytest.mark.skipif(not has_qdrant_client(), reason="qdrant-client not installed")
+def test_delete_embeddings_removes_swept_nodes(
+    integration_client: QdrantClient,
+) -> None:
+    from codebase_rag.vector_store import (
+        delete_embeddings,
+        search_embeddings,
+        store_embedding,
+    )
+
+    store_embedding(1, [1.0] + [0.0] * 767, "project.kept")
+    store_embedding(2, [0.9, 0.1] + [0.0] * 766, "project.swept")
+
+    delete_embeddings([2])
+
+    results = search_embeddings([1.0] + [0.0] * 767, top_k=5)
+    assert [node_id for node_id, _ in results] == [1]
+
+
 @pytest.mark.skipif(not has_qdrant_client(), reason="qdrant-client not installed")
 def test_empty_search_returns_empty_list(integration_client: QdrantClient) -> None:
     from codebase_rag.vector_store import search_embeddings
 
     results = search_embeddings([0.5] * 768, top_k=5)
     assert results == []
+
+
+def test_collection_name_for_shared_and_per_project() -> None:
+    import codebase_rag.vector_store as vs
+
+    assert vs.collection_name_for("my-proj") == "code_embeddings"
+    with patch.object(vs.settings, "QDRANT_COLLECTION_PER_PROJECT", True):
+        assert vs.collection_name_for("my proj/x") == "code_embeddings__my_proj_x"
+        assert vs.collection_name_for(None) == "code_embeddings"
+
+
+def test_build_payload_includes_filter_fields() -> None:
+    from codebase_rag.vector_store import build_payload
+
+    payload = build_payload(
+        7,
+        "proj.pkg.mod.func",
+        project_id="proj",
+        label="Function",
+        module_path="pkg/mod.py",
+    )
+
+    assert payload == {
+        "node_id": 7,
+        "qualified_name": "proj.pkg.mod.func",
+        "project_id": "proj",
+        "label": "Function",
+        "module_path": "pkg/mod.py",
+        "path_prefixes": ["pkg", "pkg/mod.py"],
+    }
+    assert build_payload(1, "q") == {"node_id": 1, "qualified_name": "q"}
+
+
+@pytest.mark.skipif(not has_qdrant_client(), reason="qdrant-client not installed")
+def test_search_embeddings_passes_payload_filter(
+    mock_qdrant_client: MagicMock, reset_global_client: None
+) -> None:
+    import codebase_rag.vector_store as vs
+
+    mock_qdrant_client.query_points.return_value = MagicMock(points=[])
+
+    with (
+        patch.object(vs, "get_qdrant_client", return_value=mock_qdrant_client),
+        patch.object(vs, "get_ivf_index", return_value=None),
+    ):
+        vs.search_embeddings(
+            [0.2] * 768,
+            top_k=3,
+            project_id="proj",
+            labels=["Method"],
+            path_prefix="/pkg/sub/",
+        )
+
+    query_filter = mock_qdrant_client.query_points.call_args[1]["query_filter"]
+    conditions = {c.key: c.match for c in query_filter.must}
+    assert conditions["project_id"].value == "proj"
+    assert conditions["label"].any == ["Method"]
+    assert conditions["path_prefixes"].value == "pkg/sub"
+
+
+@pytest.mark.skipif(not has_qdrant_client(), reason="qdrant-client not installed")
+def test_filtered_search_excludes_other_projects(
+    integration_client: QdrantClient,
+) -> None:
+    from codebase_rag.vector_store import search_embeddings, store_embedding
+
+    embedding = [1.0] + [0.0] * 767
+    store_embedding(1, embedding, "a.mod.f", project_id="a", label="Function")
+    store_embedding(2, embedding, "b.mod.f", project_id="b", label="Function")
+    store_embedding(
+        3,
+        embedding,
+        "a.pkg.C.m",
+        project_id="a",
+        label="Method",
+        module_path="pkg/c.py",
+    )
+
+    assert {r[0] for r in search_embeddings(embedding, top_k=5)} == {1, 2, 3}
+    assert {r[0] for r in search_embeddings(embedding, 5, project_id="a")} == {1, 3}
+    assert [
+        r[0] for r in search_embeddings(embedding, 5, project_id="a", labels=["Method"])
+    ] == [3]
+    assert [r[0] for r in search_embeddings(embedding, 5, path_prefix="pkg")] == [3]
+
+
+@pytest.mark.skipif(not has_qdrant_client(), reason="qdrant-client not installed")
+def test_per_project_collections_are_isolated(
+    integration_client: QdrantClient,
+) -> None:
+    import codebase_rag.vector_store as vs
+
+    embedding = [1.0] + [0.0] * 767
+    with patch.object(vs.settings, "QDRANT_COLLECTION_PER_PROJECT", True):
+        vs.store_embedding(1, embedding, "a.f", project_id="a")
+        vs.store_embedding(2, embedding, "b.f", project_id="b")
+
+        assert [r[0] for r in vs.search_embeddings(embedding, 5, project_id="a")] == [1]
+        assert vs.search_embeddings(embedding, 5, project_id="missing") == []
+
+    assert integration_client.collection_exists("code_embeddings__b")
+
+
+@pytest.mark.skipif(not has_qdrant_client(), reason="qdrant-client not installed")
+def test_quantized_collection_config_and_rescoring(
+    mock_qdrant_client: MagicMock, reset_global_client: None
+) -> None:
+    from qdrant_client.models import ScalarQuantization
+
+    import codebase_rag.vector_store as vs
+
+    mock_qdrant_client.collection_exists.return_value = False
+    mock_qdrant_client.query_points.return_value = MagicMock(points=[])
+
+    with (
+        patch.object(vs.settings, "QDRANT_URL", "http://qdrant:6333"),
+        patch.object(vs.settings, "VECTOR_QUANTIZATION", "int8"),
+        patch.object(vs.settings, "QUANTIZATION_RERANK_FACTOR", 3.0),
+        patch.object(vs, "get_qdrant_client", return_value=mock_qdrant_client),
+        patch.object(vs, "get_ivf_index", return_value=None),
+    ):
+        vs._ensure_collection(mock_qdrant_client, "quantized")
+        mock_qdrant_client.collection_exists.return_value = True
+        vs.search_embeddings([0.2] * 768, top_k=2)
+
+    create_kwargs = mock_qdrant_client.create_collection.call_args[1]
+    assert isinstance(create_kwargs["quantization_config"], ScalarQuantization)
+    assert create_kwargs["vectors_config"].on_disk is True
+    search_params = mock_qdrant_client.query_points.call_args[1]["search_params"]
+    assert search_params.quantization.rescore is True
+    assert search_params.quantization.oversampling == 3.0
+
+
+@pytest.mark.skipif(not has_qdrant_client(), reason="qdrant-client not installed")
+def test_filtered_search_uses_ivf_predicates(reset_global_client: None) -> None:
+    import numpy as np
+
+    import codebase_rag.vector_store as vs
+    from codebase_rag.vector_index import IVFIndex
+
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(40, 8)).astype(np.float32)
+    index = IVFIndex.build(
+        np.arange(40),
+        vectors,
+        n_lists=2,
+        iterations=2,
+        attributes={
+            "project_id": ["a" if i % 2 else "b" for i in range(40)],
+            "label": ["Function"] * 40,
+            "module_path": [
+                "pkg/sub/m.py" if i < 10 else "other.py" for i in range(40)
+            ],
+        },
+    )
+    client = MagicMock()
+
+    with (
+        patch.object(vs, "get_ivf_index", return_value=index),
+        patch.object(vs, "get_qdrant_client", return_value=client),
+    ):
+        results = vs.search_embeddings(
+            vectors[3].tolist(), top_k=3, project_id="a", path_prefix="pkg/sub"
+        )
+        fallback = vs.search_embeddings(
+            vectors[3].tolist(), top_k=30, project_id="a", path_prefix="pkg"
+        )
+
+    assert results[0][0] == 3
+    assert {node_id for node_id, _ in results} <= {1, 3, 5, 7, 9}
+    client.query_points.assert_called_once()
+    assert fallback == []
+
+
+@pytest.mark.skipif(not has_qdrant_client(), reason="qdrant-client not installed")
+def test_payload_indexes_added_to_existing_server_collection(
+    mock_qdrant_client: MagicMock, reset_global_client: None
+) -> None:
+    import codebase_rag.vector_store as vs
+
+    mock_qdrant_client.get_collection.return_value.payload_schema = {
+        "project_id": MagicMock()
+    }
+
+    with patch.object(vs.settings, "QDRANT_URL", "http://qdrant:6333"):
+        vs._ensure_collection(mock_qdrant_client, "code_embeddings")
+        vs._ensure_collection(mock_qdrant_client, "code_embeddings")
+
+    mock_qdrant_client.create_collection.assert_not_called()
+    assert [
+        c.kwargs["field_name"]
+        for c in mock_qdrant_client.create_payload_index.call_args_list
+    ] == ["label", "path_prefixes"]
+
+
+@pytest.mark.skipif(not has_qdrant_client(), reason="qdrant-client not installed")
+def test_local_mode_skips_qdrant_quantization(
+    mock_qdrant_client: MagicMock, reset_global_client: None
+) -> None:
+    import codebase_rag.vector_store as vs
+
+    mock_qdrant_client.collection_exists.return_value = False
+
+    with patch.object(vs.settings, "VECTOR_QUANTIZATION", "binary"):
+        vs._ensure_collection(mock_qdrant_client, "local")
+
+    create_kwargs = mock_qdrant_client.create_collection.call_args[1]
+    assert create_kwargs["quantization_config"] is None
+    assert create_kwargs["vectors_config"].on_disk is False
+
+
+@pytest.mark.skipif(not has_qdrant_client(), reason="qdrant-client not installed")
+def test_reembedding_in_place_marks_saved_index_stale(
+    reset_global_client: None, mock_qdrant_client: MagicMock, tmp_path: Path
+) -> None:
+    import numpy as np
+
+    import codebase_rag.vector_store as vs
+    from codebase_rag.vector_index import IVFIndex
+
+    vectors = np.eye(4, dtype=np.float32)
+    mock_qdrant_client.count.return_value.count = 4
+    vs._CLIENT = mock_qdrant_client
+    vs._KNOWN_COLLECTIONS.add("code_embeddings")
+
+    with (
+        patch.object(vs.settings, "IVF_INDEX_PATH", str(tmp_path / "ivf")),
+        patch.object(vs.settings, "IVF_INDEX_MIN_VECTORS", 1),
+    ):
+        IVFIndex.build(np.arange(4), vectors, n_lists=2).save(
+            vs.ivf_index_path("code_embeddings")
+        )
+        assert vs._load_ivf_index(mock_qdrant_client, "code_embeddings") is not None
+
+        vs.store_embedding(2, [0.0, 0.0, 1.0, 0.0], "proj.mod.f")
+
+        assert vs._load_ivf_index(mock_qdrant_client, "code_embeddings") is None
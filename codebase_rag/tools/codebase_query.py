@@ -8,6 +8,7 @@ from rich.table import Table
 
 from .. import exceptions as ex
 from .. import logs as ls
+from ..config import settings
 from ..constants import (
     QUERY_NOT_AVAILABLE,
     QUERY_RESULTS_PANEL_TITLE,
@@ -40,7 +41,9 @@ def create_query_tool(
                 natural_language_query, project_id=project_id
             )
 
-            results = ingestor.fetch_all(cypher_query)
+            results = list(
+                ingestor.fetch_iter(cypher_query, max_rows=settings.QUERY_MAX_ROWS)
+            )
 
             if results:
                 table = Table(
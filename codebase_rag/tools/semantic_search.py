@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 from loguru import logger
 from pydantic_ai import Tool
 
@@ -10,119 +12,255 @@ from ..cypher_queries import (
     CYPHER_GET_FUNCTION_SOURCE_LOCATION,
     build_nodes_by_ids_query,
 )
-from ..types_defs import SemanticSearchResult
+from ..lexical_index import (
+    get_lexical_index,
+    lexical_index_path,
+    reciprocal_rank_fusion,
+)
+from ..services import QueryProtocol
+from ..types_defs import (
+    LexicalDocument,
+    PropertyDict,
+    ResultRow,
+    SearchFilters,
+    SemanticSearchResult,
+)
 from ..utils.dependencies import has_semantic_dependencies
 from . import tool_descriptions as td
 
 
-def semantic_code_search(query: str, top_k: int = 5) -> list[SemanticSearchResult]:
-    if not has_semantic_dependencies():
+def _result_from_document(
+    doc: LexicalDocument, score: float, score_type: cs.SearchScoreType
+) -> SemanticSearchResult:
+    return SemanticSearchResult(
+        node_id=doc["node_id"],
+        qualified_name=doc["qualified_name"],
+        name=doc["name"],
+        type=doc["type"],
+        score=round(score, 3),
+        score_type=score_type,
+    )
+
+
+def _scale_scores(
+    results: list[tuple[int, float]], best: float
+) -> list[tuple[int, float]]:
+    if best <= 0:
+        return results
+    return [(node_id, score / best) for node_id, score in results]
+
+
+def _rank_candidates(
+    rankings: list[list[tuple[int, float]]], lexical: bool, rrf_k: int
+) -> tuple[list[tuple[int, float]], cs.SearchScoreType]:
+    if len(rankings) > 1:
+        # (H) 1.0 means every retriever ranked the node first.
+        fused = reciprocal_rank_fusion(rankings, rrf_k)
+        return _scale_scores(
+            fused, len(rankings) / (rrf_k + 1)
+        ), cs.SearchScoreType.HYBRID
+    (ranking,) = rankings
+    if lexical:
+        # (H) Raw BM25 is unbounded; report it relative to the best hit.
+        best = max((score for _, score in ranking), default=0.0)
+        return _scale_scores(ranking, best), cs.SearchScoreType.LEXICAL
+    return ranking, cs.SearchScoreType.VECTOR
+
+
+def _fetch_from_graph(
+    query: str, params: PropertyDict, ingestor: QueryProtocol | None
+) -> list[ResultRow]:
+    if ingestor is not None:
+        return ingestor.fetch_all(query, params)
+
+    from ..config import settings
+    from ..services.graph_service import MemgraphIngestor
+
+    with MemgraphIngestor(
+        host=settings.MEMGRAPH_HOST,
+        port=settings.MEMGRAPH_PORT,
+        batch_size=cs.SEMANTIC_BATCH_SIZE,
+    ) as fresh_ingestor:
+        return fresh_ingestor._execute_query(query, params)
+
+
+def _resolve_from_graph(
+    search_results: list[tuple[int, float]],
+    ingestor: QueryProtocol | None,
+    score_type: cs.SearchScoreType,
+) -> list[SemanticSearchResult]:
+    node_ids = [node_id for node_id, _ in search_results]
+    cypher_query = build_nodes_by_ids_query(node_ids)
+    params: PropertyDict = {str(i): node_id for i, node_id in enumerate(node_ids)}
+    results = _fetch_from_graph(cypher_query, params, ingestor)
+
+    results_map = {res["node_id"]: res for res in results}
+
+    formatted_results: list[SemanticSearchResult] = []
+    for node_id, score in search_results:
+        if node_id in results_map:
+            result = results_map[node_id]
+            result_type = result["type"]
+            type_str = (
+                result_type[0]
+                if isinstance(result_type, list) and result_type
+                else cs.SEMANTIC_TYPE_UNKNOWN
+            )
+            formatted_results.append(
+                SemanticSearchResult(
+                    node_id=node_id,
+                    qualified_name=str(result["qualified_name"]),
+                    name=str(result["name"]),
+                    type=type_str,
+                    score=round(score, 3),
+                    score_type=score_type,
+                )
+            )
+    return formatted_results
+
+
+def build_search_filters(
+    project_id: str | None = None,
+    labels: list[str] | None = None,
+    path_prefix: str | None = None,
+) -> SearchFilters:
+    filters = SearchFilters()
+    if project_id:
+        filters["project_id"] = project_id
+    if labels:
+        filters["labels"] = labels
+    if path_prefix:
+        filters["path_prefix"] = path_prefix
+    return filters
+
+
+def semantic_code_search(
+    query: str,
+    top_k: int = 5,
+    ingestor: QueryProtocol | None = None,
+    filters: SearchFilters | None = None,
+) -> list[SemanticSearchResult]:
+    from ..config import settings
+
+    filters = filters or SearchFilters()
+    lexical_index = get_lexical_index(
+        lexical_index_path(Path(settings.LEXICAL_INDEX_PATH), filters.get("project_id"))
+    )
+
+    if lexical_index is not None and (
+        exact := lexical_index.exact_matches(query, **filters)[:top_k]
+    ):
+        logger.info(ls.LEXICAL_EXACT_MATCH.format(query=query, count=len(exact)))
+        return [
+            _result_from_document(
+                doc, cs.LEXICAL_EXACT_MATCH_SCORE, cs.SearchScoreType.EXACT
+            )
+            for doc in exact
+        ]
+
+    semantic_available = has_semantic_dependencies()
+    if not semantic_available and lexical_index is None:
         logger.warning(ex.SEMANTIC_EXTRA)
         return []
 
     try:
-        from ..config import settings
-        from ..embedder import embed_code
-        from ..services.graph_service import MemgraphIngestor
-        from ..vector_store import search_embeddings
-
-        query_embedding = embed_code(query)
+        rankings: list[list[tuple[int, float]]] = []
+        candidates = top_k
+        if lexical_index is not None:
+            candidates = top_k * settings.HYBRID_CANDIDATE_MULTIPLIER
+            rankings.append(lexical_index.search(query, candidates, **filters))
+
+        if semantic_available:
+            from ..embedder import embed_query
+            from ..vector_store import search_embeddings
+
+            query_embedding = embed_query(query)
+            rankings.append(
+                search_embeddings(query_embedding, top_k=candidates, **filters)
+            )
 
-        search_results = search_embeddings(query_embedding, top_k=top_k)
+        search_results, score_type = _rank_candidates(
+            rankings, lexical_index is not None, settings.HYBRID_RRF_K
+        )
+        search_results = search_results[:top_k]
 
         if not search_results:
             logger.info(ls.SEMANTIC_NO_MATCH.format(query=query))
             return []
 
-        node_ids = [node_id for node_id, _ in search_results]
-
-        with MemgraphIngestor(
-            host=settings.MEMGRAPH_HOST,
-            port=settings.MEMGRAPH_PORT,
-            batch_size=cs.SEMANTIC_BATCH_SIZE,
-        ) as ingestor:
-            cypher_query = build_nodes_by_ids_query(node_ids)
-            params = {str(i): node_id for i, node_id in enumerate(node_ids)}
-            results = ingestor._execute_query(cypher_query, params)
-
-            results_map = {res["node_id"]: res for res in results}
-
-            formatted_results: list[SemanticSearchResult] = []
-            for node_id, score in search_results:
-                if node_id in results_map:
-                    result = results_map[node_id]
-                    result_type = result["type"]
-                    type_str = (
-                        result_type[0]
-                        if isinstance(result_type, list) and result_type
-                        else cs.SEMANTIC_TYPE_UNKNOWN
-                    )
-                    formatted_results.append(
-                        SemanticSearchResult(
-                            node_id=node_id,
-                            qualified_name=str(result["qualified_name"]),
-                            name=str(result["name"]),
-                            type=type_str,
-                            score=round(score, 3),
-                        )
-                    )
-
-            logger.info(
-                ls.SEMANTIC_FOUND.format(count=len(formatted_results), query=query)
+        documents = (
+            [lexical_index.get(node_id) for node_id, _ in search_results]
+            if lexical_index is not None
+            else []
+        )
+        if documents and all(doc is not None for doc in documents):
+            formatted_results = [
+                _result_from_document(doc, score, score_type)
+                for doc, (_, score) in zip(documents, search_results)
+                if doc is not None
+            ]
+        else:
+            formatted_results = _resolve_from_graph(
+                search_results, ingestor, score_type
             )
-            return formatted_results
+
+        logger.info(ls.SEMANTIC_FOUND.format(count=len(formatted_results), query=query))
+        return formatted_results
 
     except Exception as e:
         logger.error(ls.SEMANTIC_FAILED.format(query=query, error=e))
         return []
 
 
-def get_function_source_code(node_id: int) -> str | None:
+def get_function_source_code(
+    node_id: int, ingestor: QueryProtocol | None = None
+) -> str | None:
     try:
-        from ..config import settings
-        from ..services.graph_service import MemgraphIngestor
         from ..utils.source_extraction import (
             extract_source_lines,
             validate_source_location,
         )
 
-        with MemgraphIngestor(
-            host=settings.MEMGRAPH_HOST,
-            port=settings.MEMGRAPH_PORT,
-            batch_size=cs.SEMANTIC_BATCH_SIZE,
-        ) as ingestor:
-            results = ingestor._execute_query(
-                CYPHER_GET_FUNCTION_SOURCE_LOCATION, {"node_id": node_id}
-            )
+        results = _fetch_from_graph(
+            CYPHER_GET_FUNCTION_SOURCE_LOCATION, {"node_id": node_id}, ingestor
+        )
 
-            if not results:
-                logger.warning(ls.SEMANTIC_NODE_NOT_FOUND.format(id=node_id))
-                return None
+        if not results:
+            logger.warning(ls.SEMANTIC_NODE_NOT_FOUND.format(id=node_id))
+            return None
 
-            result = results[0]
-            file_path = result.get("path")
-            start_line = result.get("start_line")
-            end_line = result.get("end_line")
+        result = results[0]
+        file_path = result.get("path")
+        start_line = result.get("start_line")
+        end_line = result.get("end_line")
 
-            is_valid, file_path_obj = validate_source_location(
-                file_path, start_line, end_line
-            )
-            if not is_valid or file_path_obj is None:
-                logger.warning(ls.SEMANTIC_INVALID_LOCATION.format(id=node_id))
-                return None
+        is_valid, file_path_obj = validate_source_location(
+            file_path, start_line, end_line
+        )
+        if not is_valid or file_path_obj is None:
+            logger.warning(ls.SEMANTIC_INVALID_LOCATION.format(id=node_id))
+            return None
 
-            return extract_source_lines(file_path_obj, start_line, end_line)
+        return extract_source_lines(file_path_obj, start_line, end_line)
 
     except Exception as e:
         logger.error(ls.SEMANTIC_SOURCE_FAILED.format(id=node_id, error=e))
         return None
 
 
-def create_semantic_search_tool() -> Tool:
-    async def semantic_search_functions(query: str, top_k: int = 5) -> str:
+def create_semantic_search_tool(
+    ingestor: QueryProtocol | None = None, project_id: str | None = None
+) -> Tool:
+    async def semantic_search_functions(
+        query: str,
+        top_k: int = 5,
+        labels: list[str] | None = None,
+        path_prefix: str | None = None,
+    ) -> str:
         logger.info(ls.SEMANTIC_TOOL_SEARCH.format(query=query))
 
-        results = semantic_code_search(query, top_k)
+        filters = build_search_filters(project_id, labels, path_prefix)
+        results = semantic_code_search(query, top_k, ingestor, filters)
 
         if not results:
             return cs.MSG_SEMANTIC_NO_RESULTS.format(query=query)
@@ -130,7 +268,7 @@ def create_semantic_search_tool() -> Tool:
         formatted_results = []
         for i, result in enumerate(results, 1):
             formatted_results.append(
-                f"{i}. {result['qualified_name']} (type: {result['type']}, score: {result['score']})"
+                f"{i}. {result['qualified_name']} (type: {result['type']}, score: {result['score']}, match: {result['score_type']})"
             )
 
         response = cs.MSG_SEMANTIC_RESULT_HEADER.format(count=len(results), query=query)
@@ -142,11 +280,11 @@ def create_semantic_search_tool() -> Tool:
     return Tool(semantic_search_functions, name=td.AgenticToolName.SEMANTIC_SEARCH)
 
 
-def create_get_function_source_tool() -> Tool:
+def create_get_function_source_tool(ingestor: QueryProtocol | None = None) -> Tool:
     async def get_function_source_by_id(node_id: int) -> str:
         logger.info(ls.SEMANTIC_TOOL_SOURCE.format(id=node_id))
 
-        source_code = get_function_source_code(node_id)
+        source_code = get_function_source_code(node_id, ingestor)
 
         if source_code is None:
             return cs.MSG_SEMANTIC_SOURCE_UNAVAILABLE.format(id=node_id)
@@ -50,7 +50,8 @@ CODE_RETRIEVAL = (
 
 SEMANTIC_SEARCH = (
     "Performs a semantic search for functions based on a natural language query "
-    "describing their purpose, returning a list of potential matches with similarity scores."
+    "describing their purpose, returning a list of potential matches with scores in [0, 1] "
+    "and how each match was found (exact, hybrid, lexical or vector)."
 )
 
 GET_FUNCTION_SOURCE = (
@@ -45,7 +45,13 @@ class RelBatchRow(TypedDict):
     props: PropertyDict
 
 
-BatchParams = NodeBatchRow | RelBatchRow | PropertyDict
+class RelIdBatchRow(TypedDict):
+    from_id: int
+    to_id: int
+    props: PropertyDict
+
+
+BatchParams = NodeBatchRow | RelBatchRow | RelIdBatchRow | PropertyDict
 
 
 class BatchWrapper(TypedDict):
@@ -123,6 +129,7 @@ class CursorProtocol(Protocol):
     @property
     def description(self) -> Sequence[ColumnDescriptor] | None: ...
     def fetchall(self) -> list[tuple[PropertyValue, ...]]: ...
+    def fetchmany(self, size: int = ...) -> list[tuple[PropertyValue, ...]]: ...
 
 
 class PathValidatorProtocol(Protocol):
@@ -188,6 +195,8 @@ class EmbeddingQueryResult(TypedDict):
     start_line: int | None
     end_line: int | None
     path: str | None
+    project_id: str | None
+    label: str | None
 
 
 class SemanticSearchResult(TypedDict):
@@ -196,6 +205,61 @@ class SemanticSearchResult(TypedDict):
     name: str
     type: str
     score: float
+    score_type: str
+
+
+class SearchFilters(TypedDict, total=False):
+    project_id: str
+    labels: list[str]
+    path_prefix: str
+
+
+class LexicalDocument(TypedDict):
+    node_id: int
+    qualified_name: str
+    name: str
+    type: str
+    project_id: str | None
+    path: str | None
+
+
+class IVFBenchmarkReport(TypedDict):
+    num_vectors: int
+    n_lists: int
+    nprobe: int
+    top_k: int
+    num_queries: int
+    recall_at_k: float
+    ivf_p50_ms: float
+    ivf_p95_ms: float
+    exact_p50_ms: float
+    exact_p95_ms: float
+    quantization: str
+    vector_bytes: int
+    code_bytes: int
+
+
+class IndexBenchmarkPass(TypedDict):
+    flush_seconds: float
+    rows_per_second: float
+    lookup_p50_ms: float
+    lookup_p95_ms: float
+
+
+class IndexBenchmarkReport(TypedDict):
+    num_nodes: int
+    num_relationships: int
+    num_queries: int
+    without_indexes: IndexBenchmarkPass
+    with_indexes: IndexBenchmarkPass
+
+
+class StorageModeBenchmarkReport(TypedDict):
+    num_nodes: int
+    num_relationships: int
+    num_queries: int
+    transactional: IndexBenchmarkPass
+    analytical: IndexBenchmarkPass
 
 
 class JavaClassInfo(TypedDict):
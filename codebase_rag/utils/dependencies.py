@@ -4,9 +4,12 @@ import importlib.util
 from collections.abc import Sequence
 
 from codebase_rag.constants import (
+    MODULE_NUMPY,
+    MODULE_PYARROW,
     MODULE_QDRANT_CLIENT,
     MODULE_TORCH,
     MODULE_TRANSFORMERS,
+    MODULE_ZSTANDARD,
 )
 
 _dependency_cache: dict[str, bool] = {}
@@ -32,6 +35,18 @@ def has_qdrant_client() -> bool:
     return _check_dependency(MODULE_QDRANT_CLIENT)
 
 
+def has_zstandard() -> bool:
+    return _check_dependency(MODULE_ZSTANDARD)
+
+
+def has_pyarrow() -> bool:
+    return _check_dependency(MODULE_PYARROW)
+
+
+def has_numpy() -> bool:
+    return _check_dependency(MODULE_NUMPY)
+
+
 def has_semantic_dependencies() -> bool:
     return has_qdrant_client() and has_torch() and has_transformers()
 
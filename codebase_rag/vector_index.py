@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+import json
+import math
+import shutil
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+from numpy.typing import NDArray
+
+from . import constants as cs
+from . import logs as ls
+from .types_defs import IVFBenchmarkReport
+
+type FloatMatrix = NDArray[np.float32]
+type IdArray = NDArray[np.int64]
+type AttributeCodes = NDArray[np.int32]
+type Attribute = tuple[list[str], AttributeCodes]
+type RowPredicate = Callable[[str], bool]
+
+
+def normalize_rows(vectors: FloatMatrix) -> FloatMatrix:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32, copy=False)
+
+
+def default_n_lists(num_vectors: int) -> int:
+    return max(
+        1, min(num_vectors, int(cs.IVF_LISTS_PER_SQRT_N * math.sqrt(num_vectors)))
+    )
+
+
+def top_k_indices(scores: NDArray[np.float32], top_k: int) -> NDArray[np.int64]:
+    if top_k >= len(scores):
+        return np.argsort(-scores)
+    candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+    return candidates[np.argsort(-scores[candidates])]
+
+
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(
+    axis=1, dtype=np.int32
+)
+
+
+def quantize_int8(vectors: FloatMatrix) -> tuple[NDArray[np.int8], FloatMatrix]:
+    scale = np.abs(vectors).max(axis=0) / cs.INT8_MAX
+    scale[scale == 0] = 1.0
+    codes = np.clip(np.rint(vectors / scale), -cs.INT8_MAX, cs.INT8_MAX)
+    return codes.astype(np.int8), scale.astype(np.float32)
+
+
+def quantize_binary(vectors: FloatMatrix) -> NDArray[np.uint8]:
+    return np.packbits(vectors > 0, axis=-1)
+
+
+def binary_similarity(
+    codes: NDArray[np.uint8], query_code: NDArray[np.uint8]
+) -> NDArray[np.int32]:
+    return -_POPCOUNT[np.bitwise_xor(codes, query_code)].sum(axis=1, dtype=np.int32)
+
+
+def encode_attribute(values: Sequence[str | None]) -> Attribute:
+    table: dict[str, int] = {}
+    codes = np.fromiter(
+        (-1 if v is None else table.setdefault(v, len(table)) for v in values),
+        dtype=np.int32,
+        count=len(values),
+    )
+    return list(table), codes
+
+
+def assign_to_centroids(
+    vectors: FloatMatrix,
+    centroids: FloatMatrix,
+    chunk_size: int = cs.IVF_ASSIGN_CHUNK_SIZE,
+) -> IdArray:
+    assignments = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), chunk_size):
+        chunk = vectors[start : start + chunk_size]
+        assignments[start : start + chunk_size] = np.argmax(chunk @ centroids.T, axis=1)
+    return assignments
+
+
+def train_kmeans(
+    vectors: FloatMatrix,
+    n_clusters: int,
+    iterations: int,
+    seed: int = cs.IVF_KMEANS_SEED,
+) -> FloatMatrix:
+    rng = np.random.default_rng(seed)
+    initial = rng.choice(len(vectors), size=n_clusters, replace=False)
+    centroids = vectors[initial].copy()
+
+    for _ in range(iterations):
+        assignments = assign_to_centroids(vectors, centroids)
+        order = np.argsort(assignments, kind="stable")
+        counts = np.bincount(assignments, minlength=n_clusters)
+        non_empty = np.flatnonzero(counts)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[non_empty]
+
+        sums = np.add.reduceat(vectors[order], starts, axis=0)
+        updated = centroids.copy()
+        updated[non_empty] = sums
+
+        empty = np.flatnonzero(counts == 0)
+        if len(empty):
+            updated[empty] = vectors[rng.choice(len(vectors), size=len(empty))]
+
+        centroids = normalize_rows(updated)
+
+    return centroids
+
+
+class IVFIndex:
+    def __init__(
+        self,
+        centroids: FloatMatrix,
+        offsets: IdArray,
+        ids: IdArray,
+        vectors: FloatMatrix,
+        *,
+        codes: NDArray[np.int8] | NDArray[np.uint8] | None = None,
+        scale: FloatMatrix | None = None,
+        attributes: dict[str, Attribute] | None = None,
+        write_generation: str | None = None,
+    ) -> None:
+        self.centroids = centroids
+        self.offsets = offsets
+        self.ids = ids
+        self.vectors = vectors
+        self.codes = codes
+        self.scale = scale
+        self.attributes = attributes or {}
+        self.write_generation = write_generation
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def n_lists(self) -> int:
+        return len(self.centroids)
+
+    @property
+    def quantization(self) -> cs.VectorQuantization:
+        if self.codes is None:
+            return cs.VectorQuantization.NONE
+        if self.scale is None:
+            return cs.VectorQuantization.BINARY
+        return cs.VectorQuantization.INT8
+
+    def quantize(self, mode: cs.VectorQuantization) -> None:
+        vectors = np.asarray(self.vectors, dtype=np.float32)
+        match mode:
+            case cs.VectorQuantization.INT8:
+                self.codes, self.scale = quantize_int8(vectors)
+            case cs.VectorQuantization.BINARY:
+                self.codes, self.scale = quantize_binary(vectors), None
+            case _:
+                self.codes, self.scale = None, None
+
+    def supports_filters(self, fields: Iterable[str]) -> bool:
+        return all(field in self.attributes for field in fields)
+
+    def _filter_rows(
+        self, rows: IdArray, predicates: Mapping[str, RowPredicate]
+    ) -> IdArray:
+        mask = np.ones(len(rows), dtype=bool)
+        for field, predicate in predicates.items():
+            table, codes = self.attributes[field]
+            allowed = [code for code, value in enumerate(table) if predicate(value)]
+            mask &= np.isin(codes[rows], allowed)
+        return rows[mask]
+
+    @property
+    def vector_bytes(self) -> int:
+        return len(self) * int(self.centroids.shape[1]) * np.float32().itemsize
+
+    @property
+    def code_bytes(self) -> int:
+        if self.codes is None:
+            return self.vector_bytes
+        scale_bytes = int(self.scale.nbytes) if self.scale is not None else 0
+        return int(self.codes.nbytes) + scale_bytes
+
+    def _approximate_scores(
+        self, rows: IdArray, q: FloatMatrix
+    ) -> NDArray[np.float32] | NDArray[np.int32]:
+        if self.codes is None:
+            return self.vectors[rows] @ q
+        if self.scale is not None:
+            return self.codes[rows].astype(np.float32) @ (q * self.scale)
+        return binary_similarity(self.codes[rows], quantize_binary(q))
+
+    @classmethod
+    def build(
+        cls,
+        ids: IdArray,
+        vectors: FloatMatrix,
+        *,
+        n_lists: int | None = None,
+        iterations: int = 20,
+        sample_size: int | None = None,
+        seed: int = cs.IVF_KMEANS_SEED,
+        quantization: cs.VectorQuantization = cs.VectorQuantization.NONE,
+        attributes: Mapping[str, Sequence[str | None]] | None = None,
+    ) -> IVFIndex:
+        vectors = normalize_rows(vectors)
+        ids = np.asarray(ids, dtype=np.int64)
+        lists = min(n_lists or default_n_lists(len(vectors)), len(vectors))
+
+        training = vectors
+        # (H) k-means needs at least one training vector per list.
+        sample = max(sample_size, lists) if sample_size is not None else None
+        if sample is not None and len(vectors) > sample:
+            rng = np.random.default_rng(seed)
+            training = vectors[rng.choice(len(vectors), size=sample, replace=False)]
+
+        logger.info(
+            ls.IVF_TRAINING.format(
+                vectors=len(vectors), lists=lists, iterations=iterations
+            )
+        )
+        centroids = train_kmeans(training, lists, iterations, seed)
+
+        assignments = assign_to_centroids(vectors, centroids)
+        order = np.argsort(assignments, kind="stable")
+        counts = np.bincount(assignments, minlength=lists)
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+
+        encoded = {
+            field: encode_attribute(values)
+            for field, values in (attributes or {}).items()
+        }
+        index = cls(
+            centroids=centroids,
+            offsets=offsets,
+            ids=ids[order],
+            vectors=np.ascontiguousarray(vectors[order]),
+            attributes={
+                field: (table, codes[order])
+                for field, (table, codes) in encoded.items()
+            },
+        )
+        index.quantize(quantization)
+        return index
+
+    def search(
+        self,
+        query: list[float] | FloatMatrix,
+        top_k: int,
+        nprobe: int,
+        rerank_factor: float = 1.0,
+        predicates: Mapping[str, RowPredicate] | None = None,
+    ) -> list[tuple[int, float]]:
+        q = normalize_rows(np.asarray(query, dtype=np.float32))
+        probe = min(max(1, nprobe), self.n_lists)
+        lists = top_k_indices(self.centroids @ q, probe)
+
+        ranges = [
+            np.arange(self.offsets[i], self.offsets[i + 1])
+            for i in lists
+            if self.offsets[i + 1] > self.offsets[i]
+        ]
+        if not ranges:
+            return []
+
+        rows = np.concatenate(ranges)
+        if predicates:
+            rows = self._filter_rows(rows, predicates)
+            if not len(rows):
+                return []
+        scores = self._approximate_scores(rows, q)
+        if self.codes is None:
+            best = top_k_indices(scores, top_k)
+            return [(int(self.ids[rows[i]]), float(scores[i])) for i in best]
+
+        shortlist = np.sort(
+            rows[top_k_indices(scores, math.ceil(top_k * max(1.0, rerank_factor)))]
+        )
+        exact = np.asarray(self.vectors[shortlist], dtype=np.float32) @ q
+        best = top_k_indices(exact, top_k)
+        return [(int(self.ids[shortlist[i]]), float(exact[i])) for i in best]
+
+    def exact_search(
+        self, query: list[float] | FloatMatrix, top_k: int
+    ) -> list[tuple[int, float]]:
+        q = normalize_rows(np.asarray(query, dtype=np.float32))
+        scores = np.empty(len(self.ids), dtype=np.float32)
+        for start in range(0, len(self.ids), cs.IVF_ASSIGN_CHUNK_SIZE):
+            end = start + cs.IVF_ASSIGN_CHUNK_SIZE
+            scores[start:end] = self.vectors[start:end] @ q
+        best = top_k_indices(scores, top_k)
+        return [(int(self.ids[i]), float(scores[i])) for i in best]
+
+    def save(self, directory: Path) -> None:
+        tmp_dir = directory.with_name(directory.name + cs.IVF_TMP_SUFFIX)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+
+        np.save(tmp_dir / cs.IVF_CENTROIDS_FILE, self.centroids)
+        np.save(tmp_dir / cs.IVF_OFFSETS_FILE, self.offsets)
+        np.save(tmp_dir / cs.IVF_IDS_FILE, self.ids)
+        # (H) Full-precision vectors stay on disk for an mmap-backed exact rerank.
+        np.save(tmp_dir / cs.IVF_VECTORS_FILE, self.vectors)
+        if self.codes is not None:
+            np.save(tmp_dir / cs.IVF_CODES_FILE, self.codes)
+        if self.scale is not None:
+            np.save(tmp_dir / cs.IVF_SCALE_FILE, self.scale)
+        for field, (_, codes) in self.attributes.items():
+            np.save(tmp_dir / cs.IVF_ATTRIBUTE_FILE.format(field=field), codes)
+        meta = {
+            cs.IVF_META_NUM_VECTORS: len(self),
+            cs.IVF_META_N_LISTS: self.n_lists,
+            cs.IVF_META_DIM: int(self.centroids.shape[1]),
+            cs.IVF_META_QUANTIZATION: str(self.quantization),
+            cs.IVF_META_ATTRIBUTES: {
+                field: table for field, (table, _) in self.attributes.items()
+            },
+            cs.IVF_META_WRITE_GENERATION: self.write_generation,
+        }
+        (tmp_dir / cs.IVF_META_FILE).write_text(
+            json.dumps(meta), encoding=cs.ENCODING_UTF8
+        )
+
+        shutil.rmtree(directory, ignore_errors=True)
+        tmp_dir.rename(directory)
+        logger.info(
+            ls.IVF_SAVED.format(vectors=len(self), lists=self.n_lists, path=directory)
+        )
+
+    @classmethod
+    def load(cls, directory: Path) -> IVFIndex | None:
+        meta_path = directory / cs.IVF_META_FILE
+        if not meta_path.is_file():
+            return None
+        meta = json.loads(meta_path.read_text(encoding=cs.ENCODING_UTF8))
+        quantization = cs.VectorQuantization(
+            meta.get(cs.IVF_META_QUANTIZATION, cs.VectorQuantization.NONE)
+        )
+        quantized = quantization != cs.VectorQuantization.NONE
+        index = cls(
+            centroids=np.load(directory / cs.IVF_CENTROIDS_FILE),
+            offsets=np.load(directory / cs.IVF_OFFSETS_FILE),
+            ids=np.load(directory / cs.IVF_IDS_FILE, mmap_mode="r"),
+            vectors=np.load(directory / cs.IVF_VECTORS_FILE, mmap_mode="r"),
+            codes=np.load(directory / cs.IVF_CODES_FILE) if quantized else None,
+            scale=(
+                np.load(directory / cs.IVF_SCALE_FILE)
+                if quantization == cs.VectorQuantization.INT8
+                else None
+            ),
+            attributes={
+                field: (
+                    table,
+                    np.load(directory / cs.IVF_ATTRIBUTE_FILE.format(field=field)),
+                )
+                for field, table in meta.get(cs.IVF_META_ATTRIBUTES, {}).items()
+            },
+            write_generation=meta.get(cs.IVF_META_WRITE_GENERATION),
+        )
+        logger.info(
+            ls.IVF_LOADED.format(
+                vectors=len(index), lists=index.n_lists, path=directory
+            )
+        )
+        return index
+
+    def benchmark(
+        self,
+        num_queries: int,
+        top_k: int,
+        nprobe: int,
+        rerank_factor: float = 1.0,
+        seed: int = cs.IVF_KMEANS_SEED,
+    ) -> IVFBenchmarkReport:
+        rng = np.random.default_rng(seed)
+        sample = rng.choice(len(self), size=min(num_queries, len(self)), replace=False)
+        queries = np.asarray(self.vectors[np.sort(sample)], dtype=np.float32)
+        queries = normalize_rows(
+            queries + rng.normal(scale=cs.IVF_BENCHMARK_NOISE, size=queries.shape)
+        )
+
+        ivf_latencies: list[float] = []
+        exact_latencies: list[float] = []
+        recalls: list[float] = []
+        for query in queries:
+            started = time.perf_counter()
+            approx = self.search(query, top_k, nprobe, rerank_factor)
+            ivf_latencies.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            exact = self.exact_search(query, top_k)
+            exact_latencies.append(time.perf_counter() - started)
+
+            expected = {node_id for node_id, _ in exact}
+            found = {node_id for node_id, _ in approx}
+            recalls.append(len(expected & found) / max(1, len(expected)))
+
+        def percentile(values: list[float], q: float) -> float:
+            if not values:
+                return 0.0
+            return float(np.percentile(values, q)) * cs.MS_PER_SECOND
+
+        return IVFBenchmarkReport(
+            num_vectors=len(self),
+            n_lists=self.n_lists,
+            nprobe=min(nprobe, self.n_lists),
+            top_k=top_k,
+            num_queries=len(queries),
+            recall_at_k=float(np.mean(recalls)) if recalls else 0.0,
+            ivf_p50_ms=percentile(ivf_latencies, 50),
+            ivf_p95_ms=percentile(ivf_latencies, cs.IVF_LATENCY_PERCENTILE),
+            exact_p50_ms=percentile(exact_latencies, 50),
+            exact_p95_ms=percentile(exact_latencies, cs.IVF_LATENCY_PERCENTILE),
+            quantization=str(self.quantization),
+            vector_bytes=self.vector_bytes,
+            code_bytes=self.code_bytes,
+        )
@@ -1,62 +1,447 @@
+import re
+import uuid
+from collections.abc import Callable, Sequence
+from pathlib import Path, PurePosixPath
+
 from loguru import logger
 
 from . import logs as ls
 from .config import settings
-from .constants import PAYLOAD_NODE_ID, PAYLOAD_QUALIFIED_NAME
+from .constants import (
+    ENCODING_UTF8,
+    IVF_FILTER_FIELDS,
+    IVF_SCROLL_BATCH_SIZE,
+    IVF_WRITES_SUFFIX,
+    PAYLOAD_INDEXED_FIELDS,
+    PAYLOAD_LABEL,
+    PAYLOAD_MODULE_PATH,
+    PAYLOAD_NODE_ID,
+    PAYLOAD_PATH_PREFIXES,
+    PAYLOAD_PROJECT_ID,
+    PAYLOAD_QUALIFIED_NAME,
+    QDRANT_COLLECTION_NAME_PATTERN,
+    QDRANT_COLLECTION_SEPARATOR,
+    QDRANT_INT8_QUANTILE,
+    SEPARATOR_SLASH,
+    VectorQuantization,
+)
+from .types_defs import PropertyDict
 from .utils.dependencies import has_qdrant_client
 
+
+def collection_name_for(project_id: str | None) -> str:
+    if not settings.QDRANT_COLLECTION_PER_PROJECT or not project_id:
+        return settings.QDRANT_COLLECTION_NAME
+    suffix = re.sub(QDRANT_COLLECTION_NAME_PATTERN, "_", project_id)
+    return f"{settings.QDRANT_COLLECTION_NAME}{QDRANT_COLLECTION_SEPARATOR}{suffix}"
+
+
+def path_prefixes(module_path: str) -> list[str]:
+    parts = PurePosixPath(module_path.strip(SEPARATOR_SLASH)).parts
+    return [SEPARATOR_SLASH.join(parts[: i + 1]) for i in range(len(parts))]
+
+
+def build_payload(
+    node_id: int,
+    qualified_name: str,
+    project_id: str | None = None,
+    label: str | None = None,
+    module_path: str | None = None,
+) -> PropertyDict:
+    payload: PropertyDict = {
+        PAYLOAD_NODE_ID: node_id,
+        PAYLOAD_QUALIFIED_NAME: qualified_name,
+    }
+    if project_id is not None:
+        payload[PAYLOAD_PROJECT_ID] = project_id
+    if label is not None:
+        payload[PAYLOAD_LABEL] = label
+    if module_path is not None:
+        payload[PAYLOAD_MODULE_PATH] = module_path
+        payload[PAYLOAD_PATH_PREFIXES] = path_prefixes(module_path)
+    return payload
+
+
 if has_qdrant_client():
+    import numpy as np
     from qdrant_client import QdrantClient
-    from qdrant_client.models import Distance, PointStruct, VectorParams
+    from qdrant_client.models import (
+        BinaryQuantization,
+        BinaryQuantizationConfig,
+        Distance,
+        FieldCondition,
+        Filter,
+        MatchAny,
+        MatchValue,
+        PayloadSchemaType,
+        PointIdsList,
+        PointStruct,
+        QuantizationConfig,
+        QuantizationSearchParams,
+        ScalarQuantization,
+        ScalarQuantizationConfig,
+        ScalarType,
+        SearchParams,
+        VectorParams,
+    )
+
+    from .vector_index import FloatMatrix, IdArray, IVFIndex
 
     _CLIENT: QdrantClient | None = None
+    _KNOWN_COLLECTIONS: set[str] = set()
+    _IVF_INDEXES: dict[str, IVFIndex | None] = {}
+
+    def _quantization_config() -> QuantizationConfig | None:
+        match settings.VECTOR_QUANTIZATION:
+            case VectorQuantization.INT8:
+                return ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(
+                        type=ScalarType.INT8,
+                        quantile=QDRANT_INT8_QUANTILE,
+                        always_ram=True,
+                    )
+                )
+            case VectorQuantization.BINARY:
+                return BinaryQuantization(
+                    binary=BinaryQuantizationConfig(always_ram=True)
+                )
+            case _:
+                return None
+
+    def _search_params() -> SearchParams | None:
+        if settings.VECTOR_QUANTIZATION == VectorQuantization.NONE:
+            return None
+        return SearchParams(
+            quantization=QuantizationSearchParams(
+                rescore=True, oversampling=settings.QUANTIZATION_RERANK_FACTOR
+            )
+        )
+
+    def _ensure_payload_indexes(client: QdrantClient, collection_name: str) -> None:
+        indexed = client.get_collection(collection_name).payload_schema or {}
+        for field in PAYLOAD_INDEXED_FIELDS:
+            if field not in indexed:
+                client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=field,
+                    field_schema=PayloadSchemaType.KEYWORD,
+                )
+
+    def _ensure_collection(client: QdrantClient, collection_name: str) -> None:
+        if collection_name in _KNOWN_COLLECTIONS:
+            return
+        # (H) Local mode ignores quantization configs; only a server applies them.
+        quantization_config = _quantization_config() if settings.QDRANT_URL else None
+        if not client.collection_exists(collection_name):
+            client.create_collection(
+                collection_name=collection_name,
+                vectors_config=VectorParams(
+                    size=settings.QDRANT_VECTOR_DIM,
+                    distance=Distance.COSINE,
+                    on_disk=quantization_config is not None,
+                ),
+                quantization_config=quantization_config,
+            )
+        elif quantization_config is not None:
+            client.update_collection(
+                collection_name=collection_name,
+                quantization_config=quantization_config,
+            )
+        if settings.QDRANT_URL:
+            _ensure_payload_indexes(client, collection_name)
+        _KNOWN_COLLECTIONS.add(collection_name)
 
     def get_qdrant_client() -> QdrantClient:
         global _CLIENT
         if _CLIENT is None:
-            _CLIENT = QdrantClient(path=settings.QDRANT_DB_PATH)
-            if not _CLIENT.collection_exists(settings.QDRANT_COLLECTION_NAME):
-                _CLIENT.create_collection(
-                    collection_name=settings.QDRANT_COLLECTION_NAME,
-                    vectors_config=VectorParams(
-                        size=settings.QDRANT_VECTOR_DIM, distance=Distance.COSINE
-                    ),
+            _CLIENT = (
+                QdrantClient(url=settings.QDRANT_URL)
+                if settings.QDRANT_URL
+                else QdrantClient(path=settings.QDRANT_DB_PATH)
+            )
+            if (
+                not settings.QDRANT_URL
+                and settings.VECTOR_QUANTIZATION != VectorQuantization.NONE
+            ):
+                logger.info(
+                    ls.QDRANT_LOCAL_QUANTIZATION.format(
+                        mode=settings.VECTOR_QUANTIZATION
+                    )
                 )
+            _KNOWN_COLLECTIONS.clear()
+            _ensure_collection(_CLIENT, settings.QDRANT_COLLECTION_NAME)
         return _CLIENT
 
+    def build_search_filter(
+        project_id: str | None = None,
+        labels: Sequence[str] | None = None,
+        path_prefix: str | None = None,
+    ) -> Filter | None:
+        conditions: list[FieldCondition] = []
+        if project_id:
+            conditions.append(
+                FieldCondition(
+                    key=PAYLOAD_PROJECT_ID, match=MatchValue(value=project_id)
+                )
+            )
+        if labels:
+            conditions.append(
+                FieldCondition(key=PAYLOAD_LABEL, match=MatchAny(any=list(labels)))
+            )
+        if path_prefix and (prefixes := path_prefixes(path_prefix)):
+            conditions.append(
+                FieldCondition(
+                    key=PAYLOAD_PATH_PREFIXES, match=MatchValue(value=prefixes[-1])
+                )
+            )
+        return Filter(must=conditions) if conditions else None
+
+    def build_ivf_predicates(
+        project_id: str | None = None,
+        labels: Sequence[str] | None = None,
+        path_prefix: str | None = None,
+    ) -> dict[str, Callable[[str], bool]]:
+        predicates: dict[str, Callable[[str], bool]] = {}
+        if project_id:
+            predicates[PAYLOAD_PROJECT_ID] = project_id.__eq__
+        if labels:
+            predicates[PAYLOAD_LABEL] = frozenset(labels).__contains__
+        if path_prefix and (prefixes := path_prefixes(path_prefix)):
+            prefix = prefixes[-1]
+            predicates[PAYLOAD_MODULE_PATH] = lambda path: prefix in path_prefixes(path)
+        return predicates
+
+    def ivf_index_path(collection_name: str) -> Path:
+        path = Path(settings.IVF_INDEX_PATH)
+        suffix = collection_name.removeprefix(settings.QDRANT_COLLECTION_NAME)
+        return path.with_name(path.name + suffix) if suffix else path
+
+    def _writes_marker_path(collection_name: str) -> Path:
+        path = ivf_index_path(collection_name)
+        return path.with_name(path.name + IVF_WRITES_SUFFIX)
+
+    def _read_write_generation(collection_name: str) -> str | None:
+        try:
+            return _writes_marker_path(collection_name).read_text(
+                encoding=ENCODING_UTF8
+            )
+        except FileNotFoundError:
+            return None
+
+    def _bump_write_generation(collection_name: str) -> None:
+        # (H) Re-embedding in place keeps the vector count, so the count alone
+        # (H) cannot tell a saved index that it is stale.
+        if ivf_index_path(collection_name).is_dir():
+            _writes_marker_path(collection_name).write_text(
+                uuid.uuid4().hex, encoding=ENCODING_UTF8
+            )
+
+    def _invalidate_ivf_index(collection_name: str | None = None) -> None:
+        if collection_name is None:
+            _IVF_INDEXES.clear()
+        else:
+            _IVF_INDEXES.pop(collection_name, None)
+
+    def _load_ivf_index(
+        client: QdrantClient, collection_name: str | None = None
+    ) -> IVFIndex | None:
+        collection_name = collection_name or settings.QDRANT_COLLECTION_NAME
+        if not client.collection_exists(collection_name):
+            return None
+        count = client.count(collection_name=collection_name, exact=True).count
+        if count < settings.IVF_INDEX_MIN_VECTORS:
+            logger.debug(
+                ls.IVF_BELOW_THRESHOLD.format(
+                    count=count, threshold=settings.IVF_INDEX_MIN_VECTORS
+                )
+            )
+            return None
+        index_path = ivf_index_path(collection_name)
+        try:
+            index = IVFIndex.load(index_path)
+        except Exception as e:
+            logger.warning(ls.IVF_LOAD_FAILED.format(path=index_path, error=e))
+            return None
+        if index is not None and len(index) != count:
+            logger.info(
+                ls.IVF_STALE.format(path=index_path, indexed=len(index), current=count)
+            )
+            return None
+        if index is not None and index.write_generation != _read_write_generation(
+            collection_name
+        ):
+            logger.info(ls.IVF_STALE_WRITES.format(path=index_path))
+            return None
+        return index
+
+    def get_ivf_index(collection_name: str | None = None) -> IVFIndex | None:
+        collection_name = collection_name or settings.QDRANT_COLLECTION_NAME
+        if collection_name not in _IVF_INDEXES:
+            _IVF_INDEXES[collection_name] = _load_ivf_index(
+                get_qdrant_client(), collection_name
+            )
+        return _IVF_INDEXES[collection_name]
+
+    def _read_all_vectors(
+        client: QdrantClient, collection_name: str
+    ) -> tuple[IdArray, FloatMatrix, dict[str, list[str | None]]]:
+        count = client.count(collection_name=collection_name, exact=True).count
+        ids = np.empty(count, dtype=np.int64)
+        vectors = np.empty((count, settings.QDRANT_VECTOR_DIM), dtype=np.float32)
+        attributes: dict[str, list[str | None]] = {f: [] for f in IVF_FILTER_FIELDS}
+        filled = 0
+        offset = None
+        while filled < count:
+            points, offset = client.scroll(
+                collection_name=collection_name,
+                limit=IVF_SCROLL_BATCH_SIZE,
+                offset=offset,
+                with_payload=list(IVF_FILTER_FIELDS),
+                with_vectors=True,
+            )
+            for point in points[: count - filled]:
+                ids[filled] = int(point.id)
+                vectors[filled] = np.asarray(point.vector, dtype=np.float32)
+                payload = point.payload or {}
+                for field, values in attributes.items():
+                    values.append(payload.get(field))
+                filled += 1
+            if offset is None:
+                break
+        return ids[:filled], vectors[:filled], attributes
+
+    def build_ivf_index(
+        n_lists: int | None = None,
+        quantization: VectorQuantization | None = None,
+        project_id: str | None = None,
+    ) -> IVFIndex | None:
+        collection_name = collection_name_for(project_id)
+        write_generation = _read_write_generation(collection_name)
+        ids, vectors, attributes = _read_all_vectors(
+            get_qdrant_client(), collection_name
+        )
+        if not len(ids):
+            return None
+        index = IVFIndex.build(
+            ids,
+            vectors,
+            n_lists=n_lists or settings.IVF_NLIST,
+            iterations=settings.IVF_KMEANS_ITERATIONS,
+            sample_size=settings.IVF_TRAIN_SAMPLE_SIZE,
+            quantization=quantization or settings.VECTOR_QUANTIZATION,
+            attributes=attributes,
+        )
+        index.write_generation = write_generation
+        index.save(ivf_index_path(collection_name))
+        # (H) Searches reload the saved index, which mmaps the vectors instead.
+        _invalidate_ivf_index(collection_name)
+        return index
+
+    def refresh_vector_index(project_id: str | None = None) -> None:
+        collection_name = collection_name_for(project_id)
+        try:
+            client = get_qdrant_client()
+            count = client.count(collection_name=collection_name, exact=True).count
+            if count >= settings.IVF_INDEX_MIN_VECTORS:
+                build_ivf_index(project_id=project_id)
+            else:
+                _invalidate_ivf_index(collection_name)
+        except Exception as e:
+            logger.warning(ls.IVF_BUILD_FAILED.format(error=e))
+            _invalidate_ivf_index(collection_name)
+
     def store_embedding(
-        node_id: int, embedding: list[float], qualified_name: str
+        node_id: int,
+        embedding: list[float],
+        qualified_name: str,
+        *,
+        project_id: str | None = None,
+        label: str | None = None,
+        module_path: str | None = None,
     ) -> None:
         try:
+            collection_name = collection_name_for(project_id)
+            _invalidate_ivf_index(collection_name)
             client = get_qdrant_client()
+            _ensure_collection(client, collection_name)
             client.upsert(
-                collection_name=settings.QDRANT_COLLECTION_NAME,
+                collection_name=collection_name,
                 points=[
                     PointStruct(
                         id=node_id,
                         vector=embedding,
-                        payload={
-                            PAYLOAD_NODE_ID: node_id,
-                            PAYLOAD_QUALIFIED_NAME: qualified_name,
-                        },
+                        payload=build_payload(
+                            node_id, qualified_name, project_id, label, module_path
+                        ),
                     )
                 ],
             )
+            _bump_write_generation(collection_name)
         except Exception as e:
             logger.warning(
                 ls.EMBEDDING_STORE_FAILED.format(name=qualified_name, error=e)
             )
 
+    def delete_embeddings(
+        node_ids: Sequence[int], *, project_id: str | None = None
+    ) -> None:
+        if not node_ids:
+            return
+        try:
+            collection_name = collection_name_for(project_id)
+            client = get_qdrant_client()
+            if not client.collection_exists(collection_name):
+                return
+            _invalidate_ivf_index(collection_name)
+            client.delete(
+                collection_name=collection_name,
+                points_selector=PointIdsList(points=list(node_ids)),
+            )
+            _bump_write_generation(collection_name)
+        except Exception as e:
+            logger.warning(
+                ls.EMBEDDING_DELETE_FAILED.format(count=len(node_ids), error=e)
+            )
+
     def search_embeddings(
-        query_embedding: list[float], top_k: int | None = None
+        query_embedding: list[float],
+        top_k: int | None = None,
+        *,
+        project_id: str | None = None,
+        labels: Sequence[str] | None = None,
+        path_prefix: str | None = None,
     ) -> list[tuple[int, float]]:
         effective_top_k = top_k if top_k is not None else settings.QDRANT_TOP_K
+        collection_name = collection_name_for(project_id)
+        query_filter = build_search_filter(project_id, labels, path_prefix)
+        predicates = build_ivf_predicates(project_id, labels, path_prefix)
+        try:
+            index = get_ivf_index(collection_name)
+            if index is not None and index.supports_filters(predicates):
+                results = index.search(
+                    query_embedding,
+                    effective_top_k,
+                    settings.IVF_NPROBE,
+                    settings.QUANTIZATION_RERANK_FACTOR,
+                    predicates or None,
+                )
+                # (H) A selective filter can leave the probed lists short of top_k.
+                if not predicates or len(results) >= effective_top_k:
+                    return results
+        except Exception as e:
+            logger.warning(ls.IVF_SEARCH_FAILED.format(error=e))
         try:
             client = get_qdrant_client()
+            if collection_name not in _KNOWN_COLLECTIONS:
+                if not client.collection_exists(collection_name):
+                    return []
+                _ensure_collection(client, collection_name)
             result = client.query_points(
-                collection_name=settings.QDRANT_COLLECTION_NAME,
+                collection_name=collection_name,
                 query=query_embedding,
                 limit=effective_top_k,
+                **({"query_filter": query_filter} if query_filter else {}),
+                **({"search_params": params} if (params := _search_params()) else {}),
             )
             return [
                 (hit.payload[PAYLOAD_NODE_ID], hit.score)
@@ -69,12 +454,31 @@ if has_qdrant_client():
 
 else:
 
+    def refresh_vector_index(project_id: str | None = None) -> None:
+        pass
+
     def store_embedding(
-        node_id: int, embedding: list[float], qualified_name: str
+        node_id: int,
+        embedding: list[float],
+        qualified_name: str,
+        *,
+        project_id: str | None = None,
+        label: str | None = None,
+        module_path: str | None = None,
+    ) -> None:
+        pass
+
+    def delete_embeddings(
+        node_ids: Sequence[int], *, project_id: str | None = None
     ) -> None:
         pass
 
     def search_embeddings(
-        query_embedding: list[float], top_k: int | None = None
+        query_embedding: list[float],
+        top_k: int | None = None,
+        *,
+        project_id: str | None = None,
+        labels: Sequence[str] | None = None,
+        path_prefix: str | None = None,
     ) -> list[tuple[int, float]]:
         return []
@@ -1,7 +1,7 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # NO CHECKED-IN PROTOBUF GENCODE
 # source: codec/schema.proto
-# Protobuf Python Version: 6.33.1
+# Protobuf Python Version: 6.31.1
 """Generated protocol buffer code."""
 
 from google.protobuf import descriptor as _descriptor
@@ -12,7 +12,7 @@ from google.protobuf import symbol_database as _symbol_database
 from google.protobuf.internal import builder as _builder
 
 _runtime_version.ValidateProtobufRuntimeVersion(
-    _runtime_version.Domain.PUBLIC, 6, 33, 1, "", "codec/schema.proto"
+    _runtime_version.Domain.PUBLIC, 6, 31, 1, "", "codec/schema.proto"
 )
 # @@protoc_insertion_point(imports)
 
@@ -20,7 +20,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x12\x63odec/schema.proto\x12\x0cgraphcode.v1\x1a\x1cgoogle/protobuf/struct.proto"f\n\x0eGraphCodeIndex\x12!\n\x05nodes\x18\x01 \x03(\x0b\x32\x12.graphcode.v1.Node\x12\x31\n\rrelationships\x18\x02 \x03(\x0b\x32\x1a.graphcode.v1.Relationship"\x93\x04\n\x04Node\x12(\n\x07project\x18\x01 \x01(\x0b\x32\x15.graphcode.v1.ProjectH\x00\x12(\n\x07package\x18\x02 \x01(\x0b\x32\x15.graphcode.v1.PackageH\x00\x12&\n\x06\x66older\x18\x03 \x01(\x0b\x32\x14.graphcode.v1.FolderH\x00\x12&\n\x06module\x18\x04 \x01(\x0b\x32\x14.graphcode.v1.ModuleH\x00\x12)\n\nclass_node\x18\x05 \x01(\x0b\x32\x13.graphcode.v1.ClassH\x00\x12*\n\x08\x66unction\x18\x06 \x01(\x0b\x32\x16.graphcode.v1.FunctionH\x00\x12&\n\x06method\x18\x07 \x01(\x0b\x32\x14.graphcode.v1.MethodH\x00\x12"\n\x04\x66ile\x18\x08 \x01(\x0b\x32\x12.graphcode.v1.FileH\x00\x12\x39\n\x10\x65xternal_package\x18\t \x01(\x0b\x32\x1d.graphcode.v1.ExternalPackageH\x00\x12\x43\n\x15module_implementation\x18\n \x01(\x0b\x32".graphcode.v1.ModuleImplementationH\x00\x12\x39\n\x10module_interface\x18\x0b \x01(\x0b\x32\x1d.graphcode.v1.ModuleInterfaceH\x00\x42\t\n\x07payload"\xe9\x03\n\x0cRelationship\x12\x39\n\x04type\x18\x01 \x01(\x0e\x32+.graphcode.v1.Relationship.RelationshipType\x12\x11\n\tsource_id\x18\x02 \x01(\t\x12\x11\n\ttarget_id\x18\x03 \x01(\t\x12+\n\nproperties\x18\x04 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x14\n\x0csource_label\x18\x05 \x01(\t\x12\x14\n\x0ctarget_label\x18\x06 \x01(\t"\x9e\x02\n\x10RelationshipType\x12!\n\x1dRELATIONSHIP_TYPE_UNSPECIFIED\x10\x00\x12\x14\n\x10\x43ONTAINS_PACKAGE\x10\x01\x12\x13\n\x0f\x43ONTAINS_FOLDER\x10\x02\x12\x11\n\rCONTAINS_FILE\x10\x03\x12\x13\n\x0f\x43ONTAINS_MODULE\x10\x04\x12\x0b\n\x07\x44\x45\x46INES\x10\x05\x12\x12\n\x0e\x44\x45\x46INES_METHOD\x10\x06\x12\x0b\n\x07IMPORTS\x10\x07\x12\x0c\n\x08INHERITS\x10\x08\x12\r\n\tOVERRIDES\x10\t\x12\t\n\x05\x43\x41LLS\x10\n\x12\x17\n\x13\x44\x45PENDS_ON_EXTERNAL\x10\x0b\x12\x15\n\x11IMPLEMENTS_MODULE\x10\x0c\x12\x0e\n\nIMPLEMENTS\x10\r"\x17\n\x07Project\x12\x0c\n\x04name\x18\x01 \x01(\t"=\n\x07Package\x12\x16\n\x0equalified_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t"$\n\x06\x46older\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t"5\n\x04\x46ile\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\textension\x18\x03 \x01(\t"<\n\x06Module\x12\x16\n\x0equalified_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t"e\n\x14ModuleImplementation\x12\x16\n\x0equalified_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t\x12\x19\n\x11implements_module\x18\x04 \x01(\t"E\n\x0fModuleInterface\x12\x16\n\x0equalified_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t"\x1f\n\x0f\x45xternalPackage\x12\x0c\n\x04name\x18\x01 \x01(\t"\x92\x01\n\x08\x46unction\x12\x16\n\x0equalified_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tdocstring\x18\x03 \x01(\t\x12\x12\n\nstart_line\x18\x04 \x01(\x05\x12\x10\n\x08\x65nd_line\x18\x05 \x01(\x05\x12\x12\n\ndecorators\x18\x06 \x03(\t\x12\x13\n\x0bis_exported\x18\x07 \x01(\x08"{\n\x06Method\x12\x16\n\x0equalified_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tdocstring\x18\x03 \x01(\t\x12\x12\n\nstart_line\x18\x04 \x01(\x05\x12\x10\n\x08\x65nd_line\x18\x05 \x01(\x05\x12\x12\n\ndecorators\x18\x06 \x03(\t"\x8f\x01\n\x05\x43lass\x12\x16\n\x0equalified_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tdocstring\x18\x03 \x01(\t\x12\x12\n\nstart_line\x18\x04 \x01(\x05\x12\x10\n\x08\x65nd_line\x18\x05 \x01(\x05\x12\x12\n\ndecorators\x18\x06 \x03(\t\x12\x13\n\x0bis_exported\x18\x07 \x01(\x08\x62\x06proto3'
+    b'\n\x12\x63odec/schema.proto\x12\x0cgraphcode.v1\x1a\x1cgoogle/protobuf/struct.proto"\x9e\x01\n\x0eGraphCodeIndex\x12!\n\x05nodes\x18\x01 \x03(\x0b\x32\x12.graphcode.v1.Node\x12\x31\n\rrelationships\x18\x02 \x03(\x0b\x32\x1a.graphcode.v1.Relationship\x12\x36\n\x10unresolved_calls\x18\x03 \x03(\x0b\x32\x1c.graphcode.v1.UnresolvedCall"\x93\x04\n\x04Node\x12(\n\x07project\x18\x01 \x01(\x0b\x32\x15.graphcode.v1.ProjectH\x00\x12(\n\x07package\x18\x02 \x01(\x0b\x32\x15.graphcode.v1.PackageH\x00\x12&\n\x06\x66older\x18\x03 \x01(\x0b\x32\x14.graphcode.v1.FolderH\x00\x12&\n\x06module\x18\x04 \x01(\x0b\x32\x14.graphcode.v1.ModuleH\x00\x12)\n\nclass_node\x18\x05 \x01(\x0b\x32\x13.graphcode.v1.ClassH\x00\x12*\n\x08\x66unction\x18\x06 \x01(\x0b\x32\x16.graphcode.v1.FunctionH\x00\x12&\n\x06method\x18\x07 \x01(\x0b\x32\x14.graphcode.v1.MethodH\x00\x12"\n\x04\x66ile\x18\x08 \x01(\x0b\x32\x12.graphcode.v1.FileH\x00\x12\x39\n\x10\x65xternal_package\x18\t \x01(\x0b\x32\x1d.graphcode.v1.ExternalPackageH\x00\x12\x43\n\x15module_implementation\x18\n \x01(\x0b\x32".graphcode.v1.ModuleImplementationH\x00\x12\x39\n\x10module_interface\x18\x0b \x01(\x0b\x32\x1d.graphcode.v1.ModuleInterfaceH\x00\x42\t\n\x07payload"\xe9\x03\n\x0cRelationship\x12\x39\n\x04type\x18\x01 \x01(\x0e\x32+.graphcode.v1.Relationship.RelationshipType\x12\x11\n\tsource_id\x18\x02 \x01(\t\x12\x11\n\ttarget_id\x18\x03 \x01(\t\x12+\n\nproperties\x18\x04 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x14\n\x0csource_label\x18\x05 \x01(\t\x12\x14\n\x0ctarget_label\x18\x06 \x01(\t"\x9e\x02\n\x10RelationshipType\x12!\n\x1dRELATIONSHIP_TYPE_UNSPECIFIED\x10\x00\x12\x14\n\x10\x43ONTAINS_PACKAGE\x10\x01\x12\x13\n\x0f\x43ONTAINS_FOLDER\x10\x02\x12\x11\n\rCONTAINS_FILE\x10\x03\x12\x13\n\x0f\x43ONTAINS_MODULE\x10\x04\x12\x0b\n\x07\x44\x45\x46INES\x10\x05\x12\x12\n\x0e\x44\x45\x46INES_METHOD\x10\x06\x12\x0b\n\x07IMPORTS\x10\x07\x12\x0c\n\x08INHERITS\x10\x08\x12\r\n\tOVERRIDES\x10\t\x12\t\n\x05\x43\x41LLS\x10\n\x12\x17\n\x13\x44\x45PENDS_ON_EXTERNAL\x10\x0b\x12\x15\n\x11IMPLEMENTS_MODULE\x10\x0c\x12\x0e\n\nIMPLEMENTS\x10\r"`\n\x0eUnresolvedCall\x12\x11\n\tcaller_id\x18\x01 \x01(\t\x12\x14\n\x0c\x63\x61ller_label\x18\x02 \x01(\t\x12\x11\n\tcall_name\x18\x03 \x01(\t\x12\x12\n\ncandidates\x18\x04 \x03(\t"\x17\n\x07Project\x12\x0c\n\x04name\x18\x01 \x01(\t"=\n\x07Package\x12\x16\n\x0equalified_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t"$\n\x06\x46older\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t"5\n\x04\x46ile\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\textension\x18\x03 \x01(\t"<\n\x06Module\x12\x16\n\x0equalified_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t"e\n\x14ModuleImplementation\x12\x16\n\x0equalified_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t\x12\x19\n\x11implements_module\x18\x04 \x01(\t"E\n\x0fModuleInterface\x12\x16\n\x0equalified_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t"\x1f\n\x0f\x45xternalPackage\x12\x0c\n\x04name\x18\x01 \x01(\t"\x92\x01\n\x08\x46unction\x12\x16\n\x0equalified_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tdocstring\x18\x03 \x01(\t\x12\x12\n\nstart_line\x18\x04 \x01(\x05\x12\x10\n\x08\x65nd_line\x18\x05 \x01(\x05\x12\x12\n\ndecorators\x18\x06 \x03(\t\x12\x13\n\x0bis_exported\x18\x07 \x01(\x08"{\n\x06Method\x12\x16\n\x0equalified_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tdocstring\x18\x03 \x01(\t\x12\x12\n\nstart_line\x18\x04 \x01(\x05\x12\x10\n\x08\x65nd_line\x18\x05 \x01(\x05\x12\x12\n\ndecorators\x18\x06 \x03(\t"\x8f\x01\n\x05\x43lass\x12\x16\n\x0equalified_name\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tdocstring\x18\x03 \x01(\t\x12\x12\n\nstart_line\x18\x04 \x01(\x05\x12\x10\n\x08\x65nd_line\x18\x05 \x01(\x05\x12\x12\n\ndecorators\x18\x06 \x03(\t\x12\x13\n\x0bis_exported\x18\x07 \x01(\x08"\x1c\n\nStringRefs\x12\x0e\n\x06values\x18\x01 \x03(\r"\xaa\x01\n\x08Property\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\x14\n\nstring_ref\x18\x02 \x01(\rH\x00\x12\x13\n\tint_value\x18\x03 \x01(\x12H\x00\x12\x16\n\x0c\x64ouble_value\x18\x04 \x01(\x01H\x00\x12\x14\n\nbool_value\x18\x05 \x01(\x08H\x00\x12/\n\x0bstring_list\x18\x06 \x01(\x0b\x32\x18.graphcode.v1.StringRefsH\x00\x42\x07\n\x05value"\x96\x01\n\nNodeRecord\x12\n\n\x02id\x18\x01 \x01(\x04\x12&\n\x05label\x18\x02 \x01(\x0e\x32\x17.graphcode.v1.NodeLabel\x12\x13\n\x0bprimary_key\x18\x03 \x01(\r\x12*\n\nproperties\x18\x04 \x03(\x0b\x32\x16.graphcode.v1.Property\x12\x13\n\x0bplaceholder\x18\x05 \x01(\x08"\xa1\x01\n\x12RelationshipRecord\x12\x39\n\x04type\x18\x01 \x01(\x0e\x32+.graphcode.v1.Relationship.RelationshipType\x12\x11\n\tsource_id\x18\x02 \x01(\x04\x12\x11\n\ttarget_id\x18\x03 \x01(\x04\x12*\n\nproperties\x18\x04 \x03(\x0b\x32\x16.graphcode.v1.Property"\x85\x01\n\x10GraphCodeIndexV2\x12\x0f\n\x07strings\x18\x01 \x03(\t\x12\'\n\x05nodes\x18\x02 \x03(\x0b\x32\x18.graphcode.v1.NodeRecord\x12\x37\n\rrelationships\x18\x03 \x03(\x0b\x32 .graphcode.v1.RelationshipRecord*\xc8\x02\n\tNodeLabel\x12\x1a\n\x16NODE_LABEL_UNSPECIFIED\x10\x00\x12\x16\n\x12NODE_LABEL_PROJECT\x10\x01\x12\x16\n\x12NODE_LABEL_PACKAGE\x10\x02\x12\x15\n\x11NODE_LABEL_FOLDER\x10\x03\x12\x15\n\x11NODE_LABEL_MODULE\x10\x04\x12\x14\n\x10NODE_LABEL_CLASS\x10\x05\x12\x17\n\x13NODE_LABEL_FUNCTION\x10\x06\x12\x15\n\x11NODE_LABEL_METHOD\x10\x07\x12\x13\n\x0fNODE_LABEL_FILE\x10\x08\x12\x1f\n\x1bNODE_LABEL_EXTERNAL_PACKAGE\x10\t\x12$\n NODE_LABEL_MODULE_IMPLEMENTATION\x10\n\x12\x1f\n\x1bNODE_LABEL_MODULE_INTERFACE\x10\x0b\x62\x06proto3'
 )
 
 _globals = globals()
@@ -28,34 +28,48 @@ _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, "codec.schema_pb2", _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
     DESCRIPTOR._loaded_options = None
-    _globals["_GRAPHCODEINDEX"]._serialized_start = 66
-    _globals["_GRAPHCODEINDEX"]._serialized_end = 168
-    _globals["_NODE"]._serialized_start = 171
-    _globals["_NODE"]._serialized_end = 702
-    _globals["_RELATIONSHIP"]._serialized_start = 705
-    _globals["_RELATIONSHIP"]._serialized_end = 1194
-    _globals["_RELATIONSHIP_RELATIONSHIPTYPE"]._serialized_start = 908
-    _globals["_RELATIONSHIP_RELATIONSHIPTYPE"]._serialized_end = 1194
-    _globals["_PROJECT"]._serialized_start = 1196
-    _globals["_PROJECT"]._serialized_end = 1219
-    _globals["_PACKAGE"]._serialized_start = 1221
-    _globals["_PACKAGE"]._serialized_end = 1282
-    _globals["_FOLDER"]._serialized_start = 1284
-    _globals["_FOLDER"]._serialized_end = 1320
-    _globals["_FILE"]._serialized_start = 1322
-    _globals["_FILE"]._serialized_end = 1375
-    _globals["_MODULE"]._serialized_start = 1377
-    _globals["_MODULE"]._serialized_end = 1437
-    _globals["_MODULEIMPLEMENTATION"]._serialized_start = 1439
-    _globals["_MODULEIMPLEMENTATION"]._serialized_end = 1540
-    _globals["_MODULEINTERFACE"]._serialized_start = 1542
-    _globals["_MODULEINTERFACE"]._serialized_end = 1611
-    _globals["_EXTERNALPACKAGE"]._serialized_start = 1613
-    _globals["_EXTERNALPACKAGE"]._serialized_end = 1644
-    _globals["_FUNCTION"]._serialized_start = 1647
-    _globals["_FUNCTION"]._serialized_end = 1793
-    _globals["_METHOD"]._serialized_start = 1795
-    _globals["_METHOD"]._serialized_end = 1918
-    _globals["_CLASS"]._serialized_start = 1921
-    _globals["_CLASS"]._serialized_end = 2064
+    _globals["_NODELABEL"]._serialized_start = 2878
+    _globals["_NODELABEL"]._serialized_end = 3206
+    _globals["_GRAPHCODEINDEX"]._serialized_start = 67
+    _globals["_GRAPHCODEINDEX"]._serialized_end = 225
+    _globals["_NODE"]._serialized_start = 228
+    _globals["_NODE"]._serialized_end = 759
+    _globals["_RELATIONSHIP"]._serialized_start = 762
+    _globals["_RELATIONSHIP"]._serialized_end = 1251
+    _globals["_RELATIONSHIP_RELATIONSHIPTYPE"]._serialized_start = 965
+    _globals["_RELATIONSHIP_RELATIONSHIPTYPE"]._serialized_end = 1251
+    _globals["_UNRESOLVEDCALL"]._serialized_start = 1253
+    _globals["_UNRESOLVEDCALL"]._serialized_end = 1349
+    _globals["_PROJECT"]._serialized_start = 1351
+    _globals["_PROJECT"]._serialized_end = 1374
+    _globals["_PACKAGE"]._serialized_start = 1376
+    _globals["_PACKAGE"]._serialized_end = 1437
+    _globals["_FOLDER"]._serialized_start = 1439
+    _globals["_FOLDER"]._serialized_end = 1475
+    _globals["_FILE"]._serialized_start = 1477
+    _globals["_FILE"]._serialized_end = 1530
+    _globals["_MODULE"]._serialized_start = 1532
+    _globals["_MODULE"]._serialized_end = 1592
+    _globals["_MODULEIMPLEMENTATION"]._serialized_start = 1594
+    _globals["_MODULEIMPLEMENTATION"]._serialized_end = 1695
+    _globals["_MODULEINTERFACE"]._serialized_start = 1697
+    _globals["_MODULEINTERFACE"]._serialized_end = 1766
+    _globals["_EXTERNALPACKAGE"]._serialized_start = 1768
+    _globals["_EXTERNALPACKAGE"]._serialized_end = 1799
+    _globals["_FUNCTION"]._serialized_start = 1802
+    _globals["_FUNCTION"]._serialized_end = 1948
+    _globals["_METHOD"]._serialized_start = 1950
+    _globals["_METHOD"]._serialized_end = 2073
+    _globals["_CLASS"]._serialized_start = 2076
+    _globals["_CLASS"]._serialized_end = 2219
+    _globals["_STRINGREFS"]._serialized_start = 2221
+    _globals["_STRINGREFS"]._serialized_end = 2249
+    _globals["_PROPERTY"]._serialized_start = 2252
+    _globals["_PROPERTY"]._serialized_end = 2422
+    _globals["_NODERECORD"]._serialized_start = 2425
+    _globals["_NODERECORD"]._serialized_end = 2575
+    _globals["_RELATIONSHIPRECORD"]._serialized_start = 2578
+    _globals["_RELATIONSHIPRECORD"]._serialized_end = 2739
+    _globals["_GRAPHCODEINDEXV2"]._serialized_start = 2742
+    _globals["_GRAPHCODEINDEXV2"]._serialized_end = 2875
 # @@protoc_insertion_point(module_scope)
@@ -10,20 +10,63 @@ from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
-class GraphCodeIndex(_message.Message):
+class NodeLabel(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
     __slots__ = ()
+    NODE_LABEL_UNSPECIFIED: _ClassVar[NodeLabel]
+    NODE_LABEL_PROJECT: _ClassVar[NodeLabel]
+    NODE_LABEL_PACKAGE: _ClassVar[NodeLabel]
+    NODE_LABEL_FOLDER: _ClassVar[NodeLabel]
+    NODE_LABEL_MODULE: _ClassVar[NodeLabel]
+    NODE_LABEL_CLASS: _ClassVar[NodeLabel]
+    NODE_LABEL_FUNCTION: _ClassVar[NodeLabel]
+    NODE_LABEL_METHOD: _ClassVar[NodeLabel]
+    NODE_LABEL_FILE: _ClassVar[NodeLabel]
+    NODE_LABEL_EXTERNAL_PACKAGE: _ClassVar[NodeLabel]
+    NODE_LABEL_MODULE_IMPLEMENTATION: _ClassVar[NodeLabel]
+    NODE_LABEL_MODULE_INTERFACE: _ClassVar[NodeLabel]
+
+NODE_LABEL_UNSPECIFIED: NodeLabel
+NODE_LABEL_PROJECT: NodeLabel
+NODE_LABEL_PACKAGE: NodeLabel
+NODE_LABEL_FOLDER: NodeLabel
+NODE_LABEL_MODULE: NodeLabel
+NODE_LABEL_CLASS: NodeLabel
+NODE_LABEL_FUNCTION: NodeLabel
+NODE_LABEL_METHOD: NodeLabel
+NODE_LABEL_FILE: NodeLabel
+NODE_LABEL_EXTERNAL_PACKAGE: NodeLabel
+NODE_LABEL_MODULE_IMPLEMENTATION: NodeLabel
+NODE_LABEL_MODULE_INTERFACE: NodeLabel
+
+class GraphCodeIndex(_message.Message):
+    __slots__ = ("nodes", "relationships", "unresolved_calls")
     NODES_FIELD_NUMBER: _ClassVar[int]
     RELATIONSHIPS_FIELD_NUMBER: _ClassVar[int]
+    UNRESOLVED_CALLS_FIELD_NUMBER: _ClassVar[int]
     nodes: _containers.RepeatedCompositeFieldContainer[Node]
     relationships: _containers.RepeatedCompositeFieldContainer[Relationship]
+    unresolved_calls: _containers.RepeatedCompositeFieldContainer[UnresolvedCall]
     def __init__(
         self,
         nodes: _Iterable[Node | _Mapping] | None = ...,
         relationships: _Iterable[Relationship | _Mapping] | None = ...,
+        unresolved_calls: _Iterable[UnresolvedCall | _Mapping] | None = ...,
     ) -> None: ...
 
 class Node(_message.Message):
-    __slots__ = ()
+    __slots__ = (
+        "project",
+        "package",
+        "folder",
+        "module",
+        "class_node",
+        "function",
+        "method",
+        "file",
+        "external_package",
+        "module_implementation",
+        "module_interface",
+    )
     PROJECT_FIELD_NUMBER: _ClassVar[int]
     PACKAGE_FIELD_NUMBER: _ClassVar[int]
     FOLDER_FIELD_NUMBER: _ClassVar[int]
@@ -62,7 +105,14 @@ class Node(_message.Message):
     ) -> None: ...
 
 class Relationship(_message.Message):
-    __slots__ = ()
+    __slots__ = (
+        "type",
+        "source_id",
+        "target_id",
+        "properties",
+        "source_label",
+        "target_label",
+    )
     class RelationshipType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
         __slots__ = ()
         RELATIONSHIP_TYPE_UNSPECIFIED: _ClassVar[Relationship.RelationshipType]
@@ -116,14 +166,32 @@ class Relationship(_message.Message):
         target_label: str | None = ...,
     ) -> None: ...
 
+class UnresolvedCall(_message.Message):
+    __slots__ = ("caller_id", "caller_label", "call_name", "candidates")
+    CALLER_ID_FIELD_NUMBER: _ClassVar[int]
+    CALLER_LABEL_FIELD_NUMBER: _ClassVar[int]
+    CALL_NAME_FIELD_NUMBER: _ClassVar[int]
+    CANDIDATES_FIELD_NUMBER: _ClassVar[int]
+    caller_id: str
+    caller_label: str
+    call_name: str
+    candidates: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(
+        self,
+        caller_id: str | None = ...,
+        caller_label: str | None = ...,
+        call_name: str | None = ...,
+        candidates: _Iterable[str] | None = ...,
+    ) -> None: ...
+
 class Project(_message.Message):
-    __slots__ = ()
+    __slots__ = ("name",)
     NAME_FIELD_NUMBER: _ClassVar[int]
     name: str
     def __init__(self, name: str | None = ...) -> None: ...
 
 class Package(_message.Message):
-    __slots__ = ()
+    __slots__ = ("qualified_name", "name", "path")
     QUALIFIED_NAME_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
     PATH_FIELD_NUMBER: _ClassVar[int]
@@ -138,7 +206,7 @@ class Package(_message.Message):
     ) -> None: ...
 
 class Folder(_message.Message):
-    __slots__ = ()
+    __slots__ = ("path", "name")
     PATH_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
     path: str
@@ -146,7 +214,7 @@ class Folder(_message.Message):
     def __init__(self, path: str | None = ..., name: str | None = ...) -> None: ...
 
 class File(_message.Message):
-    __slots__ = ()
+    __slots__ = ("path", "name", "extension")
     PATH_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
     EXTENSION_FIELD_NUMBER: _ClassVar[int]
@@ -161,7 +229,7 @@ class File(_message.Message):
     ) -> None: ...
 
 class Module(_message.Message):
-    __slots__ = ()
+    __slots__ = ("qualified_name", "name", "path")
     QUALIFIED_NAME_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
     PATH_FIELD_NUMBER: _ClassVar[int]
@@ -176,7 +244,7 @@ class Module(_message.Message):
     ) -> None: ...
 
 class ModuleImplementation(_message.Message):
-    __slots__ = ()
+    __slots__ = ("qualified_name", "name", "path", "implements_module")
     QUALIFIED_NAME_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
     PATH_FIELD_NUMBER: _ClassVar[int]
@@ -194,7 +262,7 @@ class ModuleImplementation(_message.Message):
     ) -> None: ...
 
 class ModuleInterface(_message.Message):
-    __slots__ = ()
+    __slots__ = ("qualified_name", "name", "path")
     QUALIFIED_NAME_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
     PATH_FIELD_NUMBER: _ClassVar[int]
@@ -209,13 +277,21 @@ class ModuleInterface(_message.Message):
     ) -> None: ...
 
 class ExternalPackage(_message.Message):
-    __slots__ = ()
+    __slots__ = ("name",)
     NAME_FIELD_NUMBER: _ClassVar[int]
     name: str
     def __init__(self, name: str | None = ...) -> None: ...
 
 class Function(_message.Message):
-    __slots__ = ()
+    __slots__ = (
+        "qualified_name",
+        "name",
+        "docstring",
+        "start_line",
+        "end_line",
+        "decorators",
+        "is_exported",
+    )
     QUALIFIED_NAME_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
     DOCSTRING_FIELD_NUMBER: _ClassVar[int]
@@ -238,11 +314,18 @@ class Function(_message.Message):
         start_line: int | None = ...,
         end_line: int | None = ...,
         decorators: _Iterable[str] | None = ...,
-        is_exported: bool | None = ...,
+        is_exported: bool = ...,
     ) -> None: ...
 
 class Method(_message.Message):
-    __slots__ = ()
+    __slots__ = (
+        "qualified_name",
+        "name",
+        "docstring",
+        "start_line",
+        "end_line",
+        "decorators",
+    )
     QUALIFIED_NAME_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
     DOCSTRING_FIELD_NUMBER: _ClassVar[int]
@@ -266,7 +349,15 @@ class Method(_message.Message):
     ) -> None: ...
 
 class Class(_message.Message):
-    __slots__ = ()
+    __slots__ = (
+        "qualified_name",
+        "name",
+        "docstring",
+        "start_line",
+        "end_line",
+        "decorators",
+        "is_exported",
+    )
     QUALIFIED_NAME_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
     DOCSTRING_FIELD_NUMBER: _ClassVar[int]
@@ -289,5 +380,96 @@ class Class(_message.Message):
         start_line: int | None = ...,
         end_line: int | None = ...,
         decorators: _Iterable[str] | None = ...,
-        is_exported: bool | None = ...,
+        is_exported: bool = ...,
+    ) -> None: ...
+
+class StringRefs(_message.Message):
+    __slots__ = ("values",)
+    VALUES_FIELD_NUMBER: _ClassVar[int]
+    values: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, values: _Iterable[int] | None = ...) -> None: ...
+
+class Property(_message.Message):
+    __slots__ = (
+        "key",
+        "string_ref",
+        "int_value",
+        "double_value",
+        "bool_value",
+        "string_list",
+    )
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    STRING_REF_FIELD_NUMBER: _ClassVar[int]
+    INT_VALUE_FIELD_NUMBER: _ClassVar[int]
+    DOUBLE_VALUE_FIELD_NUMBER: _ClassVar[int]
+    BOOL_VALUE_FIELD_NUMBER: _ClassVar[int]
+    STRING_LIST_FIELD_NUMBER: _ClassVar[int]
+    key: int
+    string_ref: int
+    int_value: int
+    double_value: float
+    bool_value: bool
+    string_list: StringRefs
+    def __init__(
+        self,
+        key: int | None = ...,
+        string_ref: int | None = ...,
+        int_value: int | None = ...,
+        double_value: float | None = ...,
+        bool_value: bool = ...,
+        string_list: StringRefs | _Mapping | None = ...,
+    ) -> None: ...
+
+class NodeRecord(_message.Message):
+    __slots__ = ("id", "label", "primary_key", "properties", "placeholder")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    LABEL_FIELD_NUMBER: _ClassVar[int]
+    PRIMARY_KEY_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    PLACEHOLDER_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    label: NodeLabel
+    primary_key: int
+    properties: _containers.RepeatedCompositeFieldContainer[Property]
+    placeholder: bool
+    def __init__(
+        self,
+        id: int | None = ...,
+        label: NodeLabel | str | None = ...,
+        primary_key: int | None = ...,
+        properties: _Iterable[Property | _Mapping] | None = ...,
+        placeholder: bool = ...,
+    ) -> None: ...
+
+class RelationshipRecord(_message.Message):
+    __slots__ = ("type", "source_id", "target_id", "properties")
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_ID_FIELD_NUMBER: _ClassVar[int]
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    PROPERTIES_FIELD_NUMBER: _ClassVar[int]
+    type: Relationship.RelationshipType
+    source_id: int
+    target_id: int
+    properties: _containers.RepeatedCompositeFieldContainer[Property]
+    def __init__(
+        self,
+        type: Relationship.RelationshipType | str | None = ...,
+        source_id: int | None = ...,
+        target_id: int | None = ...,
+        properties: _Iterable[Property | _Mapping] | None = ...,
+    ) -> None: ...
+
+class GraphCodeIndexV2(_message.Message):
+    __slots__ = ("strings", "nodes", "relationships")
+    STRINGS_FIELD_NUMBER: _ClassVar[int]
+    NODES_FIELD_NUMBER: _ClassVar[int]
+    RELATIONSHIPS_FIELD_NUMBER: _ClassVar[int]
+    strings: _containers.RepeatedScalarFieldContainer[str]
+    nodes: _containers.RepeatedCompositeFieldContainer[NodeRecord]
+    relationships: _containers.RepeatedCompositeFieldContainer[RelationshipRecord]
+    def __init__(
+        self,
+        strings: _Iterable[str] | None = ...,
+        nodes: _Iterable[NodeRecord | _Mapping] | None = ...,
+        relationships: _Iterable[RelationshipRecord | _Mapping] | None = ...,
     ) -> None: ...